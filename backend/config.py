@@ -55,6 +55,42 @@ class Settings(BaseSettings):
     )
     disable_mcp: bool = Field(default=False, alias="DISABLE_MCP")
     disable_background_jobs: bool = Field(default=False, alias="DISABLE_BACKGROUND_JOBS")
+    # Opt-in query profiling (stack sampling + event-loop lag) for slow requests
+    profiling_enabled: bool = Field(
+        default=False,
+        alias="PROFILING_ENABLED",
+        description="Allow queries to be profiled (X-Profile: 1 header or PROFILING_SAMPLE_RATE)"
+    )
+    profiling_sample_rate: float = Field(
+        default=0.0,
+        alias="PROFILING_SAMPLE_RATE",
+        description="Fraction of queries profiled without being asked to (0.0-1.0)"
+    )
+    profiling_slow_threshold_ms: float = Field(
+        default=10000.0,
+        alias="PROFILING_SLOW_THRESHOLD_MS",
+        description="Sampled profiles are kept only for queries slower than this"
+    )
+    profiling_interval_ms: float = Field(
+        default=10.0,
+        alias="PROFILING_INTERVAL_MS",
+        description="Stack sampling interval of the event-loop thread"
+    )
+    profiling_buffer_size: int = Field(
+        default=50,
+        alias="PROFILING_BUFFER_SIZE",
+        description="Most recent kept profiles held in memory"
+    )
+    profiling_token: str | None = Field(
+        default=None,
+        alias="PROFILING_TOKEN",
+        description="Bearer token required to read /api/debug/profiles"
+    )
+    metrics_endpoint_enabled: bool = Field(
+        default=True,
+        alias="METRICS_ENDPOINT_ENABLED",
+        description="Serve latency histograms in the Prometheus text format on /metrics"
+    )
     use_langchain_orchestrator: bool = Field(
         default=True,  # Enabled by default for intelligent query routing
         alias="USE_LANGCHAIN_ORCHESTRATOR",
@@ -111,6 +147,202 @@ class Settings(BaseSettings):
         description="LiteLLM routing timeout in seconds"
     )
 
+    # Incremental series store (delta fetches on cache miss)
+    use_series_store: bool = Field(
+        default=True,
+        alias="USE_SERIES_STORE",
+        description="Keep fetched series histories on disk and request only newer periods from providers"
+    )
+    series_store_path: str | None = Field(
+        default=None,
+        alias="SERIES_STORE_PATH",
+        description="SQLite file for the series store (default: backend/data/series_store.db)"
+    )
+    use_imf_payload_cache: bool = Field(
+        default=True,
+        alias="USE_IMF_PAYLOAD_CACHE",
+        description="Cache IMF DataMapper indicator payloads in memory and on disk, revalidating with ETag/Last-Modified"
+    )
+
+    # Parsed-intent cache in front of the LLM query parser
+    use_intent_cache: bool = Field(
+        default=True,
+        alias="USE_INTENT_CACHE",
+        description="Reuse parsed intents for repeated queries instead of calling the LLM parser"
+    )
+    intent_cache_ttl: int = Field(
+        default=86400,
+        alias="INTENT_CACHE_TTL",
+        description="Seconds a cached parsed intent stays valid"
+    )
+    intent_cache_semantic: bool = Field(
+        default=False,
+        alias="INTENT_CACHE_SEMANTIC",
+        description="Also reuse intents of near-identical queries by embedding similarity"
+    )
+    intent_cache_similarity_threshold: float = Field(
+        default=0.95,
+        alias="INTENT_CACHE_SIMILARITY_THRESHOLD",
+        description="Minimum cosine similarity for a semantic intent cache hit"
+    )
+    use_response_cache: bool = Field(
+        default=True,
+        alias="USE_RESPONSE_CACHE",
+        description="Reuse whole query responses for repeated standalone queries while their data is fresh"
+    )
+    response_cache_ttl: int = Field(
+        default=3600,
+        alias="RESPONSE_CACHE_TTL",
+        description="Upper bound in seconds on a cached response's lifetime (provider data expiry usually ends it sooner)"
+    )
+    response_cache_max_entries: int = Field(
+        default=512,
+        alias="RESPONSE_CACHE_MAX_ENTRIES",
+        description="Maximum responses kept in each worker's in-process response cache"
+    )
+    response_cache_shared: bool = Field(
+        default=True,
+        alias="RESPONSE_CACHE_SHARED",
+        description="Also share cached responses between workers through Redis when it is connected"
+    )
+    # Background warming of popular provider requests
+    use_cache_warmer: bool = Field(
+        default=False,
+        alias="USE_CACHE_WARMER",
+        description="Keep popular series cached by re-fetching them in the background before they expire"
+    )
+    cache_warm_interval: int = Field(
+        default=600,
+        alias="CACHE_WARM_INTERVAL",
+        description="Seconds between cache warm cycles"
+    )
+    cache_warm_top_n: int = Field(
+        default=200,
+        alias="CACHE_WARM_TOP_N",
+        description="Most frequent query-log intents to keep warm (in addition to the pinned targets)"
+    )
+    cache_warm_targets_file: str = Field(
+        default="",
+        alias="CACHE_WARM_TARGETS_FILE",
+        description="JSON file of pinned warm targets (default: backend/data/cache_warm_targets.json)"
+    )
+    cache_warm_refresh_margin: int = Field(
+        default=900,
+        alias="CACHE_WARM_REFRESH_MARGIN",
+        description="Re-fetch a target when its cached data expires within this many seconds"
+    )
+    cache_warm_off_peak_hours: str = Field(
+        default="",
+        alias="CACHE_WARM_OFF_PEAK_HOURS",
+        description="UTC hour ranges in which the warmer may call providers, e.g. '0-6,22-24' (empty = any time)"
+    )
+    cache_warm_max_budget_usage: float = Field(
+        default=0.5,
+        alias="CACHE_WARM_MAX_BUDGET_USAGE",
+        description="Skip a provider once this share of its rate-limit window is used"
+    )
+    cache_warm_max_fetches_per_cycle: int = Field(
+        default=50,
+        alias="CACHE_WARM_MAX_FETCHES_PER_CYCLE",
+        description="Maximum targets fetched per warm cycle"
+    )
+    use_fast_path_parser: bool = Field(
+        default=True,
+        alias="USE_FAST_PATH_PARSER",
+        description="Parse simple single-indicator queries deterministically before calling the LLM"
+    )
+    # Chosen from the fast-path accuracy/coverage curve in
+    # scripts/benchmark_query_framework.py
+    fast_path_min_confidence: float = Field(
+        default=0.7,
+        alias="FAST_PATH_MIN_CONFIDENCE",
+        description="Minimum fast-path parser confidence required to skip the LLM parser"
+    )
+    # Must cover the longest provider request: StatsCan multi-province
+    # downloads run with a 300 s timeout and would be cancelled otherwise.
+    request_deadline_seconds: float = Field(
+        default=330.0,
+        alias="REQUEST_DEADLINE_SECONDS",
+        description="Overall deadline for one query; retries and HTTP timeouts are clamped to it (0 = none)"
+    )
+    request_retry_budget: int = Field(
+        default=6,
+        alias="REQUEST_RETRY_BUDGET",
+        description="Total retries shared by every retry layer while serving one query (-1 = unlimited)"
+    )
+    http_keepalive_expiry: float = Field(
+        default=60.0,
+        alias="HTTP_KEEPALIVE_EXPIRY",
+        description="Seconds an idle pooled upstream connection is kept open for reuse"
+    )
+    http_cassette_mode: str = Field(
+        default="off",
+        alias="HTTP_CASSETTE_MODE",
+        description="off, record (save upstream responses) or replay (serve them offline)"
+    )
+    http_cassette_path: str | None = Field(
+        default=None,
+        alias="HTTP_CASSETTE_PATH",
+        description="Cassette file used by HTTP_CASSETTE_MODE (default: backend/tests/cassettes/default.json)"
+    )
+    http_replay_latency_ms: float | None = Field(
+        default=None,
+        alias="HTTP_REPLAY_LATENCY_MS",
+        description="Fixed latency per replayed response (unset = recorded latency)"
+    )
+    http_replay_latency_scale: float = Field(
+        default=1.0,
+        alias="HTTP_REPLAY_LATENCY_SCALE",
+        description="Multiplier applied to recorded latency during replay"
+    )
+    http_replay_jitter_ms: float = Field(
+        default=0.0,
+        alias="HTTP_REPLAY_JITTER_MS",
+        description="Uniform +/- jitter added to each replayed response"
+    )
+    http_replay_seed: int | None = Field(
+        default=None,
+        alias="HTTP_REPLAY_SEED",
+        description="Random seed for replay jitter (repeatable benchmark runs)"
+    )
+    use_request_hedging: bool = Field(
+        default=False,
+        alias="USE_REQUEST_HEDGING",
+        description="Send a duplicate GET to slow providers once the primary exceeds their latency percentile"
+    )
+    request_hedging_percentile: float = Field(
+        default=0.95,
+        alias="REQUEST_HEDGING_PERCENTILE",
+        description="Per-provider latency percentile after which a hedged request is sent"
+    )
+    request_hedging_max_ratio: float = Field(
+        default=0.1,
+        alias="REQUEST_HEDGING_MAX_RATIO",
+        description="Maximum share of a provider's requests that may be hedged"
+    )
+
+    # Shared embedding model (vector search, semantic routing, intent cache)
+    embedding_model: str = Field(
+        default="sentence-transformers/all-MiniLM-L6-v2",
+        alias="EMBEDDING_MODEL",
+        description="Sentence-transformers model loaded once per process and shared by all embedding users"
+    )
+    embedding_warmup_on_startup: bool = Field(
+        default=True,
+        alias="EMBEDDING_WARMUP_ON_STARTUP",
+        description="Load the shared embedding model during API startup instead of on the first query"
+    )
+    embedding_service_url: str | None = Field(
+        default=None,
+        alias="EMBEDDING_SERVICE_URL",
+        description="URL of a shared embedding server (python -m backend.services.embedding_service); unset = in-process model"
+    )
+    sse_heartbeat_seconds: float = Field(
+        default=15.0,
+        alias="SSE_HEARTBEAT_SECONDS",
+        description="Idle seconds after which a streaming response sends a keep-alive comment (0 = never)"
+    )
+
     # Pro Mode configuration - cross-platform defaults
     promode_enabled: bool = Field(
         default=False,
@@ -119,6 +351,36 @@ class Settings(BaseSettings):
     )
     promode_public_dir: str | None = Field(default=None, alias="PROMODE_PUBLIC_DIR")
     promode_session_dir: str | None = Field(default=None, alias="PROMODE_SESSION_DIR")
+    sandbox_pool_size: int = Field(
+        default=2,
+        alias="SANDBOX_POOL_SIZE",
+        description="Pre-warmed Pro Mode sandbox workers (0 disables the pool)"
+    )
+    sandbox_pool_max_runs: int = Field(
+        default=50,
+        alias="SANDBOX_POOL_MAX_RUNS",
+        description="Executions served by a sandbox worker before it is recycled"
+    )
+    sandbox_pool_preload: str = Field(
+        default="numpy,pandas,pyarrow.feather,matplotlib.pyplot",
+        alias="SANDBOX_POOL_PRELOAD",
+        description="Comma-separated modules imported by sandbox workers at start-up"
+    )
+    code_validation_cache_size: int = Field(
+        default=512,
+        alias="CODE_VALIDATION_CACHE_SIZE",
+        description="Pro Mode security validation results cached by code hash"
+    )
+    code_validation_offload_chars: int = Field(
+        default=20000,
+        alias="CODE_VALIDATION_OFFLOAD_CHARS",
+        description="Scripts at least this long are validated in a worker thread"
+    )
+    sandbox_pool_warmup: bool = Field(
+        default=True,
+        alias="SANDBOX_POOL_WARMUP",
+        description="Start sandbox workers during application start-up"
+    )
 
     # Vector Search Configuration
     enable_metadata_loading: bool = Field(
@@ -11,7 +11,6 @@ from typing import Optional
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, StreamingResponse
-from fastapi_mcp import FastApiMCP
 from starlette.types import ASGIApp, Receive, Scope, Send
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
@@ -19,6 +18,7 @@ from slowapi.errors import RateLimitExceeded
 
 from .config import Settings, get_settings
 from .utils.logging_security import SecureLogger, log_secure
+from .utils.latency_metrics import HTTP_METRIC, latency_histograms
 from .models import (
     AuthResponse,
     AuthUser,
@@ -48,11 +48,11 @@ from .services.mock_auth import MockAuthService
 from .services.cache import cache_service
 from .services.redis_cache import get_redis_cache
 from .services.conversation import conversation_manager
-from .services.export import export_service
 from .services.feedback import feedback_service
 from .services.query import QueryService
 from .services.user_store import user_store
-from .utils.dependencies import require_promode
+from .utils.dependencies import profile_requested, require_profiling_access, require_promode
+from .utils.sse import stream_task_events
 
 logger = logging.getLogger("openecon")
 logging.basicConfig(level=logging.INFO)
@@ -88,12 +88,37 @@ async def lifespan(app: FastAPI):
     HTTPClientPool()  # Initialize singleton
     logger.info("✅ HTTP client pool ready (connection pooling enabled)")
 
+    # Load the shared embedding model once, before the first routed query needs it
+    if settings.embedding_warmup_on_startup:
+        from .services.embedding_service import get_embedding_service
+
+        embedding_service = get_embedding_service()
+        if embedding_service.available:
+            logger.info("⚙️  Warming up shared embedding model...")
+            if await asyncio.to_thread(embedding_service.warm_up) and query_service.semantic_provider_router:
+                await asyncio.to_thread(query_service.semantic_provider_router.warm_up)
+
+    # Start pre-imported Pro Mode sandbox workers so the first execution skips cold imports
+    if settings.promode_enabled and settings.sandbox_pool_warmup:
+        from .services.sandbox_pool import get_sandbox_pool
+
+        sandbox_pool = get_sandbox_pool()
+        if sandbox_pool is not None:
+            logger.info("⚙️  Starting Pro Mode sandbox pool...")
+            await sandbox_pool.start()
+
     # Load metadata asynchronously in background (non-blocking startup)
     from .services.metadata_loader import MetadataLoader
     from .services.vector_search import VECTOR_SEARCH_AVAILABLE
     from .services.async_metadata_loader import AsyncMetadataLoader
 
-    if settings.enable_metadata_loading and VECTOR_SEARCH_AVAILABLE:
+    from .services.preload import is_preloaded
+
+    if is_preloaded("vector_index"):
+        # Loaded once in the pre-fork master and shared copy-on-write
+        logger.info("📚 Metadata index inherited from preloading master process")
+        app.state.metadata_loader = None
+    elif settings.enable_metadata_loading and VECTOR_SEARCH_AVAILABLE:
         try:
             logger.info("📚 Starting async metadata loading (non-blocking)...")
             logger.info(f"   - Using FAISS: {settings.use_faiss_instead_of_chroma}")
@@ -124,9 +149,16 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("ℹ️  Metadata loading disabled (set ENABLE_METADATA_LOADING=true to enable)")
 
+    app.state.cache_warmer_task = None
     if not settings.disable_background_jobs:
         app.state.cleanup_task = asyncio.create_task(_conversation_cleanup_loop())
         app.state.file_cleanup_task = asyncio.create_task(_file_cleanup_loop())
+        if settings.use_cache_warmer:
+            from .services.cache_warmer import get_cache_warmer
+
+            app.state.cache_warmer_task = asyncio.create_task(
+                get_cache_warmer().run_forever(settings.cache_warm_interval)
+            )
     else:
         app.state.cleanup_task = None
         app.state.file_cleanup_task = None
@@ -140,6 +172,10 @@ async def lifespan(app: FastAPI):
     from .services.http_pool import close_http_pool
     await close_http_pool()
 
+    # Kill pooled sandbox workers
+    from .services.sandbox_pool import close_sandbox_pool
+    await close_sandbox_pool()
+
     # Cancel metadata loader if still running
     metadata_loader_state = getattr(app.state, "metadata_loader", None)
     if metadata_loader_state:
@@ -157,6 +193,12 @@ async def lifespan(app: FastAPI):
         with contextlib.suppress(asyncio.CancelledError):
             await file_cleanup_task
 
+    cache_warmer_task: asyncio.Task | None = getattr(app.state, "cache_warmer_task", None)
+    if cache_warmer_task:
+        cache_warmer_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await cache_warmer_task
+
 
 app = FastAPI(title="econ-data-mcp API", version="1.0.0", lifespan=lifespan)
 
@@ -308,6 +350,16 @@ class SecureLoggingASGIMiddleware:
             error_log = SecureLogger.format_error_log(request_id, e, include_traceback=True)
             log_secure("error", "Request failed", error_log, request_id)
             raise
+        finally:
+            # Route templates keep the label set small; unmatched paths share one label
+            route = scope.get("route")
+            latency_histograms.observe(
+                HTTP_METRIC,
+                time.perf_counter() - start_time,
+                route=getattr(route, "path", None) or "unmatched",
+                method=scope.get("method", ""),
+                status=status_code,
+            )
 
 
 app.add_middleware(
@@ -325,12 +377,6 @@ app.add_middleware(SecureLoggingASGIMiddleware)
 # Helper Functions
 # ====================
 
-def format_sse_event(event_type: str, data: dict) -> str:
-    """Format data as a Server-Sent Event string."""
-    import json
-    return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
-
-
 async def log_query_to_supabase(
     query: str,
     user: Optional[User],
@@ -597,13 +643,17 @@ async def session_history(session_id: str = Query(..., description="Session ID")
     description="Query economic data from multiple sources (FRED, World Bank, Comtrade, StatsCan, IMF, ExchangeRate-API, BIS, Eurostat) using natural language. Example queries: 'Show me US GDP for 2023', 'What is the unemployment rate in Canada?', 'Compare inflation between US and UK from 2020-2023'.",
     tags=["Economic Data"],
 )
-async def query_endpoint(request: QueryRequest, user: Optional[User] = Depends(get_optional_user)) -> QueryResponse:
+async def query_endpoint(
+    request: QueryRequest,
+    user: Optional[User] = Depends(get_optional_user),
+    profile: bool = Depends(profile_requested),
+) -> QueryResponse:
     if not request.query:
         return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error": "Query is required"})
 
     logger.info("📝 Query: %s (conversation: %s, user: %s)", request.query, request.conversationId, user.id if user else "anonymous")
 
-    result = await query_service.process_query(request.query, request.conversationId)
+    result = await query_service.process_query(request.query, request.conversationId, profile=profile)
 
     # Don't treat "data_not_available" as a server error - return 200 with error message
     # Only return 500 for actual processing errors
@@ -636,7 +686,11 @@ async def query_endpoint(request: QueryRequest, user: Optional[User] = Depends(g
     description="Same as /api/query but streams progress updates in real-time using Server-Sent Events. Each event shows processing steps as they complete.",
     tags=["Economic Data"],
 )
-async def query_stream_endpoint(request: QueryRequest, user: Optional[User] = Depends(get_optional_user)):
+async def query_stream_endpoint(
+    request: QueryRequest,
+    user: Optional[User] = Depends(get_optional_user),
+    profile: bool = Depends(profile_requested),
+):
     """Streaming version of query endpoint using Server-Sent Events"""
     import json
     import asyncio
@@ -656,7 +710,6 @@ async def query_stream_endpoint(request: QueryRequest, user: Optional[User] = De
 
         tracker_token = None
         query_task = None
-        client_disconnected = False
 
         try:
             # Create tracker with callback that puts events in queue
@@ -676,48 +729,28 @@ async def query_stream_endpoint(request: QueryRequest, user: Optional[User] = De
                 except Exception:
                     pass  # Queue might be closed if client disconnected
 
-            tracker = ProcessingTracker(stream_callback=stream_callback)
+            # Each fetched series is sent as soon as its provider call completes
+            def series_callback(series_id, series, metadata):
+                event = StreamEvent(
+                    event="series",
+                    data={"seriesId": series_id, "series": series.model_dump(mode="json"), **metadata},
+                )
+                try:
+                    event_queue.put_nowait(event)
+                except Exception:
+                    pass  # Queue might be closed if client disconnected
+
+            tracker = ProcessingTracker(stream_callback=stream_callback, series_callback=series_callback)
             tracker_token = activate_processing_tracker(tracker)
 
             # Start processing query in background (don't await yet)
-            query_task = asyncio.create_task(query_service.process_query(request.query, request.conversationId))
-
-            # Stream events as they come
-            processing_complete = False
-            while not processing_complete:
-                # Try to get events with timeout
-                try:
-                    event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
-                    yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
-                except asyncio.TimeoutError:
-                    # No event available
-                    pass
-                except asyncio.CancelledError:
-                    # Client disconnected
-                    client_disconnected = True
-                    logger.info("📡 Client disconnected during streaming")
-                    break
+            query_task = asyncio.create_task(
+                query_service.process_query(request.query, request.conversationId, profile=profile)
+            )
 
-                # Check if query is complete
-                if query_task.done():
-                    # Drain remaining events
-                    while not event_queue.empty():
-                        try:
-                            event = event_queue.get_nowait()
-                            yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
-                        except Exception:
-                            break
-                    processing_complete = True
-
-            # If client disconnected, cancel the query task
-            if client_disconnected:
-                if query_task and not query_task.done():
-                    query_task.cancel()
-                    try:
-                        await query_task
-                    except asyncio.CancelledError:
-                        logger.info("📡 Query task cancelled due to client disconnect")
-                return
+            # Stream events as they come; returns as soon as the query task finishes
+            async for chunk in stream_task_events(query_task, event_queue, settings.sse_heartbeat_seconds):
+                yield chunk
 
             # Get result and handle exceptions from query processing
             try:
@@ -750,6 +783,10 @@ async def query_stream_endpoint(request: QueryRequest, user: Optional[User] = De
                 error_message=result.error,
             )
 
+            # Tell clients how streamed series map onto the final (reranked) result
+            if tracker.emitted_series_count:
+                yield f"event: series_order\ndata: {json.dumps(tracker.series_order(result.data))}\n\n"
+
             # Send final result
             if result.error:
                 error_data = {"error": result.error, "message": result.message or result.error}
@@ -1161,15 +1198,8 @@ async def query_pro_stream_endpoint(request: QueryRequest, user: User = Depends(
                 return True
 
             init_task = asyncio.create_task(initialize_session())
-            while not init_task.done():
-                try:
-                    event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
-                    yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
-                except asyncio.TimeoutError:
-                    pass
-            while not event_queue.empty():
-                event = event_queue.get_nowait()
-                yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
+            async for chunk in stream_task_events(init_task, event_queue, settings.sse_heartbeat_seconds):
+                yield chunk
             await init_task
 
             # Step 2: Analyze query
@@ -1187,15 +1217,8 @@ async def query_pro_stream_endpoint(request: QueryRequest, user: User = Depends(
                 return True
 
             analyze_task = asyncio.create_task(analyze_query())
-            while not analyze_task.done():
-                try:
-                    event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
-                    yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
-                except asyncio.TimeoutError:
-                    pass
-            while not event_queue.empty():
-                event = event_queue.get_nowait()
-                yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
+            async for chunk in stream_task_events(analyze_task, event_queue, settings.sse_heartbeat_seconds):
+                yield chunk
             await analyze_task
 
             # Step 3: Generate code
@@ -1257,15 +1280,8 @@ async def query_pro_stream_endpoint(request: QueryRequest, user: User = Depends(
                 return True
 
             validate_task = asyncio.create_task(validate_code())
-            while not validate_task.done():
-                try:
-                    event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
-                    yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
-                except asyncio.TimeoutError:
-                    pass
-            while not event_queue.empty():
-                event = event_queue.get_nowait()
-                yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
+            async for chunk in stream_task_events(validate_task, event_queue, settings.sse_heartbeat_seconds):
+                yield chunk
             await validate_task
 
             # Step 5: Check for package installations (conditional)
@@ -1288,15 +1304,8 @@ async def query_pro_stream_endpoint(request: QueryRequest, user: User = Depends(
                     return True
 
                 install_task = asyncio.create_task(check_packages())
-                while not install_task.done():
-                    try:
-                        event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
-                        yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
-                    except asyncio.TimeoutError:
-                        pass
-                while not event_queue.empty():
-                    event = event_queue.get_nowait()
-                    yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
+                async for chunk in stream_task_events(install_task, event_queue, settings.sse_heartbeat_seconds):
+                    yield chunk
                 await install_task
 
             # Step 6: Execute code
@@ -1328,15 +1337,8 @@ async def query_pro_stream_endpoint(request: QueryRequest, user: User = Depends(
                 return execution_result
 
             exec_task = asyncio.create_task(execute_code_with_streaming())
-            while not exec_task.done():
-                try:
-                    event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
-                    yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
-                except asyncio.TimeoutError:
-                    pass
-            while not event_queue.empty():
-                event = event_queue.get_nowait()
-                yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
+            async for chunk in stream_task_events(exec_task, event_queue, settings.sse_heartbeat_seconds):
+                yield chunk
             execution_result = await exec_task
 
             # Step 7: Process results
@@ -1354,15 +1356,8 @@ async def query_pro_stream_endpoint(request: QueryRequest, user: User = Depends(
                 return True
 
             process_task = asyncio.create_task(process_results())
-            while not process_task.done():
-                try:
-                    event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
-                    yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
-                except asyncio.TimeoutError:
-                    pass
-            while not event_queue.empty():
-                event = event_queue.get_nowait()
-                yield f"event: {event.event}\ndata: {json.dumps(event.data)}\n\n"
+            async for chunk in stream_task_events(process_task, event_queue, settings.sse_heartbeat_seconds):
+                yield chunk
             await process_task
 
             reset_processing_tracker(tracker_token)
@@ -1459,6 +1454,9 @@ async def export_endpoint(request: ExportRequest) -> Response:
     if request.format not in {"csv", "json", "dta"}:
         return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"error": "Format must be csv, json, or dta"})
 
+    # Imported on first export: pulls in pandas, which nothing else needs at startup
+    from .services.export import export_service
+
     if request.format == "csv":
         content = export_service.generate_csv(request.data)
         media_type = "text/csv"
@@ -1514,11 +1512,57 @@ async def cache_clear(user: User = Depends(get_required_user)):
     return {"message": "Cache cleared", "redisDeleted": redis_deleted}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics() -> Response:
+    """Per-stage, upstream and API latency histograms in the Prometheus text format."""
+    if not settings.metrics_endpoint_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return Response(
+        content=latency_histograms.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@app.get("/api/debug/profiles", include_in_schema=False, dependencies=[Depends(require_profiling_access)])
+async def list_query_profiles(limit: int = Query(default=20, ge=1, le=200)):
+    """List the most recent kept query profiles, newest first."""
+    from .services.query_profiler import get_query_profiler
+
+    profiler = get_query_profiler()
+    return {"profiles": profiler.list_profiles(limit), "stats": profiler.get_stats()}
+
+
+@app.get("/api/debug/profiles/{profile_id}", include_in_schema=False, dependencies=[Depends(require_profiling_access)])
+async def get_query_profile(profile_id: str, format: str = Query(default="json", pattern="^(json|collapsed)$")):
+    """Get one query profile as JSON, or its stacks in collapsed flame graph format."""
+    from .services.query_profiler import get_query_profiler, to_collapsed
+
+    report = get_query_profiler().get(profile_id)
+    if report is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    if format == "collapsed":
+        return Response(content=to_collapsed(report), media_type="text/plain; charset=utf-8")
+    return report
+
+
 @app.get("/api/performance/metrics")
 async def performance_metrics():
     """Get detailed performance metrics for all components."""
     from .services.http_pool import HTTPClientPool
     from .services.circuit_breaker import CircuitBreakerRegistry
+    from .services.rate_limiter import get_rate_limiter_stats
+    from .services.series_store import get_series_store
+    from .services.imf_datamapper_cache import get_datamapper_cache
+    from .services.intent_cache import get_intent_cache
+    from .services.response_cache import get_response_cache
+    from .services.cache_warmer import get_cache_warmer
+    from .services.query_profiler import get_query_profiler
+    from .services.fast_path_parser import get_fast_path_parser
+    from .services.request_hedging import get_request_hedger
+    from .services.embedding_service import get_embedding_service
+    from .services.sandbox_pool import get_sandbox_pool
+    from .services.preload import get_preload_stats
+    from .services.secure_code_executor import get_validation_cache
 
     http_pool_stats = HTTPClientPool.get_stats()
     circuit_breaker_stats = CircuitBreakerRegistry.get_all_stats()
@@ -1529,12 +1573,28 @@ async def performance_metrics():
     if metadata_loader:
         metadata_status = metadata_loader.get_status()
 
+    sandbox_pool = get_sandbox_pool() if settings.promode_enabled else None
+
     return {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "http_pool": http_pool_stats,
         "circuit_breakers": circuit_breaker_stats,
+        "rate_limiters": get_rate_limiter_stats(),
         "cache": cache_stats,
+        "series_store": get_series_store().get_stats() if settings.use_series_store else None,
+        "imf_datamapper_cache": get_datamapper_cache().get_stats() if settings.use_imf_payload_cache else None,
+        "intent_cache": get_intent_cache().get_stats() if settings.use_intent_cache else None,
+        "response_cache": get_response_cache().get_stats() if settings.use_response_cache else None,
+        "cache_warmer": get_cache_warmer().get_stats() if settings.use_cache_warmer else None,
+        "fast_path_parser": get_fast_path_parser().get_stats() if settings.use_fast_path_parser else None,
+        "request_hedging": get_request_hedger().get_stats() if settings.use_request_hedging else None,
+        "embedding_model": get_embedding_service().get_stats(),
+        "sandbox_pool": sandbox_pool.get_stats() if sandbox_pool else None,
+        "code_validation_cache": get_validation_cache().get_stats() if settings.promode_enabled else None,
         "metadata_loader": metadata_status,
+        "preload": get_preload_stats(),
+        "latency": latency_histograms.get_stats(),
+        "query_profiler": get_query_profiler().get_stats() if settings.profiling_enabled else None,
     }
 
 
@@ -1566,6 +1626,8 @@ async def root():
 if not settings.disable_mcp:
     # Create and mount the MCP server **after** routes are registered so the OpenAPI schema
     # includes the endpoints we want to expose as tools.
+    from fastapi_mcp import FastApiMCP
+
     mcp = FastApiMCP(
         app,
         name="econ-data-mcp MCP Server",
@@ -0,0 +1,161 @@
+"""
+Pre-forking launcher for multi-worker deployments.
+
+``uvicorn --workers N`` spawns fresh interpreters, so each worker imports the
+app and loads every catalog, index and model again. This launcher instead
+imports the app and preloads shared state once in the master, binds the
+listening socket, then forks N workers that serve the inherited socket. The
+preloaded pages stay shared copy-on-write (see ``backend/services/preload.py``).
+
+    python -m backend.prefork --workers 4 --port 3001
+
+The master restarts workers that exit unexpectedly and forwards SIGTERM /
+SIGINT to them on shutdown. POSIX only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# A worker that dies within this many seconds of starting is restarted with a delay
+_CRASH_WINDOW_SECONDS = 5.0
+_RESTART_DELAY_SECONDS = 1.0
+
+
+def _bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(app: Any, sock: socket.socket, log_level: str, load_after_fork: bool = False) -> None:
+    import uvicorn
+
+    # uvicorn installs its own handlers; drop the master's before it starts
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    if load_after_fork:
+        from .services.preload import preload_shared_state
+
+        preload_shared_state(freeze=False)
+    config = uvicorn.Config(app, log_level=log_level, lifespan="on")
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class PreforkMaster:
+    """Owns the listening socket and keeps ``workers`` forked servers alive."""
+
+    def __init__(
+        self,
+        app: Any,
+        sock: socket.socket,
+        workers: int,
+        log_level: str = "info",
+        load_after_fork: bool = False,
+    ) -> None:
+        self.app = app
+        self.sock = sock
+        self.workers = workers
+        self.log_level = log_level
+        self.load_after_fork = load_after_fork
+        self.children: Dict[int, float] = {}
+        self._stopping = False
+
+    def spawn(self) -> int:
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                _run_worker(self.app, self.sock, self.log_level, self.load_after_fork)
+            except BaseException:
+                logger.exception("Worker %d crashed", os.getpid())
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        self.children[pid] = time.monotonic()
+        logger.info("Started worker %d", pid)
+        return pid
+
+    def stop(self, signum: int, _frame: Optional[Any] = None) -> None:
+        self._stopping = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self.children.pop(pid, None)
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        for _ in range(self.workers):
+            self.spawn()
+
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            started = self.children.pop(pid, None)
+            if started is None or self._stopping:
+                continue
+            logger.warning("Worker %d exited (status %d); restarting", pid, os.waitstatus_to_exitcode(status))
+            if time.monotonic() - started < _CRASH_WINDOW_SECONDS:
+                time.sleep(_RESTART_DELAY_SECONDS)
+            if not self._stopping:
+                self.spawn()
+        self.sock.close()
+        return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the backend from pre-forked uvicorn workers")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("WEB_CONCURRENCY", "2")))
+    parser.add_argument("--no-preload", action="store_true", help="Fork without loading shared state first")
+    parser.add_argument("--no-freeze", action="store_true", help="Skip gc.freeze() after preloading")
+    parser.add_argument(
+        "--load-per-worker", action="store_true",
+        help="Load shared state in each worker after fork instead (memory comparison baseline)",
+    )
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    if not hasattr(os, "fork"):
+        sys.exit("backend.prefork needs os.fork(); use uvicorn --workers on this platform")
+
+    logging.basicConfig(level=args.log_level.upper(), format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    sock = _bind_socket(args.host, args.port)
+
+    from .main import app
+
+    if not args.no_preload and not args.load_per_worker:
+        from .services.preload import preload_shared_state
+
+        report = preload_shared_state(freeze=not args.no_freeze)
+        memory = report["master_memory"] or {}
+        logger.info(
+            "Master preloaded in %.0fms, RSS %.1f MiB, forking %d workers",
+            report["duration_ms"],
+            memory.get("rss_kb", 0) / 1024,
+            args.workers,
+        )
+
+    sys.exit(PreforkMaster(app, sock, args.workers, args.log_level, args.load_per_worker).run())
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 import httpx
 
 from ..models import NormalizedData
+from ..utils.request_budget import allow_retry, budget_timeout
 from ..utils.retry import DataNotAvailableError
 
 logger = logging.getLogger(__name__)
@@ -90,7 +91,7 @@ class BaseProvider(ABC):
 
         for attempt in range(self.MAX_RETRIES):
             try:
-                response = await client.get(url, **kwargs, timeout=self.timeout)
+                response = await client.get(url, **kwargs, timeout=budget_timeout(self.timeout))
 
                 # Check for rate limiting
                 if response.status_code == 429:
@@ -107,7 +108,9 @@ class BaseProvider(ABC):
 
                 if status == 429:
                     # Rate limited - wait and retry
-                    continue
+                    if allow_retry(label=f"{self.provider_name} rate-limited request"):
+                        continue
+                    raise DataNotAvailableError(f"Rate limited by {self.provider_name}, retry budget exhausted")
                 elif status in (404, 403):
                     # Not found or forbidden - don't retry
                     raise DataNotAvailableError(
@@ -115,7 +118,7 @@ class BaseProvider(ABC):
                     )
                 elif status >= 500:
                     # Server error - retry
-                    if attempt < self.MAX_RETRIES - 1:
+                    if attempt < self.MAX_RETRIES - 1 and allow_retry(label=f"{self.provider_name} {url}"):
                         logger.warning(f"Server error {status}, retrying...")
                         continue
                     raise DataNotAvailableError(f"Server error {status} after {self.MAX_RETRIES} retries")
@@ -125,7 +128,7 @@ class BaseProvider(ABC):
 
             except (httpx.ConnectError, httpx.TimeoutException, httpx.ReadTimeout) as e:
                 last_error = e
-                if attempt < self.MAX_RETRIES - 1:
+                if attempt < self.MAX_RETRIES - 1 and allow_retry(label=f"{self.provider_name} {url}"):
                     logger.warning(f"Connection error, retrying... (attempt {attempt + 1})")
                     continue
                 raise DataNotAvailableError(f"Connection failed after {self.MAX_RETRIES} retries: {str(e)}")
@@ -160,7 +163,7 @@ class BaseProvider(ABC):
 
         for attempt in range(self.MAX_RETRIES):
             try:
-                response = await client.post(url, **kwargs, timeout=self.timeout)
+                response = await client.post(url, **kwargs, timeout=budget_timeout(self.timeout))
                 response.raise_for_status()
                 return response
 
@@ -170,7 +173,7 @@ class BaseProvider(ABC):
 
                 if status in (404, 403):
                     raise DataNotAvailableError(f"API returned {status}")
-                elif status >= 500 and attempt < self.MAX_RETRIES - 1:
+                elif status >= 500 and attempt < self.MAX_RETRIES - 1 and allow_retry(label=f"{self.provider_name} {url}"):
                     logger.warning(f"Server error {status}, retrying...")
                     continue
                 elif status >= 500:
@@ -180,7 +183,7 @@ class BaseProvider(ABC):
 
             except (httpx.ConnectError, httpx.TimeoutException) as e:
                 last_error = e
-                if attempt < self.MAX_RETRIES - 1:
+                if attempt < self.MAX_RETRIES - 1 and allow_retry(label=f"{self.provider_name} {url}"):
                     logger.warning(f"Connection error, retrying...")
                     continue
                 raise DataNotAvailableError(f"Connection failed: {str(e)}")
@@ -565,7 +565,7 @@ class BISProvider(BaseProvider):
 
         # Loop through each country
         # Use shared HTTP client pool for better performance
-        client = get_http_client()
+        client = get_http_client("BIS")
         for country_code_raw in country_list:
             country_code = self._country_code(country_code_raw)
 
@@ -848,7 +848,7 @@ class BISProvider(BaseProvider):
         frequency = "Q"
 
         # Use shared HTTP client pool for better performance
-        client = get_http_client()
+        client = get_http_client("BIS")
         # GLI query - just frequency, no country filter
         url = f"{self.base_url}/data/WS_GLI/{frequency}"
         params = {}
@@ -94,7 +94,7 @@ class CoinGeckoProvider(BaseProvider):
         Handles rate limiting (429) gracefully.
         """
         # Use shared HTTP client pool for better performance
-        client = get_http_client()
+        client = get_http_client("COINGECKO")
         request_state = dict(params or {})
         for attempt in range(max_retries):
             # Build URL with current API key state (may change if key is invalid)
@@ -10,8 +10,10 @@ import re
 import httpx
 
 from ..config import get_settings
+from ..exceptions import DataProviderError, ProviderRateLimitError
 from ..services.http_pool import get_http_client
 from ..models import DataPoint, Metadata, NormalizedData
+from ..utils.processing_steps import get_processing_tracker
 from .comtrade_metadata import (
     COUNTRY_CODE_MAPPINGS,
     HS_CODE_MAPPINGS,
@@ -30,6 +32,25 @@ logger = logging.getLogger(__name__)
 MAX_RETRIES = 5  # Increased from 3 to handle Comtrade API instability
 RETRY_DELAY_BASE = 2.0  # Increased from 1.0 for more conservative backoff
 RATE_LIMIT_STATUS = 429
+AUTH_ERROR_STATUSES = {401, 403}
+
+# Request packing: Comtrade accepts comma-separated reporter/partner code lists
+MAX_RECORDS_PER_CALL = 100_000  # Per-call record cap of the data API
+MAX_CODES_PER_PARAM = 50  # Keep reporterCode/partnerCode lists to a sane URL length
+RECORDS_PER_CELL_ESTIMATE = 4  # Headroom for breakdown rows per reporter/partner/period/flow
+
+# Territories that do not report to UN Comtrade themselves
+# Taiwan must be queried from the partner perspective (partner code 490)
+NON_REPORTING_TERRITORIES = {
+    "158": "Taiwan",
+    "490": "Taiwan",  # Alternative Taiwan code
+}
+
+
+def _normalize_reporter_code(code: object) -> str:
+    """Zero-pad a numeric reporter code; responses return 36 for the planned "036"."""
+    text = str(code).strip()
+    return text.zfill(3) if text.isdigit() else text
 
 
 class ComtradeProvider(BaseProvider):
@@ -414,70 +435,103 @@ class ComtradeProvider(BaseProvider):
 
         return list(merged.values())
 
-    async def _fetch_single_reporter_data(
+    @staticmethod
+    def _plan_trade_batches(
+        reporter_codes: List[str],
+        partner_codes: List[str],
+        period_chunks: List[str],
+        flow_code: str,
+    ) -> List[Tuple[List[str], str, str]]:
+        """Pack reporter/partner codes into as few API calls as Comtrade allows.
+
+        Comtrade accepts comma-separated reporterCode and partnerCode lists, so a
+        reporter × partner × period fan-out collapses into a handful of calls.
+        Batches are sized so that the estimated record count stays under the
+        per-call record cap and each code list stays a reasonable URL length.
+
+        Returns:
+            List of (reporter code batch, comma-separated partner codes, period param)
+        """
+        if not reporter_codes or not partner_codes or not period_chunks:
+            return []
+
+        max_periods = max(len(chunk.split(",")) for chunk in period_chunks)
+        flow_count = max(1, len(flow_code.split(",")))
+        records_per_pair = max_periods * flow_count * RECORDS_PER_CELL_ESTIMATE
+        max_pairs = max(1, MAX_RECORDS_PER_CALL // records_per_pair)
+
+        # Partners merge into one series per reporter anyway, so pack them first.
+        partner_size = max(1, min(len(partner_codes), MAX_CODES_PER_PARAM, max_pairs))
+        reporter_size = max(1, min(len(reporter_codes), MAX_CODES_PER_PARAM, max_pairs // partner_size))
+
+        reporter_batches = [
+            reporter_codes[i:i + reporter_size]
+            for i in range(0, len(reporter_codes), reporter_size)
+        ]
+        partner_batches = [
+            ",".join(partner_codes[i:i + partner_size])
+            for i in range(0, len(partner_codes), partner_size)
+        ]
+        return [
+            (reporter_batch, partner_param, period_param)
+            for reporter_batch in reporter_batches
+            for partner_param in partner_batches
+            for period_param in period_chunks
+        ]
+
+    @staticmethod
+    def _warn_non_reporting_territory(reporter_code: str) -> None:
+        """Explain how to query a territory that does not report to Comtrade."""
+        territory_name = NON_REPORTING_TERRITORIES[reporter_code]
+        logger.warning(
+            f"{territory_name} does not report trade data to UN Comtrade. "
+            f"To get {territory_name} trade data, use partner perspective: "
+            f"For {territory_name} exports: query partner imports FROM {territory_name} (partner code 490). "
+            f"For {territory_name} imports: query partner exports TO {territory_name} (partner code 490). "
+            f"Returning empty result - consider querying major trading partners (China, Japan, USA)."
+        )
+
+    async def _fetch_reporter_batch(
         self,
         client: httpx.AsyncClient,
-        reporter_raw: str,
-        partner_code: Optional[str],
+        reporters: Dict[str, str],
+        partner_param: str,
         commodity_code: str,
         flow_code: str,
         period_param: str,
         freq_code: str,
     ) -> List[NormalizedData]:
-        """Fetch trade data for a single reporter country with retry logic.
+        """Fetch trade data for a packed batch of reporters in one API call.
 
-        Helper method to enable parallel fetching of multiple reporters.
-        Implements exponential backoff for rate limiting (HTTP 429).
+        Implements exponential backoff for rate limiting (HTTP 429). Errors that
+        will not go away by retrying other batches (rejected key, exhausted quota)
+        are raised so the caller can stop the remaining work; anything else is
+        logged and yields an empty result for this batch.
 
         Args:
             client: httpx AsyncClient instance
-            reporter_raw: Reporter country name or code
-            partner_code: Partner country code (can be None for world total)
+            reporters: Mapping of reporter code -> original reporter input
+            partner_param: Comma-separated partner codes
             commodity_code: Commodity code
             flow_code: Trade flow code
             period_param: Comma-separated period string
             freq_code: Frequency code (A/M/Q)
 
         Returns:
-            List of NormalizedData objects (one per flow type)
-        """
-        reporter_code = self._country_code(reporter_raw)
-
-        # Check if reporter is a known non-reporting territory
-        # Taiwan (158) does not report to UN Comtrade due to political status
-        # Data about Taiwan trade must be obtained from partner perspective
-        # (e.g., China's exports TO Taiwan, Japan's imports FROM Taiwan)
-        NON_REPORTING_TERRITORIES = {
-            "158": "Taiwan",  # Taiwan - use code 490 in partner queries
-            "490": "Taiwan",  # Alternative Taiwan code
-        }
-
-        if reporter_code in NON_REPORTING_TERRITORIES:
-            territory_name = NON_REPORTING_TERRITORIES[reporter_code]
-            logger.warning(
-                f"{territory_name} does not report trade data to UN Comtrade. "
-                f"To get {territory_name} trade data, use partner perspective: "
-                f"For {territory_name} exports: query partner imports FROM {territory_name} (partner code 490). "
-                f"For {territory_name} imports: query partner exports TO {territory_name} (partner code 490). "
-                f"Returning empty result - consider querying major trading partners (China, Japan, USA)."
-            )
-            return []
-
-        # Handle invalid regional codes that cannot be resolved
-        # (e.g., "Middle East", "Asia", "Africa" without specific country codes)
-        if partner_code is None:
-            # Only happens for regional codes that aren't mapped
-            # These should be decomposed by the query service
-            logger.warning(f"Skipping fetch for {reporter_raw}: partner code is None (invalid region?)")
-            return []
+            List of NormalizedData objects (one per reporter and flow type)
 
+        Raises:
+            DataProviderError: If Comtrade rejects the subscription key
+            ProviderRateLimitError: If the call quota is exhausted
+        """
+        reporter_label = ", ".join(reporters.values())
         params = {
             "typeCode": "C",
             "freqCode": freq_code,
             "clCode": "HS",
-            "reporterCode": reporter_code,
+            "reporterCode": ",".join(reporters),
             "period": period_param,
-            "partnerCode": partner_code,
+            "partnerCode": partner_param,
             "cmdCode": commodity_code,
             "flowCode": flow_code,
             "format": "json",
@@ -497,26 +551,38 @@ class ComtradeProvider(BaseProvider):
                 payload = response.json()
                 break  # Success, exit retry loop
             except httpx.HTTPStatusError as e:
-                if e.response.status_code == RATE_LIMIT_STATUS and attempt < MAX_RETRIES - 1:
+                status_code = e.response.status_code
+                if status_code == RATE_LIMIT_STATUS and attempt < MAX_RETRIES - 1:
                     # Rate limited: wait and retry with exponential backoff
                     delay = RETRY_DELAY_BASE * (2 ** attempt)
                     logger.warning(
-                        f"Rate limited (429) for {reporter_raw}, attempt {attempt + 1}/{MAX_RETRIES}. "
+                        f"Rate limited (429) for {reporter_label}, attempt {attempt + 1}/{MAX_RETRIES}. "
                         f"Waiting {delay}s before retry..."
                     )
                     await asyncio.sleep(delay)
                     continue
-                else:
-                    # Not a rate limit error, or final retry exhausted
-                    logger.error(
-                        f"Comtrade API error for reporter {reporter_raw}: "
-                        f"HTTP {e.response.status_code}: {str(e)}"
-                    )
-                    return []
+                if status_code == RATE_LIMIT_STATUS or (
+                    status_code == 403 and "quota" in e.response.text.lower()
+                ):
+                    raise ProviderRateLimitError(
+                        f"UN Comtrade call quota exhausted (HTTP {status_code})",
+                        provider=self.provider_name,
+                    ) from e
+                if status_code in AUTH_ERROR_STATUSES:
+                    raise DataProviderError(
+                        f"UN Comtrade rejected the subscription key (HTTP {status_code})",
+                        provider=self.provider_name,
+                    ) from e
+                # Not a rate limit or auth error
+                logger.error(
+                    f"Comtrade API error for reporter {reporter_label}: "
+                    f"HTTP {status_code}: {str(e)}"
+                )
+                return []
             except Exception as e:
                 # Other errors (network, JSON parsing, etc.)
                 logger.error(
-                    f"Comtrade API error for reporter {reporter_raw}: {type(e).__name__}: {str(e)}"
+                    f"Comtrade API error for reporter {reporter_label}: {type(e).__name__}: {str(e)}"
                 )
                 return []
 
@@ -524,6 +590,52 @@ class ComtradeProvider(BaseProvider):
         if not records:
             return []  # Return empty if no data
 
+        # Build API URL string safely
+        try:
+            url_with_params = response.request.url.copy_with(params=params)
+            api_url = str(url_with_params)
+        except Exception:
+            api_url = str(response.request.url)
+
+        if "subscription-key" in params:
+            api_url = api_url.replace(params["subscription-key"], "YOUR_KEY")
+
+        # Split a packed response back into per-reporter record sets
+        if len(reporters) == 1:
+            records_by_reporter = {next(iter(reporters)): records}
+        else:
+            planned_codes = {_normalize_reporter_code(code): code for code in reporters}
+            records_by_reporter: Dict[str, List[dict]] = defaultdict(list)
+            for record in records:
+                code = _normalize_reporter_code(record.get("reporterCode", ""))
+                records_by_reporter[planned_codes.get(code, code)].append(record)
+
+        results: List[NormalizedData] = []
+        for reporter_code, reporter_records in records_by_reporter.items():
+            results.extend(
+                self._build_reporter_series(
+                    reporter_records,
+                    reporters.get(reporter_code, reporter_code),
+                    reporter_code,
+                    commodity_code,
+                    flow_code,
+                    freq_code,
+                    api_url,
+                )
+            )
+        return results
+
+    @staticmethod
+    def _build_reporter_series(
+        records: List[dict],
+        reporter_raw: str,
+        reporter_code: str,
+        commodity_code: str,
+        flow_code: str,
+        freq_code: str,
+        api_url: str,
+    ) -> List[NormalizedData]:
+        """Normalize one reporter's Comtrade records into one series per flow."""
         # IMPROVED DEDUPLICATION: Include cmdCode in key to prevent non-total values
         # from overwriting total values when querying for TOTAL trade
         dedup_map: Dict[tuple, dict] = {}
@@ -563,16 +675,6 @@ class ComtradeProvider(BaseProvider):
         for record in dedup_map.values():
             grouped[record.get("flowDesc", "Trade")].append(record)
 
-        # Build API URL string safely
-        try:
-            url_with_params = response.request.url.copy_with(params=params)
-            api_url = str(url_with_params)
-        except Exception:
-            api_url = str(response.request.url)
-
-        if "subscription-key" in params:
-            api_url = api_url.replace(params["subscription-key"], "YOUR_KEY")
-
         # Build results for this reporter
         results = []
         for flow_desc, flow_records in grouped.items():
@@ -945,45 +1047,94 @@ class ComtradeProvider(BaseProvider):
         if not period_chunks:
             return []
 
+        # Resolve reporters once; drop those that cannot produce data.
+        reporter_codes: Dict[str, str] = {}
+        for reporter_raw in reporter_list:
+            reporter_code = self._country_code(reporter_raw)
+            if reporter_code is None:
+                logger.warning(f"Skipping Comtrade reporter '{reporter_raw}': no UN country code")
+                continue
+            if reporter_code in NON_REPORTING_TERRITORIES:
+                self._warn_non_reporting_territory(reporter_code)
+                continue
+            reporter_codes.setdefault(reporter_code, reporter_raw)
+
+        plan = self._plan_trade_batches(list(reporter_codes), partner_codes, period_chunks, flow_code)
+        if not plan:
+            return []
+
         # Use shared HTTP client pool for better performance (timeout passed per-request)
-        client = get_http_client()
-        # Fetch combinations with bounded concurrency to reduce 429 bursts.
-        # Comtrade applies aggressive short-window rate limits.
+        client = get_http_client("COMTRADE")
+        # Bounded worker pipeline: a fixed set of workers pulls planned calls one
+        # at a time, so large fan-outs never create more pending requests than
+        # the concurrency limit. Comtrade applies aggressive short-window rate limits.
         max_concurrent_requests = 1 if freq_code == "A" else 2
-        semaphore = asyncio.Semaphore(max_concurrent_requests)
-
-        async def _guarded_fetch(
-            reporter_raw: str,
-            partner_code: str,
-            period_param: str,
-        ) -> List[NormalizedData]:
-            async with semaphore:
-                return await self._fetch_single_reporter_data(
+        pending = iter(plan)
+        merged: List[NormalizedData] = []
+        completed = 0
+        tracker = get_processing_tracker()
+        logger.info(
+            "Comtrade plan: %d reporter(s) × %d partner(s) × %d period chunk(s) packed into %d call(s)",
+            len(reporter_codes),
+            len(partner_codes),
+            len(period_chunks),
+            len(plan),
+        )
+
+        async def _worker() -> None:
+            nonlocal merged, completed
+            for reporter_batch, partner_param, period_param in pending:
+                series = await self._fetch_reporter_batch(
                     client,
-                    reporter_raw,
-                    partner_code,
+                    {code: reporter_codes[code] for code in reporter_batch},
+                    partner_param,
                     commodity_code,
                     flow_code,
                     period_param,
                     freq_code,
                 )
+                # Fold each batch into the running merge instead of holding
+                # every partial result until the end.
+                if series:
+                    merged = self._merge_series_segments(merged + series)
+                completed += 1
+                if tracker:
+                    tracker.add_step(
+                        step="fetching_data",
+                        description=f"📊 Retrieved Comtrade batch {completed}/{len(plan)}",
+                        status="completed" if completed == len(plan) else "in-progress",
+                        metadata={
+                            "provider": self.provider_name,
+                            "completed_calls": completed,
+                            "total_calls": len(plan),
+                            "series": len(merged),
+                        },
+                    )
 
-        tasks = [
-            _guarded_fetch(reporter_raw, partner_code, period_param)
-            for reporter_raw in reporter_list
-            for partner_code in partner_codes
-            for period_param in period_chunks
+        workers = [
+            asyncio.create_task(_worker())
+            for _ in range(min(max_concurrent_requests, len(plan)))
         ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException as exc:
+            # Auth/quota errors (or cancellation) stop all remaining calls.
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if tracker and isinstance(exc, DataProviderError):
+                tracker.emit_error(
+                    "rate_limited" if isinstance(exc, ProviderRateLimitError) else "error",
+                    exc.message,
+                    metadata={
+                        "provider": self.provider_name,
+                        "completed_calls": completed,
+                        "total_calls": len(plan),
+                    },
+                )
+            raise
 
-        # Wait for all requests to complete
-        results_list = await asyncio.gather(*tasks)
-
-        # Flatten results (each task returns a list)
-        all_results = []
-        for result in results_list:
-            all_results.extend(result)
-
-        return self._merge_series_segments(all_results)
+        return merged
 
     async def fetch_trade_balance(
         self,
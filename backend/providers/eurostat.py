@@ -395,7 +395,7 @@ class EurostatProvider(BaseProvider):
             logger.info(f"🔧 Applied youth unemployment filter: AGE=Y15-24")
 
         # Use shared HTTP client pool for better performance
-        client = get_http_client()
+        client = get_http_client("EUROSTAT")
         try:
             response = await client.get(data_url, params=query_params, timeout=30.0)
             response.raise_for_status()
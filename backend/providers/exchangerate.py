@@ -90,7 +90,7 @@ class ExchangeRateProvider(BaseProvider):
 
         try:
             # Use shared HTTP client pool for better performance
-            client = get_http_client()
+            client = get_http_client("EXCHANGERATE")
             full_url = f"{self.base_url}/latest/{base_code}"
             logger.info(f"📡 Requesting: {full_url}")
             response = await client.get(full_url, timeout=15.0)
@@ -236,7 +236,7 @@ class ExchangeRateProvider(BaseProvider):
 
         try:
             # Use shared HTTP client pool for better performance
-            client = get_http_client()
+            client = get_http_client("EXCHANGERATE")
             response = await client.get(
                 f"https://v6.exchangerate-api.com/v6/{self.api_key}/history/{base_code}/{year}/{month}/{day}",
                 timeout=15.0
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
@@ -15,6 +19,16 @@ from .base import BaseProvider
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _StoredObservations:
+    """Raw FRED observations kept for incremental (delta) pulls."""
+
+    observation_start: Optional[str]  # Requested start (None = full history)
+    observations: List[Dict[str, Any]]
+    vintage: Optional[str]  # realtime_start reported by FRED for the last pull
+    full_pull_at: float
+
+
 class FREDProvider(BaseProvider):
     """FRED (Federal Reserve Economic Data) provider.
 
@@ -314,6 +328,15 @@ class FREDProvider(BaseProvider):
         "Semiannual": "semiannual",
     }
 
+    # Series info (title, units, frequency, seasonal adjustment) rarely changes
+    SERIES_INFO_TTL = 86400  # 24 hours
+    # Observations re-pulled before the last stored date on a delta fetch so
+    # recent revisions are picked up
+    REVISION_WINDOW_OBSERVATIONS = 12
+    # Force a full observation pull periodically so deeper revisions are picked up
+    OBSERVATIONS_FULL_REFRESH_SECONDS = 7 * 86400  # 7 days
+    MAX_OBSERVATION_STORE_ENTRIES = 256
+
     @property
     def provider_name(self) -> str:
         """Return canonical provider name for logging and routing."""
@@ -330,6 +353,10 @@ class FREDProvider(BaseProvider):
         self.metadata_search = metadata_search_service  # Optional: for future integration
         # Cache for dynamic series search results to avoid redundant API calls
         self._search_cache: Dict[str, str] = {}
+        # Long-TTL series info cache: series_id -> (expires_at, info)
+        self._series_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Untransformed observations per series_id for incremental pulls (LRU)
+        self._observation_store: "OrderedDict[str, _StoredObservations]" = OrderedDict()
 
     async def _fetch_data(self, **params) -> NormalizedData | list[NormalizedData]:
         """Implementation of BaseProvider's abstract method.
@@ -357,7 +384,7 @@ class FREDProvider(BaseProvider):
             return []
 
         try:
-            client = get_http_client()
+            client = get_http_client("FRED")
             response = await client.get(
                 f"{self.base_url}/series/search",
                 params={
@@ -740,20 +767,16 @@ class FREDProvider(BaseProvider):
 
         return data
 
-    async def fetch_series(
-        self, params: Dict[str, Any]
-    ) -> NormalizedData:
-        # Use async resolver with dynamic search fallback (GENERAL solution)
-        target_series, transformation = await self._resolve_series_id_async(
-            params.get("indicator"), params.get("seriesId")
-        )
+    async def _get_series_info(self, client: httpx.AsyncClient, series_id: str) -> Dict[str, Any]:
+        """Return series info from the long-TTL cache, fetching it on a miss."""
+        cached = self._series_info_cache.get(series_id)
+        if cached and cached[0] > time.time():
+            return cached[1]
 
-        # Use shared HTTP client pool for better performance
-        client = get_http_client()
         info_response = await client.get(
             f"{self.base_url}/series",
             params={
-                "series_id": target_series,
+                "series_id": series_id,
                 "api_key": self.api_key,
                 "file_type": "json",
             },
@@ -762,8 +785,88 @@ class FREDProvider(BaseProvider):
         info_response.raise_for_status()
         info_payload = info_response.json()
         if not info_payload.get("seriess"):
-            raise DataNotAvailableError(f"FRED series '{target_series}' not found. Please check the series ID or try a different indicator.")
+            raise DataNotAvailableError(f"FRED series '{series_id}' not found. Please check the series ID or try a different indicator.")
         info = info_payload["seriess"][0]
+        self._series_info_cache[series_id] = (time.time() + self.SERIES_INFO_TTL, info)
+        return info
+
+    async def _request_observations(
+        self, client: httpx.AsyncClient, obs_params: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch raw observations and the vintage (realtime_start) they reflect."""
+        obs_response = await client.get(
+            f"{self.base_url}/series/observations", params=obs_params, timeout=15.0
+        )
+        obs_response.raise_for_status()
+        payload = obs_response.json()
+        return payload.get("observations", []), payload.get("realtime_start")
+
+    async def _get_observations(
+        self,
+        client: httpx.AsyncClient,
+        series_id: str,
+        obs_params: Dict[str, Any],
+        incremental: bool,
+    ) -> List[Dict[str, Any]]:
+        """Fetch observations, pulling only recent periods when a stored copy exists.
+
+        A delta pull re-requests the last REVISION_WINDOW_OBSERVATIONS stored
+        observations onwards and splices the result onto the stored history.
+        """
+        if not incremental:
+            observations, _ = await self._request_observations(client, obs_params)
+            return observations
+
+        start = obs_params.get("observation_start")
+        entry = self._observation_store.get(series_id)
+        covers_request = entry is not None and (
+            entry.observation_start is None
+            or (start is not None and entry.observation_start <= start)
+        )
+        fresh = entry is not None and (
+            time.time() - entry.full_pull_at < self.OBSERVATIONS_FULL_REFRESH_SECONDS
+        )
+
+        if entry is not None and covers_request and fresh and entry.observations:
+            delta_start = entry.observations[-self.REVISION_WINDOW_OBSERVATIONS:][0]["date"]
+            delta, vintage = await self._request_observations(
+                client, {**obs_params, "observation_start": delta_start}
+            )
+            entry.observations = [
+                obs for obs in entry.observations if obs["date"] < delta_start
+            ] + [obs for obs in delta if obs.get("date")]
+            entry.vintage = vintage or entry.vintage
+            self._observation_store.move_to_end(series_id)
+            logger.info(
+                "FRED delta pull for %s: %d observations since %s (vintage %s)",
+                series_id, len(delta), delta_start, entry.vintage,
+            )
+            if start is None:
+                return list(entry.observations)
+            return [obs for obs in entry.observations if obs["date"] >= start]
+
+        observations, vintage = await self._request_observations(client, obs_params)
+        self._observation_store[series_id] = _StoredObservations(
+            observation_start=start,
+            observations=[obs for obs in observations if obs.get("date")],
+            vintage=vintage,
+            full_pull_at=time.time(),
+        )
+        self._observation_store.move_to_end(series_id)
+        while len(self._observation_store) > self.MAX_OBSERVATION_STORE_ENTRIES:
+            self._observation_store.popitem(last=False)
+        return observations
+
+    async def fetch_series(
+        self, params: Dict[str, Any]
+    ) -> NormalizedData:
+        # Use async resolver with dynamic search fallback (GENERAL solution)
+        target_series, transformation = await self._resolve_series_id_async(
+            params.get("indicator"), params.get("seriesId")
+        )
+
+        # Use shared HTTP client pool for better performance
+        client = get_http_client("FRED")
 
         obs_params = {
             "series_id": target_series,
@@ -779,11 +882,22 @@ class FREDProvider(BaseProvider):
         if transformation:
             obs_params["units"] = transformation
 
-        obs_response = await client.get(
-            f"{self.base_url}/series/observations", params=obs_params, timeout=15.0
+        # Delta pulls only for open-ended, untransformed requests: transformed
+        # values depend on history outside the requested window.
+        incremental = not transformation and not params.get("endDate")
+
+        # Series info and observations are independent - fetch them concurrently
+        info_result, obs_result = await asyncio.gather(
+            self._get_series_info(client, target_series),
+            self._get_observations(client, target_series, obs_params, incremental),
+            return_exceptions=True,
         )
-        obs_response.raise_for_status()
-        observations = obs_response.json().get("observations", [])
+        if isinstance(info_result, BaseException):
+            raise info_result
+        if isinstance(obs_result, BaseException):
+            raise obs_result
+        info = info_result
+        observations = obs_result
 
         # Build API URL for metadata (without exposing actual API key)
         api_url_params = {
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 import asyncio
 import logging
 import re
@@ -9,7 +9,10 @@ import httpx
 
 from ..config import get_settings
 from ..services.http_pool import get_http_client
+from ..services.imf_datamapper_cache import NOT_MODIFIED_STATUS, get_datamapper_cache
+from ..services.request_hedging import hedged_get
 from ..models import Metadata, NormalizedData
+from ..utils.request_budget import allow_retry, budget_timeout
 from ..utils.retry import DataNotAvailableError
 from ..services.indicator_translator import get_indicator_translator
 from .base import BaseProvider
@@ -545,13 +548,20 @@ class IMFProvider(BaseProvider):
             end_year=int(end_year) if end_year else None,
         )
 
-    async def _retry_request(self, url: str, max_retries: int = 3, initial_delay: float = 1.0):
+    async def _retry_request(
+        self,
+        url: str,
+        max_retries: int = 3,
+        initial_delay: float = 1.0,
+        headers: Optional[Dict[str, str]] = None,
+    ):
         """Execute HTTP request with exponential backoff retry logic.
 
         Args:
             url: URL to request
             max_retries: Maximum number of retry attempts
             initial_delay: Initial delay in seconds (doubles on each retry)
+            headers: Extra request headers (e.g., conditional revalidation headers)
 
         Returns:
             httpx.Response object
@@ -562,11 +572,15 @@ class IMFProvider(BaseProvider):
         last_error = None
 
         # Use shared HTTP client pool for better performance
-        client = get_http_client()
+        client = get_http_client("IMF")
         for attempt in range(max_retries):
             try:
                 logger.info(f"IMF API request (attempt {attempt + 1}/{max_retries}): {url}")
-                response = await client.get(url, timeout=60.0)
+                response = await hedged_get(
+                    client, url, provider="IMF", headers=headers, timeout=budget_timeout(60.0)
+                )
+                if response.status_code == NOT_MODIFIED_STATUS:
+                    return response  # Conditional request: cached payload is still current
                 response.raise_for_status()
                 return response
 
@@ -574,19 +588,72 @@ class IMFProvider(BaseProvider):
                 last_error = e
 
                 # Log the error
-                if attempt < max_retries - 1:
-                    delay = initial_delay * (2 ** attempt)
+                delay = initial_delay * (2 ** attempt)
+                if attempt < max_retries - 1 and allow_retry(delay, f"IMF {url}"):
                     logger.warning(
                         f"IMF API request failed (attempt {attempt + 1}/{max_retries}): {e}. "
                         f"Retrying in {delay:.1f}s..."
                     )
                     await asyncio.sleep(delay)
                 else:
-                    logger.error(f"IMF API request failed after {max_retries} attempts: {e}")
+                    logger.error(f"IMF API request failed after {attempt + 1} attempts: {e}")
+                    break
 
         # All retries exhausted
         raise last_error
 
+    async def _fetch_indicator_payload(
+        self,
+        indicator_code: str,
+        max_retries: int = 3,
+        initial_delay: float = 1.0,
+    ) -> Dict[str, Any]:
+        """Fetch the all-countries DataMapper payload for an indicator.
+
+        Payloads are served from the DataMapper cache when enabled, so any country
+        subset of an already-downloaded indicator is answered without a request.
+        """
+        url = f"{self.base_url}/{indicator_code}"
+        if not get_settings().use_imf_payload_cache:
+            response = await self._retry_request(url, max_retries=max_retries, initial_delay=initial_delay)
+            return response.json()
+
+        return await get_datamapper_cache().get_json(
+            indicator_code,
+            lambda headers: self._retry_request(
+                url,
+                max_retries=max_retries,
+                initial_delay=initial_delay,
+                headers=headers,
+            ),
+        )
+
+    async def _probe_alternative_codes(
+        self,
+        alternative_codes: List[str],
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Probe alternative indicator codes concurrently; the first code with data wins."""
+
+        async def _probe(code: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+            try:
+                payload = await self._fetch_indicator_payload(code, max_retries=2, initial_delay=0.6)
+            except Exception:
+                return None
+            if "values" in payload and code in payload["values"]:
+                return code, payload
+            return None
+
+        probes = [asyncio.create_task(_probe(code)) for code in alternative_codes]
+        try:
+            for next_probe in asyncio.as_completed(probes):
+                result = await next_probe
+                if result is not None:
+                    return result
+            return None
+        finally:
+            for probe in probes:
+                probe.cancel()
+
     def _indicator_code(self, indicator: str) -> Optional[str]:
         """Get IMF indicator code from common indicator name or validate raw code."""
         key = indicator.upper().replace(" ", "_")
@@ -740,6 +807,7 @@ class IMFProvider(BaseProvider):
 
         This method is optimized for multi-country queries - it makes a single API call
         that returns data for ALL countries, then filters to the requested countries.
+        The all-countries payload is cached, so later country subsets are served locally.
 
         Args:
             indicator: Indicator name (e.g., "GDP", "UNEMPLOYMENT") or IMF code
@@ -755,12 +823,9 @@ class IMFProvider(BaseProvider):
         # Convert all country names to IMF codes
         country_codes = [self._country_code(country) for country in countries]
 
-        # Fetch data with retry logic
-        url = f"{self.base_url}/{indicator_code}"
-
+        # Fetch data with retry logic (one all-countries payload per indicator)
         try:
-            response = await self._retry_request(url, max_retries=3, initial_delay=1.0)
-            payload = response.json()
+            payload = await self._fetch_indicator_payload(indicator_code, max_retries=3, initial_delay=1.0)
         except Exception as e:
             raise RuntimeError(
                 f"Failed to fetch IMF indicator {indicator_code} after retries. "
@@ -774,30 +839,22 @@ class IMFProvider(BaseProvider):
                 primary_code=indicator_code,
                 requested_country_codes=country_codes,
             )
-            for alternative_code in alternative_codes:
-                alt_url = f"{self.base_url}/{alternative_code}"
-                try:
-                    alt_response = await self._retry_request(alt_url, max_retries=2, initial_delay=0.6)
-                    alt_payload = alt_response.json()
-                except Exception:
-                    continue
-
-                if "values" in alt_payload and alternative_code in alt_payload["values"]:
-                    logger.info(
-                        "IMF indicator fallback resolved %s -> %s for query '%s'",
-                        indicator_code,
-                        alternative_code,
-                        indicator,
-                    )
-                    indicator_code = alternative_code
-                    indicator_label = self._friendly_indicator_label(indicator, alternative_code)
-                    payload = alt_payload
-                    break
-            else:
+            resolved = await self._probe_alternative_codes(alternative_codes)
+            if resolved is None:
                 raise DataNotAvailableError(
                     f"IMF indicator {indicator_code} not found in response"
                 )
 
+            alternative_code, payload = resolved
+            logger.info(
+                "IMF indicator fallback resolved %s -> %s for query '%s'",
+                indicator_code,
+                alternative_code,
+                indicator,
+            )
+            indicator_code = alternative_code
+            indicator_label = self._friendly_indicator_label(indicator, alternative_code)
+
         all_country_data = payload["values"][indicator_code]
 
         # Determine indicator name
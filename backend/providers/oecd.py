@@ -11,13 +11,14 @@ import httpx
 
 from ..config import get_settings
 from ..services.http_pool import get_http_client
+from ..services.request_hedging import hedged_get
 from ..models import Metadata, NormalizedData
+from ..utils.request_budget import budget_timeout
 from ..utils.retry import DataNotAvailableError, retry_async
 from ..services.dsd_cache import get_dimension_key_builder
 from ..services.cache import cache_service
 from ..services.rate_limiter import (
     wait_for_provider,
-    record_provider_request,
     record_provider_rate_limit_error,
     record_provider_success,
     is_provider_circuit_open,
@@ -1187,42 +1188,41 @@ class OECDProvider:
         # OECD SDMX API requires the FULL dataflow ID including DSD_XXX@DF_XXX format
         url = f"{self.base_url}/data/{agency},{dataflow},{version}/{filter_key}"
 
-        # STEP 1: Wait for rate limiter before making request
-        # This prevents hitting rate limits in the first place by enforcing delays
-        wait_delay = await wait_for_provider("OECD")
-        if wait_delay > 0:
-            logger.info(f"⏳ OECD rate limiter applied {wait_delay:.1f}s delay before request")
-
         # Wrap HTTP call with enhanced retry logic for OECD rate limiting
         # OECD has strict per-IP rate limits - we need aggressive retries
         # Use shared HTTP client pool for better performance
-        http_client = get_http_client()
+        http_client = get_http_client("OECD")
 
         async def fetch_with_retry():
-            try:
-                # Use 50s timeout - OECD SDMX API can be very slow for complex queries
-                # Research shows OECD has 60 requests/hour rate limit, so we need patience
-                response = await http_client.get(
-                    url,
-                    params=params,
-                    headers={"Accept": "application/vnd.sdmx.data+json; version=2.0.0"},
-                    timeout=50.0,
-                )
+            # Reserve a send slot from the rate limiter before every attempt.
+            # The slot is recorded as a request when granted, so concurrent OECD
+            # fetches are spaced out instead of waking together in a burst.
+            wait_delay = await wait_for_provider("OECD")
+            if wait_delay > 0:
+                logger.info(f"⏳ OECD rate limiter applied {wait_delay:.1f}s delay before request")
+
+            # Use 50s timeout - OECD SDMX API can be very slow for complex queries
+            # Research shows OECD has 60 requests/hour rate limit, so we need patience
+            response = await hedged_get(
+                http_client,
+                url,
+                provider="OECD",
+                params=params,
+                headers={"Accept": "application/vnd.sdmx.data+json; version=2.0.0"},
+                timeout=budget_timeout(50.0),
+            )
 
-                # Check for rate limiting BEFORE raise_for_status
-                if response.status_code == 429:
-                    # Record rate limit error for circuit breaker
-                    record_provider_rate_limit_error("OECD")
-                    response.raise_for_status()  # This will trigger retry logic
+            # Check for rate limiting BEFORE raise_for_status
+            if response.status_code == 429:
+                # Record rate limit error for circuit breaker
+                record_provider_rate_limit_error("OECD")
+                response.raise_for_status()  # This will trigger retry logic
 
-                response.raise_for_status()
+            response.raise_for_status()
 
-                # Success! Record it to reset circuit breaker
-                record_provider_success("OECD")
-                return response.json()
-            finally:
-                # Record this request for rate limiting purposes
-                record_provider_request("OECD")
+            # Success! Record it to reset circuit breaker
+            record_provider_success("OECD")
+            return response.json()
 
         # Use retry_async with exponential backoff and jitter for OECD:
         # - 3 attempts (original + 2 retries)
@@ -7,9 +7,10 @@ import httpx
 
 from ..config import get_settings
 from ..services.http_pool import get_http_client
+from ..services.request_hedging import hedged_get
 from ..models import Metadata, NormalizedData
 from ..utils.retry import DataNotAvailableError
-from ..services.rate_limiter import wait_for_provider, record_provider_request
+from ..services.rate_limiter import wait_for_provider
 from .base import BaseProvider
 
 logger = logging.getLogger(__name__)
@@ -859,7 +860,7 @@ class StatsCanProvider(BaseProvider):
         """
         try:
             # Use shared HTTP client pool for better performance
-            client = get_http_client()
+            client = get_http_client("STATSCAN")
             logger.info(f"📊 Fetching metadata for product {product_id}")
             response = await client.post(
                 f"{self.base_url}/getCubeMetadata",
@@ -1045,7 +1046,7 @@ class StatsCanProvider(BaseProvider):
 
         # Fetch data using coordinate
         # Use shared HTTP client pool for better performance
-        client = get_http_client()
+        client = get_http_client("STATSCAN")
         response = await client.post(
             f"{self.base_url}/getDataFromCubePidCoordAndLatestNPeriods",
             json=[{
@@ -1145,7 +1146,7 @@ class StatsCanProvider(BaseProvider):
         # Query StatsCan API for vector metadata
         logger.info(f"🔍 Querying StatsCan API for product ID of vector {vector_id}")
         # Use shared HTTP client pool for better performance
-        client = get_http_client()
+        client = get_http_client("STATSCAN")
         try:
             response = await client.post(
                 f"{self.base_url}/getSeriesInfoFromVector",
@@ -1205,7 +1206,7 @@ class StatsCanProvider(BaseProvider):
         logger.info(f"📊 Using coordinate-based query for {indicator}: product={product_id}, coord={coordinate}")
 
         # Use shared HTTP client pool for better performance
-        client = get_http_client()
+        client = get_http_client("STATSCAN")
         response = await client.post(
             f"{self.base_url}/getDataFromCubePidCoordAndLatestNPeriods",
             json=[{
@@ -1306,7 +1307,7 @@ class StatsCanProvider(BaseProvider):
         # Use extended timeout (300s = 5 minutes) to handle complex multi-province queries
         # StatsCan API can be slow, especially for batch coordinate queries
         # Use shared HTTP client pool for better performance
-        client = get_http_client()
+        client = get_http_client("STATSCAN")
         # Fetch data using the vector ID
         response = await client.post(
             f"{self.base_url}/getDataFromVectorsAndLatestNPeriods",
@@ -1452,11 +1453,13 @@ class StatsCanProvider(BaseProvider):
         """
         try:
             # Use shared HTTP client pool for better performance
-            client = get_http_client()
+            client = get_http_client("STATSCAN")
             logger.info(f"🔍 Searching StatsCan for: {keyword}")
-            response = await client.get(
+            response = await hedged_get(
+                client,
                 f"{self.base_url}/getAllCubesListLite",
-                timeout=30.0
+                provider="STATSCAN",
+                timeout=30.0,
             )
             response.raise_for_status()
             cubes = response.json()
@@ -1616,7 +1619,7 @@ class StatsCanProvider(BaseProvider):
         # Use extended timeout (300s = 5 minutes) to handle complex multi-province queries
         # StatsCan API can be slow, especially for batch coordinate queries
         # Use shared HTTP client pool for better performance
-        client = get_http_client()
+        client = get_http_client("STATSCAN")
         # Fetch data using coordinate-based query
         response = await client.post(
             f"{self.base_url}/getDataFromCubePidCoordAndLatestNPeriods",
@@ -1951,7 +1954,7 @@ class StatsCanProvider(BaseProvider):
         # Use extended timeout (300s = 5 minutes) to handle complex multi-province queries
         # StatsCan API can be slow, especially for batch coordinate queries
         # Use shared HTTP client pool for better performance
-        client = get_http_client()
+        client = get_http_client("STATSCAN")
         response = await client.post(
             f"{self.base_url}/getDataFromCubePidCoordAndLatestNPeriods",
             json=[{
@@ -2233,13 +2236,13 @@ class StatsCanProvider(BaseProvider):
         # Use extended timeout for multi-province queries (300s = 5 minutes)
         # This prevents timeouts when StatsCan API is slow
         try:
-            # Wait for rate limiter before making request
+            # Reserve a rate-limiter send slot (recorded as a request when granted)
             wait_delay = await wait_for_provider("StatsCan")
             if wait_delay > 0:
                 logger.info(f"⏳ StatsCan rate limiter applied {wait_delay:.1f}s delay")
 
             # Use shared HTTP client pool for better performance
-            client = get_http_client()
+            client = get_http_client("STATSCAN")
             response = await client.post(
                 f"{self.base_url}/getDataFromCubePidCoordAndLatestNPeriods",
                 json=coordinate_requests,  # Send array of coordinate requests
@@ -2255,9 +2258,6 @@ class StatsCanProvider(BaseProvider):
             response.raise_for_status()
             payload = response.json()
 
-            # Record this request for rate limiting
-            record_provider_request("StatsCan")
-
         except httpx.TimeoutException:
             raise DataNotAvailableError(
                 f"StatsCan API timeout after 300 seconds for {len(coordinate_requests)} provinces. "
@@ -823,7 +823,7 @@ class WorldBankProvider(BaseProvider):
         }
 
         # Use shared HTTP client pool for better performance
-        client = get_http_client()
+        client = get_http_client("WORLDBANK")
         for country_code_raw in country_list:
             try:
                 country_code = self._country_code(country_code_raw)
@@ -14,6 +14,7 @@ The router is designed as a general framework:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -37,6 +38,11 @@ except Exception:  # pragma: no cover - optional dependency
     SemanticRouter = None
     SEMANTIC_ROUTER_AVAILABLE = False
 
+try:
+    from semantic_router.encoders import DenseEncoder
+except Exception:  # pragma: no cover - optional dependency
+    DenseEncoder = None
+
 try:
     import litellm
 
@@ -46,6 +52,39 @@ except Exception:  # pragma: no cover - optional dependency
     LITELLM_AVAILABLE = False
 
 
+if DenseEncoder is not None:
+
+    class SharedEmbeddingEncoder(DenseEncoder):
+        """semantic-router encoder backed by the process-wide embedding service."""
+
+        type: str = "shared"
+        score_threshold: float = 0.5
+
+        def __call__(self, docs: List[Any]) -> List[List[float]]:
+            from ..services.embedding_service import get_embedding_service
+
+            return get_embedding_service().encode([str(doc) for doc in docs]).tolist()
+
+        async def acall(self, docs: List[Any]) -> List[List[float]]:
+            return await asyncio.to_thread(self.__call__, docs)
+
+else:  # pragma: no cover - optional dependency
+    SharedEmbeddingEncoder = None
+
+
+def _build_encoder(model_name: str, settings: Settings) -> Any:
+    """Reuse the shared embedding model when routing uses the same model."""
+    from ..services.embedding_service import get_embedding_service
+
+    if (
+        SharedEmbeddingEncoder is not None
+        and model_name == settings.embedding_model
+        and get_embedding_service().available
+    ):
+        return SharedEmbeddingEncoder(name=model_name)
+    return HuggingFaceEncoder(name=model_name)
+
+
 class SemanticProviderRouter:
     """Semantic provider router with LiteLLM fallback."""
 
@@ -221,7 +260,7 @@ class SemanticProviderRouter:
                 Route(name=name, utterances=utterances)
                 for name, utterances in self._ROUTE_UTTERANCES.items()
             ]
-            encoder = HuggingFaceEncoder(name=model_name)
+            encoder = _build_encoder(model_name, self.settings)
             router = SemanticRouter(
                 encoder=encoder,
                 routes=routes,
@@ -242,6 +281,10 @@ class SemanticProviderRouter:
             self.__class__._SHARED_INIT_FAILED = True
         return self._semantic_engine
 
+    def warm_up(self) -> bool:
+        """Build the semantic engine (route utterance embeddings) ahead of the first query."""
+        return self._init_semantic_engine() is not None
+
     def _semantic_route_choice(
         self,
         query: str,
@@ -96,6 +96,14 @@ class CacheService:
             self.hits += 1
             return entry.value
 
+    def get_expiry(self, key: str) -> Optional[float]:
+        """Expiry timestamp of a live entry, without counting a hit or miss."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if not entry or entry.expires_at < time.time():
+                return None
+            return entry.expires_at
+
     def delete(self, key: str) -> bool:
         """Delete a raw cache key. Returns True when key existed."""
         with self._lock:
@@ -143,6 +151,10 @@ class CacheService:
         # Set with calculated TTL (atomic operation within set method)
         self.set(key, data, ttl)
 
+    def data_key(self, provider: str, params: Dict[str, Any]) -> str:
+        """Raw key under which cache_data() stores a provider result."""
+        return self._key(provider, params)
+
     def get_data(self, provider: str, params: Dict[str, Any]) -> NormalizedData | list[NormalizedData] | None:
         key = self._key(provider, params)
         return self.get(key)
@@ -0,0 +1,405 @@
+"""
+Cache Warmer
+
+Keeps the most requested series hot in the provider data cache
+(``CacheService`` and Redis), so the first request after a TTL expiry or a
+deploy does not wait on the upstream API.
+
+Targets come from two sources:
+1. A pinned list (``CACHE_WARM_TARGETS_FILE``, by default
+   ``data/cache_warm_targets.json``)
+2. The top-N parsed intents of recent successful queries in the Supabase
+   query log (``user_queries``). Logged intents carry the parameters
+   ``_fetch_data`` settled on, so replaying them hits the same cache keys.
+
+Each cycle fetches the targets whose cached data is missing or expires within
+the refresh margin, through ``QueryService._fetch_data`` at background
+priority, so interactive requests always get rate-limiter slots first.
+Fetching stops for a provider once its rate-limit window is over the
+configured budget share or its circuit is open, and only happens inside the
+configured off-peak hours. Stats report warm coverage and every upstream
+request the warmer made.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..models import ParsedIntent
+from .http_pool import count_upstream_requests
+from .rate_limiter import (
+    PRIORITY_BACKGROUND,
+    get_provider_budget_usage,
+    is_provider_circuit_open,
+    request_priority,
+)
+from .response_cache import UNCACHEABLE_TIER, collect_data_dependencies
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TARGETS_FILE = Path(__file__).resolve().parent.parent / "data" / "cache_warm_targets.json"
+
+# True while the warmer refreshes a target that is still cached
+_refreshing_var: ContextVar[bool] = ContextVar("cache_warmer_refreshing", default=False)
+
+
+def is_refreshing_cache() -> bool:
+    """Whether provider cache reads should be skipped so the entry is fetched again."""
+    return _refreshing_var.get()
+
+
+@dataclass
+class WarmTarget:
+    """One provider request to keep cached."""
+
+    provider: str
+    indicators: List[str]
+    parameters: Dict[str, Any]
+    source: str = "config"
+    popularity: int = 0
+    expires_at: Optional[float] = None
+    last_warmed_at: Optional[float] = None
+    failures: int = 0
+    retry_after: float = 0.0
+    upstream_requests: int = 0
+
+    @property
+    def key(self) -> str:
+        return json.dumps(
+            [self.provider.upper(), self.indicators, self.parameters],
+            sort_keys=True,
+            default=str,
+        )
+
+    def to_intent(self) -> ParsedIntent:
+        return ParsedIntent(
+            apiProvider=self.provider,
+            indicators=list(self.indicators),
+            parameters=dict(self.parameters),
+            clarificationNeeded=False,
+        )
+
+
+def load_config_targets(path: Path) -> List[WarmTarget]:
+    """
+    Load pinned targets from a JSON list.
+
+    Each entry has ``provider``, ``indicators`` and ``parameters``. An optional
+    ``countries`` list expands the entry into one target per country.
+    """
+    try:
+        entries = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as exc:
+        logger.warning(f"Could not read cache warm targets from {path}: {exc}")
+        return []
+
+    targets: List[WarmTarget] = []
+    for entry in entries:
+        parameters = dict(entry.get("parameters") or {})
+        for country in entry.get("countries") or [None]:
+            target_parameters = {**parameters, "country": country} if country else parameters
+            targets.append(
+                WarmTarget(
+                    provider=entry["provider"],
+                    indicators=list(entry.get("indicators") or []),
+                    parameters=target_parameters,
+                )
+            )
+    return targets
+
+
+def rank_logged_intents(rows: Iterable[Dict[str, Any]], top_n: int) -> List[WarmTarget]:
+    """Turn query-log rows into the ``top_n`` most frequent cacheable targets."""
+    targets: Dict[str, WarmTarget] = {}
+    for row in rows:
+        intent = row.get("intent")
+        if row.get("error_message") or row.get("pro_mode") or not isinstance(intent, dict):
+            continue
+        if (
+            intent.get("clarificationNeeded")
+            or intent.get("needsDecomposition")
+            or intent.get("useProMode")
+            or not intent.get("apiProvider")
+            or not intent.get("indicators")
+        ):
+            continue
+        target = WarmTarget(
+            provider=intent["apiProvider"],
+            indicators=list(intent["indicators"]),
+            parameters={k: v for k, v in (intent.get("parameters") or {}).items() if not k.startswith("__")},
+            source="query_log",
+        )
+        target = targets.setdefault(target.key, target)
+        target.popularity += 1
+
+    ranked = sorted(targets.values(), key=lambda target: target.popularity, reverse=True)
+    return ranked[:top_n]
+
+
+def parse_hour_windows(spec: str) -> List[Tuple[int, int]]:
+    """Parse UTC hour ranges such as ``"0-6,22-24"`` (end exclusive)."""
+    windows: List[Tuple[int, int]] = []
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        windows.append((int(start), int(end or int(start) + 1)))
+    return windows
+
+
+def in_hour_windows(windows: List[Tuple[int, int]], now: datetime) -> bool:
+    """Whether ``now`` falls in any window; no windows means any time."""
+    if not windows:
+        return True
+    hour = now.astimezone(timezone.utc).hour
+    return any(start <= hour < end if start <= end else hour >= start or hour < end for start, end in windows)
+
+
+@dataclass
+class _CycleReport:
+    started_at: str
+    in_window: bool
+    targets: int = 0
+    fetched: int = 0
+    refreshed: int = 0
+    already_warm: int = 0
+    failed: int = 0
+    skipped_budget: int = 0
+    skipped_backoff: int = 0
+    deferred: int = 0
+    upstream_requests: int = 0
+    duration_ms: float = 0.0
+    skipped_providers: List[str] = field(default_factory=list)
+
+
+class CacheWarmer:
+    """Keeps popular provider requests cached ahead of user traffic."""
+
+    STARTUP_DELAY_SECONDS = 30.0
+
+    def __init__(
+        self,
+        query_service: Any,
+        top_n: int = 200,
+        refresh_margin: float = 900.0,
+        off_peak_hours: str = "",
+        max_budget_usage: float = 0.5,
+        max_fetches_per_cycle: int = 50,
+        targets_file: Optional[Path] = DEFAULT_TARGETS_FILE,
+        use_query_log: bool = True,
+        query_log_window: int = 1000,
+    ) -> None:
+        self.query_service = query_service
+        self.top_n = top_n
+        self.refresh_margin = refresh_margin
+        self.windows = parse_hour_windows(off_peak_hours)
+        self.max_budget_usage = max_budget_usage
+        self.max_fetches_per_cycle = max_fetches_per_cycle
+        self.targets_file = targets_file
+        self.use_query_log = use_query_log
+        self.query_log_window = query_log_window
+        self.targets: Dict[str, WarmTarget] = {}
+        self.cycles = 0
+        self.fetches = 0
+        self.failures = 0
+        self.upstream_requests: Dict[str, int] = {}
+        self.upstream_ms = 0.0
+        self.last_cycle: Optional[_CycleReport] = None
+
+    async def _load_query_log(self) -> List[WarmTarget]:
+        if not self.use_query_log:
+            return []
+        try:
+            from .supabase_service import get_supabase_service
+
+            rows = await get_supabase_service().get_recent_intents(limit=self.query_log_window)
+        except Exception as exc:
+            logger.debug(f"Query log unavailable for cache warming: {exc}")
+            return []
+        return rank_logged_intents(rows, self.top_n)
+
+    async def refresh_targets(self) -> List[WarmTarget]:
+        """Rebuild the target list, keeping warm state for targets already known."""
+        loaded = load_config_targets(self.targets_file) if self.targets_file else []
+        loaded.extend(await self._load_query_log())
+
+        targets: Dict[str, WarmTarget] = {}
+        for target in loaded:
+            known = self.targets.get(target.key) or targets.get(target.key)
+            if known is not None:
+                known.popularity = max(known.popularity, target.popularity)
+                target = known
+            targets[target.key] = target
+        self.targets = targets
+        # Most requested first, so a capped cycle spends its budget where it matters
+        return sorted(targets.values(), key=lambda target: target.popularity, reverse=True)
+
+    async def _warm(self, target: WarmTarget, refresh: bool) -> int:
+        """Fetch one target; returns the upstream requests it cost."""
+        token = _refreshing_var.set(refresh)
+        start = perf_counter()
+        try:
+            with request_priority(PRIORITY_BACKGROUND), \
+                    collect_data_dependencies() as dependencies, \
+                    count_upstream_requests() as upstream:
+                try:
+                    await self.query_service._fetch_data(target.to_intent())  # pylint: disable=protected-access
+                    failed = False
+                except Exception as exc:
+                    logger.info(f"Cache warm failed for {target.provider} {target.indicators}: {exc}")
+                    failed = True
+        finally:
+            _refreshing_var.reset(token)
+
+        now = time.time()
+        cost = sum(upstream.values())
+        for pool, count in upstream.items():
+            self.upstream_requests[pool] = self.upstream_requests.get(pool, 0) + count
+        self.upstream_ms += (perf_counter() - start) * 1000
+        self.fetches += 1
+        target.upstream_requests += cost
+
+        expiries = [
+            dependency["expires_at"] for dependency in dependencies if dependency["tier"] != UNCACHEABLE_TIER
+        ]
+        if failed or not expiries:
+            self.failures += 1
+            target.failures += 1
+            target.retry_after = now + self.refresh_margin * 2 ** min(target.failures, 6)
+        else:
+            target.failures = 0
+            target.expires_at = min(expiries)
+            target.last_warmed_at = now
+        return cost
+
+    async def run_cycle(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Warm every target that is cold or about to expire, within budget."""
+        now = now or datetime.now(timezone.utc)
+        report = _CycleReport(started_at=now.isoformat(), in_window=in_hour_windows(self.windows, now))
+        start = perf_counter()
+        targets = await self.refresh_targets()
+        report.targets = len(targets)
+
+        if report.in_window:
+            from .query import normalize_provider_name
+
+            over_budget: set[str] = set()
+            for target in targets:
+                current = time.time()
+                if target.expires_at is not None and target.expires_at - current > self.refresh_margin:
+                    report.already_warm += 1
+                    continue
+                if target.retry_after > current:
+                    report.skipped_backoff += 1
+                    continue
+                provider = normalize_provider_name(target.provider)
+                if provider in over_budget or is_provider_circuit_open(provider) or (
+                    get_provider_budget_usage(provider) >= self.max_budget_usage
+                ):
+                    over_budget.add(provider)
+                    report.skipped_budget += 1
+                    continue
+                if report.fetched >= self.max_fetches_per_cycle:
+                    report.deferred += 1
+                    continue
+
+                refresh = target.expires_at is not None and target.expires_at > current
+                failures = target.failures
+                report.upstream_requests += await self._warm(target, refresh)
+                report.fetched += 1
+                report.refreshed += int(refresh)
+                report.failed += int(target.failures > failures)
+            report.skipped_providers = sorted(over_budget)
+
+        report.duration_ms = round((perf_counter() - start) * 1000, 1)
+        self.cycles += 1
+        self.last_cycle = report
+        if report.fetched:
+            logger.info(
+                "Cache warm cycle: %d/%d targets fetched (%d upstream requests), coverage %.0f%%",
+                report.fetched,
+                report.targets,
+                report.upstream_requests,
+                self.coverage() * 100,
+            )
+        return report.__dict__
+
+    async def run_forever(self, interval: float) -> None:
+        """Run warm cycles every ``interval`` seconds until cancelled."""
+        await asyncio.sleep(self.STARTUP_DELAY_SECONDS)
+        while True:
+            try:
+                await self.run_cycle()
+            except Exception as exc:
+                logger.warning(f"Cache warm cycle failed: {exc}")
+            await asyncio.sleep(interval)
+
+    def coverage(self) -> float:
+        """Fraction of targets whose cached data is currently fresh."""
+        if not self.targets:
+            return 0.0
+        now = time.time()
+        warm = sum(1 for target in self.targets.values() if target.expires_at and target.expires_at > now)
+        return warm / len(self.targets)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get warm coverage and upstream cost statistics."""
+        now = time.time()
+        cold = [
+            target for target in self.targets.values()
+            if not target.expires_at or target.expires_at <= now
+        ]
+        return {
+            "targets": len(self.targets),
+            "query_log_targets": sum(1 for target in self.targets.values() if target.source == "query_log"),
+            "coverage": round(self.coverage(), 4),
+            "cold_targets": [
+                f"{target.provider}:{','.join(target.indicators)}"
+                for target in sorted(cold, key=lambda target: target.popularity, reverse=True)[:10]
+            ],
+            "cycles": self.cycles,
+            "fetches": self.fetches,
+            "failures": self.failures,
+            "upstream_requests": sum(self.upstream_requests.values()),
+            "upstream_requests_by_pool": dict(self.upstream_requests),
+            "upstream_ms": round(self.upstream_ms, 1),
+            "off_peak_hours": self.windows,
+            "last_cycle": self.last_cycle.__dict__ if self.last_cycle else None,
+        }
+
+
+# Global instance
+_cache_warmer: Optional[CacheWarmer] = None
+
+
+def get_cache_warmer() -> CacheWarmer:
+    """Get the global cache warmer instance."""
+    global _cache_warmer
+    if _cache_warmer is None:
+        from ..config import get_settings
+        from ..main import get_query_service
+
+        settings = get_settings()
+        _cache_warmer = CacheWarmer(
+            get_query_service(),
+            top_n=settings.cache_warm_top_n,
+            refresh_margin=settings.cache_warm_refresh_margin,
+            off_peak_hours=settings.cache_warm_off_peak_hours,
+            max_budget_usage=settings.cache_warm_max_budget_usage,
+            max_fetches_per_cycle=settings.cache_warm_max_fetches_per_cycle,
+            targets_file=Path(settings.cache_warm_targets_file) if settings.cache_warm_targets_file else DEFAULT_TARGETS_FILE,
+            use_query_log=settings.supabase_enabled,
+        )
+    return _cache_warmer
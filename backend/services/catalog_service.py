@@ -220,6 +220,31 @@ def find_concept_by_term(term: str) -> Optional[str]:
     return None
 
 
+def find_concepts_by_exact_term(term: str) -> Dict[str, str]:
+    """
+    Find every concept whose name or synonym is exactly the given term.
+
+    Returns a mapping of concept name to the tier that matched
+    ("name", "primary" or "secondary"); more than one entry means the
+    term is ambiguous in the catalog.
+    """
+    term_lower = str(term or "").strip().lower()
+    if not term_lower:
+        return {}
+
+    matches: Dict[str, str] = {}
+    for concept_name, concept_data in load_catalog().items():
+        if term_lower == concept_name.replace("_", " "):
+            matches[concept_name] = "name"
+            continue
+        synonyms = concept_data.get("synonyms", {}) or {}
+        for tier in ("primary", "secondary"):
+            if term_lower in (str(s).strip().lower() for s in (synonyms.get(tier, []) or [])):
+                matches[concept_name] = tier
+                break
+    return matches
+
+
 def is_excluded_term(term: str, concept_name: str) -> bool:
     """
     Check if a term is explicitly excluded from a concept.
@@ -492,6 +517,32 @@ def _check_coverage(coverage: Any, countries: Optional[List[str]]) -> bool:
     return False
 
 
+def provider_covers_countries(
+    concept_name: str,
+    provider: str,
+    countries: Optional[List[str]] = None,
+) -> bool:
+    """
+    Check that the catalog does not rule out a provider for a concept and countries.
+
+    False when the provider is listed as not available, or when its primary
+    series' coverage excludes one of the countries. Providers the concept
+    does not list are left to try.
+    """
+    concept = get_concept(concept_name)
+    if not concept:
+        return True  # Unknown concept, let provider try
+    if provider.lower() in (p.lower() for p in concept.get("not_available", [])):
+        return False
+
+    providers_lower = {p.lower(): info for p, info in concept.get("providers", {}).items()}
+    if provider.lower() not in providers_lower:
+        return True
+    primary = (providers_lower[provider.lower()] or {}).get("primary", {})
+    coverage = primary.get("coverage", "global") if isinstance(primary, dict) else "global"
+    return _check_coverage(coverage, countries)
+
+
 def get_best_provider(
     concept_name: str,
     countries: Optional[List[str]] = None,
@@ -19,7 +19,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Callable
+from typing import Any, Dict, List, Optional, TYPE_CHECKING, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -29,6 +29,7 @@ from pydantic import BaseModel, Field
 
 from ..config import get_settings
 from ..models import NormalizedData, ParsedIntent, QueryResponse
+from ..utils.processing_steps import get_processing_tracker
 
 if TYPE_CHECKING:
     from .query import QueryService
@@ -179,6 +180,11 @@ PROVIDER_CAPABILITIES = {
 }
 
 
+# Providers whose QueryService path fetches many countries in one call
+# (WorldBank/IMF DataMapper/OECD multi-country keys/Eurostat multi-geo)
+BATCH_CAPABLE_PROVIDERS = {"WorldBank", "IMF", "OECD", "Eurostat"}
+
+
 def select_best_provider(indicator: str, country: str = None, is_multi_country: bool = False) -> str:
     """
     Intelligently select the best provider for a given indicator and country.
@@ -260,6 +266,7 @@ class DeepAgentConfig(BaseModel):
     enable_smart_routing: bool = Field(default=True, description="Enable intelligent provider selection")
     enable_progress_tracking: bool = Field(default=True, description="Enable detailed progress tracking")
     retry_failed_tasks: bool = Field(default=True, description="Retry failed tasks with alternate providers")
+    enable_batch_fetch: bool = Field(default=True, description="Fetch all countries of a provider/indicator in one batch call")
 
 
 class DeepAgentOrchestrator:
@@ -304,6 +311,9 @@ class DeepAgentOrchestrator:
             "failed_fetches": 0,
             "retried_fetches": 0,
             "avg_parallel_tasks": 0.0,
+            "batch_requests": 0,
+            "batched_jobs": 0,
+            "batch_fallbacks": 0,
         }
 
         logger.info("Deep Agent orchestrator initialized with planning, progress tracking, and smart routing")
@@ -651,6 +661,11 @@ class DeepAgentOrchestrator:
         # Execute with concurrency limit
         semaphore = asyncio.Semaphore(self.config.max_concurrent_subagents)
         completed_count = 0
+        # Stream each job's series as soon as it arrives (no-op outside streaming requests)
+        tracker = get_processing_tracker()
+
+        def _progress() -> float:
+            return 50 + (completed_count / len(jobs)) * 40
 
         async def fetch_with_limit(job):
             nonlocal completed_count
@@ -658,7 +673,7 @@ class DeepAgentOrchestrator:
                 self.progress_tracker.update(
                     job["task_id"], TaskStatus.IN_PROGRESS,
                     f"Fetching {job['indicator']} for {job['country']}...",
-                    50 + (completed_count / len(jobs)) * 40
+                    _progress()
                 )
 
                 result = await self._fetch_single_with_retry(
@@ -668,27 +683,103 @@ class DeepAgentOrchestrator:
                     job["task_id"],
                 )
                 completed_count += 1
+                if result.get("success") and tracker:
+                    tracker.emit_series(result.get("data"), {"indicator": job["indicator"], "country": job["country"]})
 
                 status = TaskStatus.COMPLETED if result.get("success") else TaskStatus.FAILED
                 self.progress_tracker.update(
                     job["task_id"], status,
                     f"{'✓' if result.get('success') else '✗'} {job['indicator']}/{job['country']}",
-                    50 + (completed_count / len(jobs)) * 40
+                    _progress()
                 )
 
                 return {
+                    "task_id": job["task_id"],
                     "indicator": job["indicator"],
                     "country": job["country"],
                     "provider": job["provider"],
                     "result": result,
                 }
 
+        async def fetch_batch_with_limit(group):
+            nonlocal completed_count
+            provider, indicator = group[0]["provider"], group[0]["indicator"]
+            async with semaphore:
+                # Progress is reported per member task so the tracker's task counts stay accurate
+                for job in group:
+                    self.progress_tracker.update(
+                        job["task_id"], TaskStatus.IN_PROGRESS,
+                        f"Fetching {indicator}/{job['country']} ({len(group)} countries in one {provider} request)...",
+                        _progress(),
+                        metadata={"batch_size": len(group)},
+                    )
+                try:
+                    split = await self._fetch_batch(provider, indicator, group)
+                except Exception as exc:
+                    logger.warning(f"Batch fetch {provider}/{indicator} failed, falling back per country: {exc}")
+                    split = {}
+
+            outcomes = []
+            fallback_jobs = []
+            for job in group:
+                series = split.get(job["task_id"])
+                if not series:
+                    fallback_jobs.append(job)
+                    continue
+                completed_count += 1
+                self.stats["successful_fetches"] += 1
+                if tracker:
+                    tracker.emit_series(series, {"indicator": job["indicator"], "country": job["country"]})
+                self.progress_tracker.update(
+                    job["task_id"], TaskStatus.COMPLETED,
+                    f"✓ {job['indicator']}/{job['country']}",
+                    _progress()
+                )
+                outcomes.append({
+                    "task_id": job["task_id"],
+                    "indicator": job["indicator"],
+                    "country": job["country"],
+                    "provider": job["provider"],
+                    "result": {"success": True, "data": series, "error": None, "batched": True},
+                })
+
+            logger.info(f"{provider}/{indicator}: {len(outcomes)}/{len(group)} countries in one request")
+
+            # Only countries missing from the batch response are fetched individually
+            if fallback_jobs:
+                self.stats["batch_fallbacks"] += len(fallback_jobs)
+                outcomes.extend(await asyncio.gather(
+                    *[fetch_with_limit(job) for job in fallback_jobs],
+                    return_exceptions=True
+                ))
+            return outcomes
+
+        batches, single_jobs = self._plan_fetch_batches(jobs)
+        if batches:
+            logger.info(
+                f"Batch planner: {sum(len(g) for g in batches)} jobs in {len(batches)} batch requests, "
+                f"{len(single_jobs)} individual jobs"
+            )
+
         # Wait for all fetches
-        completed = await asyncio.gather(
-            *[fetch_with_limit(job) for job in jobs],
+        gathered = await asyncio.gather(
+            *[fetch_batch_with_limit(group) for group in batches],
+            *[fetch_with_limit(job) for job in single_jobs],
             return_exceptions=True
         )
 
+        # Flatten batch outcomes and restore the original job order
+        job_order = {job["task_id"]: index for index, job in enumerate(jobs)}
+        completed = []
+        for item in gathered:
+            if isinstance(item, list):
+                completed.extend(item)
+            else:
+                completed.append(item)
+        completed.sort(
+            key=lambda r: job_order.get(r.get("task_id"), len(jobs)) if isinstance(r, dict) else len(jobs)
+        )
+
         # Process results
         # CRITICAL FIX: Safely handle None results and missing keys
         data_results = []
@@ -725,6 +816,79 @@ class DeepAgentOrchestrator:
             "parallel_execution": True,
         }
 
+    def _plan_fetch_batches(
+        self,
+        jobs: List[Dict[str, Any]],
+    ) -> Tuple[List[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        Group jobs that one multi-country provider call can serve.
+
+        Returns:
+            (batches, single_jobs) - each batch shares provider and indicator
+        """
+        if not self.config.enable_batch_fetch:
+            return [], list(jobs)
+
+        groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        single_jobs: List[Dict[str, Any]] = []
+        for job in jobs:
+            if job["provider"] in BATCH_CAPABLE_PROVIDERS:
+                groups.setdefault((job["provider"], job["indicator"]), []).append(job)
+            else:
+                single_jobs.append(job)
+
+        batches: List[List[Dict[str, Any]]] = []
+        for group in groups.values():
+            if len(group) > 1:
+                batches.append(group)
+            else:
+                single_jobs.extend(group)
+        return batches, single_jobs
+
+    async def _fetch_batch(
+        self,
+        provider: str,
+        indicator: str,
+        jobs: List[Dict[str, Any]],
+    ) -> Dict[str, List[NormalizedData]]:
+        """
+        Fetch one indicator for several countries in a single provider call.
+
+        Returns:
+            Series per job task_id (empty list when the response had no series for that country)
+        """
+        from ..routing.country_resolver import CountryResolver
+        from .parameter_validator import ParameterValidator
+
+        countries = [job["country"] for job in jobs]
+        intent = ParsedIntent(
+            apiProvider=provider,
+            indicators=[indicator],
+            parameters={"countries": countries},
+            clarificationNeeded=False,
+            originalQuery=f"{indicator} for {', '.join(countries)}",
+        )
+        ParameterValidator.apply_default_time_periods(intent)
+
+        self.stats["batch_requests"] += 1
+        data = await self.query_service._fetch_data(intent)
+
+        by_country: Dict[str, List[NormalizedData]] = {}
+        for series in data or []:
+            if series is None or not series.metadata:
+                continue
+            code = CountryResolver.normalize(series.metadata.country or "")
+            if code:
+                by_country.setdefault(code, []).append(series)
+
+        split: Dict[str, List[NormalizedData]] = {}
+        for job in jobs:
+            code = CountryResolver.normalize(job["country"]) or str(job["country"]).upper()
+            split[job["task_id"]] = by_country.get(code, [])
+            if split[job["task_id"]]:
+                self.stats["batched_jobs"] += 1
+        return split
+
     async def _fetch_single_with_retry(
         self,
         indicator: str,
@@ -20,6 +20,8 @@ import httpx
 import logging
 import json
 
+from .http_cassette import cassette_transport
+
 logger = logging.getLogger(__name__)
 
 # Default cache file location
@@ -214,7 +216,7 @@ class DSDCache:
             max_retries = 2
             for attempt in range(max_retries + 1):
                 try:
-                    async with httpx.AsyncClient(timeout=90.0) as client:
+                    async with httpx.AsyncClient(timeout=90.0, transport=cassette_transport(provider.upper())) as client:
                         response = await client.get(url, params=params, headers=headers)
                         response.raise_for_status()
                         data = response.json()
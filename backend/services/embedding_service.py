@@ -0,0 +1,347 @@
+"""
+Shared Embedding Service
+
+FAISS indicator search, the ChromaDB/FAISS vector search service, the
+semantic provider router and the intent cache all embed text with the same
+MiniLM sentence-transformers model. Loading it separately in each of them
+kept two or three copies per worker and moved the multi-second load onto the
+first routed query. This module owns a single model per process:
+
+- ``get_embedding_service()`` returns the process-wide service; callers use it
+  like a ``SentenceTransformer`` (``encode``, ``get_sentence_embedding_dimension``)
+- ``warm_up()`` loads the model eagerly; the API calls it during startup
+- With ``EMBEDDING_SERVICE_URL`` set, encoding is delegated to an embedding
+  server so several uvicorn workers share one model in one process. Run it with
+  ``python -m backend.services.embedding_service --port 8765``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import httpx
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # pragma: no cover - optional dependency
+    SentenceTransformer = None
+
+DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+Texts = Union[str, Sequence[str]]
+
+
+class EmbeddingService:
+    """One lazily loaded sentence-transformers model shared by all callers."""
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        loader: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        self.model_name = model_name
+        self._loader = loader
+        self._model: Any = None
+        self._load_failed = False
+        self._load_lock = threading.Lock()
+        self.load_ms: Optional[float] = None
+        self.encode_calls = 0
+        self.texts_encoded = 0
+
+    @property
+    def backend(self) -> str:
+        return "local"
+
+    @property
+    def available(self) -> bool:
+        """True when a model is (or can be) loaded."""
+        if self._model is not None:
+            return True
+        if self._load_failed:
+            return False
+        return self._loader is not None or SentenceTransformer is not None
+
+    def _load(self) -> Any:
+        if self._model is not None or self._load_failed:
+            return self._model
+        with self._load_lock:
+            if self._model is not None or self._load_failed:
+                return self._model
+            loader = self._loader or SentenceTransformer
+            if loader is None:
+                logger.warning("⚠️  sentence-transformers not installed, embeddings unavailable")
+                self._load_failed = True
+                return None
+            try:
+                logger.info(f"📥 Loading embedding model: {self.model_name}")
+                start = perf_counter()
+                self._model = loader(self.model_name)
+                self.load_ms = (perf_counter() - start) * 1000
+                logger.info(f"✅ Embedding model {self.model_name} loaded in {self.load_ms / 1000:.2f}s")
+            except Exception as exc:
+                logger.error(f"❌ Failed to load embedding model {self.model_name}: {exc}")
+                self._load_failed = True
+        return self._model
+
+    @property
+    def model(self) -> Any:
+        """The underlying model, loading it on first access (None if unavailable)."""
+        return self._load()
+
+    def warm_up(self) -> bool:
+        """Load the model and run one encode so the first query pays nothing."""
+        model = self._load()
+        if model is None:
+            return False
+        self.encode("warm up")
+        return True
+
+    def encode(
+        self,
+        sentences: Texts,
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """Embed one text (1-D result) or a list of texts (2-D result)."""
+        model = self._load()
+        if model is None:
+            raise RuntimeError("Embedding model is not available")
+        self.encode_calls += 1
+        self.texts_encoded += 1 if isinstance(sentences, str) else len(sentences)
+        return model.encode(
+            sentences,
+            batch_size=batch_size,
+            show_progress_bar=show_progress_bar,
+            convert_to_numpy=True,
+            normalize_embeddings=normalize_embeddings,
+            **kwargs,
+        )
+
+    def get_sentence_embedding_dimension(self) -> Optional[int]:
+        model = self._load()
+        return model.get_sentence_embedding_dimension() if model is not None else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get model load and usage statistics."""
+        return {
+            "backend": self.backend,
+            "model": self.model_name,
+            "loaded": self._model is not None,
+            "load_ms": round(self.load_ms, 1) if self.load_ms is not None else None,
+            "encode_calls": self.encode_calls,
+            "texts_encoded": self.texts_encoded,
+        }
+
+
+class RemoteEmbeddingService(EmbeddingService):
+    """Embedding service that delegates encoding to a shared embedding server."""
+
+    def __init__(self, url: str, model_name: str = DEFAULT_MODEL, timeout: float = 30.0) -> None:
+        super().__init__(model_name=model_name)
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self._client = httpx.Client(timeout=timeout)
+        self._dimension: Optional[int] = None
+
+    @property
+    def backend(self) -> str:
+        return "remote"
+
+    @property
+    def available(self) -> bool:
+        return not self._load_failed
+
+    def _load(self) -> Any:
+        # No local model: the server owns it. Keep the client as the "model".
+        return self
+
+    def warm_up(self) -> bool:
+        try:
+            response = self._client.get(f"{self.url}/health")
+            response.raise_for_status()
+            info = response.json()
+        except Exception as exc:
+            logger.error(f"❌ Embedding server {self.url} unreachable: {exc}")
+            self._load_failed = True
+            return False
+        self._load_failed = False
+        self._dimension = info.get("dimension")
+        self.load_ms = info.get("load_ms")
+        logger.info(f"✅ Using shared embedding server {self.url} ({info.get('model')})")
+        return True
+
+    def encode(
+        self,
+        sentences: Texts,
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        single = isinstance(sentences, str)
+        texts: List[str] = [sentences] if single else list(sentences)
+        self.encode_calls += 1
+        self.texts_encoded += len(texts)
+        response = self._client.post(
+            f"{self.url}/embed",
+            json={"texts": texts, "batch_size": batch_size, "normalize": normalize_embeddings},
+        )
+        response.raise_for_status()
+        vectors = np.asarray(response.json()["embeddings"], dtype=np.float32)
+        return vectors[0] if single else vectors
+
+    def get_sentence_embedding_dimension(self) -> Optional[int]:
+        if self._dimension is None:
+            self.warm_up()
+        return self._dimension
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats["loaded"] = self._dimension is not None
+        stats["url"] = self.url
+        return stats
+
+
+# Global instance
+_embedding_service: Optional[EmbeddingService] = None
+_embedding_service_lock = threading.Lock()
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Get the process-wide embedding service (local model or embedding server)."""
+    global _embedding_service
+    if _embedding_service is None:
+        with _embedding_service_lock:
+            if _embedding_service is None:
+                from ..config import get_settings
+
+                settings = get_settings()
+                if settings.embedding_service_url:
+                    _embedding_service = RemoteEmbeddingService(
+                        settings.embedding_service_url, model_name=settings.embedding_model
+                    )
+                else:
+                    _embedding_service = EmbeddingService(model_name=settings.embedding_model)
+    return _embedding_service
+
+
+# Dedicated services for callers configured with a different model
+_model_services: Dict[str, EmbeddingService] = {}
+
+
+def get_embedding_service_for(model_name: Optional[str] = None) -> EmbeddingService:
+    """
+    Get an embedding service for a specific model.
+
+    Returns the shared service when ``model_name`` is unset or matches
+    EMBEDDING_MODEL. Any other model gets its own lazily loaded service (one
+    per model name), so an index built with that model is queried in the same
+    embedding space.
+    """
+    shared = get_embedding_service()
+    if not model_name or model_name == shared.model_name:
+        return shared
+    with _embedding_service_lock:
+        service = _model_services.get(model_name)
+        if service is None:
+            logger.info(f"Embedding model {model_name} differs from {shared.model_name}; loading it separately")
+            service = EmbeddingService(model_name=model_name)
+            _model_services[model_name] = service
+    return service
+
+
+def reset_embedding_service() -> None:
+    """Drop the global instances (tests)."""
+    global _embedding_service
+    _embedding_service = None
+    _model_services.clear()
+
+
+def _make_handler(service: EmbeddingService) -> type:
+    class _EmbeddingHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            if self.path != "/health":
+                self._send_json(404, {"error": "not found"})
+                return
+            self._send_json(200, {
+                "model": service.model_name,
+                "dimension": service.get_sentence_embedding_dimension(),
+                "load_ms": service.load_ms,
+            })
+
+        def do_POST(self) -> None:  # noqa: N802 - http.server naming
+            if self.path != "/embed":
+                self._send_json(404, {"error": "not found"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                vectors = service.encode(
+                    list(request.get("texts") or []),
+                    batch_size=int(request.get("batch_size", 32)),
+                    normalize_embeddings=bool(request.get("normalize", False)),
+                )
+            except Exception as exc:
+                self._send_json(400, {"error": str(exc)})
+                return
+            self._send_json(200, {"embeddings": np.asarray(vectors).tolist()})
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            logger.debug("embedding server: " + format, *args)
+
+    return _EmbeddingHandler
+
+
+def create_embedding_server(
+    service: EmbeddingService,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+) -> ThreadingHTTPServer:
+    """Build an HTTP server exposing ``/embed`` and ``/health`` for ``service``."""
+    return ThreadingHTTPServer((host, port), _make_handler(service))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the shared embedding model over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    service = EmbeddingService(model_name=args.model)
+    if not service.warm_up():
+        raise SystemExit("Embedding model could not be loaded")
+    server = create_embedding_server(service, args.host, args.port)
+    logger.info(f"🧠 Embedding server listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
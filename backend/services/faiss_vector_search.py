@@ -31,6 +31,8 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
+from .embedding_service import get_embedding_service, get_embedding_service_for
+
 logger = logging.getLogger(__name__)
 
 # Optional FAISS dependencies
@@ -89,7 +91,7 @@ class FAISSVectorSearch:
 
     def __init__(
         self,
-        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        model_name: Optional[str] = None,
         index_dir: str = "backend/data/faiss_index",
         index_name: str = "economic_indicators",
         embedding_dim: int = 384,
@@ -99,14 +101,14 @@ class FAISSVectorSearch:
         Initialize FAISS vector search.
 
         Args:
-            model_name: HuggingFace model for embeddings
+            model_name: HuggingFace model for embeddings (default: EMBEDDING_MODEL)
             index_dir: Directory to persist index files
             index_name: Name of the index (for multi-index support)
             embedding_dim: Embedding dimension (384 for all-MiniLM-L6-v2)
             default_batch_size: Default batch size for embedding generation (default: 128)
         """
         # Initialize all attributes first
-        self.model_name = model_name
+        self.model_name = model_name or get_embedding_service().model_name
         self.index_dir = Path(index_dir)
         self.index_name = index_name
         self.embedding_dim = embedding_dim
@@ -144,17 +146,14 @@ class FAISSVectorSearch:
         self._load_or_init_index()
 
     def _load_model(self):
-        """Load sentence transformer model."""
+        """Attach the embedding model (shared unless this index uses another model)."""
         try:
-            if not FAISS_AVAILABLE or SentenceTransformer is None:
+            service = get_embedding_service_for(self.model_name)
+            if not service.available:
                 logger.error("❌ Sentence transformers not available")
                 return
-
-            logger.info(f"📥 Loading embedding model: {self.model_name}")
-            start = time.time()
-            self.model = SentenceTransformer(self.model_name)
-            elapsed = time.time() - start
-            logger.info(f"✅ Model loaded in {elapsed:.2f}s")
+            self.model = service
+            logger.info(f"✅ Using embedding model: {service.model_name}")
             logger.info(f"   - Embedding dimension: {self.model.get_sentence_embedding_dimension()}")
         except Exception as e:
             logger.error(f"❌ Failed to load model: {e}", exc_info=True)
@@ -596,18 +595,12 @@ class FAISSVectorSearch:
 
 # Singleton instances
 _faiss_vector_search: Optional[FAISSVectorSearch] = None
-_embedding_model = None  # Shared embedding model across all instances
 
 
 def get_embedding_model():
-    """Get or load the shared embedding model (singleton)."""
-    global _embedding_model
-    if _embedding_model is None and SentenceTransformer is not None:
-        try:
-            _embedding_model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-        except Exception as e:
-            logger.error(f"❌ Failed to load embedding model: {e}")
-    return _embedding_model
+    """Get the shared embedding model, or None if it cannot be loaded."""
+    service = get_embedding_service()
+    return service if service.available else None
 
 
 def get_faiss_vector_search() -> FAISSVectorSearch:
@@ -0,0 +1,361 @@
+"""
+Deterministic Fast-Path Query Parser
+
+Parses simple queries ("US unemployment rate", "China GDP since 2010",
+"inflation in Germany and France 2015-2020") into a ParsedIntent without the
+LLM. A query qualifies when, after removing geography, time phrases and filler
+words, the remaining text is exactly a catalog concept name or synonym.
+
+Building blocks are the existing deterministic components:
+- CountryResolver for geography
+- find_concept_by_term / get_all_synonyms for the indicator concept
+- IndicatorResolver to confirm the concept resolves to a provider series
+- UnifiedRouter for the provider placeholder
+
+Only providers whose requests need nothing beyond indicator, geography and
+dates are eligible, and the catalog must not rule the provider out for the
+named countries. The confidence score reflects how ambiguous the parse is:
+- concept clarity: the catalog tier the phrase matched, split across every
+  concept that lists it
+- resolver certainty: the resolved series' confidence, discounted when a
+  competing series scores close to it
+- router confidence
+- a penalty when no country is named and the provider's default geography
+  is not implied (anything but single-country providers)
+
+Callers skip the LLM only when the score is at or above their threshold, and
+fall back to the LLM parser otherwise. DEFAULT_MIN_CONFIDENCE comes from the
+accuracy/coverage curve in scripts/benchmark_query_framework.py, set just
+above the highest score an unresolved or geography-less parse can reach.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models import ParsedIntent
+from ..routing.country_resolver import CountryResolver
+from ..routing.keyword_matcher import KeywordMatcher
+from ..routing.unified_router import UnifiedRouter
+from .catalog_service import (
+    find_concept_by_term,
+    find_concepts_by_exact_term,
+    get_all_synonyms,
+    get_indicator_codes,
+    provider_covers_countries,
+)
+from .indicator_resolver import get_indicator_resolver
+
+logger = logging.getLogger(__name__)
+
+_YEAR = r"(1[89]\d{2}|20\d{2})"
+
+# (pattern, kind) pairs; first match wins
+_TIME_PATTERNS: List[Tuple[re.Pattern, str]] = [
+    (re.compile(rf"\b(?:from\s+|between\s+)?{_YEAR}\s*(?:-|–|to|through|until|and)\s*{_YEAR}\b"), "range"),
+    (re.compile(rf"\bsince\s+{_YEAR}\b"), "since"),
+    (re.compile(r"\b(?:over\s+)?(?:the\s+)?(?:last|past)\s+(\d{1,2})\s+years?\b"), "last_years"),
+    (re.compile(rf"\b(?:in|for|during)\s+{_YEAR}\b"), "year"),
+]
+
+# Words that carry no indicator meaning in a simple data request
+_FILLER_WORDS = {
+    "show", "me", "get", "plot", "chart", "graph", "display", "give", "fetch", "find",
+    "what", "whats", "what's", "is", "was", "are", "the", "a", "an", "of", "for",
+    "in", "from", "to", "data", "on", "please", "latest", "historical", "history",
+    "trend", "trends", "series", "time", "annual", "yearly", "level", "levels",
+}
+
+# Only meaningful when several countries are named
+_CONNECTOR_WORDS = {"and", "vs", "versus", "&"}
+
+# Phrases that need the LLM (trade flows, analysis, decomposition, calculations)
+_LLM_ONLY_MARKERS = re.compile(
+    r"\b(?:import|imports|export|exports|trade|partner|bilateral|why|how|explain|"
+    r"forecast|predict|projection|correlat\w*|each|all|every|by\s+country|provinces?|"
+    r"states|ratio|share|top|rank\w*|highest|lowest|average|sum|total)\b|%"
+)
+
+# Providers whose fetch is fully described by indicator, geography and dates.
+# Others need parameters only the LLM fills in (currency pairs for
+# ExchangeRate, series dimensions for BIS, flows and partners for Comtrade).
+_FAST_PATH_PROVIDERS = {"FRED", "WorldBank", "IMF", "Eurostat", "OECD", "StatsCan"}
+
+# Providers that only serve one country, so an unnamed geography is not ambiguous
+_SINGLE_COUNTRY_PROVIDERS = {"FRED": "US", "StatsCan": "CA"}
+
+# Confidence = weighted concept clarity, resolver certainty and router
+# confidence, scaled down when the geography is left implicit
+CONCEPT_WEIGHT = 0.4
+RESOLVER_WEIGHT = 0.35
+ROUTER_WEIGHT = 0.25
+
+# Concept clarity by the catalog tier the phrase matched; split across
+# concepts when the phrase names several
+_TIER_CLARITY = {"name": 1.0, "primary": 1.0, "secondary": 0.8}
+
+# Resolver certainty is its confidence, discounted while the best competing
+# series scores within this margin of it
+RESOLVER_FULL_MARGIN = 0.25
+
+MISSING_GEOGRAPHY_FACTOR = 0.65
+
+DEFAULT_MIN_CONFIDENCE = 0.7
+
+
+@dataclass
+class FastPathResult:
+    """Outcome of a fast-path parse attempt."""
+
+    intent: Optional[ParsedIntent]
+    confidence: float
+    concept: Optional[str] = None
+    reasons: List[str] = field(default_factory=list)
+    indicator_code: Optional[str] = None
+    components: Dict[str, float] = field(default_factory=dict)
+
+
+class FastPathParser:
+    """Rule-based parser for single-indicator queries."""
+
+    def __init__(self, router: Optional[UnifiedRouter] = None) -> None:
+        self.router = router or UnifiedRouter()
+        self.attempts = 0
+        self.accepted = 0
+
+    @staticmethod
+    def _extract_time_range(text: str) -> Tuple[str, Optional[str], Optional[str]]:
+        """Remove the first time phrase from text; return (remaining, startDate, endDate)."""
+        for pattern, kind in _TIME_PATTERNS:
+            match = pattern.search(text)
+            if not match:
+                continue
+            remaining = (text[:match.start()] + " " + text[match.end():]).strip()
+            if kind == "range":
+                start_year, end_year = sorted((int(match.group(1)), int(match.group(2))))
+                return remaining, f"{start_year}-01-01", f"{end_year}-12-31"
+            if kind == "since":
+                return remaining, f"{match.group(1)}-01-01", None
+            if kind == "last_years":
+                years = int(match.group(1))
+                if years <= 0:
+                    return text, None, None
+                start_year = datetime.now(timezone.utc).year - years
+                return remaining, f"{start_year}-01-01", None
+            return remaining, f"{match.group(1)}-01-01", f"{match.group(1)}-12-31"
+        return text, None, None
+
+    @staticmethod
+    def _strip_countries(query: str, codes: List[str]) -> str:
+        """Remove mentions of the detected countries from the query text."""
+        text = query
+        code_set = set(codes)
+        aliases = sorted(
+            (alias for alias, code in CountryResolver.COUNTRY_ALIASES.items() if code in code_set),
+            key=len,
+            reverse=True,
+        )
+        for alias in aliases:
+            if alias == "us":
+                text = re.sub(r"\bUS\b|\bU\.S\.A?\.?", " ", text)
+            elif len(alias) <= 3 and alias.isalpha() and alias not in {"uk", "usa", "uae", "drc", "prc"}:
+                text = re.sub(rf"\b{re.escape(alias.upper())}\b", " ", text)
+            else:
+                text = re.sub(rf"(?<![\w.]){re.escape(alias)}(?![\w])", " ", text, flags=re.IGNORECASE)
+        return text
+
+    @staticmethod
+    def _exact_concept(phrase: str) -> Optional[str]:
+        """Return the catalog concept only if the phrase is exactly one of its names."""
+        concept = find_concept_by_term(phrase)
+        if not concept:
+            return None
+        names = {str(name).strip().lower() for name in get_all_synonyms(concept)}
+        return concept if phrase in names else None
+
+    @staticmethod
+    def _runner_up_score(
+        resolver: Any,
+        phrase: str,
+        concept: str,
+        provider: str,
+        code: str,
+        countries: List[str],
+    ) -> float:
+        """Best search score among series that are not the concept's catalog codes."""
+        own_codes = {str(c).strip().upper() for c in get_indicator_codes(concept, provider)}
+        own_codes.add(str(code or "").strip().upper())
+        try:
+            ranked = resolver.rank_candidates(phrase, provider, countries=countries or None)
+        except Exception as exc:
+            logger.debug(f"Fast-path runner-up lookup failed: {exc}")
+            return 0.0
+        for candidate, score in ranked:
+            if str(candidate.get("code") or "").strip().upper() not in own_codes:
+                return score
+        return 0.0
+
+    def parse(self, query: str) -> FastPathResult:
+        """Attempt a deterministic parse of a query."""
+        self.attempts += 1
+        reasons: List[str] = []
+        text = str(query or "").strip()
+        if not text:
+            return FastPathResult(intent=None, confidence=0.0, reasons=["empty query"])
+
+        lowered = text.lower()
+        if _LLM_ONLY_MARKERS.search(lowered):
+            return FastPathResult(intent=None, confidence=0.0, reasons=["needs LLM interpretation"])
+        if KeywordMatcher.detect_explicit_provider(text):
+            return FastPathResult(intent=None, confidence=0.0, reasons=["explicit provider request"])
+        if CountryResolver.detect_regions_in_query(text):
+            return FastPathResult(intent=None, confidence=0.0, reasons=["region group"])
+
+        countries = CountryResolver.detect_all_countries_in_query(text)
+        remaining = self._strip_countries(text, countries).lower()
+        remaining, start_date, end_date = self._extract_time_range(remaining)
+        if re.search(r"\d", remaining):
+            return FastPathResult(intent=None, confidence=0.0, reasons=["unparsed numbers"])
+
+        tokens = re.findall(r"[a-z][a-z'\-]*|&", remaining.replace("'s", " "))
+        filler = _FILLER_WORDS | (_CONNECTOR_WORDS if len(countries) > 1 else set())
+        phrase = " ".join(token for token in tokens if token not in filler).strip()
+        if not phrase:
+            return FastPathResult(intent=None, confidence=0.0, reasons=["no indicator phrase"])
+
+        concept = self._exact_concept(phrase)
+        if concept is None:
+            return FastPathResult(intent=None, confidence=0.0, reasons=[f"'{phrase}' is not a catalog concept"])
+
+        matches = find_concepts_by_exact_term(phrase)
+        clarity = _TIER_CLARITY.get(matches.get(concept, "secondary"), 0.8) / max(1, len(matches))
+        reasons.append(f"concept '{concept}' from '{phrase}' ({len(matches) or 1} catalog match)")
+
+        decision = self.router.route(
+            text,
+            indicators=[phrase],
+            country=countries[0] if len(countries) == 1 else None,
+            countries=countries if len(countries) > 1 else None,
+        )
+        if decision.provider not in _FAST_PATH_PROVIDERS:
+            return FastPathResult(
+                intent=None,
+                confidence=0.0,
+                concept=concept,
+                reasons=[f"{decision.provider} needs provider-specific parameters"],
+            )
+        home_country = _SINGLE_COUNTRY_PROVIDERS.get(decision.provider)
+        if (home_country and any(code != home_country for code in countries)) or not provider_covers_countries(
+            concept, decision.provider, countries or None
+        ):
+            return FastPathResult(
+                intent=None,
+                confidence=0.0,
+                concept=concept,
+                reasons=[f"{decision.provider} does not cover {countries or 'the default geography'}"],
+            )
+        router_confidence = max(0.0, min(1.0, float(decision.confidence or 0.0)))
+        reasons.append(f"routed to {decision.provider} ({router_confidence:.2f}, {decision.match_type})")
+
+        resolver = get_indicator_resolver()
+        resolved = resolver.resolve(
+            phrase,
+            provider=decision.provider,
+            country=countries[0] if len(countries) == 1 else None,
+            countries=countries if len(countries) > 1 else None,
+        )
+        certainty = 0.0
+        indicator_code = None
+        if resolved is not None:
+            indicator_code = resolved.code
+            resolved_confidence = min(1.0, float(resolved.confidence or 0.0))
+            runner_up = self._runner_up_score(resolver, phrase, concept, decision.provider, resolved.code, countries)
+            margin = max(0.0, resolved_confidence - runner_up)
+            certainty = resolved_confidence * min(1.0, margin / RESOLVER_FULL_MARGIN)
+            reasons.append(
+                f"resolved {decision.provider}:{resolved.code} "
+                f"({resolved.confidence:.2f}, runner-up {runner_up:.2f})"
+            )
+
+        geography = 1.0
+        if not countries and decision.provider not in _SINGLE_COUNTRY_PROVIDERS:
+            geography = MISSING_GEOGRAPHY_FACTOR
+            reasons.append("no geography")
+        elif countries:
+            reasons.append(f"countries {countries}")
+
+        confidence = geography * (
+            CONCEPT_WEIGHT * clarity + RESOLVER_WEIGHT * certainty + ROUTER_WEIGHT * router_confidence
+        )
+        components = {
+            "clarity": round(clarity, 3),
+            "resolver": round(certainty, 3),
+            "router": round(router_confidence, 3),
+            "geography": geography,
+        }
+
+        parameters: Dict[str, Any] = {"startDate": start_date, "endDate": end_date}
+        if len(countries) == 1:
+            parameters["country"] = countries[0]
+        elif countries:
+            parameters["countries"] = countries
+
+        confidence = round(min(1.0, confidence), 3)
+        intent = ParsedIntent(
+            apiProvider=decision.provider,
+            indicators=[phrase],
+            parameters=parameters,
+            clarificationNeeded=False,
+            clarificationQuestions=[],
+            confidence=confidence,
+            recommendedChartType="line",
+            originalQuery=query,
+        )
+        return FastPathResult(
+            intent=intent,
+            confidence=confidence,
+            concept=concept,
+            reasons=reasons,
+            indicator_code=indicator_code,
+            components=components,
+        )
+
+    def try_parse(self, query: str, min_confidence: float = DEFAULT_MIN_CONFIDENCE) -> Optional[ParsedIntent]:
+        """Return a fast-path intent when confident enough, else None (use the LLM)."""
+        try:
+            result = self.parse(query)
+        except Exception as exc:
+            logger.warning(f"Fast-path parser failed, falling back to LLM: {exc}")
+            return None
+
+        if result.intent is None or result.confidence < min_confidence:
+            logger.debug("Fast path declined (%.2f): %s", result.confidence, "; ".join(result.reasons))
+            return None
+
+        self.accepted += 1
+        logger.info("⚡ Fast-path parse (%.2f): %s", result.confidence, "; ".join(result.reasons))
+        return result.intent
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get fast-path coverage statistics."""
+        return {
+            "attempts": self.attempts,
+            "accepted": self.accepted,
+            "coverage": round(self.accepted / self.attempts, 4) if self.attempts else 0.0,
+        }
+
+
+# Global instance
+_fast_path_parser: Optional[FastPathParser] = None
+
+
+def get_fast_path_parser() -> FastPathParser:
+    """Get the global fast-path parser instance."""
+    global _fast_path_parser
+    if _fast_path_parser is None:
+        _fast_path_parser = FastPathParser()
+    return _fast_path_parser
@@ -17,6 +17,7 @@ import json
 import re
 
 from backend.config import get_settings
+from backend.services.http_cassette import cassette_transport
 
 logger = logging.getLogger(__name__)
 
@@ -181,7 +182,7 @@ COMMON FIXES:
 Output ONLY executable Python code."""
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with httpx.AsyncClient(timeout=60.0, transport=cassette_transport("LLM")) as client:
                 response = await client.post(
                     f"{self.base_url}/chat/completions",
                     headers={
@@ -278,7 +279,7 @@ VISUALIZATION BEST PRACTICES:
 Output ONLY the Python code, no explanations."""
             })
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with httpx.AsyncClient(timeout=60.0, transport=cassette_transport("LLM")) as client:
                 response = await client.post(
                     f"{self.base_url}/chat/completions",
                     headers={
@@ -384,7 +385,7 @@ Output ONLY the Python code, no explanations."""
                 "stream": True  # Enable streaming
             }
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with httpx.AsyncClient(timeout=60.0, transport=cassette_transport("LLM")) as client:
                 async with client.stream(
                     "POST",
                     f"{self.base_url}/chat/completions",
@@ -450,18 +451,17 @@ SESSION STORAGE (minimize API calls):
 ⚠️ If you define your own versions, session persistence WILL BREAK!
 
 MANDATORY pattern (always include fallback):
-  data = load_session('my_data')  # Returns list/dict (NOT DataFrame!)
+  data = load_session('my_data')  # DataFrame if a DataFrame was saved, else list/dict
   if data is None:
       df = fetch_data()  # Your fetch code
-      save_session('my_data', df)  # DataFrames auto-converted to list of dicts
-      data = df.to_dict('records') if hasattr(df, 'to_dict') else df
+      save_session('my_data', df)  # DataFrames are stored in a fast binary format
   else:
-      df = pd.DataFrame(data)  # Convert loaded data back to DataFrame
+      df = pd.DataFrame(data)  # Works for both DataFrames and list/dict data
   # Now use df
 
-⚠️ IMPORTANT: load_session() returns JSON data (list/dict), NOT DataFrame!
-- When loading, always convert: df = pd.DataFrame(load_session('key'))
-- When saving, DataFrames are auto-converted to list of dicts
+⚠️ IMPORTANT: load_session() may return a DataFrame OR JSON data (list/dict)!
+- When loading, always normalise: df = pd.DataFrame(load_session('key'))
+- Do NOT index loaded data as a list (data[0]) - convert to a DataFrame first
 - Use the pattern above to handle both fresh fetches and follow-up queries
 
 Benefits: 10-100x faster follow-ups, data persists 24h, works first query or follow-up
@@ -0,0 +1,312 @@
+"""
+HTTP cassettes: record provider/LLM responses once, replay them offline.
+
+``HTTP_CASSETTE_MODE=record`` wraps every pooled client, plus the clients
+created outside the pool (LLM calls, metadata discovery, SDMX structure
+downloads; see ``cassette_transport``), with a transport that records each
+response in memory. ``close_http_pool()`` (application shutdown, benchmark
+teardown) writes them to ``HTTP_CASSETTE_PATH`` once, off the event loop, so
+recording neither stalls requests nor inflates the latencies it stores.
+``HTTP_CASSETTE_MODE=replay`` serves those responses without touching the
+network, after a synthetic delay:
+
+- ``HTTP_REPLAY_LATENCY_MS`` unset: the recorded upstream latency times
+  ``HTTP_REPLAY_LATENCY_SCALE``
+- ``HTTP_REPLAY_LATENCY_MS`` set: that fixed latency for every request
+- plus uniform jitter of +/- ``HTTP_REPLAY_JITTER_MS`` (seeded by
+  ``HTTP_REPLAY_SEED`` for repeatable runs)
+
+Requests are matched on method, URL (query parameters sorted, credentials
+redacted) and a hash of the body. ISO dates are masked, so prompts and
+"last N years" ranges recorded on one day still match on the next. A request
+with no recording fails with ``httpx.ConnectError``, like an unreachable
+host. Request headers are never stored, so API keys sent in headers stay out
+of cassettes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+DEFAULT_CASSETTE_PATH = Path(__file__).resolve().parents[1] / "tests" / "cassettes" / "default.json"
+
+# Query parameters whose values are replaced before keys are built or stored
+_SENSITIVE_PARAM_MARKERS = ("key", "token", "secret", "password", "signature")
+
+# Response headers that no longer apply once the body is stored decoded
+_DROPPED_RESPONSE_HEADERS = {
+    "content-encoding", "content-length", "transfer-encoding", "connection",
+    "keep-alive", "set-cookie", "date",
+}
+
+
+# Prompts and relative ranges ("last 5 years") embed today's date; match across days
+_ISO_DATE_PATTERN = re.compile(rb"\d{4}-\d{2}-\d{2}")
+
+
+def _redact_url(url: httpx.URL) -> str:
+    parts = urlsplit(str(url))
+    params = sorted(
+        (name, "REDACTED" if any(marker in name.lower() for marker in _SENSITIVE_PARAM_MARKERS) else value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+    )
+    redacted = urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(params), ""))
+    return _ISO_DATE_PATTERN.sub(b"YYYY-MM-DD", redacted.encode()).decode()
+
+
+def request_signature(request: httpx.Request) -> str:
+    """Stable cassette key for a request: method, redacted URL and body hash."""
+    signature = f"{request.method} {_redact_url(request.url)}"
+    body = request.content
+    if body:
+        body = _ISO_DATE_PATTERN.sub(b"YYYY-MM-DD", body)
+        signature += f" sha256={hashlib.sha256(body).hexdigest()[:16]}"
+    return signature
+
+
+class Cassette:
+    """Recorded responses keyed by request signature, persisted as one JSON file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._replay_positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.recorded = 0
+        self.hits = 0
+        self.misses = 0
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            self._entries = payload.get("entries", {})
+
+    def __len__(self) -> int:
+        return sum(len(variants) for variants in self._entries.values())
+
+    def record(self, signature: str, pool: str, response: httpx.Response, elapsed_ms: float) -> None:
+        content = response.content
+        try:
+            body: Dict[str, str] = {"text": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"base64": base64.b64encode(content).decode("ascii")}
+        entry = {
+            "pool": pool,
+            "status": response.status_code,
+            "headers": [[name, value] for name, value in response.headers.items()],
+            "elapsed_ms": round(elapsed_ms, 2),
+            **body,
+        }
+        with self._lock:
+            self._entries.setdefault(signature, []).append(entry)
+            self.recorded += 1
+            self._dirty = True
+
+    def lookup(self, signature: str) -> Optional[Dict[str, Any]]:
+        """Next recording for a signature, cycling through repeated recordings."""
+        with self._lock:
+            variants = self._entries.get(signature)
+            if not variants:
+                self.misses += 1
+                return None
+            position = self._replay_positions.get(signature, 0)
+            self._replay_positions[signature] = position + 1
+            self.hits += 1
+            return variants[position % len(variants)]
+
+    def save(self) -> None:
+        with self._lock:
+            payload = json.dumps({"version": CASSETTE_VERSION, "entries": self._entries}, indent=1, sort_keys=True)
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, self.path)
+
+    def flush(self) -> bool:
+        """Write recordings made since the last save; True if the file was written."""
+        if not self._dirty:
+            return False
+        self.save()
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "path": str(self.path),
+                "signatures": len(self._entries),
+                "responses": sum(len(variants) for variants in self._entries.values()),
+                "recorded": self.recorded,
+                "replay_hits": self.hits,
+                "replay_misses": self.misses,
+            }
+
+
+class ReplayLatency:
+    """Synthetic upstream latency for replayed responses."""
+
+    def __init__(
+        self,
+        fixed_ms: Optional[float] = None,
+        scale: float = 1.0,
+        jitter_ms: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.fixed_ms = fixed_ms
+        self.scale = scale
+        self.jitter_ms = jitter_ms
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay_ms(self, recorded_ms: float) -> float:
+        base = self.fixed_ms if self.fixed_ms is not None else recorded_ms * self.scale
+        if self.jitter_ms:
+            with self._lock:
+                base += self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, base)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Forwards requests to the real transport and records each response."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, cassette: Cassette, pool: str) -> None:
+        self._inner = inner
+        self._cassette = cassette
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = perf_counter()
+        response = await self._inner.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed_ms = (perf_counter() - start) * 1000
+        # The body is already decoded, so encoding/length headers no longer apply
+        recorded = httpx.Response(
+            status_code=response.status_code,
+            headers=[
+                (name, value) for name, value in response.headers.items()
+                if name.lower() not in _DROPPED_RESPONSE_HEADERS
+            ],
+            content=content,
+            request=request,
+        )
+        self._cassette.record(request_signature(request), self._pool, recorded, elapsed_ms)
+        return recorded
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serves recorded responses after a synthetic delay; never opens a socket."""
+
+    def __init__(self, cassette: Cassette, latency: ReplayLatency) -> None:
+        self._cassette = cassette
+        self._latency = latency
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        signature = request_signature(request)
+        entry = self._cassette.lookup(signature)
+        if entry is None:
+            raise httpx.ConnectError(f"No cassette recording for {signature}", request=request)
+
+        await asyncio.sleep(self._latency.delay_ms(entry.get("elapsed_ms", 0.0)) / 1000)
+        if "base64" in entry:
+            content = base64.b64decode(entry["base64"])
+        else:
+            content = entry.get("text", "").encode("utf-8")
+        return httpx.Response(
+            status_code=entry["status"],
+            headers=entry.get("headers", []),
+            content=content,
+            request=request,
+        )
+
+
+# Global instance
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """The active cassette, or None when HTTP_CASSETTE_MODE is off."""
+    global _cassette
+    settings = get_settings()
+    if settings.http_cassette_mode not in ("record", "replay"):
+        return None
+    with _cassette_lock:
+        if _cassette is None:
+            _cassette = Cassette(Path(settings.http_cassette_path or DEFAULT_CASSETTE_PATH))
+            logger.info(
+                "HTTP cassette %s mode: %s (%d recorded responses)",
+                settings.http_cassette_mode,
+                _cassette.path,
+                len(_cassette),
+            )
+    return _cassette
+
+
+def flush_cassette() -> bool:
+    """Persist the active cassette's new recordings (no-op when nothing was recorded)."""
+    with _cassette_lock:
+        cassette = _cassette
+    return cassette.flush() if cassette is not None else False
+
+
+def reset_cassette() -> None:
+    """Drop the global cassette so the next call re-reads settings and the file."""
+    global _cassette
+    with _cassette_lock:
+        _cassette = None
+
+
+def wrap_transport(transport: httpx.AsyncBaseTransport, pool: str) -> httpx.AsyncBaseTransport:
+    """Wrap a real transport for the configured cassette mode (unchanged when off)."""
+    cassette = get_cassette()
+    if cassette is None:
+        return transport
+    settings = get_settings()
+    if settings.http_cassette_mode == "record":
+        return RecordingTransport(transport, cassette, pool)
+    latency = ReplayLatency(
+        fixed_ms=settings.http_replay_latency_ms,
+        scale=settings.http_replay_latency_scale,
+        jitter_ms=settings.http_replay_jitter_ms,
+        seed=settings.http_replay_seed,
+    )
+    return ReplayTransport(cassette, latency)
+
+
+def cassette_transport(pool: str) -> Optional[httpx.AsyncBaseTransport]:
+    """
+    Transport for clients created outside the pool (LLM calls, metadata search).
+
+    Returns None when cassettes are off, so ``httpx.AsyncClient(transport=...)``
+    keeps its default transport.
+    """
+    if get_cassette() is None:
+        return None
+    return wrap_transport(httpx.AsyncHTTPTransport(), pool)
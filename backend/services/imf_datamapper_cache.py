@@ -0,0 +1,245 @@
+"""
+IMF DataMapper Payload Cache
+
+The DataMapper API returns an indicator for *all* countries in one payload, so
+any country subset of an indicator can be answered from the same download.
+This cache keeps those payloads (and the indicator catalog) in memory and on
+disk, keyed by indicator:
+
+- Fresh entries (younger than ``revalidate_after``) are served without a request
+- Older entries are revalidated with ``If-None-Match`` / ``If-Modified-Since``;
+  a 304 keeps the stored payload, anything else replaces it
+- Entries without validators are simply refetched once they go stale
+
+Concurrent requests for the same indicator share a single download.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default cache directory
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data" / "imf_datamapper"
+
+NOT_MODIFIED_STATUS = 304
+
+# Cache key for the DataMapper indicator catalog (/indicators)
+IMF_INDICATOR_CATALOG_KEY = "__indicators__"
+
+# Fetch callback: receives conditional request headers, returns an httpx-style response
+FetchCallable = Callable[[Dict[str, str]], Awaitable[Any]]
+
+
+@dataclass
+class CachedPayload:
+    """One cached DataMapper payload with its HTTP validators."""
+
+    payload: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    validated_at: float
+
+
+class DataMapperCache:
+    """
+    Memory + disk cache of IMF DataMapper payloads.
+
+    Memory holds the most recently used payloads (LRU); every payload is also
+    written to ``<cache_dir>/<key>.json`` so restarts only need a revalidation.
+    """
+
+    REVALIDATE_AFTER_SECONDS = 6 * 3600  # DataMapper publishes a few times a year
+    MAX_MEMORY_ENTRIES = 64
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        revalidate_after: float = REVALIDATE_AFTER_SECONDS,
+        max_memory_entries: int = MAX_MEMORY_ENTRIES,
+    ):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.revalidate_after = revalidate_after
+        self.max_memory_entries = max_memory_entries
+        self._entries: "OrderedDict[str, CachedPayload]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.not_modified = 0
+
+    @staticmethod
+    def _file_name(key: str) -> str:
+        return re.sub(r"[^A-Za-z0-9_.-]", "_", key) + ".json"
+
+    def _load_from_disk(self, key: str) -> Optional[CachedPayload]:
+        """Load one entry from disk, if present and readable."""
+        path = self.cache_dir / self._file_name(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return CachedPayload(
+                payload=data["payload"],
+                etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
+                fetched_at=data["fetched_at"],
+                validated_at=data["validated_at"],
+            )
+        except Exception as e:
+            logger.warning(f"Discarding unreadable DataMapper cache file {path.name}: {e}")
+            return None
+
+    def _save_to_disk(self, key: str, entry: CachedPayload) -> None:
+        """Persist one entry to disk (written to a temp file, then renamed into place)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.cache_dir / self._file_name(key)
+            tmp_path = path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "payload": entry.payload,
+                        "etag": entry.etag,
+                        "last_modified": entry.last_modified,
+                        "fetched_at": entry.fetched_at,
+                        "validated_at": entry.validated_at,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to save DataMapper cache entry {key}: {e}")
+
+    def _remember(self, key: str, entry: CachedPayload) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_memory_entries:
+            self._entries.popitem(last=False)
+
+    async def _lookup(self, key: str) -> Optional[CachedPayload]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        # Payloads run to several MB; keep file I/O and JSON decoding off the event loop
+        entry = await asyncio.to_thread(self._load_from_disk, key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    async def get_json(self, key: str, fetch: FetchCallable) -> Any:
+        """Return the payload for ``key``, fetching or revalidating as needed.
+
+        Args:
+            key: Cache key (indicator code, or a reserved name for catalogs)
+            fetch: Coroutine performing the GET with the given extra headers
+
+        Returns:
+            Decoded JSON payload
+        """
+        entry = await self._lookup(key)
+        if entry is not None and time.time() - entry.validated_at < self.revalidate_after:
+            self.hits += 1
+            return entry.payload
+
+        # Share one download between concurrent callers on the same loop
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight.get_loop() is loop:
+            return await asyncio.shield(inflight)
+
+        task = loop.create_task(self._refresh(key, entry, fetch))
+        self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _refresh(self, key: str, entry: Optional[CachedPayload], fetch: FetchCallable) -> Any:
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            self.revalidations += 1
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        else:
+            self.misses += 1
+
+        try:
+            response = await fetch(headers)
+            if entry is None or response.status_code != NOT_MODIFIED_STATUS:
+                response.raise_for_status()
+        except Exception as e:
+            if entry is None:
+                raise
+            # Serve the stored payload rather than failing on a flaky revalidation
+            logger.warning(f"DataMapper revalidation failed for {key}, serving stored payload: {e}")
+            return entry.payload
+        finally:
+            # Drop the in-flight marker once the download settles
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+        now = time.time()
+        if entry is not None and response.status_code == NOT_MODIFIED_STATUS:
+            self.not_modified += 1
+            entry.validated_at = now
+            await asyncio.to_thread(self._save_to_disk, key, entry)
+            logger.debug(f"DataMapper payload {key} not modified")
+            return entry.payload
+
+        payload = response.json()
+        fresh = CachedPayload(
+            payload=payload,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            fetched_at=now,
+            validated_at=now,
+        )
+        self._remember(key, fresh)
+        await asyncio.to_thread(self._save_to_disk, key, fresh)
+        return payload
+
+    def clear(self) -> None:
+        """Drop all cached payloads from memory and disk."""
+        self._entries.clear()
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.not_modified = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "memory_entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "not_modified": self.not_modified,
+        }
+
+
+# Global instance
+_datamapper_cache: Optional[DataMapperCache] = None
+
+
+def get_datamapper_cache() -> DataMapperCache:
+    """Get the global DataMapper payload cache instance."""
+    global _datamapper_cache
+    if _datamapper_cache is None:
+        _datamapper_cache = DataMapperCache()
+    return _datamapper_cache
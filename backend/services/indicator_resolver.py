@@ -36,6 +36,7 @@ from collections import OrderedDict
 from time import monotonic
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from ..utils.latency_metrics import timed_stage
 from .indicator_lookup import IndicatorLookup, get_indicator_lookup
 from .indicator_translator import IndicatorTranslator, get_indicator_translator
 from .vector_search import VECTOR_SEARCH_AVAILABLE, get_vector_search_service
@@ -168,6 +169,7 @@ class IndicatorResolver:
             if len(term) >= 3 or term in {"us", "gb", "eu"}:
                 self._geo_terms.add(term)
 
+    @timed_stage("resolve", provider=lambda self, query, provider=None, *args, **kwargs: (provider or "").upper())
     def resolve(
         self,
         query: str,
@@ -1359,8 +1361,27 @@ class IndicatorResolver:
         countries: Optional[List[str]] = None,
     ) -> Tuple[Optional[Dict[str, Any]], float]:
         """Select best search result using lexical + concept-aware scoring."""
-        best_result: Optional[Dict[str, Any]] = None
-        best_confidence = 0.0
+        ranked = self._rank_search_results(
+            query,
+            search_results,
+            concept_name=concept_name,
+            preferred_codes=preferred_codes,
+            countries=countries,
+        )
+        if not ranked or ranked[0][1] <= 0.0:
+            return None, 0.0
+        return ranked[0]
+
+    def _rank_search_results(
+        self,
+        query: str,
+        search_results: List[Dict[str, Any]],
+        concept_name: Optional[str] = None,
+        preferred_codes: Optional[Set[str]] = None,
+        countries: Optional[List[str]] = None,
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """Score search results (lexical + concept-aware), best first."""
+        scored: List[Tuple[Dict[str, Any], float]] = []
 
         for idx, candidate in enumerate(search_results):
             confidence = self._score_search_match(query, candidate, rank_index=idx)
@@ -1380,12 +1401,49 @@ class IndicatorResolver:
             if country_penalty > 0.0:
                 confidence -= country_penalty
 
-            confidence = max(0.0, min(1.0, confidence))
-            if confidence > best_confidence:
-                best_result = candidate
-                best_confidence = confidence
+            scored.append((candidate, max(0.0, min(1.0, confidence))))
+
+        # Stable sort keeps search order among equal scores
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored
+
+    def rank_candidates(
+        self,
+        query: str,
+        provider: str,
+        countries: Optional[List[str]] = None,
+        limit: int = 10,
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Score the provider's search candidates for a query, best first.
 
-        return best_result, best_confidence
+        Uses the same scoring as resolve() applies to search results, so
+        callers can compare a resolution against its runner-up.
+        """
+        if not query or not provider:
+            return []
+        concept_name = (
+            find_concept_by_term(self._normalize_query_for_concept_lookup(query))
+            or find_concept_by_term(query)
+        )
+        preferred_codes = {
+            self._normalize_code(code)
+            for code in (get_indicator_codes(concept_name, provider) if concept_name else [])
+            if code
+        }
+        search_results = self.lookup.search(query, provider=provider, limit=limit)
+        search_results = self._fuse_semantic_candidates(
+            query=query,
+            provider=provider,
+            search_results=search_results,
+        )
+        return self._rank_search_results(
+            query,
+            search_results,
+            concept_name=concept_name,
+            preferred_codes=preferred_codes or None,
+            countries=countries,
+        )
 
 
 # Singleton instance
@@ -0,0 +1,261 @@
+"""
+Intent Cache
+
+Caches the LLM parser's ParsedIntent so repeated questions ("US unemployment
+rate", "China GDP since 2010") skip the remote parse call.
+
+Two tiers:
+1. Exact: normalized query text + conversation history fingerprint
+2. Semantic (optional): embedding cosine similarity against cached
+   history-free queries, above a tuned threshold. A semantic match is only
+   reused when both queries mention the same countries, regions and numbers,
+   so "China GDP" never answers "India GDP".
+
+Cached intents are the raw parser output; callers still run the deterministic
+post-parse steps (country overrides, routing guardrails) on every hit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..models import ParsedIntent
+from ..routing.country_resolver import CountryResolver
+
+logger = logging.getLogger(__name__)
+
+# Bump when the parser prompt/output contract changes so stale intents are not reused
+INTENT_CACHE_VERSION = "v1"
+
+_NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+
+# Embedding function: text -> vector
+EmbedFunction = Callable[[str], Any]
+
+
+@dataclass
+class IntentCacheEntry:
+    intent: Dict[str, Any]
+    query: str
+    entity_signature: Tuple[Tuple[str, ...], Tuple[str, ...]]
+    llm_ms: float
+    expires_at: float
+    embedding: Optional[np.ndarray] = None
+
+
+def normalize_query(query: str) -> str:
+    """Normalize query text for exact matching (case, whitespace, trailing punctuation)."""
+    text = unicodedata.normalize("NFKC", str(query or "")).lower()
+    text = re.sub(r"\s+", " ", text).strip()
+    return text.strip(" ?.!")
+
+
+def history_fingerprint(history: Optional[List[str]]) -> str:
+    """Stable fingerprint of the conversation history ("" when there is none)."""
+    if not history:
+        return ""
+    return hashlib.sha256(json.dumps(list(history), ensure_ascii=False).encode()).hexdigest()[:16]
+
+
+def entity_signature(query: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Countries/regions and numbers mentioned in a query."""
+    geography = set(CountryResolver.detect_all_countries_in_query(query))
+    geography.update(CountryResolver.expand_regions_in_query(query))
+    numbers = set(_NUMBER_PATTERN.findall(query))
+    return tuple(sorted(geography)), tuple(sorted(numbers))
+
+
+class IntentCache:
+    """
+    In-memory LRU cache of parsed intents with an optional semantic tier.
+
+    Thread-safe; embeddings are computed off the event loop.
+    """
+
+    DEFAULT_TTL = 86400  # 24 hours
+    MAX_ENTRIES = 2048
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = MAX_ENTRIES,
+        embed: Optional[EmbedFunction] = None,
+        similarity_threshold: float = 0.95,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.embed = embed
+        self.similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[str, IntentCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.saved_llm_ms = 0.0
+
+    @staticmethod
+    def build_key(query: str, history: Optional[List[str]] = None) -> str:
+        """Build the exact-tier key for a query and its conversation history."""
+        return f"{INTENT_CACHE_VERSION}:{history_fingerprint(history)}:{normalize_query(query)}"
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        if self.embed is None:
+            return None
+        try:
+            vector = np.asarray(self.embed(text), dtype=np.float32).reshape(-1)
+        except Exception as exc:
+            logger.warning(f"Intent cache embedding failed, semantic tier skipped: {exc}")
+            return None
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else None
+
+    def _record_hit(self, entry: IntentCacheEntry, semantic: bool) -> ParsedIntent:
+        if semantic:
+            self.semantic_hits += 1
+        else:
+            self.exact_hits += 1
+        self.saved_llm_ms += entry.llm_ms
+        return ParsedIntent.model_validate(entry.intent)
+
+    async def lookup(self, query: str, history: Optional[List[str]] = None) -> Optional[ParsedIntent]:
+        """Return a cached intent for the query, or None on a miss."""
+        key = self.build_key(query, history)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._entries.move_to_end(key)
+                    return self._record_hit(entry, semantic=False)
+                del self._entries[key]
+
+        # Semantic tier only for standalone queries: follow-ups depend on history
+        if self.embed is not None and not history:
+            match = await self._semantic_lookup(query, now)
+            if match is not None:
+                logger.info("🧠 Intent cache semantic hit: '%s' ≈ '%s'", query, match.query)
+                with self._lock:
+                    return self._record_hit(match, semantic=True)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    async def _semantic_lookup(self, query: str, now: float) -> Optional[IntentCacheEntry]:
+        with self._lock:
+            candidates = [
+                entry for entry in self._entries.values()
+                if entry.embedding is not None and entry.expires_at > now
+            ]
+        if not candidates:
+            return None
+
+        embedding = await asyncio.to_thread(self._embed, query)
+        if embedding is None:
+            return None
+
+        matrix = np.stack([entry.embedding for entry in candidates])
+        scores = matrix @ embedding
+        best = int(np.argmax(scores))
+        if float(scores[best]) < self.similarity_threshold:
+            return None
+
+        match = candidates[best]
+        if match.entity_signature != entity_signature(query):
+            return None
+        return match
+
+    async def store(
+        self,
+        query: str,
+        history: Optional[List[str]],
+        intent: ParsedIntent,
+        llm_ms: float,
+    ) -> None:
+        """Cache a freshly parsed intent (clarification requests are not cached)."""
+        if intent.clarificationNeeded:
+            return
+
+        embedding = None
+        if self.embed is not None and not history:
+            embedding = await asyncio.to_thread(self._embed, query)
+
+        entry = IntentCacheEntry(
+            intent=intent.model_dump(),
+            query=query,
+            entity_signature=entity_signature(query),
+            llm_ms=llm_ms,
+            expires_at=time.time() + self.ttl,
+            embedding=embedding,
+        )
+        key = self.build_key(query, history)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached intents and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.exact_hits = 0
+            self.semantic_hits = 0
+            self.misses = 0
+            self.saved_llm_ms = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.exact_hits + self.semantic_hits + self.misses
+            hits = self.exact_hits + self.semantic_hits
+            return {
+                "entries": len(self._entries),
+                "exact_hits": self.exact_hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "saved_llm_ms": round(self.saved_llm_ms, 1),
+                "semantic_enabled": self.embed is not None,
+            }
+
+
+# Global instance
+_intent_cache: Optional[IntentCache] = None
+
+
+def get_intent_cache() -> IntentCache:
+    """Get the global intent cache instance."""
+    global _intent_cache
+    if _intent_cache is None:
+        from ..config import get_settings
+
+        settings = get_settings()
+        embed: Optional[EmbedFunction] = None
+        if settings.intent_cache_semantic:
+            from .embedding_service import get_embedding_service
+
+            service = get_embedding_service()
+            if service.available:
+                embed = lambda text: service.encode(text)  # noqa: E731
+            else:
+                logger.warning("Intent cache semantic tier requested but no embedding model is available")
+
+        _intent_cache = IntentCache(
+            ttl=settings.intent_cache_ttl,
+            embed=embed,
+            similarity_threshold=settings.intent_cache_similarity_threshold,
+        )
+    return _intent_cache
@@ -0,0 +1,78 @@
+"""
+Lazily built components for long-lived services.
+
+Provider modules carry large class-level mapping tables and the optional
+subsystems (metadata search, routers) pull in their own dependency trees.
+Declaring them as ``LazyComponent`` class attributes defers both the import
+and the construction until the first attribute access, so workers and tests
+only pay for what a request actually touches:
+
+    class QueryService:
+        fred_provider = LazyComponent(
+            "..providers.fred", "FREDProvider",
+            lambda service, cls: cls(service._fred_key),
+        )
+
+The built object is stored in the instance ``__dict__`` under the same name,
+so later reads are plain attribute lookups and ``patch.object`` / direct
+assignment keep working exactly as with eagerly set attributes.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import threading
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LazyComponent:
+    """Non-data descriptor that imports and builds a component on first access."""
+
+    def __init__(
+        self,
+        module: str,
+        attribute: str,
+        build: Optional[Callable[[Any, Any], Any]] = None,
+    ) -> None:
+        # Module paths are relative to backend.services, like the imports they replace
+        self.module = module
+        self.attribute = attribute
+        self.build = build or (lambda owner, cls: cls())
+        self.name = attribute
+        self._lock = threading.Lock()
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        with self._lock:
+            # Another thread may have finished building while we waited
+            if self.name in instance.__dict__:
+                return instance.__dict__[self.name]
+            start = perf_counter()
+            target = getattr(importlib.import_module(self.module, package=__package__), self.attribute)
+            component = self.build(instance, target)
+            instance.__dict__[self.name] = component
+        logger.debug("Built %s.%s in %.1fms", type(instance).__name__, self.name, (perf_counter() - start) * 1000)
+        return component
+
+
+def lazy_components(owner: type) -> Dict[str, LazyComponent]:
+    """All lazy components declared on a class (including base classes)."""
+    components: Dict[str, LazyComponent] = {}
+    for klass in reversed(owner.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, LazyComponent):
+                components[name] = value
+    return components
+
+
+def built_components(instance: Any) -> Dict[str, bool]:
+    """Which lazy components of an instance have been built so far."""
+    return {name: name in instance.__dict__ for name in lazy_components(type(instance))}
@@ -21,6 +21,7 @@ import json
 import asyncio
 
 from ..config import get_settings
+from .http_cassette import cassette_transport
 from .model_config import (
     ModelConfig, ModelFamily, get_model_config, resolve_model_alias,
     detect_model_family
@@ -169,7 +170,7 @@ class OpenRouterProvider(BaseLLMProvider):
             payload["response_format"] = response_format
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(timeout=self.timeout, transport=cassette_transport("LLM")) as client:
                 response = await client.post(
                     f"{self.base_url}/chat/completions",
                     headers={
@@ -282,7 +283,7 @@ class VLLMProvider(BaseLLMProvider):
         logger.debug(f"  Temperature: {payload['temperature']}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(timeout=self.timeout, transport=cassette_transport("LLM")) as client:
                 response = await client.post(
                     f"{self.base_url}/v1/chat/completions",
                     headers={
@@ -405,7 +406,7 @@ class OllamaProvider(BaseLLMProvider):
             payload["format"] = "json"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(timeout=self.timeout, transport=cassette_transport("LLM")) as client:
                 response = await client.post(
                     f"{self.base_url}/api/chat",
                     json=payload
@@ -16,12 +16,51 @@ from pathlib import Path
 import json
 import httpx
 
+from ..config import get_settings
 from ..services.cache import cache_service
+from ..services.http_cassette import cassette_transport
+from ..services.imf_datamapper_cache import IMF_INDICATOR_CATALOG_KEY, get_datamapper_cache
 from ..services.llm import BaseLLMProvider
 from ..utils.processing_steps import get_processing_tracker
 
 logger = logging.getLogger(__name__)
 
+# Parsed SDMX catalogs (~6.5 MB of JSON), shared by every MetadataSearchService
+# in the process and loaded before fork in preload mode
+_sdmx_catalog_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def load_sdmx_catalogs() -> Dict[str, Dict[str, Any]]:
+    """Load all SDMX dataflow catalogs from disk once per process."""
+    global _sdmx_catalog_cache
+
+    if _sdmx_catalog_cache is not None:
+        return _sdmx_catalog_cache
+
+    sdmx_dir = Path(__file__).parent.parent / 'data' / 'metadata' / 'sdmx'
+    catalogs = {}
+
+    if not sdmx_dir.exists():
+        logger.warning(f"SDMX metadata directory not found: {sdmx_dir}")
+        _sdmx_catalog_cache = {}
+        return _sdmx_catalog_cache
+
+    for file_path in sdmx_dir.glob('*_dataflows.json'):
+        try:
+            provider_key = file_path.stem.replace('_dataflows', '').upper()
+            canonical_name = MetadataSearchService.SDMX_PROVIDER_MAP.get(provider_key, provider_key)
+
+            with open(file_path, 'r', encoding='utf-8') as f:
+                catalogs[canonical_name] = json.load(f)
+
+            logger.info(f"Loaded {len(catalogs[canonical_name])} dataflows from {canonical_name}")
+        except Exception as e:
+            logger.error(f"Failed to load SDMX catalog {file_path}: {e}")
+
+    _sdmx_catalog_cache = catalogs
+    logger.info(f"Successfully loaded SDMX catalogs from {len(catalogs)} providers")
+    return _sdmx_catalog_cache
+
 
 class MetadataSearchService:
     """
@@ -65,31 +104,8 @@ class MetadataSearchService:
         Returns:
             Dict mapping provider names to their dataflow catalogs
         """
-        if self._sdmx_catalogs is not None:
-            return self._sdmx_catalogs
-
-        sdmx_dir = Path(__file__).parent.parent / 'data' / 'metadata' / 'sdmx'
-        catalogs = {}
-
-        if not sdmx_dir.exists():
-            logger.warning(f"SDMX metadata directory not found: {sdmx_dir}")
-            self._sdmx_catalogs = {}
-            return self._sdmx_catalogs
-
-        for file_path in sdmx_dir.glob('*_dataflows.json'):
-            try:
-                provider_key = file_path.stem.replace('_dataflows', '').upper()
-                canonical_name = self.SDMX_PROVIDER_MAP.get(provider_key, provider_key)
-
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    catalogs[canonical_name] = json.load(f)
-
-                logger.info(f"Loaded {len(catalogs[canonical_name])} dataflows from {canonical_name}")
-            except Exception as e:
-                logger.error(f"Failed to load SDMX catalog {file_path}: {e}")
-
-        self._sdmx_catalogs = catalogs
-        logger.info(f"Successfully loaded SDMX catalogs from {len(catalogs)} providers")
+        if self._sdmx_catalogs is None:
+            self._sdmx_catalogs = load_sdmx_catalogs()
         return self._sdmx_catalogs
 
     async def search_sdmx(self, keyword: str, provider_filter: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -856,7 +872,7 @@ Return ONLY the JSON object, no other text."""
         Example: "GDP per capita PPP" matches products containing "GDP" AND "capita" AND "PPP"
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(timeout=30.0, transport=cassette_transport("STATSCAN")) as client:
                 response = await client.get(
                     "https://www150.statcan.gc.ca/t1/wds/rest/getAllCubesListLite",
                     timeout=30.0
@@ -979,7 +995,7 @@ Return ONLY the JSON object, no other text."""
         # Common indicators (GDP, CO2, poverty, etc.) are in first 20 pages
         # Life expectancy indicators are on pages 50-58 (25,000-29,000)
         # This balances coverage with performance - most queries satisfied by first 30 pages
-        async with httpx.AsyncClient(timeout=90.0) as client:
+        async with httpx.AsyncClient(timeout=90.0, transport=cassette_transport("WORLDBANK")) as client:
             for page in range(1, 31):  # 30 pages * 500 per_page = 15000 indicators
                 try:
                     response = await client.get(
@@ -1071,11 +1087,18 @@ Return ONLY the JSON object, no other text."""
 
         KEYWORD MATCHING: Caller (search_imf) filters results using keyword matching.
         This method just fetches and normalizes all indicators from the API.
+        The raw catalog is kept in the DataMapper payload cache when enabled.
         """
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            response = await client.get(
-                "https://www.imf.org/external/datamapper/api/v1/indicators"
-            )
+        url = "https://www.imf.org/external/datamapper/api/v1/indicators"
+
+        async def _get(headers: Dict[str, str]) -> httpx.Response:
+            async with httpx.AsyncClient(timeout=20.0, transport=cassette_transport("IMF")) as client:
+                return await client.get(url, headers=headers)
+
+        if get_settings().use_imf_payload_cache:
+            payload = await get_datamapper_cache().get_json(IMF_INDICATOR_CATALOG_KEY, _get)
+        else:
+            response = await _get({})
             response.raise_for_status()
             payload = response.json()
 
@@ -1141,7 +1164,7 @@ Return ONLY the JSON object, no other text."""
 
     async def _fetch_bis_dataflows(self) -> List[Dict[str, Any]]:
         """Fetch BIS dataflow definitions in SDMX-JSON format."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with httpx.AsyncClient(timeout=30.0, transport=cassette_transport("BIS")) as client:
             response = await client.get(
                 "https://stats.bis.org/api/v1/bis/dataflow",
                 headers={"Accept": "application/vnd.sdmx.structure+json;version=1.0.0"},
@@ -1211,7 +1234,7 @@ Return ONLY the JSON object, no other text."""
 
     async def _fetch_eurostat_datasets(self) -> List[Dict[str, Any]]:
         """Fetch Eurostat dataset catalog and normalize entries."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with httpx.AsyncClient(timeout=30.0, transport=cassette_transport("EUROSTAT")) as client:
             response = await client.get(
                 "https://ec.europa.eu/eurostat/api/dissemination/statistics/1.0/datasets",
                 params={"lang": "EN"},
@@ -24,6 +24,7 @@ import httpx
 
 from ..models import ParsedIntent
 from ..config import Settings, get_settings
+from .http_cassette import cassette_transport
 from .llm import create_llm_provider, BaseLLMProvider
 from .simplified_prompt import SimplifiedPrompt
 from .json_parser import parse_json_response, JSONParseError
@@ -235,7 +236,7 @@ class OpenRouterService:
         last_error = None
 
         for attempt in range(max_retries):
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(timeout=30.0, transport=cassette_transport("LLM")) as client:
                 response = await client.post(
                     f"{self.BASE_URL}/chat/completions",
                     headers={
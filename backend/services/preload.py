@@ -0,0 +1,194 @@
+"""
+Pre-fork preload of read-only indexes and catalogs.
+
+Without preloading, every uvicorn worker parses the SDMX catalogs, the YAML
+concept catalog and the provider metadata JSON, and loads the embedding model
+and FAISS index itself, so RSS grows linearly with the worker count.
+``python -m backend.prefork`` calls ``preload_shared_state()`` in the master
+process before forking. Workers then share those pages copy-on-write.
+
+After loading, ``gc.freeze()`` moves every tracked object into the permanent
+generation. Worker GC passes then never visit (and never write to) the
+preloaded objects' headers, so those pages stay shared instead of being
+copied one collection at a time. Reference-count updates on the hottest
+objects still copy their pages, so ``process_memory()`` reports each
+process's unique set size (USS) to measure how much really stays shared.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+import os
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Set in the master by preload_shared_state(); inherited by forked workers
+_preload_report: Optional[Dict[str, Any]] = None
+
+
+def _load_concept_catalog() -> Any:
+    from .catalog_service import load_catalog
+
+    return f"{len(load_catalog())} concepts"
+
+
+def _load_sdmx_catalogs() -> Any:
+    from .metadata_search import load_sdmx_catalogs
+
+    return f"{sum(len(catalog) for catalog in load_sdmx_catalogs().values())} dataflows"
+
+
+def _load_provider_metadata() -> Any:
+    from ..providers.oecd import OECDProvider
+    from .dsd_cache import get_dsd_cache
+    from .indicator_resolver import get_indicator_resolver
+    from .statscan_metadata import get_statscan_metadata_service
+
+    OECDProvider._load_dataflows_catalog()
+    get_statscan_metadata_service()
+    get_dsd_cache()
+    get_indicator_resolver()
+    return "oecd, statscan, dsd, indicator resolver"
+
+
+def _build_query_service_components() -> Any:
+    from ..main import query_service
+    from .lazy_registry import lazy_components
+
+    names = list(lazy_components(type(query_service)))
+    for name in names:
+        getattr(query_service, name)
+    return f"{len(names)} components"
+
+
+def _load_embedding_model() -> Any:
+    from ..config import get_settings
+    from .embedding_service import get_embedding_service
+
+    service = get_embedding_service()
+    if not get_settings().embedding_warmup_on_startup or not service.available:
+        return None
+    if service.backend != "local":
+        return f"{service.backend} (nothing to share)"
+    return service.model_name if service.warm_up() else None
+
+
+def _load_vector_index() -> Any:
+    from ..config import get_settings
+    from .metadata_loader import MetadataLoader
+    from .vector_search import VECTOR_SEARCH_AVAILABLE, get_vector_search_service
+
+    if not get_settings().enable_metadata_loading or not VECTOR_SEARCH_AVAILABLE:
+        return None
+    result = asyncio.run(MetadataLoader(vector_search=get_vector_search_service()).load_all())
+    if not result.get("success"):
+        raise RuntimeError(result.get("error", "metadata loading failed"))
+    return f"{result.get('total_indicators', 0)} indicators"
+
+
+# Loaded in order; each step is optional and failures only cost sharing
+PRELOAD_STEPS: List[Tuple[str, Callable[[], Any]]] = [
+    ("concept_catalog", _load_concept_catalog),
+    ("sdmx_catalogs", _load_sdmx_catalogs),
+    ("provider_metadata", _load_provider_metadata),
+    ("query_service", _build_query_service_components),
+    ("embedding_model", _load_embedding_model),
+    ("vector_index", _load_vector_index),
+]
+
+
+def preload_shared_state(freeze: bool = True) -> Dict[str, Any]:
+    """
+    Load read-only state in the current process so forked workers share it.
+
+    Args:
+        freeze: Collect garbage, then ``gc.freeze()`` the survivors
+
+    Returns:
+        Report with per-step timings, the frozen object count and master memory
+    """
+    global _preload_report
+
+    steps: Dict[str, Dict[str, Any]] = {}
+    start = perf_counter()
+    for name, load in PRELOAD_STEPS:
+        step_start = perf_counter()
+        try:
+            detail = load()
+            status = "loaded" if detail else "skipped"
+        except Exception as exc:
+            logger.warning("Preload step %s failed: %s", name, exc)
+            detail, status = str(exc)[:200], "failed"
+        steps[name] = {
+            "status": status,
+            "detail": detail if isinstance(detail, str) else None,
+            "duration_ms": round((perf_counter() - step_start) * 1000, 1),
+        }
+
+    frozen = 0
+    if freeze:
+        gc.collect()
+        gc.freeze()
+        frozen = gc.get_freeze_count()
+
+    _preload_report = {
+        "master_pid": os.getpid(),
+        "duration_ms": round((perf_counter() - start) * 1000, 1),
+        "frozen_objects": frozen,
+        "steps": steps,
+        "master_memory": process_memory(),
+    }
+    logger.info(
+        "Preloaded shared state in %.0fms (%d objects frozen)",
+        _preload_report["duration_ms"],
+        frozen,
+    )
+    return _preload_report
+
+
+def is_preloaded(step: Optional[str] = None) -> bool:
+    """Whether this process inherited preloaded state (optionally a given step)."""
+    if _preload_report is None:
+        return False
+    if step is None:
+        return True
+    return _preload_report["steps"].get(step, {}).get("status") == "loaded"
+
+
+def get_preload_stats() -> Dict[str, Any]:
+    """Preload report plus this process's current memory, for /api/performance/metrics."""
+    return {
+        "preloaded": _preload_report is not None,
+        "report": _preload_report,
+        "pid": os.getpid(),
+        "frozen_objects": gc.get_freeze_count(),
+        "memory": process_memory(),
+    }
+
+
+def process_memory(pid: Union[int, str] = "self") -> Optional[Dict[str, int]]:
+    """
+    RSS, PSS, USS and shared memory of a process in KiB (Linux only).
+
+    USS (private clean + private dirty) is what the process would free on
+    exit; PSS splits each shared page between the processes mapping it.
+    """
+    fields: Dict[str, int] = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r", encoding="ascii") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1])
+    except (OSError, ValueError):
+        return None
+    return {
+        "rss_kb": fields.get("Rss", 0),
+        "pss_kb": fields.get("Pss", 0),
+        "uss_kb": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+        "shared_kb": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+    }
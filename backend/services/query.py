@@ -5,7 +5,9 @@ import json
 import logging
 import os
 import re
+import time
 from collections import OrderedDict
+from time import perf_counter
 from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import ValidationError
@@ -18,27 +20,34 @@ from ..services.conversation import conversation_manager
 from ..services.openrouter import OpenRouterService
 from ..services.query_complexity import QueryComplexityAnalyzer
 from ..services.parameter_validator import ParameterValidator
-from ..services.metadata_search import MetadataSearchService
 from ..services.provider_router import ProviderRouter
 from ..services.indicator_resolver import get_indicator_resolver, resolve_indicator
 from ..services.query_pipeline import QueryPipeline
+from ..services.lazy_registry import LazyComponent
+from ..services.cache_warmer import is_refreshing_cache
 from ..routing.country_resolver import CountryResolver
 from ..routing.unified_router import UnifiedRouter
-from ..routing.hybrid_router import HybridRouter
-from ..routing.semantic_provider_router import SemanticProviderRouter
-from ..providers.fred import FREDProvider
-from ..providers.worldbank import WorldBankProvider
-from ..providers.comtrade import ComtradeProvider
-from ..providers.statscan import StatsCanProvider
-from ..providers.imf import IMFProvider
-from ..providers.exchangerate import ExchangeRateProvider
-from ..providers.bis import BISProvider
-from ..providers.eurostat import EurostatProvider
-from ..providers.oecd import OECDProvider
-from ..providers.coingecko import CoinGeckoProvider
 from ..utils.geographies import normalize_canadian_region_list
+from ..utils.latency_metrics import timed_stage
 from ..utils.retry import retry_async, DataNotAvailableError
-from ..services.rate_limiter import is_provider_circuit_open
+from ..services.query_profiler import get_query_profiler
+from ..services.response_cache import (
+    collect_data_dependencies,
+    get_response_cache,
+    is_collecting_dependencies,
+    mark_response_uncacheable,
+    record_data_dependency,
+)
+from ..services.rate_limiter import PRIORITY_BACKGROUND, is_provider_circuit_open, request_priority
+from ..services.series_store import (
+    WINDOW_PARAM_KEYS,
+    StoredSeries,
+    estimate_periods_since,
+    get_series_store,
+    merge_series,
+    plan_delta_fetch,
+    slice_series,
+)
 from ..services.time_range_defaults import apply_default_time_range
 from ..utils.processing_steps import (
     ProcessingTracker,
@@ -46,6 +55,12 @@ from ..utils.processing_steps import (
     get_processing_tracker,
     reset_processing_tracker,
 )
+from ..utils.request_budget import (
+    RequestBudget,
+    activate_request_budget,
+    get_request_budget,
+    reset_request_budget,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -174,10 +189,68 @@ def _coerce_generated_file(file_item: Any) -> Optional[GeneratedFile]:
     return None
 
 
+def _build_metadata_search(service: "QueryService", cls: Any) -> Any:
+    if not service.openrouter.llm_provider:
+        logger.warning("⚠️ Metadata search service not available (no LLM provider)")
+        return None
+    logger.info("✅ Metadata search service initialized with LLM provider")
+    return cls(service.openrouter.llm_provider)
+
+
+def _with_metadata_search(service: "QueryService", cls: Any) -> Any:
+    # Providers use metadata search for intelligent discovery
+    return cls(metadata_search_service=service.metadata_search)
+
+
+def _build_semantic_provider_router(service: "QueryService", cls: Any) -> Any:
+    # Semantic provider router (default): semantic-router + LiteLLM fallback.
+    if not service.settings.use_semantic_provider_router:
+        return None
+    logger.info("🧭 SemanticProviderRouter enabled (USE_SEMANTIC_PROVIDER_ROUTER=true)")
+    return cls(settings=service.settings)
+
+
+def _build_hybrid_router(service: "QueryService", cls: Any) -> Any:
+    # Optional hybrid router: deterministic candidates + LLM ranking.
+    # Kept as fallback/legacy path when semantic provider router is disabled.
+    if not service.settings.use_hybrid_router or service.settings.use_semantic_provider_router:
+        return None
+    logger.info("🧠 HybridRouter enabled (USE_HYBRID_ROUTER=true)")
+    return cls(llm_provider=service.openrouter.llm_provider)
+
+
 class QueryService:
     # Bump when cache semantics change so stale entries from old logic are not reused.
     CACHE_KEY_VERSION = "2026-02-23.1"
     MAX_FALLBACK_CACHE_ENTRIES = 1024
+    # Providers whose fetch path honours a later startDate (or LatestNPeriods) for delta
+    # fetches. FRED is excluded: FREDProvider performs its own incremental pulls.
+    SERIES_STORE_PROVIDERS = {"WORLDBANK", "WORLD BANK", "IMF", "EUROSTAT", "OECD", "BIS", "STATSCAN", "STATISTICS CANADA"}
+
+    metadata_search = LazyComponent("..services.metadata_search", "MetadataSearchService", _build_metadata_search)
+    fred_provider = LazyComponent("..providers.fred", "FREDProvider", lambda service, cls: cls(service._fred_key))
+    world_bank_provider = LazyComponent("..providers.worldbank", "WorldBankProvider", _with_metadata_search)
+    comtrade_provider = LazyComponent(
+        "..providers.comtrade", "ComtradeProvider", lambda service, cls: cls(service._comtrade_key)
+    )
+    statscan_provider = LazyComponent("..providers.statscan", "StatsCanProvider", _with_metadata_search)
+    imf_provider = LazyComponent("..providers.imf", "IMFProvider", _with_metadata_search)
+    bis_provider = LazyComponent("..providers.bis", "BISProvider", _with_metadata_search)
+    eurostat_provider = LazyComponent("..providers.eurostat", "EurostatProvider", _with_metadata_search)
+    oecd_provider = LazyComponent("..providers.oecd", "OECDProvider", _with_metadata_search)
+    # ExchangeRate-API: Uses open access by default, API key optional
+    exchangerate_provider = LazyComponent(
+        "..providers.exchangerate", "ExchangeRateProvider",
+        lambda service, cls: cls(service.settings.exchangerate_api_key),
+    )
+    # CoinGecko: Cryptocurrency prices and market data
+    coingecko_provider = LazyComponent(
+        "..providers.coingecko", "CoinGeckoProvider", lambda service, cls: cls(service._coingecko_key)
+    )
+    semantic_provider_router = LazyComponent(
+        "..routing.semantic_provider_router", "SemanticProviderRouter", _build_semantic_provider_router
+    )
+    hybrid_router = LazyComponent("..routing.hybrid_router", "HybridRouter", _build_hybrid_router)
 
     def __init__(
         self,
@@ -191,43 +264,11 @@ class QueryService:
 
         self.settings = settings or get_settings()
         self.openrouter = OpenRouterService(openrouter_key, self.settings)
-
-        # Initialize metadata search service if LLM provider is available
-        metadata_search = None
-        if self.openrouter.llm_provider:
-            metadata_search = MetadataSearchService(self.openrouter.llm_provider)
-            logger.info("✅ Metadata search service initialized with LLM provider")
-        else:
-            logger.warning("⚠️ Metadata search service not available (no LLM provider)")
-
-        # Initialize providers with metadata search for intelligent discovery
-        self.fred_provider = FREDProvider(fred_key)
-        self.world_bank_provider = WorldBankProvider(metadata_search_service=metadata_search)
-        self.comtrade_provider = ComtradeProvider(comtrade_key)
-        self.statscan_provider = StatsCanProvider(metadata_search_service=metadata_search)
-        self.imf_provider = IMFProvider(metadata_search_service=metadata_search)
-        self.bis_provider = BISProvider(metadata_search_service=metadata_search)
-        self.eurostat_provider = EurostatProvider(metadata_search_service=metadata_search)
-        self.oecd_provider = OECDProvider(metadata_search_service=metadata_search)
-
-        # ExchangeRate-API: Uses open access by default, API key optional
-        self.exchangerate_provider = ExchangeRateProvider(self.settings.exchangerate_api_key)
-
-        # CoinGecko: Cryptocurrency prices and market data
-        self.coingecko_provider = CoinGeckoProvider(coingecko_key)
-
-        # Semantic provider router (default): semantic-router + LiteLLM fallback.
-        self.semantic_provider_router: Optional[SemanticProviderRouter] = None
-        if self.settings.use_semantic_provider_router:
-            self.semantic_provider_router = SemanticProviderRouter(settings=self.settings)
-            logger.info("🧭 SemanticProviderRouter enabled (USE_SEMANTIC_PROVIDER_ROUTER=true)")
-
-        # Optional hybrid router: deterministic candidates + LLM ranking.
-        # Kept as fallback/legacy path when semantic provider router is disabled.
-        self.hybrid_router: Optional[HybridRouter] = None
-        if self.settings.use_hybrid_router and not self.settings.use_semantic_provider_router:
-            self.hybrid_router = HybridRouter(llm_provider=self.openrouter.llm_provider)
-            logger.info("🧠 HybridRouter enabled (USE_HYBRID_ROUTER=true)")
+        # Providers, metadata search and the optional routers are LazyComponent
+        # class attributes: each is imported and built on first access.
+        self._fred_key = fred_key
+        self._comtrade_key = comtrade_key
+        self._coingecko_key = coingecko_key
 
         # Deterministic baseline router (single source of routing truth).
         self.unified_router = UnifiedRouter()
@@ -407,6 +448,7 @@ class QueryService:
                 extracted_country,
             )
 
+    @timed_stage("route")
     async def _select_routed_provider(self, intent: ParsedIntent, query: str) -> str:
         """
         Select provider using deterministic router, optionally enhanced by
@@ -944,6 +986,7 @@ class QueryService:
 
         return score
 
+    @timed_stage("rerank")
     def _rerank_data_by_query_relevance(self, query: str, data: List[Any]) -> List[Any]:
         """
         Reorder (and lightly filter) returned series by semantic relevance to query.
@@ -1105,6 +1148,7 @@ class QueryService:
         if not recovered_data:
             return None
 
+        mark_response_uncacheable("semantic_recovery")
         recovered_data = self._rerank_data_by_query_relevance(query, recovered_data)
         if ranking_or_comparison:
             recovered_data = self._apply_ranking_projection(query, recovered_data)
@@ -1794,6 +1838,8 @@ class QueryService:
         if provider_upper == "FRED":
             return iso2 == "US"
         if provider_upper == "BIS":
+            from ..providers.bis import BISProvider
+
             return iso2 in BISProvider.BIS_SUPPORTED_COUNTRIES
         return True
 
@@ -3860,6 +3906,10 @@ class QueryService:
         Returns:
             Cached data if available, None otherwise
         """
+        if is_refreshing_cache():
+            # The cache warmer is replacing this entry ahead of its expiry
+            return None
+
         cache_params = self._build_cache_params(provider, params)
 
         # Try Redis cache first
@@ -3869,6 +3919,9 @@ class QueryService:
             cached_data = await redis_cache.get(provider, query_key, cache_params)
             if cached_data:
                 logger.info(f"Redis cache hit for {provider}")
+                if is_collecting_dependencies():
+                    ttl = await redis_cache.get_ttl(provider, query_key, cache_params)
+                    record_data_dependency(query_key, time.time() + ttl if ttl is not None else None, tier="redis")
                 return cached_data
         except Exception as e:
             logger.warning(f"Redis cache error: {e}, falling back to in-memory")
@@ -3877,6 +3930,8 @@ class QueryService:
         cached_data = cache_service.get_data(provider, cache_params)
         if cached_data:
             logger.info(f"In-memory cache hit for {provider}")
+            data_key = cache_service.data_key(provider, cache_params)
+            record_data_dependency(data_key, cache_service.get_expiry(data_key))
             return cached_data
 
         return None
@@ -3904,6 +3959,35 @@ class QueryService:
         # Always save to in-memory cache as backup
         cache_service.cache_data(provider, cache_params, data)
         logger.debug(f"Saved to in-memory cache: {provider}")
+        data_key = cache_service.data_key(provider, cache_params)
+        record_data_dependency(data_key, cache_service.get_expiry(data_key))
+
+    def _uses_series_store(self, provider: str, params: dict) -> bool:
+        """Whether a cache miss for this request should go through the series store."""
+        if not getattr(self.settings, "use_series_store", False):
+            return False
+        if provider not in self.SERIES_STORE_PROVIDERS:
+            return False
+        if provider in {"STATSCAN", "STATISTICS CANADA"}:
+            # StatsCan windows are "latest N periods"; only explicit N can be trimmed back
+            return bool(params.get("periods"))
+        return True
+
+    def _build_series_delta_params(
+        self,
+        provider: str,
+        params: dict,
+        stored: StoredSeries,
+        delta_start: str,
+    ) -> Optional[dict]:
+        """Narrow request params to the periods after the stored history."""
+        delta_params = {**params, "startDate": delta_start}
+        if provider in {"STATSCAN", "STATISTICS CANADA"}:
+            periods = estimate_periods_since(delta_start, stored.series[0].metadata.frequency)
+            if periods is None:
+                return None
+            delta_params["periods"] = min(periods, int(params.get("periods") or periods))
+        return delta_params
 
     def _collect_target_countries(self, parameters: Optional[dict]) -> List[str]:
         """Extract ordered country context from query parameters."""
@@ -4026,6 +4110,7 @@ class QueryService:
 
         return ""
 
+    @timed_stage("coverage")
     async def _maybe_improve_country_coverage(
         self,
         query: str,
@@ -4720,6 +4805,7 @@ class QueryService:
                     intent.originalQuery,
                 ):
                     logger.info(f"✅ Fallback to {fallback_provider} succeeded")
+                    mark_response_uncacheable("provider_fallback")
                     return result
                 else:
                     logger.warning(
@@ -4742,6 +4828,102 @@ class QueryService:
         auto_pro_mode: bool = False,
         use_orchestrator: bool = False,
         allow_orchestrator: bool = True,
+        profile: bool = False,
+    ) -> QueryResponse:
+        """
+        Answer a natural-language query.
+
+        With profiling enabled, the query is profiled when ``profile`` is set
+        or the profiler samples it; see ``services/query_profiler.py``.
+        """
+        profiler = get_query_profiler() if self.settings.profiling_enabled else None
+        if profiler is None:
+            return await self._process_query_with_cache(
+                query, conversation_id, auto_pro_mode, use_orchestrator, allow_orchestrator
+            )
+
+        with profiler.profile(query, requested=profile) as session:
+            response = await self._process_query_with_cache(
+                query, conversation_id, auto_pro_mode, use_orchestrator, allow_orchestrator
+            )
+            if session is not None:
+                session.steps = list(response.processingSteps or [])
+            return response
+
+    async def _process_query_with_cache(
+        self,
+        query: str,
+        conversation_id: Optional[str],
+        auto_pro_mode: bool,
+        use_orchestrator: bool,
+        allow_orchestrator: bool,
+    ) -> QueryResponse:
+        """
+        Answer a natural-language query, reusing a cached response when possible.
+
+        Standalone queries (no conversation history) are served from the
+        response cache while the provider data behind them is still cached;
+        everything else runs the full pipeline.
+        """
+        response_cache = get_response_cache() if self.settings.use_response_cache else None
+        cache_key = None
+        if response_cache is not None and not (
+            conversation_id and conversation_manager.get_history(conversation_id)
+        ):
+            cache_key = response_cache.build_key(
+                query,
+                auto_pro_mode=auto_pro_mode,
+                orchestrator=allow_orchestrator and (use_orchestrator or self.settings.use_langchain_orchestrator),
+            )
+            cached = await response_cache.lookup(cache_key)
+            if cached is not None:
+                return self._serve_cached_response(query, conversation_id, cached)
+
+        if cache_key is None:
+            return await self._process_query_uncached(
+                query, conversation_id, auto_pro_mode, use_orchestrator, allow_orchestrator
+            )
+
+        start = perf_counter()
+        with collect_data_dependencies() as dependencies:
+            response = await self._process_query_uncached(
+                query, conversation_id, auto_pro_mode, use_orchestrator, allow_orchestrator
+            )
+        await response_cache.store(cache_key, response, dependencies, (perf_counter() - start) * 1000)
+        return response
+
+    def _serve_cached_response(
+        self,
+        query: str,
+        conversation_id: Optional[str],
+        cached: QueryResponse,
+    ) -> QueryResponse:
+        """Attach a cached response to the caller's conversation, as a full run would."""
+        conv_id = conversation_manager.get_or_create(conversation_id)
+        conv_id = conversation_manager.add_message_safe(conv_id, "user", query, intent=cached.intent)
+        provider = cached.intent.apiProvider if cached.intent else "cache"
+        conv_id = conversation_manager.add_message_safe(
+            conv_id,
+            "assistant",
+            f"Retrieved {len(cached.data or [])} data series from {provider}",
+        )
+
+        tracker = get_processing_tracker() or ProcessingTracker()
+        with tracker.track(
+            "response_cache_hit",
+            "⚡ Served instantly from cache",
+            {"provider": provider, "series_count": len(cached.data or [])},
+        ):
+            pass
+        return cached.model_copy(update={"conversationId": conv_id, "processingSteps": tracker.to_list()})
+
+    async def _process_query_uncached(
+        self,
+        query: str,
+        conversation_id: Optional[str] = None,
+        auto_pro_mode: bool = False,
+        use_orchestrator: bool = False,
+        allow_orchestrator: bool = True,
     ) -> QueryResponse:
         # Check if there's already an active tracker (e.g., from streaming endpoint)
         existing_tracker = get_processing_tracker()
@@ -4753,6 +4935,16 @@ class QueryService:
             # Create new tracker for non-streaming requests
             tracker = ProcessingTracker()
             tracker_token = activate_processing_tracker(tracker)
+        # One deadline and retry budget for everything this query triggers
+        budget_token = None
+        if get_request_budget() is None:
+            retry_budget = self.settings.request_retry_budget
+            budget_token = activate_request_budget(
+                RequestBudget(
+                    deadline_seconds=self.settings.request_deadline_seconds or None,
+                    max_retries=retry_budget if retry_budget >= 0 else None,
+                )
+            )
         try:
             conv_id = conversation_manager.get_or_create(conversation_id)
             history = conversation_manager.get_history(conv_id) if conversation_id else []
@@ -5142,6 +5334,8 @@ class QueryService:
                 processingSteps=tracker.to_list(),
             )
         finally:
+            if budget_token is not None:
+                reset_request_budget(budget_token)
             # Only reset tracker if we created it (not using existing one)
             if tracker_token is not None:
                 reset_processing_tracker(tracker_token)
@@ -5160,46 +5354,62 @@ class QueryService:
             logger.info("📅 Applying default time periods to multi-indicator query...")
             ParameterValidator.apply_default_time_periods(intent)
 
-        # Create separate intents for each indicator
-        fetch_tasks = []
-        for indicator in intent.indicators:
+        tracker = get_processing_tracker()
+        base_provider = normalize_provider_name(intent.apiProvider)
+
+        # Routing memo for this request: identical (indicator, countries) pairs share one decision
+        route_memo: Dict[Tuple[str, Tuple[str, ...]], asyncio.Task] = {}
+
+        def _countries_key(params: Dict[str, Any]) -> Tuple[str, ...]:
+            countries = params.get("countries")
+            if isinstance(countries, list):
+                return tuple(sorted(str(c).upper() for c in countries if c))
+            country = params.get("country")
+            return (str(country).upper(),) if country else ()
+
+        async def _route_indicator(indicator: str, params: Dict[str, Any]) -> str:
+            routing_intent = ParsedIntent(
+                apiProvider=base_provider,
+                indicators=[indicator],
+                parameters=dict(params),
+                clarificationNeeded=False,
+                originalQuery=intent.originalQuery,
+            )
+            try:
+                routed_provider = await self._select_routed_provider(
+                    routing_intent,
+                    f"{indicator} {intent.originalQuery or ''}".strip(),
+                )
+            except Exception as exc:
+                logger.debug(
+                    "Multi-indicator provider routing failed for '%s': %s",
+                    indicator,
+                    exc,
+                )
+                return base_provider
+            return routed_provider or base_provider
+
+        async def _route_and_fetch(indicator: str) -> List[NormalizedData]:
             # Create parameters for this indicator
             params = dict(intent.parameters) if intent.parameters else {}
 
-            # For FRED provider, set indicator (let _series_id() handle normalization)
-            if normalize_provider_name(intent.apiProvider) == "FRED":
+            # For FRED and StatsCan, set indicator (let provider normalization handle it)
+            if base_provider in {"FRED", "STATSCAN"}:
                 params["indicator"] = indicator
 
-            # For StatsCan, set indicator field
-            if normalize_provider_name(intent.apiProvider) == "STATSCAN":
-                params["indicator"] = indicator
-
-            single_provider = normalize_provider_name(intent.apiProvider)
+            route_start = perf_counter()
             if explicit_provider:
                 single_provider = explicit_provider
             else:
-                try:
-                    routing_intent = ParsedIntent(
-                        apiProvider=single_provider,
-                        indicators=[indicator],
-                        parameters=dict(params),
-                        clarificationNeeded=False,
-                        originalQuery=intent.originalQuery,
-                    )
-                    routed_provider = await self._select_routed_provider(
-                        routing_intent,
-                        f"{indicator} {intent.originalQuery or ''}".strip(),
-                    )
-                    if routed_provider:
-                        single_provider = routed_provider
-                except Exception as exc:
-                    logger.debug(
-                        "Multi-indicator provider routing failed for '%s': %s",
-                        indicator,
-                        exc,
-                    )
-
-            # Create a new intent with single indicator
+                memo_key = (str(indicator).strip().lower(), _countries_key(params))
+                route_task = route_memo.get(memo_key)
+                if route_task is None:
+                    route_task = asyncio.ensure_future(_route_indicator(indicator, params))
+                    route_memo[memo_key] = route_task
+                single_provider = await route_task
+            route_ms = (perf_counter() - route_start) * 1000
+
+            # Create a new intent with single indicator; its fetch starts as soon as its route is known
             single_intent = ParsedIntent(
                 apiProvider=single_provider,
                 indicators=[indicator],
@@ -5210,17 +5420,42 @@ class QueryService:
                 originalQuery=intent.originalQuery,
             )
 
-            # Create fetch task with retry
-            task = retry_async(
-                lambda i=single_intent: self._fetch_data(i),
-                max_attempts=3,
-                initial_delay=1.0,
-            )
-            fetch_tasks.append(task)
+            fetch_start = perf_counter()
+            status = "completed"
+            try:
+                series = await retry_async(
+                    lambda: self._fetch_data(single_intent),
+                    max_attempts=3,
+                    initial_delay=1.0,
+                )
+                if tracker:
+                    tracker.emit_series(series, {"indicator": indicator, "provider": single_provider})
+                return series
+            except Exception:
+                status = "error"
+                raise
+            finally:
+                fetch_ms = (perf_counter() - fetch_start) * 1000
+                if tracker:
+                    tracker.add_step(
+                        "fetching_indicator",
+                        f"📥 {indicator} via {single_provider}",
+                        duration_ms=route_ms + fetch_ms,
+                        metadata={
+                            "indicator": indicator,
+                            "provider": single_provider,
+                            "route_ms": round(route_ms, 1),
+                            "fetch_ms": round(fetch_ms, 1),
+                        },
+                        status=status,
+                    )
 
-        # Fetch all indicators in parallel
-        logger.info("🔄 Fetching %s indicators in parallel...", len(fetch_tasks))
-        results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
+        # Route and fetch every indicator concurrently
+        logger.info("🔄 Fetching %s indicators in parallel...", len(intent.indicators))
+        results = await asyncio.gather(
+            *(_route_and_fetch(indicator) for indicator in intent.indicators),
+            return_exceptions=True,
+        )
 
         # Collect successful results
         for i, result in enumerate(results):
@@ -5242,6 +5477,7 @@ class QueryService:
         logger.info("✅ Successfully fetched %s datasets for %s indicators", len(all_data), len(intent.indicators))
         return all_data
 
+    @timed_stage("fetch", provider=lambda self, intent: normalize_provider_name(intent.apiProvider))
     async def _fetch_data(self, intent: ParsedIntent) -> List[NormalizedData]:
         logger.info(f"🔍 _fetch_data called: provider={intent.apiProvider}, indicators={intent.indicators}")
 
@@ -6333,6 +6569,57 @@ class QueryService:
                 f"Provider {intent.apiProvider} is not yet implemented. Available providers: FRED, World Bank, Comtrade, StatsCan, IMF, ExchangeRate, BIS, Eurostat, OECD, CoinGecko"
             )
 
+        async def fetch_with_series_store() -> List[NormalizedData]:
+            """Serve from / extend the local series store, fetching only what is missing."""
+            nonlocal params
+
+            if not self._uses_series_store(provider, params):
+                return await fetch_from_provider()
+
+            series_store = get_series_store()
+            store_key = series_store.build_key(provider, params)
+            # sqlite and whole-history JSON (de)serialisation stay off the event loop
+            stored = await asyncio.to_thread(series_store.get, store_key)
+            request_params = params
+            start_date = request_params.get("startDate")
+            end_date = request_params.get("endDate")
+            last_n = request_params.get("periods") if provider in {"STATSCAN", "STATISTICS CANADA"} else None
+            plan = plan_delta_fetch(stored, start_date, end_date, series_store.FULL_REFRESH_SECONDS)
+
+            if plan.mode == "serve" and stored is not None:
+                series_store.served_locally += 1
+                logger.info("🗄️ Series store covers %s request window; no provider call needed", provider)
+                return slice_series(stored.series, start_date, end_date, last_n)
+
+            if plan.mode == "delta" and stored is not None and plan.delta_start:
+                delta_params = self._build_series_delta_params(provider, params, stored, plan.delta_start)
+                if delta_params is not None:
+                    params = delta_params
+                    try:
+                        delta = await fetch_from_provider()
+                    except DataNotAvailableError as exc:
+                        logger.info("🗄️ %s delta fetch since %s failed (%s); fetching in full", provider, plan.delta_start, exc)
+                        delta = None
+                    finally:
+                        # Restore the caller's window so cache keys match the original request
+                        restored = {k: v for k, v in params.items() if k not in WINDOW_PARAM_KEYS}
+                        restored.update({k: v for k, v in request_params.items() if k in WINDOW_PARAM_KEYS})
+                        params = restored
+
+                    merged = merge_series(stored.series, delta) if delta else None
+                    if merged is not None:
+                        series_store.delta_fetches += 1
+                        await asyncio.to_thread(
+                            series_store.put, store_key, merged, start_date, full_fetch=False, previous=stored
+                        )
+                        logger.info("🗄️ %s delta fetch since %s merged into %d stored series", provider, plan.delta_start, len(merged))
+                        return slice_series(merged, start_date, end_date, last_n)
+
+            result = await fetch_from_provider()
+            if result:
+                await asyncio.to_thread(series_store.put, store_key, result, start_date, full_fetch=True)
+            return result
+
         if tracker:
             # Make message more specific based on provider
             provider_names = {
@@ -6356,13 +6643,13 @@ class QueryService:
                     "indicator_count": len(intent.indicators),
                 },
             ) as update_fetch_metadata:
-                result = await fetch_from_provider()
+                result = await fetch_with_series_store()
                 update_fetch_metadata({
                     "series_count": len(result),
                     "cached": False,
                 })
         else:
-            result = await fetch_from_provider()
+            result = await fetch_with_series_store()
 
         if not result or (len(result) == 1 and not result[0].data):
             raise DataNotAvailableError(
@@ -7954,18 +8241,38 @@ class QueryService:
 
         logger.debug("Generated %d sub-queries: %s", len(sub_queries), [sq[1] for sq in sub_queries[:3]])
 
-        # Execute sub-queries in parallel using asyncio.gather
-        if tracker:
-            with tracker.track("fetching_data", f"📥 Fetching data for {len(sub_queries)} {intent.decompositionType}..."):
+        async def execute_and_stream(entity: str, sub_query: str) -> Optional[List[NormalizedData]]:
+            result = await self._execute_sub_query(entity, sub_query, intent, conversation_id)
+            if result:
+                # Add entity name to metadata for identification
+                for normalized_data in result:
+                    # Store entity name in metadata.country or a custom field
+                    if intent.decompositionType == "provinces":
+                        normalized_data.metadata.country = entity
+                    elif intent.decompositionType == "states":
+                        normalized_data.metadata.country = entity
+                    elif intent.decompositionType == "countries":
+                        # Already has country in metadata
+                        pass
+                if tracker:
+                    tracker.emit_series(result, {"entity": entity})
+            return result
+
+        # Execute sub-queries in parallel using asyncio.gather.
+        # Decomposition fan-out runs at background priority so the provider rate
+        # limiters keep serving interactive queries first.
+        with request_priority(PRIORITY_BACKGROUND):
+            if tracker:
+                with tracker.track("fetching_data", f"📥 Fetching data for {len(sub_queries)} {intent.decompositionType}..."):
+                    results = await asyncio.gather(*[
+                        execute_and_stream(entity, sq)
+                        for entity, sq in sub_queries
+                    ], return_exceptions=True)
+            else:
                 results = await asyncio.gather(*[
-                    self._execute_sub_query(entity, sq, intent, conversation_id)
+                    execute_and_stream(entity, sq)
                     for entity, sq in sub_queries
                 ], return_exceptions=True)
-        else:
-            results = await asyncio.gather(*[
-                self._execute_sub_query(entity, sq, intent, conversation_id)
-                for entity, sq in sub_queries
-            ], return_exceptions=True)
 
         # Filter out failed queries and aggregate successful results
         aggregated_data = []
@@ -7980,17 +8287,6 @@ class QueryService:
                 continue
 
             if result:
-                # Add entity name to metadata for identification
-                for normalized_data in result:
-                    # Store entity name in metadata.country or a custom field
-                    if intent.decompositionType == "provinces":
-                        normalized_data.metadata.country = entity
-                    elif intent.decompositionType == "states":
-                        normalized_data.metadata.country = entity
-                    elif intent.decompositionType == "countries":
-                        # Already has country in metadata
-                        pass
-
                 aggregated_data.extend(result)
 
         logger.info("✅ Query decomposition completed: %d/%d entities succeeded, %d failed",
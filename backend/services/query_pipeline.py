@@ -8,9 +8,14 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from time import perf_counter
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
+from ..config import get_settings
 from ..models import ParsedIntent
+from ..utils.latency_metrics import timed_stage
+from .fast_path_parser import get_fast_path_parser
+from .intent_cache import get_intent_cache
 from .parameter_validator import ParameterValidator
 from .provider_router import ProviderRouter
 
@@ -57,7 +62,7 @@ class QueryPipeline:
         Returns:
             ParseRouteResult with routed intent and optional routing warning.
         """
-        parsed_intent = await self.query_service.openrouter.parse_query(query, history or [])
+        parsed_intent = await self._parse_intent(query, history or [])
         parsed_intent.originalQuery = query
 
         # Geography override is deterministic and should always be applied post-parse.
@@ -99,6 +104,35 @@ class QueryPipeline:
             validation_warning=validation_warning,
         )
 
+    @timed_stage("parse")
+    async def _parse_intent(self, query: str, history: List[str]) -> ParsedIntent:
+        """
+        Parse with the LLM, reusing a cached intent for repeated queries.
+
+        The cache holds raw parser output only; the deterministic post-parse
+        steps in parse_and_route still run on every cached intent. Standalone
+        simple queries the fast-path parser handles confidently skip the LLM.
+        """
+        settings = get_settings()
+        intent_cache = get_intent_cache() if settings.use_intent_cache else None
+        if intent_cache is not None:
+            cached_intent = await intent_cache.lookup(query, history)
+            if cached_intent is not None:
+                logger.info("⚡ Intent cache hit: %s", query)
+                return cached_intent
+
+        # Follow-ups depend on conversation context, so only standalone queries qualify
+        if settings.use_fast_path_parser and not history:
+            fast_intent = get_fast_path_parser().try_parse(query, settings.fast_path_min_confidence)
+            if fast_intent is not None:
+                return fast_intent
+
+        start = perf_counter()
+        parsed_intent = await self.query_service.openrouter.parse_query(query, history)
+        if intent_cache is not None:
+            await intent_cache.store(query, history, parsed_intent, (perf_counter() - start) * 1000)
+        return parsed_intent
+
     def validate_intent(self, intent: ParsedIntent) -> ValidationResult:
         """
         Validate parsed intent and confidence in a shared stage.
@@ -0,0 +1,370 @@
+"""
+Query Profiler
+
+Opt-in profiling of slow queries (PROFILING_ENABLED). A query is profiled
+when the caller sends ``X-Profile: 1`` together with
+``Authorization: Bearer <PROFILING_TOKEN>``, or when PROFILING_SAMPLE_RATE
+picks it. While at least one profiled query runs:
+
+- a sampler thread records the event-loop thread's Python stack every
+  PROFILING_INTERVAL_MS. A sample with no coroutine running is idle: the
+  loop was waiting on I/O or timers (LLM calls, upstream requests,
+  rate-limiter sleeps). Any other sample is synchronous work running on the
+  loop (resolver scoring, embedding, parsing).
+- a loop-lag probe measures how late a periodic wake-up fires, i.e. how long
+  the loop was blocked.
+
+A profiled query also adds up the time it waited for rate-limiter slots and
+for upstream HTTP responses (``record_wait``). Profiles of requested queries,
+and of sampled ones slower than PROFILING_SLOW_THRESHOLD_MS, are kept with
+the query's ProcessingTracker steps in a bounded ring buffer served by
+``/api/debug/profiles``.
+
+The event loop serves several queries at once, so stack samples and loop lag
+are shared by every query profiled at the same time; each profile reports how
+many overlapped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How often the lag probe wakes up, and the lag worth listing individually
+LAG_PROBE_SECONDS = 0.05
+LAG_EVENT_SECONDS = 0.05
+MAX_STACK_DEPTH = 64
+
+# Frames of coroutines, async generators and generator-based coroutines
+_COROUTINE_FLAGS = inspect.CO_COROUTINE | inspect.CO_ASYNC_GENERATOR | inspect.CO_ITERABLE_COROUTINE
+
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Profile of the query running in this context (None when not profiled)
+_session_var: ContextVar[Optional["ProfileSession"]] = ContextVar("query_profile_session", default=None)
+
+
+def record_wait(kind: str, seconds: float) -> None:
+    """Add time the current query spent waiting (no-op unless it is profiled)."""
+    session = _session_var.get()
+    if session is not None:
+        session.add_wait(kind, seconds)
+
+
+def _frame_label(frame: Any) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(_BACKEND_ROOT):
+        filename = "backend" + filename[len(_BACKEND_ROOT):]
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename}:{frame.f_lineno})"
+
+
+def collapse_stack(frame: Any) -> Tuple[str, bool]:
+    """
+    Root-first ``;``-joined stack of a frame, and whether the loop was idle.
+
+    The loop is idle when no coroutine is running on it: the pure-Python
+    loop then sits in ``selectors.py``, and uvloop waits in C with only the
+    frame that entered the loop (e.g. ``asyncio.run``) above it. Both have no
+    coroutine frame on the stack, which does not depend on the loop in use.
+    """
+    idle = True
+    labels: List[str] = []
+    while frame is not None:
+        if frame.f_code.co_flags & _COROUTINE_FLAGS:
+            idle = False
+        if len(labels) < MAX_STACK_DEPTH:
+            labels.append(_frame_label(frame))
+        elif not idle:
+            break
+        frame = frame.f_back
+    return ";".join(reversed(labels)), idle
+
+
+class ProfileSession:
+    """Samples, loop lag and waits collected for one profiled query."""
+
+    MAX_STACKS = 2000
+    MAX_LAG_EVENTS = 100
+
+    def __init__(self, query: str, reason: str) -> None:
+        self.id = uuid.uuid4().hex[:12]
+        self.query = query[:200]
+        self.reason = reason
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self.start = perf_counter()
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self.idle_samples = 0
+        self.dropped_stacks = 0
+        self.max_lag = 0.0
+        self.blocked = 0.0
+        self.lag_events: List[Dict[str, float]] = []
+        self.waits: Dict[str, float] = {}
+        self.wait_counts: Dict[str, int] = {}
+        self.max_overlap = 1
+        self.steps: List[Any] = []
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def add_sample(self, stack: str, idle: bool) -> None:
+        with self._lock:
+            self.samples += 1
+            if idle:
+                self.idle_samples += 1
+            elif stack in self.stacks or len(self.stacks) < self.MAX_STACKS:
+                self.stacks[stack] += 1
+            else:
+                self.dropped_stacks += 1
+
+    def add_lag(self, lag: float) -> None:
+        with self._lock:
+            self.blocked += lag
+            self.max_lag = max(self.max_lag, lag)
+            if lag >= LAG_EVENT_SECONDS and len(self.lag_events) < self.MAX_LAG_EVENTS:
+                self.lag_events.append({
+                    "at_ms": round((perf_counter() - self.start) * 1000, 1),
+                    "lag_ms": round(lag * 1000, 1),
+                })
+
+    def add_wait(self, kind: str, seconds: float) -> None:
+        with self._lock:
+            self.waits[kind] = self.waits.get(kind, 0.0) + seconds
+            self.wait_counts[kind] = self.wait_counts.get(kind, 0) + 1
+
+    def to_report(self, interval: float) -> Dict[str, Any]:
+        with self._lock:
+            stacks = self.stacks.most_common()
+            busy = self.samples - self.idle_samples
+            waits = dict(self.waits)
+            wait_counts = dict(self.wait_counts)
+            lag_events = list(self.lag_events)
+
+        leaf_functions: Counter[str] = Counter()
+        for stack, count in stacks:
+            leaf_functions[stack.rsplit(";", 1)[-1]] += count
+
+        return {
+            "id": self.id,
+            "query": self.query,
+            "reason": self.reason,
+            "started_at": self.started_at,
+            "duration_ms": round((perf_counter() - self.start) * 1000, 1),
+            "error": self.error,
+            "concurrent_profiles": self.max_overlap,
+            "steps": [step.model_dump() if hasattr(step, "model_dump") else step for step in self.steps],
+            "event_loop": {
+                "max_lag_ms": round(self.max_lag * 1000, 1),
+                "blocked_ms": round(self.blocked * 1000, 1),
+                "lag_events": lag_events,
+            },
+            "waits": {
+                f"{kind}_ms": round(seconds * 1000, 1) for kind, seconds in sorted(waits.items())
+            } | {f"{kind}_count": count for kind, count in sorted(wait_counts.items())},
+            "samples": {
+                "interval_ms": round(interval * 1000, 1),
+                "total": self.samples,
+                "busy": busy,
+                "idle": self.idle_samples,
+                "busy_ms_estimate": round(busy * interval * 1000, 1),
+                "dropped_stacks": self.dropped_stacks,
+                "top_functions": [
+                    {"function": function, "samples": count}
+                    for function, count in leaf_functions.most_common(20)
+                ],
+                "stacks": [{"stack": stack, "samples": count} for stack, count in stacks[:200]],
+            },
+        }
+
+
+class QueryProfiler:
+    """Starts profiles, runs the shared sampler and lag probe, and keeps recent profiles."""
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        slow_threshold_ms: float = 10000.0,
+        interval_ms: float = 10.0,
+        buffer_size: int = 50,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.slow_threshold_ms = slow_threshold_ms
+        self.interval = max(interval_ms, 1.0) / 1000
+        self.profiles: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self._active: Set[ProfileSession] = set()
+        self._lock = threading.Lock()
+        self._loop_thread_id: Optional[int] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._lag_task: Optional[asyncio.Task] = None
+        self.started = 0
+        self.kept = 0
+
+    def _reason(self, requested: bool) -> Optional[str]:
+        if requested:
+            return "requested"
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return "sampled"
+        return None
+
+    @contextmanager
+    def profile(self, query: str, requested: bool = False) -> Iterator[Optional[ProfileSession]]:
+        """
+        Profile the block if requested or sampled.
+
+        Yields the session (None when not profiled) so the caller can attach
+        the query's processing steps. Nested queries share the outer profile.
+        """
+        reason = self._reason(requested) if _session_var.get() is None else None
+        if reason is None:
+            yield None
+            return
+
+        session = ProfileSession(query, reason)
+        token = _session_var.set(session)
+        self._activate(session)
+        try:
+            yield session
+        except BaseException as exc:
+            session.error = f"{type(exc).__name__}: {exc}"[:300]
+            raise
+        finally:
+            _session_var.reset(token)
+            self._finish(session)
+
+    def _activate(self, session: ProfileSession) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.started += 1
+            self._active.add(session)
+            overlap = len(self._active)
+            for active in self._active:
+                active.max_overlap = max(active.max_overlap, overlap)
+            self._loop_thread_id = threading.get_ident()
+            if self._sampler is None:
+                self._sampler = threading.Thread(target=self._sample_loop, name="query-profiler", daemon=True)
+                self._sampler.start()
+            if self._lag_task is None or self._lag_task.done() or self._lag_task.get_loop() is not loop:
+                self._lag_task = loop.create_task(self._probe_lag())
+
+    def _finish(self, session: ProfileSession) -> None:
+        with self._lock:
+            self._active.discard(session)
+        report = session.to_report(self.interval)
+        if session.reason == "requested" or report["duration_ms"] >= self.slow_threshold_ms:
+            self.profiles.append(report)
+            self.kept += 1
+            logger.info(
+                "Kept query profile %s (%s, %.0fms, max loop lag %.0fms)",
+                session.id,
+                session.reason,
+                report["duration_ms"],
+                report["event_loop"]["max_lag_ms"],
+            )
+
+    def _sample_loop(self) -> None:
+        while True:
+            with self._lock:
+                if not self._active:
+                    self._sampler = None
+                    return
+                sessions = list(self._active)
+                thread_id = self._loop_thread_id
+            frame = sys._current_frames().get(thread_id)  # pylint: disable=protected-access
+            if frame is not None:
+                stack, idle = collapse_stack(frame)
+                del frame
+                for session in sessions:
+                    session.add_sample(stack, idle)
+            time.sleep(self.interval)
+
+    async def _probe_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if not self._active:
+                    return
+            start = loop.time()
+            await asyncio.sleep(LAG_PROBE_SECONDS)
+            lag = loop.time() - start - LAG_PROBE_SECONDS
+            if lag > 0:
+                with self._lock:
+                    sessions = list(self._active)
+                for session in sessions:
+                    session.add_lag(lag)
+
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        """Return a kept profile by id."""
+        for report in list(self.profiles):
+            if report["id"] == profile_id:
+                return report
+        return None
+
+    def list_profiles(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Summaries of the most recent kept profiles, newest first."""
+        return [
+            {
+                "id": report["id"],
+                "query": report["query"],
+                "reason": report["reason"],
+                "started_at": report["started_at"],
+                "duration_ms": report["duration_ms"],
+                "max_lag_ms": report["event_loop"]["max_lag_ms"],
+                "busy_ms_estimate": report["samples"]["busy_ms_estimate"],
+            }
+            for report in list(self.profiles)[::-1][:limit]
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get profiler statistics."""
+        with self._lock:
+            active = len(self._active)
+        return {
+            "sample_rate": self.sample_rate,
+            "slow_threshold_ms": self.slow_threshold_ms,
+            "active": active,
+            "started": self.started,
+            "kept": self.kept,
+            "buffered": len(self.profiles),
+        }
+
+
+def to_collapsed(report: Dict[str, Any]) -> str:
+    """Render a profile's busy stacks in the collapsed format flame graph tools read."""
+    return "".join(f"{entry['stack']} {entry['samples']}\n" for entry in report["samples"]["stacks"])
+
+
+# Global instance
+_query_profiler: Optional[QueryProfiler] = None
+
+
+def get_query_profiler() -> QueryProfiler:
+    """Get the global query profiler instance."""
+    global _query_profiler
+    if _query_profiler is None:
+        from ..config import get_settings
+
+        settings = get_settings()
+        _query_profiler = QueryProfiler(
+            sample_rate=settings.profiling_sample_rate,
+            slow_threshold_ms=settings.profiling_slow_threshold_ms,
+            interval_ms=settings.profiling_interval_ms,
+            buffer_size=settings.profiling_buffer_size,
+        )
+    return _query_profiler
@@ -2,18 +2,72 @@
 
 This module prevents rate limit errors by tracking request counts and enforcing
 delays between requests to stay within provider limits.
+
+Send slots are handed out by a per-provider scheduler: callers enqueue a
+reservation and a single dispatcher grants slots one at a time (by priority,
+then arrival order), recording each request at grant time. Concurrent callers
+therefore never compute the same delay and wake together in a burst.
 """
 from __future__ import annotations
 
+import asyncio
+import heapq
+import itertools
 import logging
 import time
-from typing import Dict, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
 from collections import deque
 from datetime import datetime, timedelta
 
+from .query_profiler import record_wait
+
 logger = logging.getLogger(__name__)
 
 
+# Lower value = served first. Interactive user queries beat background work
+# such as query decomposition fan-out or cache warming.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+# Upper bounds (seconds) of the wait-time histogram buckets.
+WAIT_TIME_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_request_priority_var: ContextVar[int] = ContextVar(
+    "provider_request_priority", default=PRIORITY_INTERACTIVE
+)
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """Set the scheduling priority for provider requests made in this context.
+
+    Tasks spawned inside the block (e.g. via ``asyncio.gather``) inherit it.
+    """
+    token = _request_priority_var.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority_var.reset(token)
+
+
+def get_request_priority() -> int:
+    """Return the scheduling priority of the current async context."""
+    return _request_priority_var.get()
+
+
+@dataclass(order=True)
+class _Reservation:
+    """A queued request for a send slot (ordered by priority, then FIFO)."""
+
+    priority: int
+    sequence: int
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+
 class RateLimiterConfig:
     """Configuration for a provider's rate limits."""
 
@@ -53,6 +107,17 @@ class ProviderRateLimiter:
         self._circuit_open_until: Optional[float] = None  # Timestamp when circuit breaker closes
         self._consecutive_429_count: int = 0  # Number of consecutive 429 errors
 
+        # Slot scheduler state - pending reservations and the task granting them
+        self._waiters: List[_Reservation] = []
+        self._sequence = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        # Scheduler metrics
+        self._granted_total = 0
+        self._max_queue_depth = 0
+        self._total_wait_seconds = 0.0
+        self._wait_histogram: List[int] = [0] * (len(WAIT_TIME_BUCKETS) + 1)
+
     def _cleanup_windows(self, current_time: float) -> None:
         """Remove timestamps outside sliding windows."""
         minute_cutoff = current_time - 60  # 1 minute ago
@@ -105,25 +170,155 @@ class ProviderRateLimiter:
         # Return maximum delay needed
         return max(delays) if delays else 0
 
-    async def wait_until_ready(self) -> float:
+    async def wait_until_ready(self, priority: Optional[int] = None) -> float:
         """
-        Wait until the next request can be made.
+        Wait for a reserved send slot.
+
+        The slot is recorded as a request when it is granted, so callers must
+        not call ``record_request`` again for the same request.
+
+        Args:
+            priority: Scheduling priority (lower is served first). Defaults to
+                the priority of the current context (see ``request_priority``).
 
         Returns:
             Delay that was applied (in seconds)
         """
-        import asyncio
-
-        delay = self.get_delay_until_ready()
-        if delay > 0:
-            logger.info(
-                f"🚦 {self.config.name} rate limit: waiting {delay:.1f}s before next request "
-                f"(minute: {len(self.minute_window)}/{self.config.max_requests_per_minute}, "
-                f"hour: {len(self.hour_window)}/{self.config.max_requests_per_hour})"
-            )
-            await asyncio.sleep(delay)
+        if priority is None:
+            priority = get_request_priority()
+
+        loop = asyncio.get_running_loop()
+        enqueued_at = time.monotonic()
+
+        # Fast path: nobody queued and the provider is ready now.
+        if not self._waiters and self.get_delay_until_ready() <= 0:
+            self._grant(enqueued_at)
+            record_wait("rate_limiter", 0.0)
+            return 0.0
+
+        reservation = _Reservation(
+            priority=priority,
+            sequence=next(self._sequence),
+            future=loop.create_future(),
+            enqueued_at=enqueued_at,
+        )
+        heapq.heappush(self._waiters, reservation)
+        self._max_queue_depth = max(self._max_queue_depth, len(self._waiters))
+        self._ensure_dispatcher(loop)
 
-        return delay
+        await reservation.future
+        waited = time.monotonic() - enqueued_at
+        record_wait("rate_limiter", waited)
+        return waited
+
+    def try_acquire_now(self) -> bool:
+        """
+        Take a send slot only if one is free right now, without queueing.
+
+        Used for optional extra requests (e.g. hedges) that must never delay
+        or displace queued reservations. Counts as a request when granted.
+        """
+        if self._waiters or self.is_circuit_open() or self.get_delay_until_ready() > 0:
+            return False
+        self._grant(time.monotonic())
+        return True
+
+    def _ensure_dispatcher(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the slot dispatcher on the current loop if it is not running."""
+        dispatcher = self._dispatcher
+        if dispatcher is not None and not dispatcher.done() and dispatcher.get_loop() is loop:
+            return
+        self._dispatcher = loop.create_task(self._dispatch())
+
+    def _prune_waiters(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Drop cancelled reservations and ones left behind by a closed event loop."""
+        live = [
+            r for r in self._waiters
+            if not r.future.done() and r.future.get_loop() is loop
+        ]
+        if len(live) != len(self._waiters):
+            heapq.heapify(live)
+            self._waiters = live
+
+    async def _dispatch(self) -> None:
+        """Grant send slots to queued reservations one at a time."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                self._prune_waiters(loop)
+                if not self._waiters:
+                    return
+
+                delay = self.get_delay_until_ready()
+                if delay > 0:
+                    logger.info(
+                        f"🚦 {self.config.name} rate limit: waiting {delay:.1f}s before next request "
+                        f"(queued: {len(self._waiters)}, "
+                        f"minute: {len(self.minute_window)}/{self.config.max_requests_per_minute}, "
+                        f"hour: {len(self.hour_window)}/{self.config.max_requests_per_hour})"
+                    )
+                    await asyncio.sleep(delay)
+                    # Re-evaluate: higher-priority reservations may have arrived meanwhile
+                    continue
+
+                reservation = heapq.heappop(self._waiters)
+                if reservation.future.done():
+                    continue
+                self._grant(reservation.enqueued_at)
+                reservation.future.set_result(None)
+        finally:
+            if self._dispatcher is asyncio.current_task():
+                self._dispatcher = None
+
+    def _grant(self, enqueued_at: float) -> None:
+        """Record a granted slot as a request and update wait-time metrics."""
+        self.record_request()
+        waited = time.monotonic() - enqueued_at
+        self._granted_total += 1
+        self._total_wait_seconds += waited
+        for index, upper in enumerate(WAIT_TIME_BUCKETS):
+            if waited <= upper:
+                self._wait_histogram[index] += 1
+                break
+        else:
+            self._wait_histogram[-1] += 1
+
+    def get_scheduler_stats(self) -> dict:
+        """Get queue depth and wait-time histogram for this provider."""
+        buckets: Dict[str, int] = {}
+        cumulative = 0
+        for upper, count in zip(WAIT_TIME_BUCKETS, self._wait_histogram):
+            cumulative += count
+            buckets[f"le_{upper:g}s"] = cumulative
+        buckets["le_inf"] = cumulative + self._wait_histogram[-1]
+
+        avg_wait_ms = (
+            self._total_wait_seconds / self._granted_total * 1000
+            if self._granted_total
+            else 0.0
+        )
+        return {
+            "name": self.config.name,
+            "queue_depth": sum(1 for r in self._waiters if not r.future.done()),
+            "max_queue_depth": self._max_queue_depth,
+            "granted": self._granted_total,
+            "average_wait_ms": round(avg_wait_ms, 2),
+            "wait_time_histogram": buckets,
+        }
+
+    def get_budget_usage(self) -> float:
+        """
+        Fraction of the tightest request window already used (0.0-1.0).
+
+        Providers without per-minute or per-hour limits report 0.0.
+        """
+        self._cleanup_windows(time.time())
+        usage = 0.0
+        if self.config.max_requests_per_minute:
+            usage = max(usage, len(self.minute_window) / self.config.max_requests_per_minute)
+        if self.config.max_requests_per_hour:
+            usage = max(usage, len(self.hour_window) / self.config.max_requests_per_hour)
+        return min(usage, 1.0)
 
     def record_request(self) -> None:
         """Record that a request was just made."""
@@ -273,6 +468,13 @@ class GlobalRateLimiter:
         for name, config in self.DEFAULT_CONFIGS.items():
             self._limiters[name] = ProviderRateLimiter(config)
 
+    def get_all_scheduler_stats(self) -> Dict[str, dict]:
+        """Get scheduler statistics for every provider limiter."""
+        return {
+            name: limiter.get_scheduler_stats()
+            for name, limiter in self._limiters.items()
+        }
+
     def get_limiter(self, provider: str) -> ProviderRateLimiter:
         """Get or create a rate limiter for a provider."""
         provider_upper = provider.upper()
@@ -311,22 +513,32 @@ def get_global_rate_limiter() -> GlobalRateLimiter:
     return _global_rate_limiter
 
 
-async def wait_for_provider(provider: str) -> float:
+async def wait_for_provider(provider: str, priority: Optional[int] = None) -> float:
     """
-    Wait until it's safe to make a request to a provider.
+    Wait for a reserved send slot for a provider.
+
+    The slot counts as a request once granted; do not also call
+    ``record_provider_request`` for it.
 
     Args:
         provider: Provider name (e.g., "OECD")
+        priority: Scheduling priority (defaults to the current context's priority)
 
     Returns:
         Delay that was applied in seconds
     """
     limiter = get_global_rate_limiter().get_limiter(provider)
-    return await limiter.wait_until_ready()
+    return await limiter.wait_until_ready(priority)
+
+
+def try_acquire_provider_slot(provider: str) -> bool:
+    """Take a free send slot for an optional request; False if none is free now."""
+    limiter = get_global_rate_limiter().get_limiter(provider)
+    return limiter.try_acquire_now()
 
 
 def record_provider_request(provider: str) -> None:
-    """Record that a request was made to a provider."""
+    """Record a request made without a reserved slot (bypassing ``wait_for_provider``)."""
     limiter = get_global_rate_limiter().get_limiter(provider)
     limiter.record_request()
 
@@ -356,7 +568,18 @@ def is_provider_circuit_open(provider: str) -> bool:
     return limiter.is_circuit_open()
 
 
+def get_provider_budget_usage(provider: str) -> float:
+    """Fraction of a provider's tightest rate-limit window already used."""
+    limiter = get_global_rate_limiter().get_limiter(provider)
+    return limiter.get_budget_usage()
+
+
 def get_provider_circuit_status(provider: str) -> dict:
     """Get detailed circuit breaker status for a provider."""
     limiter = get_global_rate_limiter().get_limiter(provider)
     return limiter.get_circuit_status()
+
+
+def get_rate_limiter_stats() -> Dict[str, dict]:
+    """Get scheduler queue depth and wait-time statistics for all providers."""
+    return get_global_rate_limiter().get_all_scheduler_stats()
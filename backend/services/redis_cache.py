@@ -10,6 +10,7 @@ from __future__ import annotations
 import json
 import logging
 import hashlib
+import time
 from typing import Any, Optional, Dict
 import asyncio
 from pydantic import BaseModel
@@ -255,6 +256,28 @@ class RedisCacheService:
 
         return success
 
+    async def get_ttl(self, provider: str, query: str, params: Optional[Dict] = None) -> Optional[float]:
+        """
+        Remaining time to live of a cached query in seconds.
+
+        Returns:
+            Seconds until expiry, or None when the key is missing or has no expiry
+        """
+        key = self._generate_key(provider, query, params)
+
+        if self._connected and self.redis_client:
+            try:
+                ttl = await self.redis_client.ttl(key)
+                if ttl is not None and ttl >= 0:
+                    return float(ttl)
+            except Exception as e:
+                logger.warning(f"Redis ttl error: {e}")
+
+        expires_at = self.fallback_cache.get_expiry(key)
+        if expires_at is None:
+            return None
+        return max(0.0, expires_at - time.time())
+
     async def delete(self, provider: str, query: str, params: Optional[Dict] = None) -> bool:
         """
         Delete cached data for a query.
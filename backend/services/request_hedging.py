@@ -0,0 +1,189 @@
+"""
+Request Hedging
+
+Tail latency on slow upstreams (OECD, IMF, StatsCan) is usually one stuck
+connection rather than a slow server. For idempotent GETs, a hedge fires a
+duplicate request once the primary has been outstanding longer than the
+provider's recent latency percentile; whichever successful (2xx/304) response
+arrives first wins and the other request is cancelled.
+
+Safeguards:
+- Opt-in (``USE_REQUEST_HEDGING``); otherwise ``hedged_get`` is a plain GET
+- No hedging until a provider has ``min_samples`` recorded latencies
+- A hedge only fires if the provider's rate limiter has a free slot right now
+  (it never queues or delays other requests)
+- Hedges are capped at ``max_hedge_ratio`` of a provider's requests
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Deque, Dict, Optional
+
+import httpx
+
+from ..config import get_settings
+from .rate_limiter import try_acquire_provider_slot
+
+logger = logging.getLogger(__name__)
+
+
+def _is_success(task: asyncio.Future) -> bool:
+    """Whether a finished GET may win the race: no exception and a 2xx/304 status.
+
+    httpx returns error statuses without raising, so a fast 503 from one
+    request must not beat a slower 200 from the other.
+    """
+    if task.exception() is not None:
+        return False
+    status_code = getattr(task.result(), "status_code", 200)
+    return 200 <= status_code < 300 or status_code == 304
+
+
+@dataclass
+class _ProviderHedgeStats:
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=RequestHedger.WINDOW_SIZE))
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    skipped_no_slot: int = 0
+    skipped_ratio: int = 0
+
+
+class RequestHedger:
+    """Tracks per-provider GET latencies and issues hedged requests."""
+
+    WINDOW_SIZE = 200
+    MIN_SAMPLES = 20
+    MIN_DELAY_SECONDS = 0.05
+    MAX_DELAY_SECONDS = 30.0
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_samples: int = MIN_SAMPLES,
+        max_hedge_ratio: float = 0.1,
+    ) -> None:
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self._providers: Dict[str, _ProviderHedgeStats] = {}
+
+    def _stats_for(self, provider: str) -> _ProviderHedgeStats:
+        key = provider.upper()
+        stats = self._providers.get(key)
+        if stats is None:
+            stats = _ProviderHedgeStats()
+            self._providers[key] = stats
+        return stats
+
+    def record_latency(self, provider: str, seconds: float) -> None:
+        """Record the latency of a completed request."""
+        self._stats_for(provider).latencies.append(seconds)
+
+    def hedge_delay(self, provider: str) -> Optional[float]:
+        """Delay after which to hedge, or None while there are too few samples."""
+        latencies = self._stats_for(provider).latencies
+        if len(latencies) < self.min_samples:
+            return None
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return min(self.MAX_DELAY_SECONDS, max(self.MIN_DELAY_SECONDS, ordered[index]))
+
+    async def _timed_get(self, client: httpx.AsyncClient, url: str, provider: str, kwargs: Dict[str, Any]):
+        start = perf_counter()
+        response = await client.get(url, **kwargs)
+        self.record_latency(provider, perf_counter() - start)
+        return response
+
+    def _may_hedge(self, provider: str, stats: _ProviderHedgeStats) -> bool:
+        if stats.hedged >= self.max_hedge_ratio * stats.requests:
+            stats.skipped_ratio += 1
+            return False
+        if not try_acquire_provider_slot(provider):
+            stats.skipped_no_slot += 1
+            return False
+        return True
+
+    async def get(self, client: httpx.AsyncClient, url: str, provider: str, **kwargs: Any):
+        """GET ``url``, hedging with a duplicate request if the primary is slow."""
+        stats = self._stats_for(provider)
+        stats.requests += 1
+
+        primary = asyncio.ensure_future(self._timed_get(client, url, provider, kwargs))
+        delay = self.hedge_delay(provider)
+        if delay is None:
+            return await primary
+
+        hedge: Optional[asyncio.Future] = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._may_hedge(provider, stats):
+                return await primary
+
+            stats.hedged += 1
+            logger.info(f"🔀 Hedging {provider} request after {delay:.2f}s: {url}")
+            hedge = asyncio.ensure_future(self._timed_get(client, url, provider, kwargs))
+
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if _is_success(task):
+                        if task is hedge:
+                            stats.hedge_wins += 1
+                        return task.result()
+            # Neither succeeded: surface the primary's error response or exception
+            return primary.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hedge rate, win rate and current threshold per provider."""
+        result: Dict[str, Any] = {}
+        for provider, stats in sorted(self._providers.items()):
+            delay = self.hedge_delay(provider)
+            result[provider] = {
+                "requests": stats.requests,
+                "hedged": stats.hedged,
+                "hedge_wins": stats.hedge_wins,
+                "hedge_rate": round(stats.hedged / stats.requests, 4) if stats.requests else 0.0,
+                "skipped_no_slot": stats.skipped_no_slot,
+                "skipped_ratio": stats.skipped_ratio,
+                "samples": len(stats.latencies),
+                "threshold_ms": round(delay * 1000, 1) if delay is not None else None,
+            }
+        return result
+
+
+# Global instance
+_request_hedger: Optional[RequestHedger] = None
+
+
+def get_request_hedger() -> RequestHedger:
+    """Get the global request hedger instance."""
+    global _request_hedger
+    if _request_hedger is None:
+        settings = get_settings()
+        _request_hedger = RequestHedger(
+            percentile=settings.request_hedging_percentile,
+            max_hedge_ratio=settings.request_hedging_max_ratio,
+        )
+    return _request_hedger
+
+
+async def hedged_get(client: httpx.AsyncClient, url: str, *, provider: str, **kwargs: Any):
+    """
+    Idempotent GET through the hedger when hedging is enabled.
+
+    Only use for requests that are safe to send twice.
+    """
+    if not get_settings().use_request_hedging:
+        return await client.get(url, **kwargs)
+    return await get_request_hedger().get(client, url, provider, **kwargs)
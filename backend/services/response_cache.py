@@ -0,0 +1,330 @@
+"""
+Response Cache
+
+Caches whole QueryResponse results, so a repeated standalone question skips
+LLM parsing, routing, indicator resolution, reranking, coverage improvement
+and clarification checks, not just the provider fetch. Serves both
+``/api/query`` and the MCP ``query_data`` tool, which call the same
+``QueryService.process_query``.
+
+Two tiers:
+1. In-process LRU (per worker)
+2. Redis (shared by workers), used only while Redis is connected
+
+Keys combine the normalized query text and the request flags that change the
+execution path. Only conversation-independent requests are cached or served:
+a request that continues a conversation with history always runs in full.
+
+Freshness fingerprint: while a query runs, every provider data-cache entry it
+reads or writes is recorded with its expiry. A cached response expires with its
+earliest dependency. A first-tier hit is also dropped (from both tiers) as soon
+as any in-memory dependency has been evicted or cleared, so responses never
+outlive the provider data they were built from. Responses that touched no
+provider cache entry carry no freshness signal and are not cached.
+
+Answers shaped by a failure are not cached either: responses carrying a
+warning message (e.g. partial country coverage) and answers served by a
+fallback provider or semantic recovery (``mark_response_uncacheable``). The
+failed fetches behind them leave no dependency, so caching them would freeze
+a transient upstream error until the successful entries expire.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..models import QueryResponse
+from .cache import cache_service
+from .intent_cache import normalize_query
+
+logger = logging.getLogger(__name__)
+
+# Bump when response assembly changes so stale responses are not reused
+RESPONSE_CACHE_VERSION = "v1"
+
+# Redis namespace for the shared tier
+REDIS_NAMESPACE = "RESPONSE"
+
+# Dependency tier that marks a response as never cacheable
+UNCACHEABLE_TIER = "uncacheable"
+
+# Provider cache entries the current query depended on (None outside collection)
+_dependencies_var: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar(
+    "response_cache_dependencies", default=None
+)
+
+
+@contextmanager
+def collect_data_dependencies() -> Iterator[List[Dict[str, Any]]]:
+    """Collect the provider cache entries read or written inside the block."""
+    dependencies: List[Dict[str, Any]] = []
+    token = _dependencies_var.set(dependencies)
+    try:
+        yield dependencies
+    finally:
+        _dependencies_var.reset(token)
+
+
+def is_collecting_dependencies() -> bool:
+    """Whether a response-cacheable query is running in this context."""
+    return _dependencies_var.get() is not None
+
+
+def record_data_dependency(key: str, expires_at: Optional[float], tier: str = "memory") -> None:
+    """
+    Record that the running query used a provider cache entry.
+
+    Args:
+        key: Raw data-cache key
+        expires_at: When the entry expires (None if unknown)
+        tier: "memory" for the in-process data cache, "redis" for the shared one
+    """
+    dependencies = _dependencies_var.get()
+    if dependencies is None or expires_at is None:
+        return
+    dependencies.append({"key": key, "expires_at": expires_at, "tier": tier})
+
+
+def mark_response_uncacheable(reason: str) -> None:
+    """Keep the running query's response out of the cache (e.g. a fallback answer)."""
+    dependencies = _dependencies_var.get()
+    if dependencies is not None:
+        dependencies.append({"key": reason, "expires_at": 0.0, "tier": UNCACHEABLE_TIER})
+
+
+@dataclass
+class ResponseCacheEntry:
+    response_json: str
+    dependencies: List[Dict[str, Any]]
+    expires_at: float
+    compute_ms: float
+
+
+class ResponseCache:
+    """
+    LRU cache of serialized QueryResponses with an optional Redis tier.
+
+    Thread-safe for the in-process tier.
+    """
+
+    DEFAULT_TTL = 3600  # Upper bound; dependencies usually expire sooner
+    MAX_ENTRIES = 512
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = MAX_ENTRIES,
+        shared: bool = True,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.shared = shared
+        self._entries: "OrderedDict[str, ResponseCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.stores = 0
+        self.skipped = 0
+        self.saved_ms = 0.0
+
+    @staticmethod
+    def build_key(query: str, **flags: Any) -> str:
+        """Build the cache key for a standalone query and its execution flags."""
+        flag_part = ",".join(f"{name}={int(bool(value))}" for name, value in sorted(flags.items()))
+        return f"{RESPONSE_CACHE_VERSION}:{flag_part}:{normalize_query(query)}"
+
+    @staticmethod
+    def is_cacheable(response: QueryResponse) -> bool:
+        """Only complete data answers are reused; errors, warnings and clarifications are not."""
+        return bool(
+            response.data
+            and not response.error
+            and not response.message
+            and not response.clarificationNeeded
+            and not response.codeExecution
+            and not response.isProMode
+        )
+
+    @staticmethod
+    def _dependencies_valid(entry: ResponseCacheEntry) -> bool:
+        for dependency in entry.dependencies:
+            if dependency.get("tier") == "memory" and cache_service.get_expiry(dependency["key"]) is None:
+                return False
+        return True
+
+    async def _shared_tier(self) -> Any:
+        if not self.shared:
+            return None
+        try:
+            from .redis_cache import get_redis_cache
+
+            redis_cache = await get_redis_cache()
+        except Exception as exc:
+            logger.debug(f"Response cache shared tier unavailable: {exc}")
+            return None
+        # The Redis service falls back to process memory when disconnected; tier 1 covers that
+        return redis_cache if redis_cache.redis_client is not None else None
+
+    def _record_hit(self, entry: ResponseCacheEntry, shared: bool) -> QueryResponse:
+        if shared:
+            self.shared_hits += 1
+        else:
+            self.local_hits += 1
+        self.saved_ms += entry.compute_ms
+        return QueryResponse.model_validate_json(entry.response_json)
+
+    def _put_local(self, key: str, entry: ResponseCacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def lookup(self, key: str) -> Optional[QueryResponse]:
+        """Return a fresh cached response for the key, or None on a miss."""
+        now = time.time()
+        invalidated = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > now and self._dependencies_valid(entry):
+                    self._entries.move_to_end(key)
+                    return self._record_hit(entry, shared=False)
+                invalidated = entry.expires_at > now
+                del self._entries[key]
+
+        shared_tier = await self._shared_tier()
+        if invalidated:
+            # A dependency went away early: make sure no other worker serves it either
+            with self._lock:
+                self.invalidations += 1
+            if shared_tier is not None:
+                await shared_tier.delete(REDIS_NAMESPACE, key)
+        elif shared_tier is not None:
+            payload = await shared_tier.get(REDIS_NAMESPACE, key)
+            if isinstance(payload, dict) and payload.get("expires_at", 0) > now:
+                entry = ResponseCacheEntry(
+                    response_json=payload["response_json"],
+                    dependencies=payload.get("dependencies", []),
+                    expires_at=payload["expires_at"],
+                    compute_ms=payload.get("compute_ms", 0.0),
+                )
+                # Memory dependencies belong to the worker that stored it; rely on expiry here
+                entry.dependencies = [d for d in entry.dependencies if d.get("tier") != "memory"]
+                self._put_local(key, entry)
+                with self._lock:
+                    return self._record_hit(entry, shared=True)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    async def store(
+        self,
+        key: str,
+        response: QueryResponse,
+        dependencies: List[Dict[str, Any]],
+        compute_ms: float,
+    ) -> bool:
+        """Cache a response built from the given provider cache entries."""
+        now = time.time()
+        if (
+            not self.is_cacheable(response)
+            or not dependencies
+            or any(dependency["tier"] == UNCACHEABLE_TIER for dependency in dependencies)
+        ):
+            with self._lock:
+                self.skipped += 1
+            return False
+
+        expires_at = min(min(d["expires_at"] for d in dependencies), now + self.ttl)
+        if expires_at <= now + 1:
+            with self._lock:
+                self.skipped += 1
+            return False
+
+        # Conversation and per-request steps are filled in on every hit
+        stored = response.model_copy(update={"conversationId": "", "processingSteps": None})
+        entry = ResponseCacheEntry(
+            response_json=stored.model_dump_json(),
+            dependencies=list(dependencies),
+            expires_at=expires_at,
+            compute_ms=compute_ms,
+        )
+        self._put_local(key, entry)
+        with self._lock:
+            self.stores += 1
+
+        shared_tier = await self._shared_tier()
+        if shared_tier is not None:
+            await shared_tier.set(
+                REDIS_NAMESPACE,
+                key,
+                {
+                    "response_json": entry.response_json,
+                    "dependencies": entry.dependencies,
+                    "expires_at": entry.expires_at,
+                    "compute_ms": entry.compute_ms,
+                },
+                ttl=max(1, math.ceil(expires_at - now)),
+            )
+        return True
+
+    def clear(self) -> None:
+        """Remove all locally cached responses and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.local_hits = 0
+            self.shared_hits = 0
+            self.misses = 0
+            self.invalidations = 0
+            self.stores = 0
+            self.skipped = 0
+            self.saved_ms = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            hits = self.local_hits + self.shared_hits
+            lookups = hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "local_hits": self.local_hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "stores": self.stores,
+                "skipped": self.skipped,
+                "saved_ms": round(self.saved_ms, 1),
+                "shared_tier": self.shared,
+            }
+
+
+# Global instance
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the global response cache instance."""
+    global _response_cache
+    if _response_cache is None:
+        from ..config import get_settings
+
+        settings = get_settings()
+        _response_cache = ResponseCache(
+            ttl=settings.response_cache_ttl,
+            max_entries=settings.response_cache_max_entries,
+            shared=settings.response_cache_shared,
+        )
+    return _response_cache
@@ -0,0 +1,288 @@
+"""
+Pre-warmed sandbox worker pool for Pro Mode code execution.
+
+A cold sandbox run starts a new interpreter and re-imports pandas, numpy and
+matplotlib every time, which costs 1-3 s per execution and per
+``fix_code_errors`` retry. The pool keeps ``size`` worker processes
+(``sandbox_worker.py``) that have already imported those modules. Each
+execution is sent to an idle worker over its stdin pipe, and the worker forks
+a child to run it. The child gets the same filtered environment and work
+directory as a cold run, and runs in a fresh namespace.
+
+Safeguards:
+- A worker serves one execution at a time and is recycled after ``max_runs``
+- Timeouts, crashes, non-zero exits and cancellations kill the worker's whole
+  process group (worker and running child) and spawn a replacement
+- When no worker is idle (or the platform has no ``fork``) callers fall back
+  to the cold path rather than queueing
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+from collections import deque
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = Path(__file__).with_name("sandbox_worker.py")
+
+# Workers fork per execution and are killed as a process group
+POOL_SUPPORTED = hasattr(os, "fork") and hasattr(os, "killpg")
+
+
+class SandboxPoolUnavailable(RuntimeError):
+    """No pooled worker can take this execution; use the cold path."""
+
+
+class _Worker:
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self.process = process
+        self.runs = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    def kill(self) -> None:
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
+class SandboxWorkerPool:
+    """Pool of pre-imported sandbox workers bound to one event loop."""
+
+    STARTUP_TIMEOUT = 60.0
+    WINDOW_SIZE = 200
+
+    def __init__(
+        self,
+        size: int,
+        env: Dict[str, str],
+        home_dir: Path,
+        max_runs: int = 50,
+        preload: Sequence[str] = (),
+        startup_timeout: float = STARTUP_TIMEOUT,
+    ) -> None:
+        self.size = size
+        self.env = env
+        self.home_dir = home_dir
+        self.max_runs = max(1, max_runs)
+        self.preload = list(preload)
+        self.startup_timeout = startup_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._idle: Deque[_Worker] = deque()
+        self._busy: Set[_Worker] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._closed = False
+        self.executions = 0
+        self.fallbacks = 0
+        self.recycled = 0
+        self.timeouts = 0
+        self.spawn_failures = 0
+        self._spawn_ms: Deque[float] = deque(maxlen=self.WINDOW_SIZE)
+
+    @property
+    def started(self) -> bool:
+        """True when the pool was started on the running event loop."""
+        try:
+            return self._loop is asyncio.get_running_loop() and not self._closed
+        except RuntimeError:
+            return False
+
+    def has_idle_worker(self) -> bool:
+        return self.started and any(worker.alive for worker in self._idle)
+
+    async def _spawn(self) -> _Worker:
+        start = perf_counter()
+        self.home_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            str(WORKER_SCRIPT),
+            *self.preload,
+            cwd=str(self.home_dir),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=self.env,
+            start_new_session=True,
+        )
+        worker = _Worker(process)
+        try:
+            line = await asyncio.wait_for(process.stdout.readline(), timeout=self.startup_timeout)
+            if not json.loads(line or b"{}").get("ready"):
+                raise RuntimeError("sandbox worker exited during start-up")
+        except BaseException:
+            worker.kill()
+            raise
+        self._spawn_ms.append((perf_counter() - start) * 1000)
+        return worker
+
+    async def _add_worker(self) -> None:
+        try:
+            worker = await self._spawn()
+        except Exception as exc:
+            self.spawn_failures += 1
+            logger.warning(f"Sandbox worker failed to start: {exc}")
+            return
+        if self._closed:
+            worker.kill()
+            return
+        self._idle.append(worker)
+
+    def _replenish(self) -> None:
+        if self._closed or self._loop is None:
+            return
+        task = self._loop.create_task(self._add_worker())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _retire(self, worker: _Worker) -> None:
+        self.recycled += 1
+        worker.kill()
+        self._replenish()
+
+    async def start(self) -> None:
+        """Spawn the workers and wait until they have finished importing."""
+        if not POOL_SUPPORTED or self.size <= 0 or self.started:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._closed = False
+        start = perf_counter()
+        await asyncio.gather(*(self._add_worker() for _ in range(self.size)))
+        logger.info(
+            f"✅ Sandbox pool ready: {len(self._idle)}/{self.size} workers "
+            f"in {perf_counter() - start:.2f}s (preload: {', '.join(self.preload) or 'none'})"
+        )
+
+    def start_in_background(self) -> None:
+        """Start the pool without waiting; executions use the cold path meanwhile."""
+        if not POOL_SUPPORTED or self.size <= 0 or self.started:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._closed = False
+        for _ in range(self.size):
+            self._replenish()
+
+    def _acquire(self) -> _Worker:
+        while self._idle:
+            worker = self._idle.popleft()
+            if worker.alive:
+                return worker
+            self._retire(worker)
+        raise SandboxPoolUnavailable("no idle sandbox worker")
+
+    async def execute(self, script: str, work_dir: Path, timeout: float) -> int:
+        """
+        Run a wrapped script in ``work_dir`` on a pooled worker.
+
+        Returns the child's exit status. Raises ``asyncio.TimeoutError`` on
+        timeout and ``SandboxPoolUnavailable`` when no worker can take it.
+        """
+        if not self.started:
+            raise SandboxPoolUnavailable("sandbox pool not started")
+        try:
+            worker = self._acquire()
+        except SandboxPoolUnavailable:
+            self.fallbacks += 1
+            raise
+
+        self._busy.add(worker)
+        healthy = False
+        try:
+            request = json.dumps({"script": script, "work_dir": str(work_dir)})
+            worker.process.stdin.write(request.encode() + b"\n")
+            await worker.process.stdin.drain()
+            try:
+                line = await asyncio.wait_for(worker.process.stdout.readline(), timeout=timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                raise
+            if not line:
+                raise SandboxPoolUnavailable("sandbox worker exited")
+            exit_status = int(json.loads(line).get("exit_status", -1))
+            healthy = exit_status == 0
+            self.executions += 1
+            return exit_status
+        finally:
+            self._busy.discard(worker)
+            worker.runs += 1
+            if healthy and worker.alive and worker.runs < self.max_runs and not self._closed:
+                self._idle.append(worker)
+            else:
+                self._retire(worker)
+
+    async def close(self) -> None:
+        """Kill all workers."""
+        self._closed = True
+        for task in list(self._tasks):
+            task.cancel()
+        for worker in [*self._idle, *self._busy]:
+            worker.kill()
+            try:
+                await asyncio.wait_for(worker.process.wait(), timeout=5)
+            except (asyncio.TimeoutError, RuntimeError):
+                pass
+        self._idle.clear()
+        self._busy.clear()
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool size, utilisation and recycling counters."""
+        spawn_ms: List[float] = list(self._spawn_ms)
+        return {
+            "size": self.size,
+            "started": self.started,
+            "idle": sum(1 for worker in self._idle if worker.alive),
+            "busy": len(self._busy),
+            "executions": self.executions,
+            "fallbacks": self.fallbacks,
+            "recycled": self.recycled,
+            "timeouts": self.timeouts,
+            "spawn_failures": self.spawn_failures,
+            "max_runs": self.max_runs,
+            "avg_spawn_ms": round(sum(spawn_ms) / len(spawn_ms), 1) if spawn_ms else None,
+        }
+
+
+# Global instance
+_sandbox_pool: Optional[SandboxWorkerPool] = None
+
+
+def get_sandbox_pool() -> Optional[SandboxWorkerPool]:
+    """Get the global sandbox pool, or None when pooling is disabled or unsupported."""
+    global _sandbox_pool
+    if _sandbox_pool is None:
+        from ..config import get_settings
+        from .secure_code_executor import build_sandbox_env
+        from .session_storage import get_session_storage_dir
+
+        settings = get_settings()
+        if not POOL_SUPPORTED or settings.sandbox_pool_size <= 0:
+            return None
+        home_dir = get_session_storage_dir() / "work" / "pool"
+        _sandbox_pool = SandboxWorkerPool(
+            size=settings.sandbox_pool_size,
+            env=build_sandbox_env(home_dir),
+            home_dir=home_dir,
+            max_runs=settings.sandbox_pool_max_runs,
+            preload=[name.strip() for name in settings.sandbox_pool_preload.split(",") if name.strip()],
+        )
+    return _sandbox_pool
+
+
+async def close_sandbox_pool() -> None:
+    """Kill the global pool's workers (application shutdown)."""
+    global _sandbox_pool
+    if _sandbox_pool is not None:
+        await _sandbox_pool.close()
+        _sandbox_pool = None
@@ -0,0 +1,89 @@
+"""
+Pre-warmed Pro Mode sandbox worker.
+
+Started by ``SandboxWorkerPool`` as ``python sandbox_worker.py <module> ...``
+with the same filtered environment as a cold sandbox run. It imports the
+given modules once, then serves execution requests read from stdin, one
+JSON line each: ``{"script": <wrapped code>, "work_dir": <path>}``.
+
+Every request runs in a forked child, so user code gets a fresh namespace
+and a copy-on-write snapshot of the pre-imported modules; nothing it changes
+survives into the next run. The child keeps only fds 0-2 (all pointing at
+``/dev/null``), so it cannot reach the protocol pipe. The wrapped script writes ``result.json`` into
+the work directory exactly as in the cold path. The worker replies with one
+JSON line ``{"exit_status": <int>}``.
+
+This file is executed as a script and must only use the standard library.
+"""
+
+import importlib
+import json
+import os
+import sys
+
+
+def _preload(modules):
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+
+
+def _max_fd():
+    try:
+        return os.sysconf("SC_OPEN_MAX")
+    except (AttributeError, ValueError, OSError):
+        return 4096
+
+
+def _execute(request):
+    work_dir = request["work_dir"]
+    pid = os.fork()
+    if pid == 0:
+        # Child: detach from the protocol pipes, run the script, never return
+        status = 1
+        try:
+            devnull = os.open(os.devnull, os.O_RDWR)
+            os.dup2(devnull, 0)
+            # Close the protocol fd (and anything else inherited) so user
+            # code cannot write replies on the worker's behalf
+            os.closerange(3, _max_fd())
+            os.chdir(work_dir)
+            os.environ["HOME"] = work_dir
+            code = compile(request["script"], os.path.join(work_dir, "exec.py"), "exec")
+            exec(code, {"__name__": "__main__"})
+            status = 0
+        except BaseException:
+            pass
+        finally:
+            os._exit(status)
+
+    _, status = os.waitpid(pid, 0)
+    return {"exit_status": os.waitstatus_to_exitcode(status)}
+
+
+def main():
+    # Keep the real stdout for the protocol; anything else printed goes nowhere
+    protocol_out = os.fdopen(os.dup(1), "w")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+
+    _preload(sys.argv[1:])
+    protocol_out.write(json.dumps({"ready": True}) + "\n")
+    protocol_out.flush()
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            response = _execute(json.loads(line))
+        except Exception as exc:
+            response = {"exit_status": -1, "error": str(exc)[:500]}
+        protocol_out.write(json.dumps(response) + "\n")
+        protocol_out.flush()
+
+
+if __name__ == "__main__":
+    main()
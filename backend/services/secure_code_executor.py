@@ -28,18 +28,84 @@ import shutil
 import signal
 import sys
 import tempfile
+import threading
 import time
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from backend.models import CodeExecutionResult
 from backend.config import get_settings
+from backend.services.sandbox_pool import SandboxPoolUnavailable, SandboxWorkerPool, get_sandbox_pool
 from backend.services.session_storage import get_session_storage_dir
 
 logger = logging.getLogger(__name__)
 
 
+def build_sandbox_env(home_dir: Path) -> Dict[str, str]:
+    """
+    Environment for sandboxed code: the parent environment minus credentials.
+
+    Shared by cold subprocess runs and pooled sandbox workers.
+    """
+    # Build environment by inheriting from parent and filtering sensitive vars
+    # This ensures threading/library dependencies work correctly
+
+    # Start with copy of parent environment
+    env = os.environ.copy()
+
+    # Remove sensitive environment variables FIRST, before setting custom values
+    # Comprehensive list of sensitive environment variable prefixes
+    # These should never be exposed to user code
+    sensitive_prefixes = [
+        # Cloud provider credentials
+        'AWS_', 'AZURE_', 'GCP_', 'GOOGLE_', 'ALIBABA_', 'DO_', 'DIGITALOCEAN_',
+        # Generic secrets/tokens
+        'SECRET_', 'TOKEN_', 'API_KEY', 'APIKEY', 'PASSWORD', 'PASSWD', 'CREDENTIAL',
+        'PRIVATE_KEY', 'PRIVATEKEY', 'AUTH_', 'BEARER_',
+        # econ-data-mcp specific API keys
+        'OPENROUTER_', 'GROK_', 'FRED_', 'COMTRADE_',
+        'SUPABASE_', 'JWT_', 'EXCHANGERATE_', 'COINGECKO_',
+        'VLLM_', 'ANTHROPIC_', 'OPENAI_', 'CLAUDE_',
+        # Database and service credentials
+        'DATABASE_', 'DB_', 'REDIS_', 'MONGO_', 'POSTGRES_', 'MYSQL_',
+        # SSH/encryption keys
+        'SSH_', 'GPG_', 'PGP_', 'ENCRYPTION_',
+    ]
+
+    # Also filter exact matches for common sensitive variable names
+    sensitive_exact = {
+        'HOME', 'USER', 'USERNAME', 'LOGNAME', 'MAIL',
+        'HOSTNAME', 'HOSTTYPE',
+    }
+
+    for key in list(env.keys()):
+        key_upper = key.upper()
+        # Check prefix match (case-insensitive)
+        if any(key_upper.startswith(prefix.upper()) for prefix in sensitive_prefixes):
+            del env[key]
+        # Check exact match
+        elif key_upper in sensitive_exact:
+            del env[key]
+        # Filter any variable containing 'KEY', 'SECRET', 'TOKEN', 'PASSWORD' (defense in depth)
+        elif any(sensitive in key_upper for sensitive in ['KEY', 'SECRET', 'TOKEN', 'PASSWORD', 'CREDENTIAL']):
+            del env[key]
+
+    # Set custom environment values AFTER filtering (so they don't get deleted)
+    env["HOME"] = str(home_dir)
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    env["PYTHONUNBUFFERED"] = "1"
+
+    # Limit threading libraries to single thread for OpenBLAS/MKL
+    env["OPENBLAS_NUM_THREADS"] = "1"
+    env["MKL_NUM_THREADS"] = "1"
+    env["NUMEXPR_NUM_THREADS"] = "1"
+    env["OMP_NUM_THREADS"] = "1"
+
+    return env
+
+
 class SecurityLevel(Enum):
     """Security levels for code execution"""
     STRICT = "strict"         # No file I/O, no network, no pip
@@ -47,6 +113,71 @@ class SecurityLevel(Enum):
     RELAXED = "relaxed"       # File I/O allowed, network restricted
 
 
+class ValidationCache:
+    """
+    Thread-safe LRU of validation results keyed by (security level, code hash).
+
+    Auto-fix retries resubmit mostly identical code, and validation is a pure
+    function of the source text and security level.
+    """
+
+    MAX_ENTRIES = 512
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[bool, Tuple[str, ...], Tuple[str, ...]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(code: str, security_level: SecurityLevel) -> Tuple[str, str]:
+        return security_level.value, hashlib.sha256(code.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def get(self, key: Tuple[str, str]) -> Optional[Tuple[bool, Tuple[str, ...], Tuple[str, ...]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Tuple[str, str], is_safe: bool, violations: List[str], warnings: List[str]) -> None:
+        with self._lock:
+            self._entries[key] = (is_safe, tuple(violations), tuple(warnings))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
+
+
+_validation_cache: Optional[ValidationCache] = None
+
+
+def get_validation_cache() -> ValidationCache:
+    """Get the process-wide validation cache."""
+    global _validation_cache
+    if _validation_cache is None:
+        _validation_cache = ValidationCache(get_settings().code_validation_cache_size)
+    return _validation_cache
+
+
 class SecurityValidator:
     """Multi-layer security validation using AST analysis"""
 
@@ -86,6 +217,15 @@ class SecurityValidator:
         'open', 'file', 'execfile', 'compile',
     }
 
+    # Shell/filesystem fragments flagged in string constants
+    SUSPICIOUS_STRING_PATTERNS = (
+        'rm -rf', 'sudo', 'chmod', 'chown',
+        '/etc/passwd', '/etc/shadow', '../../',
+        'cat /', 'ls /', 'bash -c'
+    )
+
+    HEX_ESCAPE_PATTERN = re.compile(r'\\x[0-9a-fA-F]{2}')
+
     def __init__(self, security_level: SecurityLevel = SecurityLevel.STRICT):
         self.security_level = security_level
         self.violations = []
@@ -95,9 +235,21 @@ class SecurityValidator:
         """
         Validate code safety using AST analysis.
 
+        Results are cached by content hash, so resubmitting identical code
+        (e.g. an auto-fix retry) skips parsing entirely.
+
         Returns:
             Tuple of (is_safe, violations, warnings)
         """
+        cache = get_validation_cache()
+        cache_key = cache.key(code, self.security_level)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            is_safe, violations, warnings = cached
+            self.violations = list(violations)
+            self.warnings = list(warnings)
+            return is_safe, list(self.violations), list(self.warnings)
+
         self.violations = []
         self.warnings = []
 
@@ -108,39 +260,64 @@ class SecurityValidator:
             # Additional string-based checks for obfuscation attempts
             self._check_string_patterns(code)
 
-            return len(self.violations) == 0, self.violations, self.warnings
+            is_safe = len(self.violations) == 0
 
         except SyntaxError as e:
             self.violations.append(f"Syntax error: {e}")
-            return False, self.violations, self.warnings
-
-    def _check_ast(self, node: ast.AST) -> None:
-        """Recursively check AST nodes for security issues"""
+            is_safe = False
 
-        # Check imports
-        if isinstance(node, (ast.Import, ast.ImportFrom)):
-            self._check_import(node)
+        cache.put(cache_key, is_safe, self.violations, self.warnings)
+        return is_safe, self.violations, self.warnings
 
-        # Check function calls
-        elif isinstance(node, ast.Call):
-            self._check_call(node)
-
-        # Check attribute access
-        elif isinstance(node, ast.Attribute):
-            self._check_attribute(node)
+    async def validate_async(self, code: str) -> Tuple[bool, List[str], List[str]]:
+        """
+        Validate without blocking the event loop on large scripts.
 
-        # Check name references
-        elif isinstance(node, ast.Name):
-            self._check_name(node)
+        Cache hits and small scripts are validated inline; scripts of at least
+        CODE_VALIDATION_OFFLOAD_CHARS characters run in a worker thread.
+        """
+        if len(code) < get_settings().code_validation_offload_chars:
+            return self.validate(code)
+        return await asyncio.to_thread(self.validate, code)
 
-        # Check string operations (potential code injection)
-        elif isinstance(node, ast.Constant):
-            if isinstance(node.value, str):
-                self._check_string(node)
+    def _check_ast(self, tree: ast.AST) -> None:
+        """
+        Check every AST node in a single pre-order pass.
 
-        # Recurse through child nodes
-        for child in ast.iter_child_nodes(node):
-            self._check_ast(child)
+        Iterative, with one type lookup per node instead of a chain of
+        isinstance checks, and without descending into expression
+        contexts (Load/Store), which are over a quarter of all nodes.
+        """
+        checks = self._node_checks()
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            check = checks.get(type(node))
+            if check is not None:
+                check(node)
+            children = []
+            for field in node._fields:
+                if field == 'ctx':
+                    continue
+                value = getattr(node, field, None)
+                if isinstance(value, ast.AST):
+                    children.append(value)
+                elif isinstance(value, list):
+                    children.extend([item for item in value if isinstance(item, ast.AST)])
+            # Reverse so children are visited in source order
+            children.reverse()
+            stack.extend(children)
+
+    def _node_checks(self) -> Dict[type, Any]:
+        """Node type -> check method for _check_ast"""
+        return {
+            ast.Import: self._check_import,
+            ast.ImportFrom: self._check_import,
+            ast.Call: self._check_call,
+            ast.Attribute: self._check_attribute,
+            ast.Name: self._check_name,
+            ast.Constant: self._check_string,
+        }
 
     def _check_import(self, node: ast.AST) -> None:
         """Check import statements for forbidden modules"""
@@ -221,13 +398,7 @@ class SecurityValidator:
             return
 
         # Check for potential shell commands
-        suspicious_patterns = [
-            'rm -rf', 'sudo', 'chmod', 'chown',
-            '/etc/passwd', '/etc/shadow', '../../',
-            'cat /', 'ls /', 'bash -c'
-        ]
-
-        for pattern in suspicious_patterns:
+        for pattern in self.SUSPICIOUS_STRING_PATTERNS:
             if pattern in node.value:
                 self.warnings.append(
                     f"Suspicious string pattern: '{pattern}' at line {node.lineno}"
@@ -236,7 +407,7 @@ class SecurityValidator:
     def _check_string_patterns(self, code: str) -> None:
         """Additional string-based security checks for obfuscation"""
         # Check for hex-encoded malicious content
-        if re.search(r'\\x[0-9a-fA-F]{2}', code):
+        if self.HEX_ESCAPE_PATTERN.search(code):
             self.warnings.append("Hex-encoded strings detected - possible obfuscation")
 
         # Check for obfuscated code patterns
@@ -244,6 +415,8 @@ class SecurityValidator:
             self.warnings.append("Potentially obfuscated code pattern (lambda+map/filter)")
 
         # Check for extremely long lines (obfuscation indicator)
+        if len(code) <= 500:
+            return
         for i, line in enumerate(code.split('\n'), 1):
             if len(line) > 500:
                 self.violations.append(
@@ -350,7 +523,7 @@ class SecureCodeExecutor:
 
         # Step 1: Validate code for security issues
         validator = SecurityValidator(self.security_level)
-        is_safe, violations, warnings = validator.validate(code)
+        is_safe, violations, warnings = await validator.validate_async(code)
 
         if not is_safe:
             error_msg = "Security violations detected:\n" + "\n".join(violations)
@@ -375,29 +548,40 @@ class SecureCodeExecutor:
 
         # Persistent session directory - uses same structure as SessionStorage class
         # so that list_keys() in SessionStorage can find keys saved by wrapped code
-        # Structure: {session_dir}/{sanitized_session_id}/*.json
+        # Structure: {session_dir}/{sanitized_session_id}/*.arrow (DataFrames) and *.json
         persistent_session_dir = self.session_dir / sanitized_session_id
         persistent_session_dir.mkdir(mode=0o700, exist_ok=True, parents=True)
 
         try:
             # Step 3: Prepare execution script with safety wrappers
-            exec_script = work_dir / "exec.py"
             wrapped_code = self._wrap_code(code, work_dir, persistent_session_dir, max_output_size)
 
-            with open(exec_script, 'w') as f:
-                f.write(wrapped_code)
-
-            # Set secure file permissions
-            os.chmod(exec_script, 0o600)
-
-            # Step 4: Execute in subprocess with resource restrictions
-            result = await self._run_sandboxed(
-                exec_script,
-                work_dir,
-                timeout,
-                memory_limit_mb,
-                max_output_size
-            )
+            # Step 4: Execute on a pre-warmed worker, or in a fresh subprocess
+            result = None
+            pool = get_sandbox_pool()
+            if pool is not None:
+                if not pool.started:
+                    pool.start_in_background()
+                try:
+                    result = await self._run_pooled(pool, wrapped_code, work_dir, timeout, max_output_size)
+                except SandboxPoolUnavailable:
+                    result = None
+
+            if result is None:
+                exec_script = work_dir / "exec.py"
+                with open(exec_script, 'w') as f:
+                    f.write(wrapped_code)
+
+                # Set secure file permissions
+                os.chmod(exec_script, 0o600)
+
+                result = await self._run_sandboxed(
+                    exec_script,
+                    work_dir,
+                    timeout,
+                    memory_limit_mb,
+                    max_output_size
+                )
 
             # Step 5: Add warnings to result if any
             if warnings:
@@ -558,17 +742,51 @@ def _validate_session_path(file_path):
         raise ValueError(f"Path traversal attempt detected")
     return real_path
 
+def _session_paths(key):
+    '''Return the validated (arrow, json) paths for a session key'''
+    safe_key = _sanitize_key(key)
+    session_dir = _get_session_dir()
+    # Validate paths are within session directory (defense in depth)
+    return (
+        _validate_session_path(os.path.join(session_dir, f"{{safe_key}}.arrow")),
+        _validate_session_path(os.path.join(session_dir, f"{{safe_key}}.json")),
+    )
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def _save_arrow(df, arrow_file):
+    '''Write a DataFrame as uncompressed Arrow IPC; False if pyarrow is missing or the frame is unsupported'''
+    try:
+        import pyarrow.feather as feather
+    except ImportError:
+        return False
+    tmp_file = arrow_file + ".tmp"
+    try:
+        feather.write_feather(df, tmp_file, compression="uncompressed")
+        os.replace(tmp_file, arrow_file)
+        return True
+    except Exception:
+        return False
+    finally:
+        _remove_file(tmp_file)
+
 def save_session(key, data):
     '''Save data to PERSISTENT session storage for use in follow-up queries'''
     import json
     try:
-        safe_key = _sanitize_key(key)
-        session_dir = _get_session_dir()
-        session_file = os.path.join(session_dir, f"{{safe_key}}.json")
-        # Validate path is within session directory (defense in depth)
-        session_file = _validate_session_path(session_file)
+        arrow_file, session_file = _session_paths(key)
 
-        # Convert pandas DataFrames to dict for JSON serialization
+        # DataFrames go to Arrow IPC so follow-up runs can memory-map them
+        if hasattr(data, 'to_dict') and hasattr(data, 'columns') and _save_arrow(data, arrow_file):
+            _remove_file(session_file)
+            print(f"Session data saved: '{{key}}'")
+            return
+
+        # Fallback: convert pandas DataFrames to dict for JSON serialization
         if hasattr(data, 'to_dict'):
             import pandas as pd
             # Convert datetime columns to ISO strings before serialization
@@ -600,19 +818,22 @@ def save_session(key, data):
 
         with open(session_file, 'w') as f:
             json.dump(data, f, default=json_encoder)
+        _remove_file(arrow_file)
         print(f"Session data saved: '{{key}}'")
     except Exception as e:
         print(f"Warning: Could not save session data for '{{key}}': {{e}}")
 
 def load_session(key, default=None):
-    '''Load data from PERSISTENT session storage'''
+    '''Load data from PERSISTENT session storage (saved DataFrames come back as DataFrames)'''
     import json
     try:
-        safe_key = _sanitize_key(key)
-        session_dir = _get_session_dir()
-        session_file = os.path.join(session_dir, f"{{safe_key}}.json")
-        # Validate path is within session directory (defense in depth)
-        session_file = _validate_session_path(session_file)
+        arrow_file, session_file = _session_paths(key)
+        if os.path.exists(arrow_file):
+            import pyarrow.feather as feather
+            # Copy out of the read-only mapped buffers so callers can mutate the frame
+            data = feather.read_table(arrow_file, memory_map=True).to_pandas(split_blocks=True).copy()
+            print(f"Session data loaded: '{{key}}'")
+            return data
         if os.path.exists(session_file):
             with open(session_file, 'r') as f:
                 data = json.load(f)
@@ -626,10 +847,10 @@ def list_session_data():
     '''List all available session keys'''
     import glob
     session_dir = _get_session_dir()
-    session_files = glob.glob(os.path.join(session_dir, "*.json"))
+    session_files = glob.glob(os.path.join(session_dir, "*.arrow")) + glob.glob(os.path.join(session_dir, "*.json"))
     # Filter out internal files (starting with underscore)
-    return [os.path.basename(f).replace('.json', '') for f in session_files
-            if not os.path.basename(f).startswith('_')]
+    return sorted({{os.path.splitext(os.path.basename(f))[0] for f in session_files
+                   if not os.path.basename(f).startswith('_')}})
 
 # Set up output capture
 _output = io.StringIO()
@@ -687,6 +908,80 @@ finally:
         json.dump(result, f)
 """
 
+    def _read_result(
+        self,
+        work_dir: Path,
+        stdout: Optional[bytes],
+        stderr: Optional[bytes],
+        max_output_size: int
+    ) -> Dict[str, Any]:
+        """Read result.json written by the wrapped script."""
+        result_file = work_dir / "result.json"
+        if result_file.exists():
+            try:
+                with open(result_file) as f:
+                    result = json.load(f)
+                logger.info(f"Code execution result: success={result.get('success')}")
+                return result
+            except json.JSONDecodeError as e:
+                # Read the raw content for debugging
+                try:
+                    with open(result_file, 'r') as f:
+                        raw_content = f.read()[:1000]
+                except:
+                    raw_content = "[could not read file]"
+                stderr_text = stderr.decode() if stderr else ""
+                logger.error(f"Failed to parse result JSON: {e}, raw content: {raw_content[:200]}, stderr: {stderr_text[:200]}")
+                return {
+                    "success": False,
+                    "error": f"Failed to parse execution result: {str(e)[:100]}. stderr: {stderr_text[:300]}"
+                }
+
+        # No result file - process may have crashed
+        stderr_text = stderr.decode() if stderr else ""
+        stdout_text = stdout.decode() if stdout else ""
+
+        return {
+            "success": False,
+            "error": f"No result produced. stderr: {stderr_text[:500]}",
+            "output": stdout_text[:max_output_size]
+        }
+
+    async def _run_pooled(
+        self,
+        pool: SandboxWorkerPool,
+        wrapped_code: str,
+        work_dir: Path,
+        timeout: int,
+        max_output_size: int
+    ) -> Dict[str, Any]:
+        """
+        Run wrapped code on a pre-warmed sandbox worker.
+
+        Raises SandboxPoolUnavailable when no worker can take the execution.
+        """
+        try:
+            exit_status = await pool.execute(wrapped_code, work_dir, timeout)
+        except SandboxPoolUnavailable:
+            # Work dir is left in place for the cold path
+            raise
+        except asyncio.TimeoutError:
+            logger.error(f"Code execution timed out after {timeout} seconds")
+            shutil.rmtree(work_dir, ignore_errors=True)
+            return {
+                "success": False,
+                "error": f"Code execution timed out after {timeout} seconds"
+            }
+        except BaseException:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            raise
+
+        try:
+            stderr = f"sandbox worker exit status {exit_status}".encode() if exit_status else None
+            return self._read_result(work_dir, None, stderr, max_output_size)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
     async def _run_sandboxed(
         self,
         script_path: Path,
@@ -709,59 +1004,7 @@ finally:
             Execution result dictionary
         """
         try:
-            # Build environment by inheriting from parent and filtering sensitive vars
-            # This ensures threading/library dependencies work correctly
-
-            # Start with copy of parent environment
-            env = os.environ.copy()
-
-            # Remove sensitive environment variables FIRST, before setting custom values
-            # Comprehensive list of sensitive environment variable prefixes
-            # These should never be exposed to user code
-            sensitive_prefixes = [
-                # Cloud provider credentials
-                'AWS_', 'AZURE_', 'GCP_', 'GOOGLE_', 'ALIBABA_', 'DO_', 'DIGITALOCEAN_',
-                # Generic secrets/tokens
-                'SECRET_', 'TOKEN_', 'API_KEY', 'APIKEY', 'PASSWORD', 'PASSWD', 'CREDENTIAL',
-                'PRIVATE_KEY', 'PRIVATEKEY', 'AUTH_', 'BEARER_',
-                # econ-data-mcp specific API keys
-                'OPENROUTER_', 'GROK_', 'FRED_', 'COMTRADE_',
-                'SUPABASE_', 'JWT_', 'EXCHANGERATE_', 'COINGECKO_',
-                'VLLM_', 'ANTHROPIC_', 'OPENAI_', 'CLAUDE_',
-                # Database and service credentials
-                'DATABASE_', 'DB_', 'REDIS_', 'MONGO_', 'POSTGRES_', 'MYSQL_',
-                # SSH/encryption keys
-                'SSH_', 'GPG_', 'PGP_', 'ENCRYPTION_',
-            ]
-
-            # Also filter exact matches for common sensitive variable names
-            sensitive_exact = {
-                'HOME', 'USER', 'USERNAME', 'LOGNAME', 'MAIL',
-                'HOSTNAME', 'HOSTTYPE',
-            }
-
-            for key in list(env.keys()):
-                key_upper = key.upper()
-                # Check prefix match (case-insensitive)
-                if any(key_upper.startswith(prefix.upper()) for prefix in sensitive_prefixes):
-                    del env[key]
-                # Check exact match
-                elif key_upper in sensitive_exact:
-                    del env[key]
-                # Filter any variable containing 'KEY', 'SECRET', 'TOKEN', 'PASSWORD' (defense in depth)
-                elif any(sensitive in key_upper for sensitive in ['KEY', 'SECRET', 'TOKEN', 'PASSWORD', 'CREDENTIAL']):
-                    del env[key]
-
-            # Set custom environment values AFTER filtering (so they don't get deleted)
-            env["HOME"] = str(work_dir)
-            env["PYTHONDONTWRITEBYTECODE"] = "1"
-            env["PYTHONUNBUFFERED"] = "1"
-
-            # Limit threading libraries to single thread for OpenBLAS/MKL
-            env["OPENBLAS_NUM_THREADS"] = "1"
-            env["MKL_NUM_THREADS"] = "1"
-            env["NUMEXPR_NUM_THREADS"] = "1"
-            env["OMP_NUM_THREADS"] = "1"
+            env = build_sandbox_env(work_dir)
 
             # Create subprocess with restrictions
             # Note: preexec_fn disabled because resource limits prevent httpx/numpy
@@ -792,37 +1035,7 @@ finally:
                     "error": f"Code execution timed out after {timeout} seconds"
                 }
 
-            # Read result file
-            result_file = work_dir / "result.json"
-            if result_file.exists():
-                try:
-                    with open(result_file) as f:
-                        result = json.load(f)
-                    logger.info(f"Code execution result: success={result.get('success')}")
-                    return result
-                except json.JSONDecodeError as e:
-                    # Read the raw content for debugging
-                    try:
-                        with open(result_file, 'r') as f:
-                            raw_content = f.read()[:1000]
-                    except:
-                        raw_content = "[could not read file]"
-                    stderr_text = stderr.decode() if stderr else ""
-                    logger.error(f"Failed to parse result JSON: {e}, raw content: {raw_content[:200]}, stderr: {stderr_text[:200]}")
-                    return {
-                        "success": False,
-                        "error": f"Failed to parse execution result: {str(e)[:100]}. stderr: {stderr_text[:300]}"
-                    }
-
-            # No result file - process may have crashed
-            stderr_text = stderr.decode() if stderr else ""
-            stdout_text = stdout.decode() if stdout else ""
-
-            return {
-                "success": False,
-                "error": f"No result produced. stderr: {stderr_text[:500]}",
-                "output": stdout_text[:max_output_size]
-            }
+            return self._read_result(work_dir, stdout, stderr, max_output_size)
 
         except Exception as e:
             logger.error(f"Sandboxed execution error: {str(e)}")
@@ -0,0 +1,354 @@
+"""
+Persistent Local Time-Series Store
+
+Keeps the last fetched history of each series on disk (SQLite) so that a
+cache miss does not have to refetch a series' full history. On the next
+request for the same series, only periods after the stored end date are
+requested from the provider and spliced onto the stored history:
+
+- World Bank: ``date=`` range
+- IMF / OECD / Eurostat / BIS: start year (SDMX ``startPeriod``)
+- StatsCan: ``LatestNPeriods`` sized to the gap since the stored end date
+
+Entries are keyed by provider + series code + country, plus a fingerprint of
+the remaining request parameters so differently-scoped requests never mix.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models import NormalizedData
+
+logger = logging.getLogger(__name__)
+
+# Database path
+DB_PATH = Path(__file__).parent.parent / "data" / "series_store.db"
+
+# Request parameters that describe the time window rather than the series itself
+WINDOW_PARAM_KEYS = {"startDate", "endDate", "start_year", "end_year", "periods"}
+
+# Approximate number of periods per year, used to size StatsCan LatestNPeriods deltas
+PERIODS_PER_YEAR = {
+    "daily": 365,
+    "weekly": 52,
+    "monthly": 12,
+    "quarterly": 4,
+    "semiannual": 2,
+    "annual": 1,
+}
+
+
+@dataclass
+class StoredSeries:
+    """Series history stored for one request scope."""
+
+    series: List[NormalizedData]
+    requested_start: Optional[str]  # startDate of the full fetch (None = provider default/full history)
+    end_date: Optional[str]  # Latest observation date across all stored series
+    full_fetch_at: float
+    updated_at: float
+
+
+@dataclass
+class DeltaPlan:
+    """How to satisfy a request given the stored history."""
+
+    mode: str  # "full", "delta" or "serve"
+    delta_start: Optional[str] = None
+
+
+def series_identity(series: NormalizedData) -> Tuple[str, str]:
+    """Identity used to match a delta series with its stored counterpart."""
+    metadata = series.metadata
+    code = str(metadata.seriesId or metadata.indicator or "").strip().upper()
+    country = str(metadata.country or "").strip().upper()
+    return code, country
+
+
+def latest_observation_date(series_list: List[NormalizedData]) -> Optional[str]:
+    """Return the latest observation date across all series."""
+    dates = [point.date for series in series_list for point in series.data if point.date]
+    return max(dates) if dates else None
+
+
+def plan_delta_fetch(
+    stored: Optional[StoredSeries],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    full_refresh_seconds: float,
+) -> DeltaPlan:
+    """Decide whether a request needs a full fetch, a delta fetch, or none at all."""
+    if stored is None or not stored.series or not stored.end_date:
+        return DeltaPlan(mode="full")
+
+    # Stored history must reach back at least as far as the request
+    if stored.requested_start != start_date and (
+        stored.requested_start is None
+        or start_date is None
+        or start_date < stored.requested_start
+    ):
+        return DeltaPlan(mode="full")
+
+    # Periodic full refresh picks up revisions deeper than the delta window
+    if time.time() - stored.full_fetch_at >= full_refresh_seconds:
+        return DeltaPlan(mode="full")
+
+    # Closed historical window that is fully covered: no provider call needed
+    if end_date and end_date < stored.end_date:
+        return DeltaPlan(mode="serve")
+
+    # Re-pull from the last stored observation so its revision is picked up
+    return DeltaPlan(mode="delta", delta_start=stored.end_date)
+
+
+def estimate_periods_since(last_date: str, frequency: Optional[str]) -> Optional[int]:
+    """Estimate how many periods have elapsed since ``last_date`` (plus overlap)."""
+    per_year = PERIODS_PER_YEAR.get(str(frequency or "").lower())
+    if not per_year:
+        return None
+    try:
+        last = date.fromisoformat(last_date[:10])
+    except ValueError:
+        return None
+    elapsed_years = max(0.0, (date.today() - last).days / 365.25)
+    # +2: the last stored period (revisions) and a period of slack for rounding
+    return int(elapsed_years * per_year) + 2
+
+
+def merge_series(
+    stored: List[NormalizedData],
+    delta: List[NormalizedData],
+) -> Optional[List[NormalizedData]]:
+    """Splice delta observations onto stored histories.
+
+    Stored points dated before the first delta point are kept; everything from
+    there on comes from the delta. Returns None when the delta does not cover
+    exactly the stored series, in which case the caller should fetch in full.
+    """
+    stored_by_id = {series_identity(series): series for series in stored}
+    delta_by_id = {series_identity(series): series for series in delta}
+    if set(stored_by_id) != set(delta_by_id) or len(stored_by_id) != len(stored):
+        return None
+
+    merged: List[NormalizedData] = []
+    for series in delta:
+        base = stored_by_id[series_identity(series)]
+        if series.data:
+            first_delta_date = min(point.date for point in series.data)
+            points = [point for point in base.data if point.date < first_delta_date]
+            points.extend(series.data)
+        else:
+            points = list(base.data)
+        points.sort(key=lambda point: point.date)
+
+        metadata = series.metadata.model_copy()
+        if points:
+            metadata.startDate = points[0].date
+            metadata.endDate = points[-1].date
+        merged.append(NormalizedData(metadata=metadata, data=points))
+    return merged
+
+
+def slice_series(
+    series_list: List[NormalizedData],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    last_n: Optional[int] = None,
+) -> List[NormalizedData]:
+    """Restrict series to the requested window (and optionally the latest N points).
+
+    Bounds are truncated to each point's date precision, so an annual "2015"
+    point falls inside a window starting "2015-01-01".
+    """
+    sliced: List[NormalizedData] = []
+    for series in series_list:
+        points = [
+            point for point in series.data
+            if (not start_date or point.date >= start_date[:len(point.date)])
+            and (not end_date or point.date <= end_date[:len(point.date)])
+        ]
+        if last_n:
+            points = points[-last_n:]
+        metadata = series.metadata.model_copy()
+        if points:
+            metadata.startDate = points[0].date
+            metadata.endDate = points[-1].date
+        sliced.append(NormalizedData(metadata=metadata, data=points))
+    return sliced
+
+
+class SeriesStore:
+    """
+    SQLite-backed store of fetched series histories.
+
+    One row per (provider, series code, country, scope fingerprint) holding the
+    JSON-serialized NormalizedData list for that request scope.
+    """
+
+    FULL_REFRESH_SECONDS = 30 * 86400  # Full refetch monthly to pick up deep revisions
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or DB_PATH
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.delta_fetches = 0
+        self.served_locally = 0
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create database connection."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS series_store (
+                    provider TEXT NOT NULL,
+                    series_code TEXT NOT NULL,
+                    country TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    requested_start TEXT,
+                    end_date TEXT,
+                    payload TEXT NOT NULL,
+                    full_fetch_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (provider, series_code, country, scope)
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def build_key(provider: str, params: Dict[str, Any]) -> Tuple[str, str, str, str]:
+        """Build the (provider, series code, country, scope) key for a request."""
+        series_code = str(params.get("indicator") or params.get("seriesId") or "").strip().upper()
+
+        countries = params.get("countries")
+        if isinstance(countries, list) and countries:
+            country = ",".join(sorted(str(c).strip().upper() for c in countries if c))
+        else:
+            country = str(params.get("country") or params.get("reporter") or "").strip().upper()
+
+        scope_params = {k: v for k, v in params.items() if k not in WINDOW_PARAM_KEYS}
+        scope_json = json.dumps(scope_params, sort_keys=True, separators=(",", ":"), default=str)
+        scope = hashlib.md5(scope_json.encode()).hexdigest()
+        return provider.upper(), series_code, country, scope
+
+    def get(self, key: Tuple[str, str, str, str]) -> Optional[StoredSeries]:
+        """Return stored history for a key, if any."""
+        try:
+            with self._lock:
+                row = self._get_connection().execute(
+                    """
+                    SELECT requested_start, end_date, payload, full_fetch_at, updated_at
+                    FROM series_store
+                    WHERE provider = ? AND series_code = ? AND country = ? AND scope = ?
+                    """,
+                    key,
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning(f"Series store read failed: {exc}")
+            return None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        try:
+            series = [NormalizedData.model_validate(item) for item in json.loads(row[2])]
+        except Exception as exc:
+            logger.warning(f"Discarding unreadable series store entry {key[:3]}: {exc}")
+            return None
+
+        self.hits += 1
+        return StoredSeries(
+            series=series,
+            requested_start=row[0],
+            end_date=row[1],
+            full_fetch_at=row[3],
+            updated_at=row[4],
+        )
+
+    def put(
+        self,
+        key: Tuple[str, str, str, str],
+        series: List[NormalizedData],
+        requested_start: Optional[str],
+        full_fetch: bool,
+        previous: Optional[StoredSeries] = None,
+    ) -> None:
+        """Store (or replace) the history for a key."""
+        now = time.time()
+        full_fetch_at = now if full_fetch or previous is None else previous.full_fetch_at
+        if not full_fetch and previous is not None:
+            requested_start = previous.requested_start
+        payload = json.dumps([item.model_dump(mode="json") for item in series])
+
+        try:
+            with self._lock:
+                conn = self._get_connection()
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO series_store (
+                        provider, series_code, country, scope,
+                        requested_start, end_date, payload, full_fetch_at, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (*key, requested_start, latest_observation_date(series), payload, full_fetch_at, now),
+                )
+                conn.commit()
+        except sqlite3.Error as exc:
+            logger.warning(f"Series store write failed: {exc}")
+
+    def clear(self) -> None:
+        """Remove all stored series."""
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("DELETE FROM series_store")
+            conn.commit()
+            self.hits = 0
+            self.misses = 0
+            self.delta_fetches = 0
+            self.served_locally = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        try:
+            with self._lock:
+                (entries,) = self._get_connection().execute(
+                    "SELECT COUNT(*) FROM series_store"
+                ).fetchone()
+        except sqlite3.Error:
+            entries = None
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "delta_fetches": self.delta_fetches,
+            "served_locally": self.served_locally,
+        }
+
+
+# Global instance
+_series_store: Optional[SeriesStore] = None
+
+
+def get_series_store() -> SeriesStore:
+    """Get the global series store instance."""
+    global _series_store
+    if _series_store is None:
+        from ..config import get_settings
+
+        configured_path = get_settings().series_store_path
+        _series_store = SeriesStore(Path(configured_path) if configured_path else None)
+    return _series_store
@@ -1,6 +1,14 @@
-"""Session storage for Pro Mode - persist data across executions within a conversation"""
+"""
+Session storage for Pro Mode - persist data across executions within a conversation
+
+DataFrames are stored as uncompressed Arrow IPC files (``<key>.arrow``) that the
+sandbox memory-maps and copies once into a writable DataFrame. Everything else (metadata,
+scalars, small dicts) stays JSON (``<key>.json``). Without pyarrow, DataFrames
+fall back to JSON records, and existing JSON files always load.
+"""
 import json
 import logging
+import os
 import shutil
 import tempfile
 import time
@@ -12,6 +20,45 @@ from backend.utils import NumpyPandasEncoder, sanitize_identifier
 
 logger = logging.getLogger(__name__)
 
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+ARROW_SUFFIX = ".arrow"
+JSON_SUFFIX = ".json"
+
+
+def _is_dataframe(value: Any) -> bool:
+    try:
+        import pandas as pd
+    except ImportError:
+        return False
+    return isinstance(value, pd.DataFrame)
+
+
+def write_arrow(df: Any, path: Path) -> None:
+    """Write a DataFrame as an uncompressed (memory-mappable) Arrow IPC file."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        feather.write_feather(df, str(tmp_path), compression="uncompressed")
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def read_arrow(path: Path) -> Any:
+    """
+    Memory-map an Arrow IPC file into a writable DataFrame.
+
+    Zero-copy conversion leaves the columns backed by read-only mapped
+    buffers, so the frame is copied once into memory pandas owns.
+    """
+    table = feather.read_table(str(path), memory_map=True)
+    return table.to_pandas(split_blocks=True).copy()
+
 
 def get_session_storage_dir() -> Path:
     """Get session storage directory with cross-platform default"""
@@ -58,12 +105,15 @@ class SessionStorage:
 
     def save(self, session_id: str, key: str, value: Any) -> bool:
         """
-        Save data to session storage using JSON
+        Save data to session storage
+
+        DataFrames are written as Arrow IPC when pyarrow is available,
+        everything else as JSON.
 
         Args:
             session_id: Unique session identifier
             key: Data key/name
-            value: Python object to store (must be JSON-serializable)
+            value: DataFrame or JSON-serializable Python object
 
         Returns:
             True if save was successful, False otherwise
@@ -71,10 +121,24 @@ class SessionStorage:
         try:
             session_dir = self._get_session_dir(session_id)
             sanitized_key = self._validate_key(key)
-            file_path = session_dir / f"{sanitized_key}.json"
+            arrow_path = session_dir / f"{sanitized_key}{ARROW_SUFFIX}"
+            json_path = session_dir / f"{sanitized_key}{JSON_SUFFIX}"
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(value, f, cls=NumpyPandasEncoder, indent=2)
+            if ARROW_AVAILABLE and _is_dataframe(value):
+                try:
+                    write_arrow(value, arrow_path)
+                    json_path.unlink(missing_ok=True)
+                    logger.info(f"Saved session data: {session_id}/{sanitized_key} (arrow)")
+                    return True
+                except (pa.ArrowException, TypeError, ValueError) as e:
+                    logger.warning(f"Arrow write failed for {session_id}/{sanitized_key}, using JSON: {e}")
+
+            if _is_dataframe(value):
+                value = value.to_dict('records')
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(value, f, cls=NumpyPandasEncoder)
+            # Only one representation per key, so loads never see an old value
+            arrow_path.unlink(missing_ok=True)
 
             logger.info(f"Saved session data: {session_id}/{sanitized_key}")
             return True
@@ -94,14 +158,23 @@ class SessionStorage:
             key: Data key/name
 
         Returns:
-            Stored object or None if not found
+            Stored object (a DataFrame for Arrow-stored data) or None if not found
         """
         try:
             session_dir = self._get_session_dir(session_id)
             sanitized_key = self._validate_key(key)
 
-            # Load JSON only (pickle is not supported for security reasons)
-            json_path = session_dir / f"{sanitized_key}.json"
+            arrow_path = session_dir / f"{sanitized_key}{ARROW_SUFFIX}"
+            if arrow_path.exists():
+                if not ARROW_AVAILABLE:
+                    logger.error(f"Cannot load {session_id}/{sanitized_key}: pyarrow is not installed")
+                    return None
+                data = read_arrow(arrow_path)
+                logger.info(f"Loaded session data: {session_id}/{sanitized_key}")
+                return data
+
+            # JSON (pickle is not supported for security reasons)
+            json_path = session_dir / f"{sanitized_key}{JSON_SUFFIX}"
             if json_path.exists():
                 with open(json_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
@@ -143,9 +216,10 @@ class SessionStorage:
             if not session_dir.exists():
                 return []
 
-            # Only list JSON files (pickle is not supported for security reasons)
-            json_keys = {f.stem for f in session_dir.glob("*.json")}
-            return list(json_keys)
+            # Only list Arrow and JSON files (pickle is not supported for security reasons)
+            keys = {f.stem for f in session_dir.glob(f"*{ARROW_SUFFIX}")}
+            keys.update(f.stem for f in session_dir.glob(f"*{JSON_SUFFIX}"))
+            return list(keys)
         except Exception as e:
             logger.error(f"Failed to list session keys {session_id}: {e}")
             return []
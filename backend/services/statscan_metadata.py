@@ -10,6 +10,8 @@ import json
 from functools import lru_cache
 from pathlib import Path
 
+from .http_cassette import cassette_transport
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,7 +60,7 @@ class StatsCanMetadataService:
 
         # Fallback to API search (slower, may timeout)
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(timeout=30.0, transport=cassette_transport("STATSCAN")) as client:
                 response = await client.get(f"{self.base_url}/getAllCubesListLite")
                 response.raise_for_status()
                 cubes = response.json()
@@ -130,7 +132,7 @@ class StatsCanMetadataService:
                 write=10.0,    # 10 seconds for writing request
                 pool=10.0      # 10 seconds for pool acquire
             )
-            async with httpx.AsyncClient(timeout=timeout_config) as client:
+            async with httpx.AsyncClient(timeout=timeout_config, transport=cassette_transport("STATSCAN")) as client:
                 response = await client.post(
                     f"{self.base_url}/getCubeMetadata",
                     json=[{"productId": int(product_id)}],
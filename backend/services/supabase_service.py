@@ -17,16 +17,18 @@ import asyncio
 import logging
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial, lru_cache
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
 
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
-from supabase import create_client, Client
 
 from ..config import get_settings
 from ..models import AuthResponse, AuthUser, LoginRequest, RegisterRequest, User
-from .async_supabase import AsyncSupabase
+
+if TYPE_CHECKING:
+    # The supabase SDK is slow to import; load it when a client is first built
+    from supabase import Client
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,8 @@ bearer_scheme = HTTPBearer(auto_error=False)
 @lru_cache
 def get_supabase_client() -> Client:
     """Get authenticated Supabase client (service role for backend operations)."""
+    from supabase import create_client
+
     settings = get_settings()
     return create_client(
         settings.supabase_url,
@@ -52,6 +56,8 @@ def get_supabase_client() -> Client:
 @lru_cache
 def get_supabase_anon_client() -> Client:
     """Get anonymous Supabase client (for frontend-like operations)."""
+    from supabase import create_client
+
     settings = get_settings()
     return create_client(
         settings.supabase_url,
@@ -286,6 +292,8 @@ class SupabaseService:
             logger.warning("Supabase credentials not configured - database operations will fail")
             self.client = None
         else:
+            from .async_supabase import AsyncSupabase
+
             self.client = AsyncSupabase(
                 settings.supabase_url,
                 settings.supabase_service_key
@@ -377,6 +385,20 @@ class SupabaseService:
             timeout=5.0
         )
 
+    async def get_recent_intents(self, limit: int = 1000) -> list[Dict[str, Any]]:
+        """Get the parsed intents of recent queries (all users) asynchronously."""
+        if not self.client:
+            return []
+
+        return await self.client.select(
+            "user_queries",
+            columns="intent,pro_mode,error_message",
+            order_by="created_at",
+            order_asc=False,
+            limit=limit,
+            timeout=5.0
+        )
+
     async def delete_user_queries(
         self,
         user_id: Optional[str] = None,
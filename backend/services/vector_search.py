@@ -16,6 +16,8 @@ import logging
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
+from .embedding_service import get_embedding_service, get_embedding_service_for
+
 logger = logging.getLogger(__name__)
 
 # Optional vector search dependencies - gracefully degrade if not available
@@ -87,7 +89,7 @@ class VectorSearchService:
 
     def __init__(
         self,
-        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        model_name: Optional[str] = None,
         persist_directory: str = "backend/data/chroma_db",
         collection_name: str = "economic_indicators",
         use_faiss: bool = True,  # Prefer FAISS by default (100x faster)
@@ -96,12 +98,12 @@ class VectorSearchService:
         Initialize the vector search service.
 
         Args:
-            model_name: HuggingFace model name for embeddings
+            model_name: HuggingFace model name for embeddings (default: EMBEDDING_MODEL)
             persist_directory: Directory to persist Chroma database (if using ChromaDB)
             collection_name: Name of the Chroma collection (if using ChromaDB)
             use_faiss: Prefer FAISS backend if available (default: True)
         """
-        self.model_name = model_name
+        self.model_name = model_name or get_embedding_service().model_name
         self.persist_directory = persist_directory
         self.collection_name = collection_name
         self.model = None
@@ -141,19 +143,15 @@ class VectorSearchService:
         logger.info(f"✅ VectorSearchService lazy initialization complete")
 
     def _load_model(self):
-        """Load the sentence transformer model."""
-        if SentenceTransformer is None:
+        """Attach the embedding model (shared unless this service uses another model)."""
+        service = get_embedding_service_for(self.model_name)
+        if not service.available:
             logger.error("❌ Sentence transformers not available")
             return
 
-        try:
-            logger.info(f"📥 Loading embedding model: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name)
-            logger.info(f"✅ Model loaded: {self.model_name}")
-            logger.info(f"   - Embedding dimension: {self.model.get_sentence_embedding_dimension()}")
-        except Exception as e:
-            logger.error(f"❌ Failed to load model: {e}", exc_info=True)
-            raise
+        self.model = service
+        logger.info(f"✅ Using embedding model: {service.model_name}")
+        logger.info(f"   - Embedding dimension: {self.model.get_sentence_embedding_dimension()}")
 
     def _init_backend(self):
         """Initialize the preferred backend (FAISS or ChromaDB)."""
@@ -16,6 +16,7 @@ from backend.main import (  # noqa: E402  # pylint: disable=C0413
     LoginRequest,
     health,
     query_endpoint,
+    query_stream_endpoint,
     register,
     login,
     me,
@@ -70,6 +71,54 @@ class ApiTests(unittest.TestCase):
         self.assertEqual(result.conversationId, "123")
         self.assertFalse(result.clarificationNeeded)
 
+    def test_query_stream_endpoint_sends_result_when_query_finishes(self) -> None:
+        mock_response = QueryResponse(conversationId="456", clarificationNeeded=False, data=[])
+
+        async def collect():
+            with patch("backend.main.query_service.process_query", AsyncMock(return_value=mock_response)), \
+                    patch("backend.main.log_query_to_supabase", AsyncMock()):
+                response = await query_stream_endpoint(QueryRequest(query="GDP", conversationId=None), user=None)
+                return [chunk async for chunk in response.body_iterator]
+
+        chunks = asyncio.run(collect())
+
+        self.assertTrue(chunks[0].startswith("event: data"))
+        self.assertEqual(chunks[-1], 'event: done\ndata: {"conversationId": "456"}\n\n')
+
+    def test_query_stream_endpoint_streams_series_before_final_result(self) -> None:
+        from backend.utils.processing_steps import get_processing_tracker
+
+        series = NormalizedData.model_validate(
+            {
+                "metadata": {
+                    "source": "FRED",
+                    "indicator": "GDP",
+                    "country": "US",
+                    "frequency": "quarterly",
+                    "unit": "Billions",
+                    "lastUpdated": "2024-01-01",
+                },
+                "data": [{"date": "2020-01-01", "value": 100}],
+            }
+        )
+
+        async def fake_process_query(query, conversation_id=None, profile=False):
+            get_processing_tracker().emit_series([series], {"indicator": "GDP"})
+            return QueryResponse(conversationId="789", clarificationNeeded=False, data=[series])
+
+        async def collect():
+            with patch("backend.main.query_service.process_query", side_effect=fake_process_query), \
+                    patch("backend.main.log_query_to_supabase", AsyncMock()):
+                response = await query_stream_endpoint(QueryRequest(query="GDP", conversationId=None), user=None)
+                return [chunk async for chunk in response.body_iterator]
+
+        chunks = asyncio.run(collect())
+        event_types = [chunk.split("\n", 1)[0] for chunk in chunks]
+
+        self.assertEqual(event_types, ["event: series", "event: series_order", "event: data", "event: done"])
+        self.assertIn('"seriesId": 0', chunks[0])
+        self.assertIn('"order": [0]', chunks[1])
+
     def test_auth_flow(self) -> None:
         """Test auth flow using MockAuthService (simulates dev mode without Supabase)."""
         # Create a fresh MockAuthService for this test
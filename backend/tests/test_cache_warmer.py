@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from backend.services import cache_warmer as cache_warmer_module
+from backend.services.cache import cache_service
+from backend.services.cache_warmer import (
+    DEFAULT_TARGETS_FILE,
+    CacheWarmer,
+    in_hour_windows,
+    is_refreshing_cache,
+    load_config_targets,
+    parse_hour_windows,
+    rank_logged_intents,
+)
+from backend.services.http_pool import _PoolMetrics, _PoolWaitTransport
+from backend.services.query import QueryService
+from backend.services.response_cache import record_data_dependency
+from backend.tests.test_query_service import sample_series
+from backend.tests.utils import run
+
+NOON = datetime(2026, 1, 5, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    cache_service.clear()
+    yield
+    cache_service.clear()
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """A pool transport whose upstream always answers 200 without touching the network."""
+    monkeypatch.setattr(
+        httpx.AsyncHTTPTransport,
+        "handle_async_request",
+        AsyncMock(return_value=httpx.Response(200, json={})),
+    )
+    return _PoolWaitTransport(_PoolMetrics(), "FRED")
+
+
+class _FakeQueryService:
+    """Caches each intent under its indicator, calling upstream only on a miss or refresh."""
+
+    def __init__(self, transport: _PoolWaitTransport, ttl: int = 3600) -> None:
+        self.transport = transport
+        self.ttl = ttl
+        self.refreshes = 0
+
+    async def _fetch_data(self, intent):
+        key = f"warm:{intent.indicators[0]}"
+        self.refreshes += int(is_refreshing_cache())
+        if is_refreshing_cache() or cache_service.get_expiry(key) is None:
+            await self.transport.handle_async_request(httpx.Request("GET", "https://upstream.test/series"))
+            cache_service.set(key, [sample_series()], ttl=self.ttl)
+        record_data_dependency(key, cache_service.get_expiry(key))
+        return cache_service.get(key)
+
+
+def _targets_file(tmp_path, indicators):
+    path = tmp_path / "targets.json"
+    path.write_text(json.dumps([
+        {"provider": "FRED", "indicators": [indicator], "parameters": {"indicator": indicator}}
+        for indicator in indicators
+    ]))
+    return path
+
+
+def test_rank_logged_intents_counts_successful_data_queries() -> None:
+    gdp = {"apiProvider": "FRED", "indicators": ["GDP"], "parameters": {"indicator": "GDP"}}
+    rows = [
+        {"intent": gdp},
+        {"intent": {**gdp, "parameters": {"indicator": "GDP", "__fallback_excluded_providers": ["IMF"]}}},
+        {"intent": {"apiProvider": "FRED", "indicators": ["UNRATE"], "parameters": {}}},
+        {"intent": {"apiProvider": "FRED", "indicators": ["CPI"]}, "error_message": "timeout"},
+        {"intent": {"apiProvider": "FRED", "indicators": ["CPI"], "clarificationNeeded": True}},
+        {"intent": {"apiProvider": "FRED", "indicators": ["CPI"]}, "pro_mode": True},
+        {"intent": None},
+    ]
+
+    targets = rank_logged_intents(rows, top_n=5)
+
+    assert [(target.indicators, target.popularity) for target in targets] == [(["GDP"], 2), (["UNRATE"], 1)]
+    assert targets[0].source == "query_log"
+
+
+def test_pinned_targets_expand_countries(tmp_path) -> None:
+    targets = load_config_targets(DEFAULT_TARGETS_FILE)
+
+    assert len({target.key for target in targets}) == len(targets) > 50
+    assert {"indicator": "SL.UEM.TOTL.ZS", "country": "CN"} in [target.parameters for target in targets]
+    assert load_config_targets(tmp_path / "missing.json") == []
+
+
+def test_off_peak_windows_wrap_midnight() -> None:
+    windows = parse_hour_windows("22-6")
+
+    assert in_hour_windows(windows, NOON.replace(hour=23))
+    assert in_hour_windows(windows, NOON.replace(hour=3))
+    assert not in_hour_windows(windows, NOON)
+    assert in_hour_windows([], NOON)
+
+
+def test_cycle_warms_cold_targets_and_reports_upstream_cost(tmp_path, upstream) -> None:
+    service = _FakeQueryService(upstream)
+    warmer = CacheWarmer(service, targets_file=_targets_file(tmp_path, ["GDP", "UNRATE"]), use_query_log=False)
+
+    first = run(warmer.run_cycle(now=NOON))
+    second = run(warmer.run_cycle(now=NOON))
+
+    assert first["fetched"] == first["upstream_requests"] == 2
+    assert second["fetched"] == 0 and second["already_warm"] == 2
+    stats = warmer.get_stats()
+    assert stats["coverage"] == 1.0
+    assert stats["upstream_requests_by_pool"] == {"FRED": 2}
+    assert stats["cold_targets"] == []
+
+
+def test_targets_near_expiry_are_refetched_past_the_cache(tmp_path, upstream) -> None:
+    service = _FakeQueryService(upstream, ttl=60)
+    warmer = CacheWarmer(service, refresh_margin=300, targets_file=_targets_file(tmp_path, ["GDP"]), use_query_log=False)
+
+    run(warmer.run_cycle(now=NOON))
+    report = run(warmer.run_cycle(now=NOON))
+
+    assert report["refreshed"] == 1
+    assert service.refreshes == 1
+    assert warmer.get_stats()["upstream_requests"] == 2
+
+
+def test_cycle_respects_off_peak_hours_budget_and_cap(tmp_path, upstream, monkeypatch) -> None:
+    targets_file = _targets_file(tmp_path, ["GDP", "UNRATE", "CPI"])
+    warmer = CacheWarmer(
+        _FakeQueryService(upstream), off_peak_hours="0-6", targets_file=targets_file, use_query_log=False
+    )
+    assert run(warmer.run_cycle(now=NOON))["fetched"] == 0
+
+    capped = CacheWarmer(
+        _FakeQueryService(upstream), max_fetches_per_cycle=1, targets_file=targets_file, use_query_log=False
+    )
+    report = run(capped.run_cycle(now=NOON))
+    assert (report["fetched"], report["deferred"]) == (1, 2)
+
+    monkeypatch.setattr(cache_warmer_module, "get_provider_budget_usage", lambda provider: 0.9)
+    report = run(capped.run_cycle(now=NOON))
+    assert report["fetched"] == 0
+    assert report["skipped_providers"] == ["FRED"]
+
+
+def test_warms_real_provider_requests_through_fetch_data(tmp_path) -> None:
+    service = QueryService(openrouter_key="test", fred_key="fred", comtrade_key="demo")
+    warmer = CacheWarmer(service, refresh_margin=0, targets_file=_targets_file(tmp_path, ["GDP"]), use_query_log=False)
+
+    with patch.object(service.fred_provider, "fetch_series", AsyncMock(return_value=sample_series())) as fetch:
+        run(warmer.run_cycle(now=NOON))
+        run(service._fetch_data(warmer.targets[next(iter(warmer.targets))].to_intent()))  # pylint: disable=protected-access
+
+    assert fetch.await_count == 1
+    assert warmer.get_stats()["coverage"] == 1.0
+
+    warmer.refresh_margin = 10 ** 9
+    with patch.object(service.fred_provider, "fetch_series", AsyncMock(return_value=sample_series())) as fetch:
+        run(warmer.run_cycle(now=NOON))
+
+    assert fetch.await_count == 1
@@ -9,10 +9,12 @@ all dangerous operations while allowing legitimate data science code.
 import pytest
 import asyncio
 from pathlib import Path
+from backend.services import secure_code_executor as executor_module
 from backend.services.secure_code_executor import (
     SecurityValidator,
     SecureCodeExecutor,
-    SecurityLevel
+    SecurityLevel,
+    ValidationCache,
 )
 
 
@@ -549,6 +551,67 @@ def test_validator_handles_syntax_errors():
     assert any("Syntax error" in v for v in violations)
 
 
+class TestValidationCache:
+    """Test content-hash caching and off-loop validation"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        cache = ValidationCache(max_entries=2)
+        monkeypatch.setattr(executor_module, "_validation_cache", cache)
+        return cache
+
+    def test_identical_code_hits_cache(self, fresh_cache):
+        code = "import os\nprint('x')"
+        first = SecurityValidator().validate(code)
+        second = SecurityValidator().validate(code)
+
+        assert first == second
+        assert fresh_cache.get_stats()["hits"] == 1
+
+    def test_cached_results_are_not_shared_lists(self, fresh_cache):
+        code = "import os"
+        _, violations, _ = SecurityValidator().validate(code)
+        violations.append("mutated by caller")
+
+        _, cached_violations, _ = SecurityValidator().validate(code)
+        assert cached_violations == ["Forbidden import: os at line 1"]
+
+    def test_cache_is_keyed_by_security_level(self, fresh_cache):
+        code = "open('data.txt')"
+        strict_safe, _, _ = SecurityValidator(SecurityLevel.STRICT).validate(code)
+        moderate_safe, _, _ = SecurityValidator(SecurityLevel.MODERATE).validate(code)
+
+        assert not strict_safe
+        assert moderate_safe
+
+    def test_cache_evicts_least_recently_used(self, fresh_cache):
+        for code in ("a = 1", "b = 2", "c = 3"):
+            SecurityValidator().validate(code)
+
+        assert fresh_cache.get_stats()["entries"] == 2
+        SecurityValidator().validate("a = 1")
+        assert fresh_cache.get_stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_large_scripts_validate_off_loop(self, monkeypatch):
+        calls = []
+
+        async def fake_to_thread(func, *args):
+            calls.append(func)
+            return func(*args)
+
+        monkeypatch.setattr(executor_module.asyncio, "to_thread", fake_to_thread)
+        monkeypatch.setattr(executor_module.get_settings(), "code_validation_offload_chars", 100)
+        validator = SecurityValidator()
+
+        await validator.validate_async("x = 1")
+        assert calls == []
+
+        is_safe, _, _ = await validator.validate_async("\n".join(f"x{i} = {i}" for i in range(50)))
+        assert is_safe
+        assert len(calls) == 1
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v"])
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, Mock, patch
+
+from backend.models import NormalizedData
+from backend.services.deep_agent_orchestrator import DeepAgentOrchestrator
+from backend.tests.utils import run
+
+
+def _series(country: str) -> NormalizedData:
+    return NormalizedData.model_validate(
+        {
+            "metadata": {
+                "source": "World Bank",
+                "indicator": "GDP (current US$)",
+                "country": country,
+                "frequency": "annual",
+                "unit": "USD",
+                "lastUpdated": "2024-01-01",
+                "seriesId": "NY.GDP.MKTP.CD",
+                "apiUrl": "https://example.com",
+            },
+            "data": [{"date": "2020-01-01", "value": 1.0}],
+        }
+    )
+
+
+def _orchestrator(fetch_data) -> DeepAgentOrchestrator:
+    query_service = Mock()
+    query_service._fetch_data = fetch_data  # pylint: disable=protected-access
+    with patch.object(DeepAgentOrchestrator, "_initialize_llm", return_value=None):
+        return DeepAgentOrchestrator(query_service)
+
+
+def _analysis(countries, indicators=("gdp",)):
+    return {
+        "countries": list(countries),
+        "indicators": list(indicators),
+        "is_multi_country": True,
+        "regions": [],
+    }
+
+
+def test_parallel_fetch_batches_countries_and_splits_results_per_job() -> None:
+    fetch_data = AsyncMock(return_value=[_series("United States"), _series("Germany"), _series("Japan")])
+    orchestrator = _orchestrator(fetch_data)
+
+    with patch.object(orchestrator, "_fetch_single_with_retry", new=AsyncMock()) as single:
+        result = run(orchestrator._execute_parallel_fetch("gdp", _analysis(["US", "DE", "JP"]), None))  # pylint: disable=protected-access
+
+    assert fetch_data.await_count == 1
+    intent = fetch_data.await_args.args[0]
+    assert intent.apiProvider == "WorldBank"
+    assert intent.parameters["countries"] == ["US", "DE", "JP"]
+    single.assert_not_awaited()
+    assert [r["country"] for r in result["results"]] == ["US", "DE", "JP"]
+    assert [r["result"]["data"][0].metadata.country for r in result["results"]] == [
+        "United States", "Germany", "Japan",
+    ]
+    assert orchestrator.stats["batch_requests"] == 1
+    updates = orchestrator.progress_tracker.updates
+    assert {update.task_id for update in updates} == {"parallel_setup", "fetch_1", "fetch_2", "fetch_3"}
+    assert orchestrator.progress_tracker.get_summary()["completed"] == 4
+
+
+def test_parallel_fetch_falls_back_per_country_only_for_missing_countries() -> None:
+    fetch_data = AsyncMock(return_value=[_series("United States")])
+    orchestrator = _orchestrator(fetch_data)
+    fallback = AsyncMock(return_value={"success": True, "data": [_series("France")], "error": None})
+
+    with patch.object(orchestrator, "_fetch_single_with_retry", new=fallback):
+        result = run(orchestrator._execute_parallel_fetch("gdp", _analysis(["US", "FR"]), None))  # pylint: disable=protected-access
+
+    assert fallback.await_count == 1
+    assert fallback.await_args.args[:2] == ("gdp", "FR")
+    assert [r["country"] for r in result["results"]] == ["US", "FR"]
+    assert orchestrator.stats["batch_fallbacks"] == 1
+
+
+def test_parallel_fetch_batch_error_falls_back_for_every_job() -> None:
+    fetch_data = AsyncMock(side_effect=RuntimeError("provider down"))
+    orchestrator = _orchestrator(fetch_data)
+    fallback = AsyncMock(return_value={"success": False, "error": "no data"})
+
+    with patch.object(orchestrator, "_fetch_single_with_retry", new=fallback):
+        result = run(orchestrator._execute_parallel_fetch("gdp", _analysis(["US", "DE"]), None))  # pylint: disable=protected-access
+
+    assert fallback.await_count == 2
+    assert result["success"] is False
+    assert result["errors"] == ["no data", "no data"]
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from backend.services import embedding_service as embedding_module
+from backend.services.embedding_service import (
+    EmbeddingService,
+    RemoteEmbeddingService,
+    create_embedding_server,
+)
+
+
+class _FakeModel:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.encoded = []
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return 3
+
+    def encode(self, sentences, batch_size=32, show_progress_bar=False, convert_to_numpy=True, normalize_embeddings=False):
+        self.encoded.append(sentences)
+        texts = [sentences] if isinstance(sentences, str) else list(sentences)
+        vectors = np.array([[len(text), 1.0, 0.0] for text in texts], dtype=np.float32)
+        return vectors[0] if isinstance(sentences, str) else vectors
+
+
+class _CountingLoader:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, name: str) -> _FakeModel:
+        with self.lock:
+            self.calls += 1
+        return _FakeModel(name)
+
+
+@pytest.fixture
+def shared_service(monkeypatch):
+    loader = _CountingLoader()
+    service = EmbeddingService(model_name="fake-minilm", loader=loader)
+    monkeypatch.setattr(embedding_module, "_embedding_service", service)
+    return service, loader
+
+
+def test_model_loads_once_across_concurrent_callers(shared_service) -> None:
+    service, loader = shared_service
+
+    threads = [threading.Thread(target=service.encode, args=(f"query {i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == 1
+    assert service.get_stats()["encode_calls"] == 8
+
+
+def test_vector_search_and_intent_cache_share_the_same_model(shared_service) -> None:
+    from backend.services.faiss_vector_search import get_embedding_model
+    from backend.services.vector_search import VectorSearchService
+
+    service, loader = shared_service
+    vector_search = VectorSearchService()
+    vector_search._load_model()  # pylint: disable=protected-access
+
+    assert vector_search.model is service
+    assert get_embedding_model() is service
+    assert loader.calls == 1
+
+
+def test_other_model_names_get_their_own_model(shared_service, monkeypatch) -> None:
+    from backend.services.vector_search import VectorSearchService
+
+    service, loader = shared_service
+    monkeypatch.setattr(embedding_module, "_model_services", {})
+
+    dedicated = embedding_module.get_embedding_service_for("other-model")
+    vector_search = VectorSearchService(model_name="other-model")
+    vector_search._load_model()  # pylint: disable=protected-access
+
+    assert embedding_module.get_embedding_service_for(None) is service
+    assert embedding_module.get_embedding_service_for("fake-minilm") is service
+    assert dedicated is not service and dedicated.model_name == "other-model"
+    assert embedding_module.get_embedding_service_for("other-model") is dedicated
+    assert vector_search.model is not service
+    assert loader.calls == 0
+
+
+def test_warm_up_loads_and_encodes(shared_service) -> None:
+    service, loader = shared_service
+
+    assert service.warm_up() is True
+    assert loader.calls == 1
+    assert service.model.encoded == ["warm up"]
+    assert service.get_stats()["loaded"] is True
+
+
+def test_unavailable_model_reports_unavailable() -> None:
+    def _failing_loader(name):
+        raise OSError("model files missing")
+
+    service = EmbeddingService(model_name="missing", loader=_failing_loader)
+
+    assert service.warm_up() is False
+    assert service.available is False
+    with pytest.raises(RuntimeError):
+        service.encode("gdp")
+
+
+def test_remote_service_encodes_through_embedding_server() -> None:
+    local = EmbeddingService(model_name="fake-minilm", loader=_FakeModel)
+    server = create_embedding_server(local, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address[:2]
+        remote = RemoteEmbeddingService(f"http://{host}:{port}", model_name="fake-minilm")
+
+        assert remote.warm_up() is True
+        assert remote.get_sentence_embedding_dimension() == 3
+        single = remote.encode("gdp")
+        batch = remote.encode(["gdp", "inflation"])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert single.shape == (3,)
+    assert batch.shape == (2, 3)
+    assert batch[1][0] == len("inflation")
+    assert local.get_stats()["texts_encoded"] == 3
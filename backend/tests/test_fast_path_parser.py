@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from backend.services import fast_path_parser as fast_path_module
+from backend.services.fast_path_parser import DEFAULT_MIN_CONFIDENCE, FastPathParser
+from backend.services.indicator_resolver import get_indicator_resolver
+
+
+@pytest.fixture(scope="module")
+def parser() -> FastPathParser:
+    return FastPathParser()
+
+
+def test_single_country_concept_with_year_range(parser: FastPathParser) -> None:
+    result = parser.parse("Germany unemployment rate 2010 to 2020")
+
+    assert result.confidence >= DEFAULT_MIN_CONFIDENCE
+    assert result.concept == "unemployment"
+    assert result.intent.indicators == ["unemployment rate"]
+    assert result.intent.parameters["country"] == "DE"
+    assert result.intent.parameters["startDate"] == "2010-01-01"
+    assert result.intent.parameters["endDate"] == "2020-12-31"
+    assert result.intent.clarificationNeeded is False
+
+
+def test_multiple_countries_and_since_year(parser: FastPathParser) -> None:
+    result = parser.parse("inflation in Germany and France since 2015")
+
+    assert result.confidence >= DEFAULT_MIN_CONFIDENCE
+    assert result.intent.parameters["countries"] == ["DE", "FR"]
+    assert result.intent.parameters["startDate"] == "2015-01-01"
+    assert result.intent.parameters["endDate"] is None
+
+
+def test_last_n_years_is_relative_to_current_year(parser: FastPathParser) -> None:
+    result = parser.parse("Canada CPI last 10 years")
+
+    expected_start = datetime.now(timezone.utc).year - 10
+    assert result.intent.parameters["startDate"] == f"{expected_start}-01-01"
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "US exports to China",
+        "US GDP and inflation",
+        "GDP of EU countries",
+        "US GDP from OECD",
+        "why did unemployment rise in Spain",
+        "top 10 countries by GDP",
+    ],
+)
+def test_complex_queries_are_left_to_the_llm(parser: FastPathParser, query: str) -> None:
+    assert parser.try_parse(query) is None
+
+
+@pytest.mark.parametrize("query", ["Korea exchange rate", "UK interest rate", "Japan policy rate"])
+def test_providers_needing_specific_parameters_are_left_to_the_llm(parser: FastPathParser, query: str) -> None:
+    result = parser.parse(query)
+
+    assert result.intent is None
+    assert parser.try_parse(query) is None
+
+
+@pytest.mark.parametrize("query", ["consumer sentiment in Germany", "Japan hicp inflation"])
+def test_providers_not_covering_the_countries_are_left_to_the_llm(parser: FastPathParser, query: str) -> None:
+    result = parser.parse(query)
+
+    assert result.intent is None
+    assert "does not cover" in result.reasons[0]
+
+
+def test_term_shared_by_several_concepts_lowers_confidence(parser: FastPathParser) -> None:
+    query = "Germany unemployment rate"
+    assert parser.parse(query).confidence >= DEFAULT_MIN_CONFIDENCE
+
+    with patch.object(
+        fast_path_module,
+        "find_concepts_by_exact_term",
+        return_value={"unemployment": "primary", "youth_unemployment": "secondary"},
+    ):
+        result = parser.parse(query)
+
+    assert result.components["clarity"] == 0.5
+    assert result.confidence < DEFAULT_MIN_CONFIDENCE
+
+
+def test_close_runner_up_series_lowers_confidence(parser: FastPathParser) -> None:
+    query = "Germany unemployment rate"
+    resolved = get_indicator_resolver().resolve("unemployment rate", provider="Eurostat", country="DE")
+
+    with patch.object(
+        get_indicator_resolver(),
+        "rank_candidates",
+        return_value=[({"code": "OTHER_SERIES"}, resolved.confidence - 0.05)],
+    ):
+        result = parser.parse(query)
+
+    assert result.components["resolver"] < resolved.confidence / 2
+    assert result.confidence < DEFAULT_MIN_CONFIDENCE
+
+
+def test_single_country_provider_implies_geography(parser: FastPathParser) -> None:
+    result = parser.parse("federal funds rate")
+
+    assert result.intent.apiProvider == "FRED"
+    assert result.components["geography"] == 1.0
+    assert result.confidence >= DEFAULT_MIN_CONFIDENCE
+
+
+def test_queries_without_geography_stay_below_threshold(parser: FastPathParser) -> None:
+    result = parser.parse("unemployment rate")
+
+    assert result.intent is not None
+    assert result.confidence < DEFAULT_MIN_CONFIDENCE
+    assert parser.try_parse("unemployment rate") is None
+
+
+def test_try_parse_falls_back_when_parser_raises() -> None:
+    parser = FastPathParser()
+
+    with patch.object(parser, "parse", side_effect=RuntimeError("boom")):
+        assert parser.try_parse("US GDP") is None
+
+
+def test_stats_report_coverage() -> None:
+    parser = FastPathParser()
+    parser.try_parse("US unemployment rate")
+    parser.try_parse("US exports to China")
+
+    stats = parser.get_stats()
+    assert stats == {"attempts": 2, "accepted": 1, "coverage": 0.5}
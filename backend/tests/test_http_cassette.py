@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from backend.config import get_settings
+from backend.services import http_cassette
+from backend.services.http_cassette import (
+    Cassette,
+    RecordingTransport,
+    ReplayLatency,
+    ReplayTransport,
+    request_signature,
+)
+from backend.services.http_pool import close_http_pool, get_http_client
+from backend.tests.utils import run
+
+FRED_URL = "https://api.stlouisfed.org/fred/series/observations"
+
+
+def _upstream(request: httpx.Request) -> httpx.Response:
+    body = gzip.compress(json.dumps({"series": request.url.params.get("series_id")}).encode())
+    return httpx.Response(200, headers={"content-encoding": "gzip", "content-type": "application/json"}, content=body)
+
+
+async def _get(transport: httpx.AsyncBaseTransport, params: dict) -> httpx.Response:
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await client.get(FRED_URL, params=params)
+
+
+def test_signature_sorts_params_and_redacts_credentials() -> None:
+    first = httpx.Request("GET", FRED_URL, params={"series_id": "GDP", "api_key": "secret-1"})
+    second = httpx.Request("GET", FRED_URL, params={"api_key": "secret-2", "series_id": "GDP"})
+
+    assert request_signature(first) == request_signature(second)
+    assert "secret" not in request_signature(first)
+    assert request_signature(httpx.Request("POST", FRED_URL, json={"q": 1})) != request_signature(
+        httpx.Request("POST", FRED_URL, json={"q": 2})
+    )
+
+
+def test_signature_ignores_todays_date() -> None:
+    recorded = httpx.Request("POST", FRED_URL, params={"start": "2021-03-01"}, json={"prompt": "Today is 2026-03-01"})
+    replayed = httpx.Request("POST", FRED_URL, params={"start": "2021-03-02"}, json={"prompt": "Today is 2026-03-02"})
+
+    assert request_signature(recorded) == request_signature(replayed)
+
+
+def test_record_then_replay_offline(tmp_path) -> None:
+    path = tmp_path / "cassette.json"
+    cassette = Cassette(path)
+    recorder = RecordingTransport(httpx.MockTransport(_upstream), cassette, "FRED")
+
+    recorded = run(_get(recorder, {"series_id": "GDP", "api_key": "secret"}))
+    cassette.flush()
+
+    assert recorded.json() == {"series": "GDP"}
+    assert "secret" not in path.read_text()
+
+    replayer = ReplayTransport(Cassette(path), ReplayLatency(fixed_ms=0))
+    replayed = run(_get(replayer, {"api_key": "other", "series_id": "GDP"}))
+
+    assert replayed.status_code == 200
+    assert replayed.json() == {"series": "GDP"}
+    assert replayed.headers["content-type"] == "application/json"
+
+
+def test_recordings_are_buffered_until_the_pool_closes(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "cassette.json"
+    settings = get_settings()
+    monkeypatch.setattr(settings, "http_cassette_mode", "record")
+    monkeypatch.setattr(settings, "http_cassette_path", str(path))
+    http_cassette.reset_cassette()
+
+    async def _scenario():
+        recorder = RecordingTransport(httpx.MockTransport(_upstream), http_cassette.get_cassette(), "FRED")
+        for series_id in ("GDP", "UNRATE", "CPIAUCSL"):
+            await _get(recorder, {"series_id": series_id})
+        written_before_close = path.exists()
+        await close_http_pool()
+        return written_before_close
+
+    try:
+        assert run(_scenario()) is False
+        assert len(json.loads(path.read_text())["entries"]) == 3
+        assert http_cassette.get_cassette().flush() is False
+    finally:
+        http_cassette.reset_cassette()
+
+
+def test_replay_miss_fails_like_unreachable_host(tmp_path) -> None:
+    cassette = Cassette(tmp_path / "empty.json")
+
+    with pytest.raises(httpx.ConnectError):
+        run(_get(ReplayTransport(cassette, ReplayLatency(fixed_ms=0)), {"series_id": "UNRATE"}))
+    assert cassette.get_stats()["replay_misses"] == 1
+
+
+def test_replay_latency_modes() -> None:
+    assert ReplayLatency(scale=0.5).delay_ms(200.0) == 100.0
+    assert ReplayLatency(fixed_ms=40.0).delay_ms(900.0) == 40.0
+
+    first = [ReplayLatency(fixed_ms=50.0, jitter_ms=10.0, seed=7).delay_ms(0) for _ in range(3)]
+    jittered = ReplayLatency(fixed_ms=50.0, jitter_ms=10.0, seed=7)
+    second = [jittered.delay_ms(0) for _ in range(3)]
+
+    assert first[0] == second[0]
+    assert all(40.0 <= delay <= 60.0 for delay in second)
+    assert ReplayLatency(fixed_ms=1.0, jitter_ms=5.0, seed=1).delay_ms(0) >= 0.0
+
+
+def test_pooled_clients_replay_when_enabled(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "cassette.json"
+    cassette = Cassette(path)
+    run(_get(RecordingTransport(httpx.MockTransport(_upstream), cassette, "FRED"), {"series_id": "GDP"}))
+    cassette.flush()
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "http_cassette_mode", "replay")
+    monkeypatch.setattr(settings, "http_cassette_path", str(path))
+    monkeypatch.setattr(settings, "http_replay_latency_ms", 0.0)
+    http_cassette.reset_cassette()
+
+    async def _scenario():
+        try:
+            response = await get_http_client("FRED").get(FRED_URL, params={"series_id": "GDP"})
+            return response.json()
+        finally:
+            await close_http_pool()
+
+    try:
+        assert run(_scenario()) == {"series": "GDP"}
+        assert http_cassette.get_cassette().get_stats()["replay_hits"] == 1
+    finally:
+        http_cassette.reset_cassette()
+
+
+def test_metadata_clients_outside_the_pool_replay(tmp_path, monkeypatch) -> None:
+    from backend.services.statscan_metadata import StatsCanMetadataService
+
+    service = StatsCanMetadataService()
+    path = tmp_path / "cassette.json"
+    cubes = [{"productId": 20100008, "cubeTitleEn": "Retail trade sales by industry"}]
+    cassette = Cassette(path)
+    recorder = RecordingTransport(httpx.MockTransport(lambda request: httpx.Response(200, json=cubes)), cassette, "STATSCAN")
+
+    async def _record():
+        async with httpx.AsyncClient(transport=recorder) as client:
+            await client.get(f"{service.base_url}/getAllCubesListLite")
+
+    run(_record())
+    cassette.flush()
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "http_cassette_mode", "replay")
+    monkeypatch.setattr(settings, "http_cassette_path", str(path))
+    monkeypatch.setattr(settings, "http_replay_latency_ms", 0.0)
+    http_cassette.reset_cassette()
+
+    try:
+        assert run(service.discover_product_for_indicator("retail trade")) == "20100008"
+        assert http_cassette.get_cassette().get_stats()["replay_hits"] == 1
+    finally:
+        http_cassette.reset_cassette()
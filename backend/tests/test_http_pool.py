@@ -59,3 +59,73 @@ def test_http_pool_close_resets_all_clients() -> None:
     stats = HTTPClientPool.get_stats()
     assert stats["status"] == "not_initialized"
     assert stats["active_clients"] == 0
+
+
+def test_http_pool_gives_each_provider_its_own_client_and_limits() -> None:
+    async def _clients():
+        return get_http_client("FRED"), get_http_client("fred"), get_http_client("OECD"), get_http_client()
+
+    fred, fred_again, oecd, shared = _run_in_new_loop(_clients())
+
+    assert fred is fred_again
+    assert len({id(fred), id(oecd), id(shared)}) == 3
+    assert HTTPClientPool._limits_for("OECD").max_connections == 5  # pylint: disable=protected-access
+    assert HTTPClientPool._limits_for("SHARED").max_connections == 100  # pylint: disable=protected-access
+
+
+def test_http_pool_waits_for_a_connection_as_long_as_provider_requests_run() -> None:
+    async def _clients():
+        return get_http_client("OECD"), get_http_client("STATSCAN"), get_http_client("FRED"), get_http_client()
+
+    oecd, statscan, fred, shared = _run_in_new_loop(_clients())
+
+    # Fan-outs larger than the pool queue for a socket instead of raising PoolTimeout
+    assert oecd.timeout.pool == 50.0
+    assert statscan.timeout.pool == 300.0
+    assert fred.timeout.pool == 30.0
+    assert shared.timeout.pool == 5.0
+
+
+def test_http_pool_honours_environment_proxies(monkeypatch) -> None:
+    import httpx
+
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    monkeypatch.setenv("NO_PROXY", "api.stlouisfed.org")
+
+    async def _client():
+        return get_http_client("FRED")
+
+    client = _run_in_new_loop(_client())
+    # pylint: disable=protected-access
+    proxied = client._transport_for_url(httpx.URL("https://api.worldbank.org/v2"))
+    bypassed = client._transport_for_url(httpx.URL("https://api.stlouisfed.org/fred"))
+
+    assert proxied is not client._transport
+    assert proxied._pool._proxy_url.host == b"proxy.internal"
+    assert bypassed is client._transport
+
+
+def test_http_pool_records_pool_wait_until_connection_is_acquired(monkeypatch) -> None:
+    import httpx
+
+    from backend.services.http_pool import _PoolMetrics, _PoolWaitTransport
+
+    async def _fake_handle(self, request):
+        await asyncio.sleep(0.03)  # queued behind other requests
+        await request.extensions["trace"]("connection.connect_tcp.started", {})
+        return httpx.Response(200, request=request)
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "handle_async_request", _fake_handle)
+    metrics = _PoolMetrics()
+
+    async def _send():
+        transport = _PoolWaitTransport(metrics)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.get("https://example.com/data")
+
+    response = _run_in_new_loop(_send())
+
+    assert response.status_code == 200
+    stats = metrics.get_stats()
+    assert stats["requests"] == 1
+    assert stats["max_pool_wait_ms"] >= 25
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from backend.config import get_settings
+from backend.providers.imf import IMFProvider
+from backend.services.imf_datamapper_cache import DataMapperCache
+from backend.tests.utils import MockAsyncResponse, run
+
+
+class RecordingFetch:
+    def __init__(self, responses) -> None:
+        self._responses = list(responses)
+        self.headers = []
+
+    async def __call__(self, headers):
+        self.headers.append(dict(headers))
+        return self._responses.pop(0)
+
+
+class FailingResponse(MockAsyncResponse):
+    def raise_for_status(self) -> None:
+        raise RuntimeError(f"HTTP {self.status_code}")
+
+
+def payload(code: str, values: dict) -> dict:
+    return {"values": {code: values}}
+
+
+class DataMapperCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmpdir.name)
+        self.cache = DataMapperCache(cache_dir=self.cache_dir)
+
+    def tearDown(self) -> None:
+        self._tmpdir.cleanup()
+
+    def test_fresh_entry_is_served_without_request(self) -> None:
+        fetch = RecordingFetch([MockAsyncResponse(payload("LUR", {"USA": {"2020": 8.1}}))])
+
+        run(self.cache.get_json("LUR", fetch))
+        result = run(self.cache.get_json("LUR", fetch))
+
+        self.assertEqual(len(fetch.headers), 1)
+        self.assertEqual(result["values"]["LUR"]["USA"]["2020"], 8.1)
+        self.assertEqual(self.cache.get_stats()["hits"], 1)
+
+    def test_stale_entry_revalidates_with_etag_and_keeps_payload_on_304(self) -> None:
+        fetch = RecordingFetch([
+            MockAsyncResponse(payload("LUR", {"USA": {"2020": 8.1}}), headers={"ETag": '"v1"'}),
+            MockAsyncResponse(None, status_code=304),
+        ])
+        self.cache.revalidate_after = 0
+
+        run(self.cache.get_json("LUR", fetch))
+        result = run(self.cache.get_json("LUR", fetch))
+
+        self.assertEqual(fetch.headers[1], {"If-None-Match": '"v1"'})
+        self.assertEqual(result["values"]["LUR"]["USA"]["2020"], 8.1)
+        self.assertEqual(self.cache.get_stats()["not_modified"], 1)
+
+    def test_entries_survive_restart_via_disk(self) -> None:
+        fetch = RecordingFetch([MockAsyncResponse(payload("LUR", {"USA": {"2020": 8.1}}))])
+        run(self.cache.get_json("LUR", fetch))
+
+        restarted = DataMapperCache(cache_dir=self.cache_dir)
+        result = run(restarted.get_json("LUR", RecordingFetch([])))
+
+        self.assertEqual(result["values"]["LUR"]["USA"]["2020"], 8.1)
+
+    def test_disk_reads_and_writes_run_off_the_event_loop(self) -> None:
+        fetch = RecordingFetch([MockAsyncResponse(payload("LUR", {"USA": {"2020": 8.1}}))])
+        threads = []
+        load, save = self.cache._load_from_disk, self.cache._save_to_disk  # pylint: disable=protected-access
+
+        def _record(func):
+            def wrapper(*args):
+                threads.append(threading.get_ident())
+                return func(*args)
+            return wrapper
+
+        async def _get():
+            return threading.get_ident(), await self.cache.get_json("LUR", fetch)
+
+        with patch.object(self.cache, "_load_from_disk", _record(load)), \
+                patch.object(self.cache, "_save_to_disk", _record(save)):
+            loop_thread, _ = run(_get())
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(loop_thread, threads)
+        self.assertEqual(list(self.cache_dir.glob("*.tmp")), [])
+
+    def test_failed_revalidation_serves_stored_payload(self) -> None:
+        fetch = RecordingFetch([
+            MockAsyncResponse(payload("LUR", {"USA": {"2020": 8.1}})),
+            FailingResponse({}, status_code=503),
+        ])
+        self.cache.revalidate_after = 0
+
+        run(self.cache.get_json("LUR", fetch))
+        result = run(self.cache.get_json("LUR", fetch))
+
+        self.assertEqual(result["values"]["LUR"]["USA"]["2020"], 8.1)
+
+    def test_concurrent_callers_share_one_download(self) -> None:
+        calls = []
+
+        async def _slow_fetch(headers):
+            calls.append(headers)
+            await asyncio.sleep(0.01)
+            return MockAsyncResponse(payload("LUR", {"USA": {"2020": 8.1}}))
+
+        async def _both():
+            return await asyncio.gather(
+                self.cache.get_json("LUR", _slow_fetch),
+                self.cache.get_json("LUR", _slow_fetch),
+            )
+
+        first, second = run(_both())
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(first, second)
+
+    def test_imf_country_subsets_share_cached_indicator_payload(self) -> None:
+        provider = IMFProvider(metadata_search_service=None)
+        settings = get_settings()
+        requested_urls = []
+
+        async def _fake_retry(url, max_retries=3, initial_delay=1.0, headers=None):
+            requested_urls.append(url)
+            return MockAsyncResponse(
+                payload("LUR", {"USA": {"2020": 8.1}, "DEU": {"2020": 3.8}, "FRA": {"2020": 8.0}})
+            )
+
+        settings.use_imf_payload_cache = True
+        try:
+            with patch("backend.providers.imf.get_datamapper_cache", return_value=self.cache), \
+                 patch.object(provider, "_retry_request", side_effect=_fake_retry):
+                first = run(provider.fetch_batch_indicator("LUR", ["USA", "DEU"]))
+                second = run(provider.fetch_batch_indicator("LUR", ["FRA"]))
+        finally:
+            settings.use_imf_payload_cache = False
+
+        self.assertEqual(len(requested_urls), 1)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(second[0].data[0].value, 8.0)
+
+    def test_alternative_code_probes_run_concurrently_first_success_wins(self) -> None:
+        provider = IMFProvider(metadata_search_service=None)
+        started = []
+
+        async def _fake_payload(code, max_retries=3, initial_delay=1.0):
+            started.append((code, time.monotonic()))
+            if code == "SLOW_CODE":
+                await asyncio.sleep(0.5)
+                return payload(code, {"USA": {"2020": 1.0}})
+            if code == "EMPTY_CODE":
+                return {"values": {}}
+            await asyncio.sleep(0.01)
+            return payload(code, {"USA": {"2020": 2.0}})
+
+        with patch.object(provider, "_fetch_indicator_payload", side_effect=_fake_payload):
+            begin = time.monotonic()
+            code, _ = run(provider._probe_alternative_codes(["SLOW_CODE", "EMPTY_CODE", "FAST_CODE"]))  # pylint: disable=protected-access
+            elapsed = time.monotonic() - begin
+
+        self.assertEqual(code, "FAST_CODE")
+        self.assertEqual(len(started), 3)
+        self.assertLess(elapsed, 0.4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from backend.models import ParsedIntent
+from backend.services.intent_cache import IntentCache, normalize_query
+from backend.tests.utils import run
+
+
+def _intent(country: str = "CN") -> ParsedIntent:
+    return ParsedIntent(
+        apiProvider="WorldBank",
+        indicators=["GDP"],
+        parameters={"country": country},
+        clarificationNeeded=False,
+    )
+
+
+class _KeywordEmbedder:
+    """Deterministic embedding: bag of known words."""
+
+    VOCAB = ["gdp", "growth", "unemployment", "rate", "china", "india", "since", "2010", "2015"]
+
+    def __call__(self, text: str):
+        words = normalize_query(text).replace(",", " ").split()
+        return [float(words.count(token)) for token in self.VOCAB]
+
+
+def test_exact_tier_matches_normalized_query_and_tracks_saved_time() -> None:
+    cache = IntentCache()
+    run(cache.store("China GDP since 2010", None, _intent(), llm_ms=1200.0))
+
+    hit = run(cache.lookup("  china   gdp since 2010?", None))
+
+    assert hit is not None
+    assert hit.parameters["country"] == "CN"
+    stats = cache.get_stats()
+    assert stats["exact_hits"] == 1
+    assert stats["saved_llm_ms"] == 1200.0
+    assert stats["hit_rate"] == 1.0
+
+
+def test_history_fingerprint_separates_follow_up_queries() -> None:
+    cache = IntentCache()
+    run(cache.store("what about france", ["germany gdp", "Here is Germany GDP"], _intent("FR"), llm_ms=900.0))
+
+    assert run(cache.lookup("what about france", ["us unemployment", "Here is US unemployment"])) is None
+    assert run(cache.lookup("what about france", ["germany gdp", "Here is Germany GDP"])) is not None
+
+
+def test_clarification_intents_are_not_cached() -> None:
+    cache = IntentCache()
+    intent = _intent()
+    intent.clarificationNeeded = True
+
+    run(cache.store("gdp", None, intent, llm_ms=800.0))
+
+    assert run(cache.lookup("gdp", None)) is None
+
+
+def test_semantic_tier_reuses_similar_query_with_same_entities() -> None:
+    cache = IntentCache(embed=_KeywordEmbedder(), similarity_threshold=0.9)
+    run(cache.store("China GDP growth since 2010", None, _intent(), llm_ms=1000.0))
+
+    hit = run(cache.lookup("GDP growth, China, since 2010", None))
+
+    assert hit is not None
+    assert cache.get_stats()["semantic_hits"] == 1
+
+
+def test_semantic_tier_rejects_different_country_or_year() -> None:
+    cache = IntentCache(embed=_KeywordEmbedder(), similarity_threshold=0.5)
+    run(cache.store("China GDP growth since 2010", None, _intent(), llm_ms=1000.0))
+
+    assert run(cache.lookup("India GDP growth since 2010", None)) is None
+    assert run(cache.lookup("China GDP growth since 2015", None)) is None
+    assert cache.get_stats()["misses"] == 2
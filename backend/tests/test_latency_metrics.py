@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from backend.utils import latency_metrics
+from backend.utils.latency_metrics import (
+    QUERY_STAGE_METRIC,
+    QUERY_STEP_METRIC,
+    LatencyHistograms,
+    timed_stage,
+)
+from backend.utils.processing_steps import ProcessingTracker
+from backend.tests.utils import run
+
+
+@pytest.fixture(autouse=True)
+def _fresh_histograms(monkeypatch):
+    histograms = LatencyHistograms()
+    monkeypatch.setattr(latency_metrics, "latency_histograms", histograms)
+    monkeypatch.setattr("backend.utils.processing_steps.latency_histograms", histograms)
+    return histograms
+
+
+def _series(histograms: LatencyHistograms, metric: str, **labels):
+    key = (metric, tuple(sorted((name, str(value)) for name, value in labels.items())))
+    return histograms.snapshot()[key]
+
+
+def test_prometheus_exposition_is_cumulative() -> None:
+    histograms = LatencyHistograms(buckets=(0.1, 1.0))
+    histograms.observe("demo_seconds", 0.05, stage="parse")
+    histograms.observe("demo_seconds", 0.1, stage="parse")
+    histograms.observe("demo_seconds", 3.0, stage="parse")
+    histograms.observe("demo_seconds", 0.5, stage='say "hi"')
+
+    text = histograms.render_prometheus()
+
+    assert "# TYPE demo_seconds histogram" in text
+    assert 'demo_seconds_bucket{stage="parse",le="0.1"} 2' in text
+    assert 'demo_seconds_bucket{stage="parse",le="1"} 2' in text
+    assert 'demo_seconds_bucket{stage="parse",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{stage="parse"} 3' in text
+    assert 'demo_seconds_sum{stage="parse"} 3.150000' in text
+    assert 'stage="say \\"hi\\""' in text
+
+
+def test_thread_shards_are_summed() -> None:
+    histograms = LatencyHistograms()
+
+    def _record() -> None:
+        for _ in range(1000):
+            histograms.observe("demo_seconds", 0.2, provider="FRED")
+
+    threads = [threading.Thread(target=_record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    series = _series(histograms, "demo_seconds", provider="FRED")
+    assert sum(series[:-1]) == 4000
+    assert len(histograms._shards) == 4  # pylint: disable=protected-access
+
+
+def test_label_cardinality_is_capped() -> None:
+    histograms = LatencyHistograms(max_series=2)
+    for route in ("/a", "/b", "/c"):
+        histograms.observe("demo_seconds", 0.01, route=route)
+
+    assert len(histograms.snapshot()) == 2
+    assert histograms.dropped == 1
+
+
+def test_quantiles_interpolate_within_buckets() -> None:
+    histograms = LatencyHistograms(buckets=(1.0, 2.0))
+    for value in (0.5, 1.5, 1.5, 1.5):
+        histograms.observe("demo_seconds", value)
+
+    stats = histograms.get_stats()["histograms"]["demo_seconds"]["all"]
+
+    assert stats["count"] == 4
+    assert stats["p50_ms"] == pytest.approx(1333.3, abs=0.1)
+    assert 1000 < stats["p99_ms"] <= 2000
+
+
+def test_tracker_steps_feed_histograms(_fresh_histograms) -> None:
+    tracker = ProcessingTracker()
+    with tracker.track("fetching_data", "Fetching", {"provider": "IMF"}):
+        pass
+    tracker.add_step("fetching_indicator", "GDP", duration_ms=250.0, metadata={"provider": "FRED"}, status="error")
+    tracker.add_step("applying_fallback", "Fallback", status="in-progress")
+
+    snapshot = _fresh_histograms.snapshot()
+
+    assert {labels for metric, labels in snapshot if metric == QUERY_STEP_METRIC} == {
+        (("provider", "IMF"), ("status", "completed"), ("step", "fetching_data")),
+        (("provider", "FRED"), ("status", "error"), ("step", "fetching_indicator")),
+    }
+    assert _series(
+        _fresh_histograms, QUERY_STEP_METRIC, provider="FRED", status="error", step="fetching_indicator"
+    )[-1] == pytest.approx(0.25)
+
+
+def test_timed_stage_records_provider_and_outcome(_fresh_histograms) -> None:
+    @timed_stage("fetch", provider=lambda provider, fail: provider)
+    async def _fetch(provider: str, fail: bool) -> str:
+        if fail:
+            raise RuntimeError("upstream down")
+        return provider
+
+    assert run(_fetch("FRED", False)) == "FRED"
+    with pytest.raises(RuntimeError):
+        run(_fetch("IMF", True))
+
+    assert sum(_series(_fresh_histograms, QUERY_STAGE_METRIC, stage="fetch", provider="FRED", outcome="ok")[:-1]) == 1
+    assert sum(_series(_fresh_histograms, QUERY_STAGE_METRIC, stage="fetch", provider="IMF", outcome="error")[:-1]) == 1
+
+
+def test_metrics_endpoint_serves_text_format(monkeypatch) -> None:
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setenv("DISABLE_MCP", "1")
+    monkeypatch.setenv("DISABLE_BACKGROUND_JOBS", "1")
+    from backend import main
+
+    histograms = LatencyHistograms()
+    monkeypatch.setattr(main, "latency_histograms", histograms)
+    client = TestClient(main.app)
+
+    client.get("/api/does-not-exist")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'econ_http_request_duration_seconds_count{method="GET",route="unmatched",status="404"} 1' in response.text
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock, patch
+
+from backend.services.lazy_registry import LazyComponent, built_components, lazy_components
+from backend.services.query import QueryService
+from backend.tests.utils import run
+
+
+class _Owner:
+    built = 0
+
+    def _build(self, cls):
+        type(self).built += 1
+        return cls(maxlen=3)
+
+    recent = LazyComponent("collections", "deque", _build)
+
+
+def test_component_is_built_once_on_first_access() -> None:
+    _Owner.built = 0
+    owner = _Owner()
+
+    assert built_components(owner) == {"recent": False}
+    first = owner.recent
+
+    assert owner.recent is first
+    assert first.maxlen == 3
+    assert _Owner.built == 1
+    assert built_components(owner) == {"recent": True}
+
+
+def test_concurrent_first_access_builds_once() -> None:
+    _Owner.built = 0
+    owner = _Owner()
+    seen = []
+    threads = [threading.Thread(target=lambda: seen.append(owner.recent)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert _Owner.built == 1
+    assert all(item is seen[0] for item in seen)
+
+
+def test_query_service_defers_providers_until_used() -> None:
+    service = QueryService(openrouter_key="test", fred_key="fred", comtrade_key="demo")
+
+    assert "fred_provider" in lazy_components(QueryService)
+    assert not any(built_components(service).values())
+
+    provider = service.fred_provider
+
+    assert provider.api_key == "fred"
+    assert service.fred_provider is provider
+    built = {name for name, done in built_components(service).items() if done}
+    assert built == {"fred_provider"}
+
+    service.imf_provider
+    assert built_components(service)["metadata_search"] is True
+
+
+def test_lazy_providers_can_be_patched_and_replaced() -> None:
+    service = QueryService(openrouter_key="test", fred_key="fred", comtrade_key="demo")
+
+    with patch.object(service.world_bank_provider, "fetch_indicator", return_value=["patched"]):
+        assert run(service.world_bank_provider.fetch_indicator()) == ["patched"]
+
+    replacement = Mock()
+    service.oecd_provider = replacement
+    assert service.oecd_provider is replacement
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import gc
+import sys
+
+import pytest
+
+from backend.services import preload
+
+
+@pytest.fixture(autouse=True)
+def _reset_report(monkeypatch):
+    monkeypatch.setattr(preload, "_preload_report", None)
+
+
+def _fail():
+    raise RuntimeError("index missing")
+
+
+def test_preload_runs_steps_and_freezes(monkeypatch) -> None:
+    monkeypatch.setattr(preload, "PRELOAD_STEPS", [
+        ("catalog", lambda: "3 concepts"),
+        ("model", lambda: None),
+        ("index", _fail),
+    ])
+
+    try:
+        report = preload.preload_shared_state(freeze=True)
+        # Frozen objects that other threads release afterwards leave the permanent generation
+        assert 0 < gc.get_freeze_count() <= report["frozen_objects"]
+    finally:
+        gc.unfreeze()
+
+    assert report["steps"]["catalog"]["status"] == "loaded"
+    assert report["steps"]["model"]["status"] == "skipped"
+    assert report["steps"]["index"] == {
+        "status": "failed", "detail": "index missing", "duration_ms": report["steps"]["index"]["duration_ms"],
+    }
+    assert preload.is_preloaded()
+    assert preload.is_preloaded("catalog")
+    assert not preload.is_preloaded("index")
+    assert preload.get_preload_stats()["report"] is report
+
+
+def test_not_preloaded_by_default() -> None:
+    assert not preload.is_preloaded()
+    assert preload.get_preload_stats()["preloaded"] is False
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs /proc/<pid>/smaps_rollup")
+def test_process_memory_reports_uss() -> None:
+    memory = preload.process_memory()
+
+    assert memory is not None
+    assert 0 < memory["uss_kb"] <= memory["rss_kb"]
+    assert preload.process_memory(pid=2**22 + 7) is None
+
+
+def test_sdmx_catalogs_are_shared_across_services() -> None:
+    from backend.services.metadata_search import MetadataSearchService, load_sdmx_catalogs
+
+    first = MetadataSearchService(llm_provider=None)
+    second = MetadataSearchService(llm_provider=None)
+
+    assert first._load_sdmx_catalogs() is second._load_sdmx_catalogs() is load_sdmx_catalogs()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from backend.models import NormalizedData
+from backend.utils.processing_steps import ProcessingTracker
+
+
+def _series(country: str) -> NormalizedData:
+    return NormalizedData.model_validate(
+        {
+            "metadata": {
+                "source": "World Bank",
+                "indicator": "GDP (current US$)",
+                "country": country,
+                "frequency": "annual",
+                "unit": "current US$",
+                "lastUpdated": "2024-01-01",
+                "seriesId": "NY.GDP.MKTP.CD",
+            },
+            "data": [{"date": "2020-01-01", "value": 1.0}],
+        }
+    )
+
+
+def test_emit_series_is_a_noop_without_callback() -> None:
+    tracker = ProcessingTracker()
+
+    tracker.emit_series([_series("US")])
+
+    assert tracker.emitted_series_count == 0
+
+
+def test_emit_series_assigns_ids_once_per_series() -> None:
+    streamed = []
+    tracker = ProcessingTracker(series_callback=lambda sid, series, meta: streamed.append((sid, series.metadata.country, meta)))
+    us, de = _series("US"), _series("DE")
+
+    tracker.emit_series([us], {"indicator": "GDP"})
+    tracker.emit_series([us, de], {"indicator": "GDP"})
+
+    assert streamed == [(0, "US", {"indicator": "GDP"}), (1, "DE", {"indicator": "GDP"})]
+
+
+def test_series_order_follows_final_ranking_and_reports_dropped() -> None:
+    tracker = ProcessingTracker(series_callback=lambda *args: None)
+    us, de, fr = _series("US"), _series("DE"), _series("FR")
+    tracker.emit_series([us, de, fr])
+
+    # Final result: reranked, FR dropped, DE replaced by an equal copy, one new series added
+    final = [de.model_copy(deep=True), us, _series("JP")]
+
+    assert tracker.series_order(final) == {"order": [1, 0, None], "dropped": [2]}
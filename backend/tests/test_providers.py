@@ -14,6 +14,16 @@ from backend.providers.oecd import OECDProvider
 from backend.tests.utils import MockAsyncClient, MockAsyncResponse, run
 
 
+class RecordingMockAsyncClient(MockAsyncClient):
+    def __init__(self, responses) -> None:
+        super().__init__(responses)
+        self.calls = []
+
+    async def get(self, url, *, params=None, **kwargs):
+        self.calls.append((url, dict(params or {})))
+        return await super().get(url, params=params, **kwargs)
+
+
 class ProviderTests(unittest.TestCase):
     def test_oecd_lookup_terms_prioritize_semantic_alias_for_short_code(self) -> None:
         provider = OECDProvider()
@@ -138,6 +148,61 @@ class ProviderTests(unittest.TestCase):
         self.assertEqual(result.data[0].value, 100.0)
         self.assertIsNone(result.data[1].value)
 
+    def test_fred_reuses_cached_series_info_and_pulls_observation_delta(self) -> None:
+        provider = FREDProvider(api_key="test-key")
+        provider.REVISION_WINDOW_OBSERVATIONS = 2
+        info = {
+            "seriess": [
+                {
+                    "title": "Unemployment Rate",
+                    "units": "Percent",
+                    "frequency": "Monthly",
+                    "last_updated": "2024-03-01",
+                }
+            ]
+        }
+        first_responses = [
+            MockAsyncResponse(info),
+            MockAsyncResponse(
+                {
+                    "realtime_start": "2024-03-05",
+                    "observations": [
+                        {"date": "2024-01-01", "value": "3.7"},
+                        {"date": "2024-02-01", "value": "3.9"},
+                        {"date": "2024-03-01", "value": "3.8"},
+                    ],
+                }
+            ),
+        ]
+        # Only the delta observations are requested the second time
+        second_client = RecordingMockAsyncClient([
+            MockAsyncResponse(
+                {
+                    "realtime_start": "2024-04-05",
+                    "observations": [
+                        {"date": "2024-02-01", "value": "3.9"},
+                        {"date": "2024-03-01", "value": "3.9"},
+                        {"date": "2024-04-01", "value": "3.8"},
+                    ],
+                }
+            ),
+        ])
+
+        with patch("backend.providers.fred.get_http_client", return_value=MockAsyncClient(first_responses)):
+            run(provider.fetch_series({"seriesId": "UNRATE"}))
+        with patch("backend.providers.fred.get_http_client", return_value=second_client):
+            result = run(provider.fetch_series({"seriesId": "UNRATE"}))
+
+        self.assertEqual(len(second_client.calls), 1)
+        url, params = second_client.calls[0]
+        self.assertTrue(url.endswith("/series/observations"))
+        self.assertEqual(params["observation_start"], "2024-02-01")
+        self.assertEqual(
+            [(point.date, point.value) for point in result.data],
+            [("2024-01-01", 3.7), ("2024-02-01", 3.9), ("2024-03-01", 3.9), ("2024-04-01", 3.8)],
+        )
+        self.assertEqual(result.metadata.indicator, "Unemployment Rate")
+
     def test_worldbank_fetch_indicator(self) -> None:
         provider = WorldBankProvider()
 
@@ -265,15 +330,15 @@ class ProviderTests(unittest.TestCase):
 
     def test_comtrade_splits_comma_separated_partner_input(self) -> None:
         provider = ComtradeProvider(api_key="demo")
-        captured_partner_codes = []
+        captured_partner_params = []
 
         async def _fake_fetch(
-            client, reporter_raw, partner_code, commodity_code, flow_code, period_param, freq_code
+            client, reporters, partner_param, commodity_code, flow_code, period_param, freq_code
         ):
-            captured_partner_codes.append(partner_code)
+            captured_partner_params.append(partner_param)
             return []
 
-        with patch.object(provider, "_fetch_single_reporter_data", new=AsyncMock(side_effect=_fake_fetch)):
+        with patch.object(provider, "_fetch_reporter_batch", new=AsyncMock(side_effect=_fake_fetch)):
             run(
                 provider.fetch_trade_data(
                     reporter="UK",
@@ -284,8 +349,82 @@ class ProviderTests(unittest.TestCase):
                 )
             )
 
-        self.assertIn("276", captured_partner_codes)  # Germany
-        self.assertIn("528", captured_partner_codes)  # Netherlands
+        # Germany and Netherlands are packed into a single call
+        self.assertEqual(captured_partner_params, ["276,528"])
+
+    def test_comtrade_packs_reporters_and_splits_response_per_reporter(self) -> None:
+        provider = ComtradeProvider(api_key="demo")
+
+        def _record(code: int, name: str, value: float) -> dict:
+            return {
+                "period": 2020,
+                "reporterCode": code,
+                "reporterDesc": name,
+                "flowDesc": "Exports",
+                "cmdCode": "TOTAL",
+                "cmdDesc": "All Commodities",
+                "primaryValue": value,
+            }
+
+        client = RecordingMockAsyncClient([
+            MockAsyncResponse({"data": [_record(276, "Germany", 1.5e12), _record(251, "France", 6e11)]})
+        ])
+
+        with patch("backend.providers.comtrade.get_http_client", return_value=client):
+            result = run(
+                provider.fetch_trade_data(
+                    reporters=["Germany", "France"],
+                    flow="EXPORT",
+                    start_year=2020,
+                    end_year=2020,
+                )
+            )
+
+        self.assertEqual(len(client.calls), 1)
+        self.assertEqual(client.calls[0][1]["reporterCode"], "276,251")
+        values = {series.metadata.country: series.data[0].value for series in result}
+        self.assertEqual(values, {"Germany": 1.5e12, "France": 6e11})
+
+    def test_comtrade_matches_unpadded_reporter_codes_to_planned_reporters(self) -> None:
+        provider = ComtradeProvider(api_key="demo")
+        records = [
+            {"period": 2020, "reporterCode": code, "flowDesc": "Exports", "cmdCode": "TOTAL", "primaryValue": value}
+            for code, value in ((36, 2.5e11), (76, 2.1e11))
+        ]
+        client = RecordingMockAsyncClient([MockAsyncResponse({"data": records})])
+
+        with patch("backend.providers.comtrade.get_http_client", return_value=client):
+            result = run(
+                provider.fetch_trade_data(
+                    reporters=["Australia", "Brazil"],
+                    flow="EXPORT",
+                    start_year=2020,
+                    end_year=2020,
+                )
+            )
+
+        self.assertEqual(client.calls[0][1]["reporterCode"], "036,076")
+        values = {series.metadata.country: series.data[0].value for series in result}
+        self.assertEqual(values, {"Australia": 2.5e11, "Brazil": 2.1e11})
+
+    def test_comtrade_stops_remaining_calls_on_auth_error(self) -> None:
+        from backend.exceptions import DataProviderError
+
+        provider = ComtradeProvider(api_key="bad-key")
+        fetch = AsyncMock(side_effect=DataProviderError("rejected", provider="Comtrade"))
+
+        with patch.object(provider, "_fetch_reporter_batch", new=fetch):
+            with self.assertRaises(DataProviderError):
+                run(
+                    provider.fetch_trade_data(
+                        reporter="US",
+                        flow="EXPORT",
+                        start_year=1990,
+                        end_year=2020,  # three 12-period chunks
+                    )
+                )
+
+        self.assertEqual(fetch.call_count, 1)
 
     def test_worldbank_metadata_discovery(self) -> None:
         class StubMetadata:
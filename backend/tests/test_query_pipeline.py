@@ -102,3 +102,58 @@ def test_validate_intent_invalid() -> None:
     assert result.is_valid is False
     assert result.validation_error == "bad"
     assert result.is_confident is False
+
+
+def test_parse_and_route_reuses_cached_intent_and_reapplies_guardrails() -> None:
+    from backend.config import get_settings
+    from backend.services.intent_cache import IntentCache
+
+    service = _ServiceStub(_intent())
+    parse_calls = []
+    original_parse = service.openrouter.parse_query
+
+    async def _counting_parse(query, history=None):
+        parse_calls.append(query)
+        return await original_parse(query, history)
+
+    service.openrouter.parse_query = _counting_parse
+    service.routed_provider = "IMF"
+    pipeline = QueryPipeline(service)
+    intent_cache = IntentCache()
+
+    with patch.object(get_settings(), "use_intent_cache", True), \
+         patch("backend.services.query_pipeline.get_intent_cache", return_value=intent_cache), \
+         patch("backend.services.query_pipeline.ProviderRouter.validate_routing", return_value=None):
+        run(pipeline.parse_and_route("US GDP", history=[]))
+        service.country_overrides_applied = False
+        result = run(pipeline.parse_and_route("  us gdp? ", history=[]))
+
+    assert parse_calls == ["US GDP"]
+    assert service.country_overrides_applied is True
+    assert result.intent.apiProvider == "IMF"
+    assert result.intent.originalQuery == "  us gdp? "
+    assert intent_cache.get_stats()["exact_hits"] == 1
+
+
+def test_parse_and_route_skips_llm_for_confident_fast_path() -> None:
+    from backend.config import get_settings
+    from backend.services.fast_path_parser import FastPathParser
+
+    service = _ServiceStub(_intent())
+    parse_calls = []
+
+    async def _counting_parse(query, history=None):
+        parse_calls.append(query)
+        return _intent()
+
+    service.openrouter.parse_query = _counting_parse
+    pipeline = QueryPipeline(service)
+
+    with patch.object(get_settings(), "use_fast_path_parser", True), \
+         patch("backend.services.query_pipeline.get_fast_path_parser", return_value=FastPathParser()), \
+         patch("backend.services.query_pipeline.ProviderRouter.validate_routing", return_value=None):
+        run(pipeline.parse_and_route("China GDP since 2010", history=[]))
+        run(pipeline.parse_and_route("China GDP since 2010", history=["Show me US GDP"]))
+        run(pipeline.parse_and_route("US exports to China", history=[]))
+
+    assert parse_calls == ["China GDP since 2010", "US exports to China"]
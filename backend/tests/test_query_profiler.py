@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.models import ProcessingStep, QueryResponse
+from backend.services import query_profiler as query_profiler_module
+from backend.services.query_profiler import QueryProfiler, record_wait, to_collapsed
+from backend.tests.utils import run
+
+
+def _score_candidates(seconds: float) -> int:
+    """Synchronous CPU work that blocks the event loop."""
+    total = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        total += sum(range(200))
+    return total
+
+
+def test_profile_separates_loop_blocking_work_from_waiting() -> None:
+    profiler = QueryProfiler(interval_ms=2)
+
+    async def _query() -> None:
+        with profiler.profile("slow gdp query", requested=True) as session:
+            await asyncio.sleep(0.1)
+            _score_candidates(0.3)
+            await asyncio.sleep(0.1)
+            record_wait("rate_limiter", 0.25)
+            session.steps = [ProcessingStep(step="parsing_query", description="Parse", status="completed")]
+
+    run(_query())
+
+    [summary] = profiler.list_profiles()
+    report = profiler.get(summary["id"])
+    assert report["reason"] == "requested"
+    assert report["event_loop"]["max_lag_ms"] >= 200
+    assert report["event_loop"]["lag_events"]
+    assert report["samples"]["idle"] > 0
+    assert report["samples"]["busy"] > 0
+    assert "_score_candidates" in report["samples"]["top_functions"][0]["function"]
+    assert report["waits"] == {"rate_limiter_ms": 250.0, "rate_limiter_count": 1}
+    assert report["steps"][0]["step"] == "parsing_query"
+    assert "_score_candidates (backend/tests/test_query_profiler.py" in to_collapsed(report)
+
+
+def test_idle_detection_does_not_depend_on_the_event_loop() -> None:
+    uvloop = pytest.importorskip("uvloop")
+    profiler = QueryProfiler(interval_ms=2)
+
+    async def _query() -> None:
+        with profiler.profile("uvloop query", requested=True):
+            await asyncio.sleep(0.2)
+            _score_candidates(0.2)
+
+    uvloop.run(_query())
+
+    report = profiler.get(profiler.list_profiles()[0]["id"])
+    samples = report["samples"]
+    assert samples["idle"] > 0
+    assert samples["busy"] > 0
+    assert "_score_candidates" in samples["top_functions"][0]["function"]
+
+
+def test_sampled_fast_queries_are_not_kept() -> None:
+    profiler = QueryProfiler(sample_rate=1.0, slow_threshold_ms=60000)
+
+    async def _query() -> None:
+        with profiler.profile("fast query") as session:
+            assert session is not None
+            await asyncio.sleep(0)
+
+    run(_query())
+
+    assert profiler.get_stats()["started"] == 1
+    assert profiler.list_profiles() == []
+
+
+def test_unprofiled_and_nested_queries_record_nothing() -> None:
+    profiler = QueryProfiler(sample_rate=0.0)
+
+    async def _query() -> None:
+        with profiler.profile("not sampled") as session:
+            assert session is None
+            record_wait("upstream_http", 1.0)
+        with profiler.profile("outer", requested=True) as outer:
+            with profiler.profile("inner", requested=True) as inner:
+                assert inner is None
+                record_wait("upstream_http", 0.5)
+        assert outer.waits == {"upstream_http": 0.5}
+
+    run(_query())
+    assert profiler.get_stats()["kept"] == 1
+
+
+def test_query_service_attaches_steps_to_requested_profile(monkeypatch) -> None:
+    from backend.services.query import QueryService
+
+    profiler = QueryProfiler()
+    monkeypatch.setattr(query_profiler_module, "_query_profiler", profiler)
+    service = QueryService(openrouter_key="test", fred_key="fred", comtrade_key="demo")
+    monkeypatch.setattr(service.settings, "profiling_enabled", True)
+    response = QueryResponse(
+        conversationId="c1",
+        clarificationNeeded=False,
+        processingSteps=[ProcessingStep(step="fetching_data", description="Fetch", status="completed")],
+    )
+
+    with patch.object(service, "_process_query_with_cache", AsyncMock(return_value=response)):
+        assert run(service.process_query("gdp", profile=True)) is response
+        run(service.process_query("gdp"))
+
+    [summary] = profiler.list_profiles()
+    assert profiler.get(summary["id"])["steps"][0]["step"] == "fetching_data"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from backend import main
+    from backend.config import get_settings
+
+    settings = get_settings().model_copy(update={"profiling_enabled": True, "profiling_token": "s3cret"})
+    main.app.dependency_overrides[get_settings] = lambda: settings
+    monkeypatch.setattr(query_profiler_module, "_query_profiler", QueryProfiler())
+    yield TestClient(main.app)
+    main.app.dependency_overrides.pop(get_settings, None)
+
+
+def test_profile_endpoints_require_token(client) -> None:
+    profiler = query_profiler_module.get_query_profiler()
+    profiler.profiles.append({
+        "id": "abc", "query": "q", "reason": "requested", "started_at": "", "duration_ms": 1.0,
+        "event_loop": {"max_lag_ms": 0.0}, "samples": {"busy_ms_estimate": 0.0, "stacks": [{"stack": "a;b", "samples": 3}]},
+    })
+
+    assert client.get("/api/debug/profiles").status_code == 401
+    assert client.get("/api/debug/profiles", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    headers = {"Authorization": "Bearer s3cret"}
+    listing = client.get("/api/debug/profiles", headers=headers).json()
+    assert [profile["id"] for profile in listing["profiles"]] == ["abc"]
+    assert client.get("/api/debug/profiles/abc?format=collapsed", headers=headers).text == "a;b 3\n"
+    assert client.get("/api/debug/profiles/missing", headers=headers).status_code == 404
+
+
+def test_profile_header_needs_the_profiling_token(client) -> None:
+    from backend import main
+
+    response = QueryResponse(conversationId="c1", clarificationNeeded=False)
+    with patch.object(main.query_service, "process_query", AsyncMock(return_value=response)) as process:
+        client.post("/api/query", json={"query": "gdp"}, headers={"X-Profile": "1"})
+        client.post("/api/query", json={"query": "gdp"}, headers={"X-Profile": "1", "Authorization": "Bearer wrong"})
+        client.post("/api/query", json={"query": "gdp"}, headers={"X-Profile": "1", "Authorization": "Bearer s3cret"})
+
+    assert [call.kwargs["profile"] for call in process.await_args_list] == [False, False, True]
@@ -2097,6 +2097,88 @@ class QueryServiceTests(unittest.TestCase):
         self.assertEqual(historical_mock.call_args.kwargs.get("metric"), "volume")
         self.assertEqual(historical_mock.call_args.kwargs.get("days"), 90)
 
+    def test_multi_indicator_fetch_starts_before_slower_routes_finish(self) -> None:
+        import asyncio
+
+        from backend.utils.processing_steps import (
+            ProcessingTracker,
+            activate_processing_tracker,
+            reset_processing_tracker,
+        )
+
+        intent = ParsedIntent(
+            apiProvider="WorldBank",
+            indicators=["GDP", "inflation", "gdp"],
+            parameters={"country": "US", "startDate": "2015-01-01", "endDate": "2020-12-31"},
+            clarificationNeeded=False,
+            originalQuery="US GDP and inflation",
+        )
+        events = []
+
+        async def _route(routing_intent, query):
+            indicator = routing_intent.indicators[0]
+            events.append(("route", indicator))
+            if indicator == "inflation":
+                await asyncio.sleep(0.05)
+            return "FRED"
+
+        async def _fetch(single_intent):
+            events.append(("fetch", single_intent.indicators[0]))
+            return [sample_series()]
+
+        async def _run_tracked():
+            tracker = ProcessingTracker()
+            token = activate_processing_tracker(tracker)
+            try:
+                data = await self.service._fetch_multi_indicator_data(intent)  # pylint: disable=protected-access
+            finally:
+                reset_processing_tracker(token)
+            return data, tracker
+
+        with patch.object(self.service, "_detect_explicit_provider", return_value=None), \
+             patch.object(self.service, "_select_routed_provider", side_effect=_route), \
+             patch.object(self.service, "_fetch_data", side_effect=_fetch):
+            data, tracker = run(_run_tracked())
+
+        self.assertEqual(len(data), 3)
+        # GDP and gdp share one memoised route; GDP is fetched before inflation's route completes
+        self.assertEqual([e for e in events if e[0] == "route"], [("route", "GDP"), ("route", "inflation")])
+        self.assertLess(events.index(("fetch", "GDP")), events.index(("fetch", "inflation")))
+        steps = [step for step in tracker.to_list() if step.step == "fetching_indicator"]
+        self.assertEqual(len(steps), 3)
+        self.assertEqual(steps[-1].metadata["indicator"], "inflation")
+        self.assertGreaterEqual(steps[-1].metadata["route_ms"], 40)
+
+    def test_decomposition_streams_each_entity_series_when_it_completes(self) -> None:
+        import asyncio
+
+        from backend.utils.processing_steps import ProcessingTracker
+
+        intent = ParsedIntent(
+            apiProvider="FRED",
+            indicators=["unemployment"],
+            parameters={},
+            clarificationNeeded=False,
+            needsDecomposition=True,
+            decompositionType="states",
+            decompositionEntities=["Texas", "Ohio"],
+        )
+        streamed = []
+
+        async def _sub_query(entity, sub_query, original_intent, conversation_id):
+            await asyncio.sleep(0.05 if entity == "Texas" else 0)
+            return [sample_series()]
+
+        tracker = ProcessingTracker(
+            series_callback=lambda series_id, series, meta: streamed.append((series_id, series.metadata.country, meta))
+        )
+        with patch.object(self.service, "_execute_sub_query", side_effect=_sub_query):
+            data = run(self.service._decompose_and_aggregate("unemployment by state", intent, "conv", tracker))  # pylint: disable=protected-access
+
+        self.assertEqual([series.metadata.country for series in data], ["Texas", "Ohio"])
+        self.assertEqual(streamed, [(0, "Ohio", {"entity": "Ohio"}), (1, "Texas", {"entity": "Texas"})])
+        self.assertEqual(tracker.series_order(data), {"order": [1, 0], "dropped": []})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from backend.services.rate_limiter import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    ProviderRateLimiter,
+    RateLimiterConfig,
+    request_priority,
+)
+
+
+def _limiter(min_delay: float = 0.05, per_minute: int | None = None) -> ProviderRateLimiter:
+    return ProviderRateLimiter(
+        RateLimiterConfig(name="TEST", min_delay_seconds=min_delay, max_requests_per_minute=per_minute)
+    )
+
+
+async def test_concurrent_waiters_are_spaced_not_bursty() -> None:
+    limiter = _limiter(min_delay=0.05)
+    grant_times: list[float] = []
+
+    async def _send() -> None:
+        await limiter.wait_until_ready()
+        grant_times.append(time.monotonic())
+
+    await asyncio.gather(*[_send() for _ in range(4)])
+
+    gaps = [b - a for a, b in zip(grant_times, grant_times[1:])]
+    assert len(grant_times) == 4
+    assert all(gap >= 0.04 for gap in gaps)
+    assert len(limiter.minute_window) == 0  # no per-minute limit configured
+    assert limiter.get_scheduler_stats()["granted"] == 4
+
+
+async def test_waiters_are_granted_fifo_within_priority() -> None:
+    limiter = _limiter(min_delay=0.02)
+    order: list[int] = []
+
+    async def _send(index: int) -> None:
+        await limiter.wait_until_ready()
+        order.append(index)
+
+    await asyncio.gather(*[_send(i) for i in range(5)])
+
+    assert order == [0, 1, 2, 3, 4]
+
+
+async def test_interactive_priority_beats_queued_background_work() -> None:
+    limiter = _limiter(min_delay=0.03)
+    order: list[str] = []
+
+    async def _send(label: str, priority: int) -> None:
+        await limiter.wait_until_ready(priority)
+        order.append(label)
+
+    # First request takes the free slot; the rest queue up behind it.
+    await limiter.wait_until_ready()
+    background = [asyncio.create_task(_send(f"bg{i}", PRIORITY_BACKGROUND)) for i in range(3)]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(_send("ui", PRIORITY_INTERACTIVE))
+
+    await asyncio.gather(*background, interactive)
+
+    assert order[0] == "ui"
+    assert order[1:] == ["bg0", "bg1", "bg2"]
+
+
+async def test_context_priority_is_used_when_not_passed() -> None:
+    limiter = _limiter(min_delay=0.03)
+    order: list[str] = []
+
+    async def _send(label: str) -> None:
+        await limiter.wait_until_ready()
+        order.append(label)
+
+    await limiter.wait_until_ready()
+    with request_priority(PRIORITY_BACKGROUND):
+        background = asyncio.create_task(_send("bg"))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(_send("ui"))
+
+    await asyncio.gather(background, interactive)
+
+    assert order == ["ui", "bg"]
+
+
+async def test_cancelled_reservation_does_not_consume_a_slot() -> None:
+    limiter = _limiter(min_delay=0.03)
+    await limiter.wait_until_ready()
+
+    cancelled = asyncio.create_task(limiter.wait_until_ready())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await limiter.wait_until_ready()
+
+    stats = limiter.get_scheduler_stats()
+    assert stats["granted"] == 2
+    assert stats["queue_depth"] == 0
+
+
+async def test_scheduler_stats_report_queue_depth_and_wait_histogram() -> None:
+    limiter = _limiter(min_delay=0.02)
+
+    await asyncio.gather(*[limiter.wait_until_ready() for _ in range(3)])
+
+    stats = limiter.get_scheduler_stats()
+    assert stats["max_queue_depth"] == 2
+    assert stats["wait_time_histogram"]["le_inf"] == 3
+    assert stats["wait_time_histogram"]["le_0.05s"] >= 1
+    assert stats["average_wait_ms"] > 0
+
+
+def test_budget_usage_tracks_tightest_window() -> None:
+    limiter = ProviderRateLimiter(
+        RateLimiterConfig(name="TEST", min_delay_seconds=0, max_requests_per_minute=4, max_requests_per_hour=100)
+    )
+    assert limiter.get_budget_usage() == 0.0
+
+    limiter.record_request()
+    limiter.record_request()
+
+    assert limiter.get_budget_usage() == 0.5
+    assert _limiter(per_minute=None).get_budget_usage() == 0.0
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from backend.providers.base import BaseProvider
+from backend.utils.request_budget import (
+    RequestBudget,
+    activate_request_budget,
+    reset_request_budget,
+)
+from backend.utils.retry import DataNotAvailableError, retry_async
+from backend.tests.utils import run
+
+
+class _FailingCall:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        raise httpx.ConnectError("upstream down")
+
+
+class _Provider(BaseProvider):
+    @property
+    def provider_name(self) -> str:
+        return "Test"
+
+    async def _fetch_data(self, **params):
+        return []
+
+
+class _RecordingClient:
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+        self.timeouts = []
+
+    async def get(self, url, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        raise self.error
+
+
+async def _with_budget(budget: RequestBudget, coro_factory):
+    token = activate_request_budget(budget)
+    try:
+        return await coro_factory()
+    finally:
+        reset_request_budget(token)
+
+
+def test_retry_async_without_budget_keeps_all_attempts() -> None:
+    call = _FailingCall()
+
+    with pytest.raises(httpx.ConnectError):
+        run(retry_async(call, max_attempts=3, initial_delay=0))
+
+    assert call.calls == 3
+
+
+def test_nested_retries_share_one_budget() -> None:
+    inner = _FailingCall()
+    budget = RequestBudget(max_retries=2)
+
+    async def _outer_attempt():
+        return await retry_async(inner, max_attempts=3, initial_delay=0)
+
+    with pytest.raises(httpx.ConnectError):
+        run(_with_budget(budget, lambda: retry_async(_outer_attempt, max_attempts=3, initial_delay=0)))
+
+    # 1 initial inner attempt + 2 budgeted retries, instead of 3 x 3
+    assert inner.calls == 3
+    assert budget.retries_used == 2
+    assert budget.retries_denied >= 1
+
+
+def test_deadline_bounds_attempts_and_skips_retries_that_cannot_fit() -> None:
+    attempts = []
+
+    async def _slow():
+        attempts.append(time.monotonic())
+        await asyncio.sleep(5)
+
+    budget = RequestBudget(deadline_seconds=0.1)
+    start = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        run(_with_budget(budget, lambda: retry_async(_slow, max_attempts=3, initial_delay=0)))
+
+    assert time.monotonic() - start < 1.0
+    assert len(attempts) == 1
+
+
+def test_base_provider_clamps_timeout_and_stops_when_budget_is_spent() -> None:
+    provider = _Provider(timeout=30.0)
+    client = _RecordingClient(httpx.ConnectError("refused"))
+    budget = RequestBudget(deadline_seconds=10.0, max_retries=0)
+
+    with pytest.raises(DataNotAvailableError):
+        run(_with_budget(budget, lambda: provider._get_with_retry(client, "https://example.com")))  # pylint: disable=protected-access
+
+    assert len(client.timeouts) == 1
+    assert client.timeouts[0] <= 10.0
+
+
+def test_default_deadline_outlasts_the_longest_provider_timeout() -> None:
+    from backend.config import Settings
+
+    # StatsCan multi-province downloads use a 300 s request timeout
+    assert Settings.model_fields["request_deadline_seconds"].default > 300.0
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import httpx
+
+from backend.services.rate_limiter import ProviderRateLimiter, RateLimiterConfig
+from backend.services.request_hedging import RequestHedger
+
+
+class _SequencedClient:
+    """Returns responses after per-call delays; records how many calls were made."""
+
+    def __init__(self, delays, statuses=None) -> None:
+        self.delays = list(delays)
+        self.statuses = list(statuses) if statuses else None
+        self.calls = 0
+        self.cancelled = 0
+
+    async def get(self, url, **kwargs):
+        delay = self.delays[self.calls]
+        self.calls += 1
+        call = self.calls
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.statuses:
+            return httpx.Response(self.statuses[call - 1], text=f"response-{call}")
+        return f"response-{self.calls}"
+
+
+def _warm(hedger: RequestHedger, provider: str, seconds: float, count: int = 20) -> None:
+    for _ in range(count):
+        hedger.record_latency(provider, seconds)
+
+
+async def test_no_hedge_until_enough_samples() -> None:
+    hedger = RequestHedger(min_samples=5)
+    client = _SequencedClient([0.05])
+
+    result = await hedger.get(client, "https://example.com", "OECD")
+
+    assert result == "response-1"
+    assert client.calls == 1
+    assert hedger.hedge_delay("OECD") is None
+
+
+async def test_slow_primary_is_hedged_and_hedge_wins() -> None:
+    hedger = RequestHedger(min_samples=20, max_hedge_ratio=1.0)
+    _warm(hedger, "OECD", 0.02)
+    client = _SequencedClient([2.0, 0.01])
+
+    with patch("backend.services.request_hedging.try_acquire_provider_slot", return_value=True):
+        start = time.monotonic()
+        result = await hedger.get(client, "https://example.com", "OECD")
+        elapsed = time.monotonic() - start
+        await asyncio.sleep(0)
+
+    assert result == "response-2"
+    assert elapsed < 0.5
+    assert client.cancelled == 1
+    stats = hedger.get_stats()["OECD"]
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+    assert stats["hedge_rate"] == 1.0
+
+
+async def test_fast_error_status_does_not_beat_a_slower_success() -> None:
+    hedger = RequestHedger(min_samples=20, max_hedge_ratio=1.0)
+    _warm(hedger, "OECD", 0.02)
+    client = _SequencedClient([0.2, 0.01], statuses=[200, 503])
+
+    with patch("backend.services.request_hedging.try_acquire_provider_slot", return_value=True):
+        result = await hedger.get(client, "https://example.com", "OECD")
+
+    assert result.status_code == 200
+    assert result.text == "response-1"
+    assert hedger.get_stats()["OECD"]["hedge_wins"] == 0
+
+
+async def test_hedge_skipped_without_free_rate_limit_slot() -> None:
+    hedger = RequestHedger(min_samples=20, max_hedge_ratio=1.0)
+    _warm(hedger, "OECD", 0.01)
+    client = _SequencedClient([0.1, 0.01])
+
+    with patch("backend.services.request_hedging.try_acquire_provider_slot", return_value=False):
+        result = await hedger.get(client, "https://example.com", "OECD")
+
+    assert result == "response-1"
+    assert client.calls == 1
+    assert hedger.get_stats()["OECD"]["skipped_no_slot"] == 1
+
+
+async def test_hedge_threshold_adapts_to_recorded_latency() -> None:
+    hedger = RequestHedger(percentile=0.9, min_samples=10)
+    for value in range(1, 11):
+        hedger.record_latency("IMF", value / 10)
+
+    assert hedger.hedge_delay("IMF") == 1.0
+    _warm(hedger, "IMF", 0.2, count=200)
+    assert hedger.hedge_delay("IMF") == 0.2
+
+
+def test_try_acquire_now_never_jumps_the_queue() -> None:
+    limiter = ProviderRateLimiter(RateLimiterConfig(name="TEST", min_delay_seconds=10.0))
+
+    assert limiter.try_acquire_now() is True
+    # Second request inside min_delay: no free slot
+    assert limiter.try_acquire_now() is False
+    assert limiter.get_scheduler_stats()["granted"] == 1
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.models import ParsedIntent, QueryResponse
+from backend.services import response_cache as response_cache_module
+from backend.services.cache import cache_service
+from backend.services.conversation import conversation_manager
+from backend.services.query import QueryService
+from backend.services.response_cache import (
+    ResponseCache,
+    collect_data_dependencies,
+    mark_response_uncacheable,
+    record_data_dependency,
+)
+from backend.tests.test_query_service import sample_series
+from backend.tests.utils import run
+
+
+@pytest.fixture(autouse=True)
+def _clean_caches(monkeypatch):
+    cache_service.clear()
+    monkeypatch.setattr(response_cache_module, "_response_cache", None)
+    yield
+    cache_service.clear()
+
+
+def _response() -> QueryResponse:
+    return QueryResponse(
+        conversationId="conv-1",
+        intent=ParsedIntent(
+            apiProvider="FRED",
+            indicators=["GDP"],
+            parameters={"seriesId": "GDP"},
+            clarificationNeeded=False,
+        ),
+        data=[sample_series()],
+        clarificationNeeded=False,
+    )
+
+
+def _cached_dependency(key: str = "fred:gdp", ttl: int = 600) -> list:
+    cache_service.set(key, [sample_series()], ttl=ttl)
+    return [{"key": key, "expires_at": cache_service.get_expiry(key), "tier": "memory"}]
+
+
+def test_store_and_lookup_normalizes_query_and_strips_conversation() -> None:
+    cache = ResponseCache(shared=False)
+    key = cache.build_key("US GDP", auto_pro_mode=False)
+
+    assert run(cache.store(key, _response(), _cached_dependency(), compute_ms=2500.0))
+    hit = run(cache.lookup(cache.build_key("  us   gdp?", auto_pro_mode=False)))
+
+    assert hit is not None
+    assert hit.conversationId == ""
+    assert hit.data[0].metadata.indicator == "Real GDP"
+    assert run(cache.lookup(cache.build_key("US GDP", auto_pro_mode=True))) is None
+    stats = cache.get_stats()
+    assert stats["local_hits"] == 1
+    assert stats["saved_ms"] == 2500.0
+
+
+def test_entry_is_dropped_when_provider_data_is_cleared() -> None:
+    cache = ResponseCache(shared=False)
+    key = cache.build_key("US GDP")
+    run(cache.store(key, _response(), _cached_dependency(), compute_ms=10.0))
+
+    cache_service.clear()
+
+    assert run(cache.lookup(key)) is None
+    assert cache.get_stats()["invalidations"] == 1
+
+
+def test_entry_expires_with_earliest_dependency() -> None:
+    cache = ResponseCache(ttl=3600, shared=False)
+    key = cache.build_key("US GDP")
+    dependencies = _cached_dependency("fred:gdp", ttl=600) + _cached_dependency("fred:cpi", ttl=30)
+
+    run(cache.store(key, _response(), dependencies, compute_ms=10.0))
+
+    entry = cache._entries[key]  # pylint: disable=protected-access
+    assert entry.expires_at == pytest.approx(time.time() + 30, abs=2)
+
+
+def test_responses_without_dependencies_or_data_are_not_cached() -> None:
+    cache = ResponseCache(shared=False)
+    clarification = _response().model_copy(update={"data": None, "clarificationNeeded": True})
+
+    assert not run(cache.store("a", _response(), [], compute_ms=10.0))
+    assert not run(cache.store("b", clarification, _cached_dependency(), compute_ms=10.0))
+    assert cache.get_stats()["skipped"] == 2
+
+
+def test_warning_and_fallback_answers_are_not_cached() -> None:
+    cache = ResponseCache(shared=False)
+    partial = _response().model_copy(update={"message": "Data for 3 of 5 countries"})
+
+    with collect_data_dependencies() as dependencies:
+        record_data_dependency("fred:gdp", time.time() + 60)
+        mark_response_uncacheable("provider_fallback")
+
+    assert not run(cache.store("a", partial, _cached_dependency(), compute_ms=10.0))
+    assert not run(cache.store("b", _response(), dependencies, compute_ms=10.0))
+    assert cache.get_stats()["skipped"] == 2
+
+
+def test_dependencies_are_only_collected_inside_the_block() -> None:
+    record_data_dependency("outside", time.time() + 60)
+    with collect_data_dependencies() as dependencies:
+        record_data_dependency("inside", time.time() + 60)
+        record_data_dependency("unknown-expiry", None)
+
+    assert [dependency["key"] for dependency in dependencies] == ["inside"]
+
+
+def test_repeated_standalone_query_skips_pipeline(monkeypatch) -> None:
+    service = QueryService(openrouter_key="test", fred_key="fred", comtrade_key="demo")
+    monkeypatch.setattr(service.settings, "use_response_cache", True)
+    monkeypatch.setattr(service.settings, "response_cache_shared", False)
+    intent = _response().intent
+
+    with patch.object(service.openrouter, "parse_query", AsyncMock(return_value=intent)), \
+            patch.object(service.fred_provider, "fetch_series", AsyncMock(return_value=sample_series())):
+        first = run(service.process_query("US GDP"))
+    assert first.data
+
+    with patch.object(service, "_process_query_uncached", side_effect=AssertionError("should be cached")):
+        second = run(service.process_query("us gdp"))
+
+    assert second.data[0].metadata.indicator == "Real GDP"
+    assert second.conversationId and second.conversationId != first.conversationId
+    assert [step.step for step in second.processingSteps] == ["response_cache_hit"]
+    assert len(conversation_manager.get_history(second.conversationId)) == 2
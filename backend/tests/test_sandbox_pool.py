@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import os
+
+import pytest
+
+from backend.services import secure_code_executor as executor_module
+from backend.services.sandbox_pool import POOL_SUPPORTED, SandboxPoolUnavailable, SandboxWorkerPool
+from backend.services.secure_code_executor import SecureCodeExecutor, SecurityLevel, build_sandbox_env
+from backend.tests.utils import run
+
+pytestmark = pytest.mark.skipif(not POOL_SUPPORTED, reason="sandbox pool needs os.fork")
+
+
+def _make_pool(tmp_path, size=1, max_runs=50) -> SandboxWorkerPool:
+    home_dir = tmp_path / "pool"
+    return SandboxWorkerPool(size=size, env=build_sandbox_env(home_dir), home_dir=home_dir, max_runs=max_runs)
+
+
+def _make_executor(tmp_path, monkeypatch, pool) -> SecureCodeExecutor:
+    monkeypatch.setattr(executor_module, "get_sandbox_pool", lambda: pool)
+    return SecureCodeExecutor(
+        security_level=SecurityLevel.MODERATE,
+        session_dir=tmp_path / "sessions",
+        public_dir=tmp_path / "public",
+    )
+
+
+def test_pooled_execution_returns_output(tmp_path, monkeypatch) -> None:
+    async def _scenario():
+        pool = _make_pool(tmp_path)
+        await pool.start()
+        executor = _make_executor(tmp_path, monkeypatch, pool)
+        try:
+            result = await executor.execute_code("print(sum(range(10)))", session_id="pooled")
+            return result, pool.get_stats()
+        finally:
+            await pool.close()
+
+    result, stats = run(_scenario())
+
+    assert result["success"] is True
+    assert result["output"].strip() == "45"
+    assert stats["executions"] == 1
+    assert stats["fallbacks"] == 0
+    assert not list((tmp_path / "sessions" / "work").glob("[0-9a-f]*"))
+
+
+def test_module_state_does_not_leak_between_runs(tmp_path) -> None:
+    async def _scenario():
+        pool = _make_pool(tmp_path)
+        await pool.start()
+        try:
+            first, second = tmp_path / "first", tmp_path / "second"
+            first.mkdir()
+            second.mkdir()
+            await pool.execute("import json\njson.leaked = 1\nmarker = 1", first, timeout=10)
+            await pool.execute(
+                "import json\n"
+                "with open('out.txt', 'w') as f:\n"
+                "    f.write(f\"{hasattr(json, 'leaked')} {'marker' in globals()}\")",
+                second,
+                timeout=10,
+            )
+            return (second / "out.txt").read_text(), pool.get_stats()
+        finally:
+            await pool.close()
+
+    output, stats = run(_scenario())
+
+    assert output == "False False"
+    assert stats["executions"] == 2
+    assert stats["recycled"] == 0
+
+
+def test_worker_recycled_after_max_runs(tmp_path) -> None:
+    async def _scenario():
+        pool = _make_pool(tmp_path, max_runs=2)
+        await pool.start()
+        try:
+            pids = []
+            for index in range(3):
+                pids.append(pool._idle[0].process.pid)
+                work_dir = tmp_path / f"run{index}"
+                work_dir.mkdir()
+                assert await pool.execute("x = 1", work_dir, timeout=10) == 0
+                while not pool.has_idle_worker():
+                    await asyncio.sleep(0.01)
+            return pids, pool.get_stats()
+        finally:
+            await pool.close()
+
+    pids, stats = run(_scenario())
+
+    assert pids[0] == pids[1] != pids[2]
+    assert stats["recycled"] == 1
+
+
+def test_timeout_kills_and_replaces_worker(tmp_path) -> None:
+    async def _scenario():
+        pool = _make_pool(tmp_path)
+        await pool.start()
+        try:
+            worker = pool._idle[0]
+            work_dir = tmp_path / "slow"
+            work_dir.mkdir()
+            with pytest.raises(asyncio.TimeoutError):
+                await pool.execute("import time\ntime.sleep(30)", work_dir, timeout=0.3)
+            await asyncio.wait_for(worker.process.wait(), timeout=5)
+            with pytest.raises(SandboxPoolUnavailable):
+                pool._acquire()
+            while not pool.has_idle_worker():
+                await asyncio.sleep(0.01)
+            return worker, pool.get_stats()
+        finally:
+            await pool.close()
+
+    worker, stats = run(_scenario())
+
+    assert not worker.alive
+    assert stats["timeouts"] == 1
+    assert stats["idle"] == 1
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc/self/fd")
+def test_child_cannot_forge_the_worker_reply(tmp_path) -> None:
+    async def _scenario():
+        pool = _make_pool(tmp_path)
+        await pool.start()
+        try:
+            forged, follow_up = tmp_path / "forged", tmp_path / "follow_up"
+            forged.mkdir()
+            follow_up.mkdir()
+            status = await pool.execute(
+                "import time\n"
+                "try:\n"
+                "    f = open('/proc/self/fd/3', 'w')\n"
+                "    f.write('{\"exit_status\": 0}\\n')\n"
+                "    f.flush()\n"
+                "except OSError:\n"
+                "    pass\n"
+                "time.sleep(0.3)\n"
+                "open('late.txt', 'w').write('late')\n"
+                "raise RuntimeError('boom')",
+                forged,
+                timeout=10,
+            )
+            late_written = (forged / "late.txt").exists()
+            while not pool.has_idle_worker():
+                await asyncio.sleep(0.01)
+            next_status = await pool.execute("x = 1", follow_up, timeout=10)
+            return status, late_written, next_status
+        finally:
+            await pool.close()
+
+    status, late_written, next_status = run(_scenario())
+
+    assert status == 1
+    assert late_written
+    assert next_status == 0
+
+
+def test_falls_back_to_cold_path_when_pool_busy(tmp_path, monkeypatch) -> None:
+    async def _scenario():
+        pool = _make_pool(tmp_path)
+        await pool.start()
+        executor = _make_executor(tmp_path, monkeypatch, pool)
+        busy_dir = tmp_path / "busy"
+        busy_dir.mkdir()
+        try:
+            busy = asyncio.create_task(pool.execute("import time\ntime.sleep(1)", busy_dir, timeout=10))
+            while pool.has_idle_worker():
+                await asyncio.sleep(0.01)
+            result = await executor.execute_code("print('cold')", session_id="cold")
+            await busy
+            return result, pool.get_stats()
+        finally:
+            await pool.close()
+
+    result, stats = run(_scenario())
+
+    assert result["success"] is True
+    assert result["output"].strip() == "cold"
+    assert stats["fallbacks"] == 1
+    assert stats["executions"] == 1
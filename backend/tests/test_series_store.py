@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from backend.models import NormalizedData, ParsedIntent
+from backend.services.query import QueryService
+from backend.services.series_store import (
+    SeriesStore,
+    StoredSeries,
+    merge_series,
+    plan_delta_fetch,
+    slice_series,
+)
+from backend.tests.utils import run
+
+
+def make_series(points: list[tuple[str, float]], country: str = "DE") -> NormalizedData:
+    return NormalizedData.model_validate(
+        {
+            "metadata": {
+                "source": "World Bank",
+                "indicator": "GDP (current US$)",
+                "country": country,
+                "frequency": "annual",
+                "unit": "US$",
+                "lastUpdated": "2024-01-01",
+                "seriesId": "NY.GDP.MKTP.CD",
+            },
+            "data": [{"date": date, "value": value} for date, value in points],
+        }
+    )
+
+
+def stored_entry(series: list[NormalizedData], requested_start: str | None = "2015-01-01") -> StoredSeries:
+    return StoredSeries(
+        series=series,
+        requested_start=requested_start,
+        end_date=max(p.date for s in series for p in s.data),
+        full_fetch_at=time.time(),
+        updated_at=time.time(),
+    )
+
+
+class SeriesStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.store = SeriesStore(Path(self._tmpdir.name) / "series.db")
+
+    def tearDown(self) -> None:
+        self._tmpdir.cleanup()
+
+    def test_plan_requests_delta_from_last_stored_observation(self) -> None:
+        stored = stored_entry([make_series([("2021-01-01", 1.0), ("2022-01-01", 2.0)])])
+
+        plan = plan_delta_fetch(stored, "2015-01-01", None, SeriesStore.FULL_REFRESH_SECONDS)
+
+        self.assertEqual(plan.mode, "delta")
+        self.assertEqual(plan.delta_start, "2022-01-01")
+
+    def test_plan_requires_full_fetch_when_request_reaches_further_back(self) -> None:
+        stored = stored_entry([make_series([("2021-01-01", 1.0)])])
+
+        plan = plan_delta_fetch(stored, "2010-01-01", None, SeriesStore.FULL_REFRESH_SECONDS)
+
+        self.assertEqual(plan.mode, "full")
+
+    def test_plan_serves_closed_window_inside_stored_history(self) -> None:
+        stored = stored_entry([make_series([("2021-01-01", 1.0), ("2023-01-01", 3.0)])])
+
+        plan = plan_delta_fetch(stored, "2016-01-01", "2021-12-31", SeriesStore.FULL_REFRESH_SECONDS)
+
+        self.assertEqual(plan.mode, "serve")
+
+    def test_merge_replaces_overlap_with_delta_points(self) -> None:
+        stored = [make_series([("2020-01-01", 1.0), ("2021-01-01", 2.0), ("2022-01-01", 3.0)])]
+        delta = [make_series([("2022-01-01", 3.5), ("2023-01-01", 4.0)])]
+
+        merged = merge_series(stored, delta)
+
+        assert merged is not None
+        self.assertEqual(
+            [(p.date, p.value) for p in merged[0].data],
+            [("2020-01-01", 1.0), ("2021-01-01", 2.0), ("2022-01-01", 3.5), ("2023-01-01", 4.0)],
+        )
+        self.assertEqual(merged[0].metadata.endDate, "2023-01-01")
+
+    def test_merge_rejects_delta_with_different_series(self) -> None:
+        stored = [make_series([("2020-01-01", 1.0)], country="DE")]
+        delta = [make_series([("2021-01-01", 2.0)], country="FR")]
+
+        self.assertIsNone(merge_series(stored, delta))
+
+    def test_slice_matches_annual_points_against_full_dates(self) -> None:
+        series = [make_series([("2014", 0.5), ("2015", 1.0), ("2016", 2.0)])]
+
+        sliced = slice_series(series, "2015-01-01", None)
+
+        self.assertEqual([p.date for p in sliced[0].data], ["2015", "2016"])
+
+    def test_put_and_get_round_trip(self) -> None:
+        key = SeriesStore.build_key("WORLDBANK", {"indicator": "NY.GDP.MKTP.CD", "country": "DE", "startDate": "2015-01-01"})
+        series = [make_series([("2021-01-01", 1.0), ("2022-01-01", 2.0)])]
+
+        self.store.put(key, series, "2015-01-01", full_fetch=True)
+        stored = self.store.get(key)
+
+        assert stored is not None
+        self.assertEqual(stored.end_date, "2022-01-01")
+        self.assertEqual(stored.requested_start, "2015-01-01")
+        self.assertEqual(stored.series[0].data[1].value, 2.0)
+
+    def test_key_ignores_window_but_not_scope(self) -> None:
+        base = {"indicator": "X", "country": "DE", "startDate": "2015-01-01"}
+
+        self.assertEqual(
+            SeriesStore.build_key("IMF", base),
+            SeriesStore.build_key("IMF", {**base, "startDate": "2018-01-01", "endDate": "2024-12-31"}),
+        )
+        self.assertNotEqual(
+            SeriesStore.build_key("IMF", base),
+            SeriesStore.build_key("IMF", {**base, "frequency": "Q"}),
+        )
+
+    def test_fetch_data_requests_only_delta_on_cache_miss(self) -> None:
+        service = QueryService(openrouter_key="test", fred_key="fred", comtrade_key="demo")
+        service.settings.use_series_store = True
+        intent_params = {"indicator": "NY.GDP.MKTP.CD", "country": "DE", "startDate": "2015-01-01"}
+
+        def _intent() -> ParsedIntent:
+            return ParsedIntent(
+                apiProvider="WorldBank",
+                indicators=["NY.GDP.MKTP.CD"],
+                parameters=dict(intent_params),
+                clarificationNeeded=False,
+                originalQuery="germany gdp since 2015",
+            )
+
+        full = [make_series([("2015-01-01", 1.0), ("2016-01-01", 2.0), ("2017-01-01", 3.0)])]
+        delta = [make_series([("2017-01-01", 3.1), ("2018-01-01", 4.0)])]
+
+        try:
+            with patch("backend.services.query.get_series_store", return_value=self.store), \
+                 patch.object(service, "_get_from_cache", return_value=None), \
+                 patch.object(service, "_save_to_cache", new=AsyncMock()), \
+                 patch.object(service.world_bank_provider, "fetch_indicator", new=AsyncMock(side_effect=[full, delta])) as fetch:
+                run(service._fetch_data(_intent()))  # pylint: disable=protected-access
+                result = run(service._fetch_data(_intent()))  # pylint: disable=protected-access
+        finally:
+            service.settings.use_series_store = False
+
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(fetch.call_args_list[1].kwargs["start_date"], "2017-01-01")
+        self.assertEqual(
+            [(p.date, p.value) for p in result[0].data],
+            [("2015-01-01", 1.0), ("2016-01-01", 2.0), ("2017-01-01", 3.1), ("2018-01-01", 4.0)],
+        )
+        self.assertEqual(self.store.get_stats()["delta_fetches"], 1)
+
+
+    def test_fetch_data_reads_and_writes_the_store_off_the_event_loop(self) -> None:
+        service = QueryService(openrouter_key="test", fred_key="fred", comtrade_key="demo")
+        service.settings.use_series_store = True
+        intent = ParsedIntent(
+            apiProvider="WorldBank",
+            indicators=["NY.GDP.MKTP.CD"],
+            parameters={"indicator": "NY.GDP.MKTP.CD", "country": "DE", "startDate": "2015-01-01"},
+            clarificationNeeded=False,
+            originalQuery="germany gdp since 2015",
+        )
+        threads = []
+        get, put = self.store.get, self.store.put
+
+        def _get(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return get(*args, **kwargs)
+
+        def _put(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return put(*args, **kwargs)
+
+        async def _fetch():
+            return threading.get_ident(), await service._fetch_data(intent)  # pylint: disable=protected-access
+
+        try:
+            with patch("backend.services.query.get_series_store", return_value=self.store), \
+                 patch.object(self.store, "get", side_effect=_get), \
+                 patch.object(self.store, "put", side_effect=_put), \
+                 patch.object(service, "_get_from_cache", return_value=None), \
+                 patch.object(service, "_save_to_cache", new=AsyncMock()), \
+                 patch.object(service.world_bank_provider, "fetch_indicator", new=AsyncMock(return_value=[make_series([("2015-01-01", 1.0)])])):
+                loop_thread, result = run(_fetch())
+        finally:
+            service.settings.use_series_store = False
+
+        self.assertEqual(result[0].data[0].value, 1.0)
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(loop_thread, threads)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+
+import pandas as pd
+import pytest
+
+from backend.services import session_storage as storage_module
+from backend.services.secure_code_executor import SecureCodeExecutor, SecurityLevel
+from backend.services.session_storage import SessionStorage
+from backend.tests.utils import run
+
+requires_arrow = pytest.mark.skipif(not storage_module.ARROW_AVAILABLE, reason="pyarrow not installed")
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch) -> SessionStorage:
+    monkeypatch.setattr(storage_module, "get_session_storage_dir", lambda: tmp_path)
+    return SessionStorage()
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "date": pd.to_datetime(["2020-01-01", "2021-01-01"]),
+        "country": ["US", "CA"],
+        "value": [1.5, None],
+    })
+
+
+@requires_arrow
+def test_dataframe_round_trips_through_arrow(storage, tmp_path) -> None:
+    assert storage.save("abc123", "gdp", _frame())
+
+    loaded = storage.load("abc123", "gdp")
+
+    assert (tmp_path / "abc123" / "gdp.arrow").exists()
+    assert not (tmp_path / "abc123" / "gdp.json").exists()
+    pd.testing.assert_frame_equal(loaded, _frame())
+
+
+@requires_arrow
+def test_loaded_arrow_frame_is_writable(storage) -> None:
+    storage.save("abc123", "gdp", pd.DataFrame({"year": [2020, 2021], "value": [1.5, 2.5]}))
+
+    loaded = storage.load("abc123", "gdp")
+    loaded.loc[0, "year"] = 2019
+    loaded.loc[1, "value"] = 9.0
+
+    assert loaded.to_dict("list") == {"year": [2019, 2021], "value": [1.5, 9.0]}
+
+
+def test_dataframe_falls_back_to_json_without_pyarrow(storage, tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(storage_module, "ARROW_AVAILABLE", False)
+
+    assert storage.save("abc123", "gdp", _frame())
+
+    assert not (tmp_path / "abc123" / "gdp.arrow").exists()
+    assert storage.load("abc123", "gdp")[0]["country"] == "US"
+
+
+def test_scalars_stay_json_and_legacy_json_loads(storage, tmp_path) -> None:
+    storage.save("abc123", "meta", {"tables": ["36100434"]})
+    (tmp_path / "abc123" / "legacy.json").write_text(json.dumps([{"year": 2020, "value": 1.0}]))
+
+    assert storage.load("abc123", "meta") == {"tables": ["36100434"]}
+    assert storage.load("abc123", "legacy") == [{"year": 2020, "value": 1.0}]
+    assert sorted(storage.list_keys("abc123")) == ["legacy", "meta"]
+
+
+@requires_arrow
+def test_resaving_key_replaces_other_format(storage, tmp_path) -> None:
+    storage.save("abc123", "gdp", {"note": "old"})
+    storage.save("abc123", "gdp", _frame())
+
+    assert storage.list_keys("abc123") == ["gdp"]
+    assert isinstance(storage.load("abc123", "gdp"), pd.DataFrame)
+
+    storage.save("abc123", "gdp", {"note": "new"})
+
+    assert storage.load("abc123", "gdp") == {"note": "new"}
+    assert not (tmp_path / "abc123" / "gdp.arrow").exists()
+
+
+@requires_arrow
+def test_sandbox_session_helpers_use_arrow(tmp_path) -> None:
+    executor = SecureCodeExecutor(
+        security_level=SecurityLevel.MODERATE,
+        session_dir=tmp_path / "sessions",
+        public_dir=tmp_path / "public",
+    )
+    save_code = (
+        "import pandas as pd\n"
+        "df = pd.DataFrame({'date': pd.to_datetime(['2020-01-01']), 'value': [2.5]})\n"
+        "save_session('gdp', df)\n"
+    )
+    load_code = (
+        "import pandas as pd\n"
+        "data = load_session('gdp')\n"
+        "data.loc[0, 'value'] = 9.0\n"
+        "print(isinstance(data, pd.DataFrame), str(data['date'].dtype), data.loc[0, 'value'], list_session_data())\n"
+    )
+
+    async def _scenario():
+        await executor.execute_code(save_code, session_id="sandbox")
+        return await executor.execute_code(load_code, session_id="sandbox")
+
+    result = run(_scenario())
+
+    assert result["success"] is True, result
+    flags = result["output"].splitlines()[-1]
+    assert flags.startswith("True datetime64") and flags.endswith("9.0 ['gdp']")
+    assert (tmp_path / "sessions" / "sandbox" / "gdp.arrow").exists()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from backend.models import StreamEvent
+from backend.utils.sse import HEARTBEAT_COMMENT, stream_task_events
+from backend.tests.utils import run
+
+
+async def _collect(task, queue, heartbeat=15.0):
+    return [chunk async for chunk in stream_task_events(task, queue, heartbeat)]
+
+
+def test_relays_events_and_flushes_queue_when_task_finishes() -> None:
+    async def _scenario():
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def _work():
+            queue.put_nowait(StreamEvent(event="step", data={"step": "parsing_query"}))
+            await asyncio.sleep(0.01)
+            queue.put_nowait(StreamEvent(event="step", data={"step": "fetching_data"}))
+            queue.put_nowait(StreamEvent(event="step", data={"step": "done"}))
+            return "result"
+
+        task = asyncio.create_task(_work())
+        chunks = await _collect(task, queue)
+        return chunks, await task
+
+    chunks, result = run(_scenario())
+
+    assert result == "result"
+    assert [chunk.split("\n")[1] for chunk in chunks] == [
+        'data: {"step": "parsing_query"}',
+        'data: {"step": "fetching_data"}',
+        'data: {"step": "done"}',
+    ]
+
+
+def test_stream_ends_as_soon_as_task_completes() -> None:
+    async def _scenario():
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = {}
+
+        async def _work():
+            await asyncio.sleep(0.02)
+            finished["at"] = time.perf_counter()
+
+        task = asyncio.create_task(_work())
+        await _collect(task, queue)
+        return time.perf_counter() - finished["at"]
+
+    assert run(_scenario()) < 0.02
+
+
+def test_idle_stream_sends_heartbeat_comments() -> None:
+    async def _scenario():
+        queue: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(asyncio.sleep(0.12))
+        return await _collect(task, queue, heartbeat=0.05)
+
+    chunks = run(_scenario())
+
+    assert chunks.count(HEARTBEAT_COMMENT) == 2
+
+
+def test_closing_stream_cancels_task() -> None:
+    async def _scenario():
+        queue: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(asyncio.sleep(10))
+        queue.put_nowait(StreamEvent(event="step", data={"step": "parsing_query"}))
+
+        stream = stream_task_events(task, queue)
+        await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0)
+        return task
+
+    task = run(_scenario())
+
+    assert task.cancelled()
@@ -1,7 +1,10 @@
 """FastAPI dependency functions for request validation and authorization."""
 
+import hmac
 import logging
-from fastapi import Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, status
 
 from ..config import Settings, get_settings
 
@@ -36,3 +39,54 @@ async def require_promode(settings: Settings = Depends(get_settings)):
 
     # If we get here, Pro Mode is enabled
     logger.debug("✅ Pro Mode access granted - feature enabled")
+
+
+async def require_profiling_access(
+    authorization: Optional[str] = Header(default=None),
+    settings: Settings = Depends(get_settings),
+):
+    """
+    Dependency that guards the query profile endpoints.
+
+    Profiles contain raw queries and stack traces, so they are served only
+    when profiling is enabled and the request carries
+    ``Authorization: Bearer <PROFILING_TOKEN>``.
+    """
+    if not settings.profiling_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiling is disabled")
+    if not settings.profiling_token:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Set PROFILING_TOKEN to read query profiles",
+        )
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), settings.profiling_token.encode()):
+        logger.warning("⚠️ Rejected query profile access with a missing or invalid token")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid profiling token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def profile_requested(
+    x_profile: Optional[str] = Header(default=None, include_in_schema=False),
+    authorization: Optional[str] = Header(default=None),
+    settings: Settings = Depends(get_settings),
+) -> bool:
+    """
+    Dependency that decides whether ``X-Profile: 1`` forces a query profile.
+
+    A forced profile starts the sampler thread and takes a slot in the profile
+    ring buffer, so the header only counts alongside a valid PROFILING_TOKEN
+    (see ``require_profiling_access``). Otherwise the query runs normally and
+    is profiled only if PROFILING_SAMPLE_RATE picks it.
+    """
+    if x_profile != "1":
+        return False
+    try:
+        await require_profiling_access(authorization=authorization, settings=settings)
+    except HTTPException:
+        logger.warning("⚠️ Ignoring X-Profile without a valid profiling token")
+        return False
+    return True
@@ -0,0 +1,243 @@
+"""
+Process-wide latency histograms with Prometheus text exposition.
+
+Fed from:
+1. ``ProcessingTracker`` steps (``econ_query_step_duration_seconds``)
+2. Pipeline stages timed with ``stage_timer`` / ``timed_stage``
+   (``econ_query_stage_duration_seconds``): parse, route, resolve, fetch,
+   rerank, coverage
+3. The HTTP layer: upstream provider calls in the connection pool
+   (``econ_upstream_request_duration_seconds``) and every API request
+   (``econ_http_request_duration_seconds``)
+
+Recording takes no lock: each thread increments bucket counters in its own
+shard, and a scrape sums the shards. A lock is only taken the first time a
+thread or a label combination is seen. Label values come from small fixed
+sets (step names, provider names, route templates); a metric stops accepting
+new label combinations after ``MAX_SERIES_PER_METRIC``.
+
+Counters are per process: with several workers, every worker exports its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Upper bounds (seconds); queries range from cached milliseconds to 2-minute deadlines
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+MAX_SERIES_PER_METRIC = 500
+
+QUERY_STEP_METRIC = "econ_query_step_duration_seconds"
+QUERY_STAGE_METRIC = "econ_query_stage_duration_seconds"
+UPSTREAM_METRIC = "econ_upstream_request_duration_seconds"
+HTTP_METRIC = "econ_http_request_duration_seconds"
+
+METRIC_HELP = {
+    QUERY_STEP_METRIC: "Duration of processing steps recorded by ProcessingTracker",
+    QUERY_STAGE_METRIC: "Duration of query pipeline stages",
+    UPSTREAM_METRIC: "Duration of upstream provider HTTP requests",
+    HTTP_METRIC: "Duration of API requests served by this process",
+}
+
+_LabelSet = Tuple[Tuple[str, str], ...]
+_SeriesKey = Tuple[str, _LabelSet]
+
+
+class LatencyHistograms:
+    """Sharded, lock-free-on-record histograms keyed by metric name and labels."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, max_series: int = MAX_SERIES_PER_METRIC) -> None:
+        self.buckets = tuple(buckets)
+        self.max_series = max_series
+        self._local = threading.local()
+        self._shards: List[Dict[_SeriesKey, List[float]]] = []
+        self._series: Dict[str, set] = {}
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def _shard(self) -> Dict[_SeriesKey, List[float]]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _admit(self, key: _SeriesKey) -> bool:
+        known = self._series.get(key[0])
+        if known is not None and key in known:
+            return True
+        with self._lock:
+            known = self._series.setdefault(key[0], set())
+            if key not in known:
+                if len(known) >= self.max_series:
+                    self.dropped += 1
+                    return False
+                known.add(key)
+        return True
+
+    def observe(self, metric: str, seconds: float, **labels: Any) -> None:
+        """Record one duration in seconds."""
+        key = (metric, tuple(sorted((name, str(value)) for name, value in labels.items())))
+        shard = self._shard()
+        series = shard.get(key)
+        if series is None:
+            if not self._admit(key):
+                return
+            # Non-cumulative bucket counts (last one is +Inf), then the sum
+            series = shard[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, seconds)] += 1
+        series[-1] += seconds
+
+    def snapshot(self) -> Dict[_SeriesKey, List[float]]:
+        """Sum all shards: per series, bucket counts followed by the sum."""
+        with self._lock:
+            shards = list(self._shards)
+        totals: Dict[_SeriesKey, List[float]] = {}
+        for shard in shards:
+            for key, series in list(shard.items()):
+                total = totals.get(key)
+                if total is None:
+                    totals[key] = list(series)
+                else:
+                    for index, value in enumerate(series):
+                        total[index] += value
+        return totals
+
+    def quantile(self, series: List[float], q: float) -> Optional[float]:
+        """Estimate a quantile from bucket counts (linear within a bucket)."""
+        counts = series[:-1]
+        total = sum(counts)
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        lower = 0.0
+        for index, count in enumerate(counts):
+            upper = self.buckets[index] if index < len(self.buckets) else self.buckets[-1]
+            if count and seen + count >= rank:
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = upper
+        return self.buckets[-1]
+
+    def render_prometheus(self) -> str:
+        """Render every histogram in the Prometheus text exposition format."""
+        by_metric: Dict[str, List[Tuple[_LabelSet, List[float]]]] = {}
+        for (metric, labels), series in sorted(self.snapshot().items()):
+            by_metric.setdefault(metric, []).append((labels, series))
+
+        lines: List[str] = []
+        for metric, entries in by_metric.items():
+            lines.append(f"# HELP {metric} {METRIC_HELP.get(metric, metric)}")
+            lines.append(f"# TYPE {metric} histogram")
+            for labels, series in entries:
+                cumulative = 0
+                for index, count in enumerate(series[:-1]):
+                    cumulative += count
+                    le = f"{self.buckets[index]:g}" if index < len(self.buckets) else "+Inf"
+                    lines.append(f"{metric}_bucket{_format_labels(labels + (('le', le),))} {int(cumulative)}")
+                lines.append(f"{metric}_sum{_format_labels(labels)} {series[-1]:.6f}")
+                lines.append(f"{metric}_count{_format_labels(labels)} {int(cumulative)}")
+        lines.append("# HELP econ_latency_series_dropped_total Observations dropped by the label cardinality limit")
+        lines.append("# TYPE econ_latency_series_dropped_total counter")
+        lines.append(f"econ_latency_series_dropped_total {self.dropped}")
+        return "\n".join(lines) + "\n"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-series count and estimated p50/p95/p99 in ms, for /api/performance/metrics."""
+        stats: Dict[str, Dict[str, Any]] = {}
+        for (metric, labels), series in sorted(self.snapshot().items()):
+            count = int(sum(series[:-1]))
+            name = ",".join(f"{label}={value}" for label, value in labels) or "all"
+            stats.setdefault(metric, {})[name] = {
+                "count": count,
+                "mean_ms": round(series[-1] / count * 1000, 1) if count else 0.0,
+                **{
+                    f"p{int(q * 100)}_ms": round((self.quantile(series, q) or 0.0) * 1000, 1)
+                    for q in (0.5, 0.95, 0.99)
+                },
+            }
+        return {"histograms": stats, "dropped": self.dropped}
+
+    def reset(self) -> None:
+        """Clear every histogram (used by tests)."""
+        with self._lock:
+            for shard in self._shards:
+                shard.clear()
+            self._series.clear()
+            self.dropped = 0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: _LabelSet) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+# Global instance
+latency_histograms = LatencyHistograms()
+
+
+def observe_stage(stage: str, seconds: float, provider: Optional[str] = None, outcome: str = "ok") -> None:
+    """Record the duration of one pipeline stage."""
+    latency_histograms.observe(QUERY_STAGE_METRIC, seconds, stage=stage, provider=provider or "", outcome=outcome)
+
+
+@contextmanager
+def stage_timer(stage: str, provider: Optional[str] = None) -> Iterator[None]:
+    """Time the block as a pipeline stage; exceptions are recorded as outcome="error"."""
+    start = perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        observe_stage(stage, perf_counter() - start, provider, outcome)
+
+
+def timed_stage(stage: str, provider: Optional[Callable[..., Optional[str]]] = None) -> Callable:
+    """
+    Decorate a sync or async function so every call is timed as a pipeline stage.
+
+    Args:
+        stage: Stage label
+        provider: Optional callable taking the call's arguments and returning the provider label
+    """
+
+    def decorator(func: Callable) -> Callable:
+        def _provider(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[str]:
+            if provider is None:
+                return None
+            try:
+                return provider(*args, **kwargs)
+            except Exception:
+                return None
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with stage_timer(stage, _provider(args, kwargs)):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with stage_timer(stage, _provider(args, kwargs)):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
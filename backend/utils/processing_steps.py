@@ -3,9 +3,10 @@ from __future__ import annotations
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from time import perf_counter
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from ..models import ProcessingStep
+from ..models import NormalizedData, ProcessingStep
+from .latency_metrics import QUERY_STEP_METRIC, latency_histograms
 
 
 _processing_tracker_var: ContextVar[Optional["ProcessingTracker"]] = ContextVar(
@@ -35,6 +36,25 @@ STEP_DESCRIPTIONS = {
 }
 
 
+SeriesCallback = Callable[[int, NormalizedData, Dict[str, Any]], None]
+
+
+def _observe_step(step: str, duration_ms: float, status: str, metadata: Optional[Dict[str, Any]]) -> None:
+    provider = metadata.get("provider") if metadata else None
+    latency_histograms.observe(
+        QUERY_STEP_METRIC,
+        duration_ms / 1000,
+        step=step,
+        provider=provider if isinstance(provider, str) else "",
+        status=status,
+    )
+
+
+def _series_signature(series: NormalizedData) -> Tuple[Optional[str], ...]:
+    meta = series.metadata
+    return (meta.source, meta.indicator, meta.country, meta.seriesId)
+
+
 class ProcessingTracker:
     """Collects processing steps for a single query cycle.
 
@@ -42,9 +62,16 @@ class ProcessingTracker:
     including data fetching, fallback attempts, and error handling.
     """
 
-    def __init__(self, stream_callback: Optional[Callable[[ProcessingStep], None]] = None) -> None:
+    def __init__(
+        self,
+        stream_callback: Optional[Callable[[ProcessingStep], None]] = None,
+        series_callback: Optional[SeriesCallback] = None,
+    ) -> None:
         self._steps: list[ProcessingStep] = []
         self._stream_callback = stream_callback
+        self._series_callback = series_callback
+        self._emitted_series: List[NormalizedData] = []
+        self._emitted_index: Dict[int, int] = {}
         self._fallback_attempts: List[str] = []
         self._original_provider: Optional[str] = None
 
@@ -95,6 +122,7 @@ class ProcessingTracker:
                 metadata=collected_meta,
             )
             self._steps.append(processing_step)
+            _observe_step(step, duration_ms, "completed", collected_meta)
 
             # Send "completed" event with duration
             if self._stream_callback:
@@ -125,6 +153,8 @@ class ProcessingTracker:
             metadata=metadata,
         )
         self._steps.append(processing_step)
+        if duration_ms is not None:
+            _observe_step(step, duration_ms, status, metadata)
 
         # Call streaming callback if available
         if self._stream_callback:
@@ -133,6 +163,54 @@ class ProcessingTracker:
     def to_list(self) -> list[ProcessingStep]:
         return list(self._steps)
 
+    # === PARTIAL RESULTS ===
+
+    def emit_series(
+        self,
+        series: Optional[Iterable[NormalizedData]],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Stream fetched series before the final response is assembled.
+
+        Each series object is emitted once and gets a sequential id that
+        ``series_order`` later maps the final (reranked) response onto.
+        No-op unless a series callback is registered.
+        """
+        if not self._series_callback or not series:
+            return
+        for item in series:
+            if not isinstance(item, NormalizedData) or id(item) in self._emitted_index:
+                continue
+            series_id = len(self._emitted_series)
+            self._emitted_series.append(item)
+            self._emitted_index[id(item)] = series_id
+            self._series_callback(series_id, item, dict(metadata or {}))
+
+    @property
+    def emitted_series_count(self) -> int:
+        return len(self._emitted_series)
+
+    def series_order(self, final_data: Optional[Iterable[NormalizedData]]) -> Dict[str, Any]:
+        """Map the final series list onto streamed series ids.
+
+        Returns ``order`` (one id per final series, None for series that were
+        never streamed) and ``dropped`` (streamed ids absent from the final list).
+        """
+        by_signature: Dict[Tuple[Optional[str], ...], int] = {}
+        for series_id, item in enumerate(self._emitted_series):
+            by_signature.setdefault(_series_signature(item), series_id)
+
+        order: List[Optional[int]] = []
+        for item in final_data or []:
+            series_id = self._emitted_index.get(id(item))
+            if series_id is None:
+                series_id = by_signature.get(_series_signature(item))
+            order.append(series_id)
+
+        kept = {series_id for series_id in order if series_id is not None}
+        dropped = [series_id for series_id in range(len(self._emitted_series)) if series_id not in kept]
+        return {"order": order, "dropped": dropped}
+
     # === FALLBACK TRACKING ===
 
     def set_original_provider(self, provider: str) -> None:
@@ -0,0 +1,127 @@
+"""Per-request deadline and retry budget.
+
+Retries are nested at several levels (query service → provider → HTTP helper),
+so a single failing upstream can multiply into dozens of requests. A
+``RequestBudget`` is activated once per query, like ``ProcessingTracker``, and
+every retry helper consults it:
+
+- ``allow_retry(delay)`` spends one retry from the shared budget, and refuses
+  when none are left or the remaining time cannot fit the backoff delay plus
+  another attempt
+- ``budget_timeout(timeout)`` clamps per-call HTTP timeouts to the time left
+
+Without an active budget both helpers are no-ops, so code paths outside a
+query (scripts, background jobs, tests) keep their existing behaviour.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextvars import ContextVar, Token
+from time import monotonic
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+_request_budget_var: ContextVar[Optional["RequestBudget"]] = ContextVar(
+    "request_budget", default=None
+)
+
+
+class RequestBudgetExceeded(asyncio.TimeoutError):
+    """Raised when a request's deadline has passed."""
+
+
+class RequestBudget:
+    """Deadline and retry allowance shared by everything a request does."""
+
+    # Smallest time worth starting another attempt with
+    MIN_ATTEMPT_SECONDS = 1.0
+
+    def __init__(
+        self,
+        deadline_seconds: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        min_attempt_seconds: float = MIN_ATTEMPT_SECONDS,
+    ) -> None:
+        self.deadline = monotonic() + deadline_seconds if deadline_seconds else None
+        self.max_retries = max_retries
+        self.min_attempt_seconds = min_attempt_seconds
+        self.retries_used = 0
+        self.retries_denied = 0
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (None when there is no deadline)."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - monotonic())
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def allow_retry(self, delay: float = 0.0) -> bool:
+        """Spend one retry if the budget can fit ``delay`` plus another attempt."""
+        if self.max_retries is not None and self.retries_used >= self.max_retries:
+            self.retries_denied += 1
+            return False
+        remaining = self.remaining()
+        if remaining is not None and remaining < delay + self.min_attempt_seconds:
+            self.retries_denied += 1
+            return False
+        self.retries_used += 1
+        return True
+
+    def clamp_timeout(self, timeout: Optional[float]) -> Optional[float]:
+        """Limit a per-call timeout to the time left before the deadline."""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise RequestBudgetExceeded("Request deadline exceeded")
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def get_stats(self) -> Dict[str, Any]:
+        remaining = self.remaining()
+        return {
+            "remaining_seconds": round(remaining, 2) if remaining is not None else None,
+            "retries_used": self.retries_used,
+            "retries_denied": self.retries_denied,
+            "max_retries": self.max_retries,
+        }
+
+
+def activate_request_budget(budget: RequestBudget) -> Token:
+    """Activate budget for current async context."""
+    return _request_budget_var.set(budget)
+
+
+def get_request_budget() -> Optional[RequestBudget]:
+    """Retrieve budget for current async context, if any."""
+    return _request_budget_var.get()
+
+
+def reset_request_budget(token: Token) -> None:
+    """Reset budget context variable."""
+    _request_budget_var.reset(token)
+
+
+def allow_retry(delay: float = 0.0, label: str = "request") -> bool:
+    """Return True if the active budget permits another attempt after ``delay``."""
+    budget = get_request_budget()
+    if budget is None:
+        return True
+    if budget.allow_retry(delay):
+        return True
+    logger.warning(f"Retry budget exhausted, not retrying {label} ({budget.get_stats()})")
+    return False
+
+
+def budget_timeout(timeout: Optional[float]) -> Optional[float]:
+    """Clamp ``timeout`` to the active budget's remaining time."""
+    budget = get_request_budget()
+    if budget is None:
+        return timeout
+    return budget.clamp_timeout(timeout)
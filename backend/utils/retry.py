@@ -9,6 +9,8 @@ from functools import wraps
 
 import httpx
 
+from .request_budget import allow_retry, get_request_budget
+
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,9 @@ async def retry_async(
         jitter: Random jitter range [0, jitter] added to delay to avoid thundering herd (default: 0.0)
         exceptions: Tuple of exceptions to catch and retry
 
+    Each attempt is bounded by the active request deadline, and each retry is
+    drawn from the active request retry budget (see ``utils.request_budget``).
+
     Returns:
         The result of the function call
 
@@ -50,6 +55,9 @@ async def retry_async(
 
     for attempt in range(1, max_attempts + 1):
         try:
+            budget = get_request_budget()
+            if budget is not None and budget.deadline is not None:
+                return await asyncio.wait_for(func(), budget.clamp_timeout(None))
             return await func()
         except exceptions as exc:
             last_exception = exc
@@ -99,18 +107,20 @@ async def retry_async(
                         f"Rate limit hit (429). Attempt {attempt}/{max_attempts}. "
                         f"Retrying after {delay:.1f}s..."
                     )
-                    if attempt < max_attempts:
+                    if attempt < max_attempts and allow_retry(delay, "rate-limited request"):
                         await asyncio.sleep(delay)
                         delay *= backoff_factor  # Exponential backoff for next attempt
                         continue  # Skip the normal retry logic below
                     else:
                         raise DataNotAvailableError(
-                            f"Rate limit exceeded after {max_attempts} attempts. Please try again later."
+                            f"Rate limit exceeded after {attempt} attempts. Please try again later."
                         ) from exc
 
             if attempt < max_attempts:
                 # Add jitter to avoid thundering herd problem
                 actual_delay = delay + random.uniform(0, jitter) if jitter > 0 else delay
+                if not allow_retry(actual_delay, f"after attempt {attempt}/{max_attempts}"):
+                    raise
                 logger.warning(
                     f"Attempt {attempt}/{max_attempts} failed: {exc}. "
                     f"Retrying in {actual_delay:.1f}s..."
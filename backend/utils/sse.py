@@ -0,0 +1,65 @@
+"""Server-Sent Events helpers for the streaming query endpoints.
+
+``stream_task_events`` relays tracker events from a queue while a task runs.
+It waits on "next event" and "task finished" together instead of polling the
+queue on a short timeout, so an idle stream does not wake the event loop, and
+the final result goes out as soon as the task completes. When nothing has
+happened for ``heartbeat_interval`` seconds it sends an SSE comment, which keeps
+proxies from closing the connection.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Optional
+
+HEARTBEAT_COMMENT = ": keep-alive\n\n"
+
+
+def format_sse_event(event_type: str, data: dict) -> str:
+    """Format data as a Server-Sent Event string."""
+    return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+
+
+def _format_queued(event: Any) -> str:
+    return format_sse_event(event.event, event.data)
+
+
+async def stream_task_events(
+    task: asyncio.Future,
+    event_queue: asyncio.Queue,
+    heartbeat_interval: Optional[float] = 15.0,
+) -> AsyncIterator[str]:
+    """
+    Yield queued events (objects with ``event`` and ``data``) until ``task`` is done.
+
+    Events still queued when the task finishes are flushed before returning.
+    The caller awaits ``task`` afterwards for its result. If the consumer stops
+    early (client disconnect), ``task`` is cancelled.
+    """
+    getter: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if getter is None:
+                getter = asyncio.ensure_future(event_queue.get())
+            done, _ = await asyncio.wait(
+                {getter, task},
+                timeout=heartbeat_interval or None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if getter in done:
+                event = getter.result()
+                getter = None
+                yield _format_queued(event)
+            elif task in done:
+                break
+            elif not done:
+                yield HEARTBEAT_COMMENT
+
+        while not event_queue.empty():
+            yield _format_queued(event_queue.get_nowait())
+    finally:
+        if getter is not None and not getter.done():
+            getter.cancel()
+        if not task.done():
+            task.cancel()
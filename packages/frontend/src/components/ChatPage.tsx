@@ -244,6 +244,18 @@ export function ChatPage() {
 
     const startTime = Date.now()
     const stepMap = new Map<string, ProcessingTimelineStep>()
+    const partialSeries = new Map<number, NormalizedData>()
+    const dropPartial = () => setMessages(prev => prev.filter(m => !m.isPartial))
+    const showPartial = (data: NormalizedData[]) => {
+      setMessages(prev => [...prev.filter(m => !m.isPartial), {
+        role: 'assistant',
+        content: '',
+        timestamp: new Date(),
+        data,
+        chartType: determineChartType(data),
+        isPartial: true,
+      }])
+    }
 
     // Use streaming for both regular and Pro Mode
     try {
@@ -262,9 +274,26 @@ export function ChatPage() {
           stepMap.set(step.step, timelineStep)
           setActiveProcessingSteps(Array.from(stepMap.values()))
         },
+        onSeries: (event) => {
+          // Render series as they arrive; replaced by the final response in onData
+          partialSeries.set(event.seriesId, event.series)
+          showPartial(Array.from(partialSeries.values()))
+        },
+        onSeriesOrder: ({ order }) => {
+          // Settle the provisional chart into the final order, without series the final result drops
+          const data = order
+            .filter((seriesId): seriesId is number => seriesId !== null && partialSeries.has(seriesId))
+            .map(seriesId => partialSeries.get(seriesId) as NormalizedData)
+          if (data.length) {
+            showPartial(data)
+          } else {
+            dropPartial()
+          }
+        },
         onData: (response) => {
           const elapsed = Date.now() - startTime
           logger.log(`Query completed in ${elapsed}ms`)
+          dropPartial()
 
           setLoadingStatus('')
           processingQuery.current = null
@@ -328,6 +357,7 @@ export function ChatPage() {
         },
         onError: (error) => {
           logger.error('Stream error:', error)
+          dropPartial()
           setLoadingStatus('')
           processingQuery.current = null
           setActiveProcessingSteps([])
@@ -346,6 +376,7 @@ export function ChatPage() {
       })
     } catch (error: any) {
       logger.error('Streaming query error:', error)
+      dropPartial()
       setLoadingStatus('')
       processingQuery.current = null
       setActiveProcessingSteps([])
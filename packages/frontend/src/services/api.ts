@@ -160,6 +160,8 @@ export const api = {
     callbacks: {
       onStep?: (step: { step: string; description: string; duration_ms?: number; status?: string; metadata?: any }) => void;
       onData?: (data: QueryResponse) => void;
+      onSeries?: (event: { seriesId: number; series: NormalizedData; [key: string]: any }) => void;
+      onSeriesOrder?: (event: { order: (number | null)[]; dropped: number[] }) => void;
       onError?: (error: { error: string; message: string }) => void;
       onDone?: (conversationId: string) => void;
     },
@@ -246,6 +248,12 @@ export const api = {
               case 'step':
                 callbacks.onStep?.(data);
                 break;
+              case 'series':
+                callbacks.onSeries?.(data);
+                break;
+              case 'series_order':
+                callbacks.onSeriesOrder?.(data);
+                break;
               case 'data':
                 callbacks.onData?.(data);
                 break;
@@ -81,6 +81,7 @@ export interface Message {
   codeExecution?: CodeExecutionResult;
   isProMode?: boolean;
   processingSteps?: ProcessingStep[];
+  isPartial?: boolean;  // Series streamed before the final response arrived
 }
 
 export interface ExportFormat {
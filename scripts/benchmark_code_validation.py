@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Pro Mode code validation benchmark.
+
+Builds scripts shaped like the code the Pro Mode generator produces (httpx
+fetches, session helpers, pandas transforms, matplotlib charts) at several
+sizes and measures:
+1. legacy: the previous recursive isinstance-chain ``_check_ast`` walk
+2. single_pass: the current ``SecurityValidator`` with the cache cleared
+3. cached: the current validator on a resubmission of identical code
+
+Also reports the worst event-loop stall while validating the largest script
+inline vs through ``validate_async``. No network or API keys required.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from backend.services.secure_code_executor import (  # noqa: E402
+    SecurityLevel,
+    SecurityValidator,
+    get_validation_cache,
+)
+
+SECTION = '''
+# --- Section {i}: fetch and analyse indicator {i} ---
+data_{i} = load_session('indicator_{i}')
+if data_{i} is None:
+    response = httpx.get(
+        "https://api.worldbank.org/v2/country/USA;CAN;MEX/indicator/NY.GDP.MKTP.CD",
+        params={{"format": "json", "per_page": 500, "date": "2000:2023"}},
+        timeout=30.0,
+    )
+    records = response.json()[1] if response.status_code == 200 else []
+    df_{i} = pd.DataFrame([
+        {{"country": r["country"]["value"], "year": int(r["date"]), "value": r["value"]}}
+        for r in records if r.get("value") is not None
+    ])
+    save_session('indicator_{i}', df_{i})
+else:
+    df_{i} = pd.DataFrame(data_{i})
+
+if df_{i}.empty:
+    print("No data for indicator {i}")
+else:
+    pivot_{i} = df_{i}.pivot_table(index="year", columns="country", values="value", aggfunc="mean")
+    growth_{i} = pivot_{i}.pct_change().mul(100).round(2)
+    summary_{i} = growth_{i}.describe().T[["mean", "std", "min", "max"]]
+    print(f"Indicator {i} growth summary:\\n{{summary_{i}.to_string()}}")
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for country in pivot_{i}.columns:
+        ax.plot(pivot_{i}.index, pivot_{i}[country] / 1e9, marker="o", label=country)
+    ax.set_title("GDP (billions USD) - section {i}")
+    ax.set_xlabel("Year")
+    ax.set_ylabel("USD bn")
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    output_path = f"/tmp/promode_bench_chart_{i}.png"
+    plt.savefig(output_path, dpi=100, bbox_inches="tight")
+    plt.close(fig)
+    print(f"Chart saved: {{output_path}}")
+'''
+
+HEADER = '''import httpx
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+'''
+
+
+def build_script(sections: int) -> str:
+    return HEADER + "".join(SECTION.format(i=i) for i in range(sections))
+
+
+class LegacyValidator(SecurityValidator):
+    """The pre-cache validator: recursive walk with an isinstance chain, no cache."""
+
+    def validate(self, code: str):
+        self.violations = []
+        self.warnings = []
+        try:
+            tree = ast.parse(code)
+            self._check_ast(tree)
+            self._check_string_patterns(code)
+            return len(self.violations) == 0, self.violations, self.warnings
+        except SyntaxError as e:
+            self.violations.append(f"Syntax error: {e}")
+            return False, self.violations, self.warnings
+
+    def _check_ast(self, node: ast.AST) -> None:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            self._check_import(node)
+        elif isinstance(node, ast.Call):
+            self._check_call(node)
+        elif isinstance(node, ast.Attribute):
+            self._check_attribute(node)
+        elif isinstance(node, ast.Name):
+            self._check_name(node)
+        elif isinstance(node, ast.Constant):
+            if isinstance(node.value, str):
+                self._check_string(node)
+        for child in ast.iter_child_nodes(node):
+            self._check_ast(child)
+
+
+def _time_ms(func: Callable[[], Any], repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _uncached(code: str) -> None:
+    get_validation_cache().clear()
+    SecurityValidator(SecurityLevel.MODERATE).validate(code)
+
+
+async def _max_loop_stall_ms(validate: Callable[[], Any]) -> float:
+    stalls: List[float] = []
+    done = asyncio.Event()
+
+    async def _ticker():
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stalls.append((now - last) * 1000)
+            last = now
+
+    ticker = asyncio.create_task(_ticker())
+    await asyncio.sleep(0.01)
+    await validate()
+    done.set()
+    await ticker
+    return max(stalls)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Pro Mode security validation")
+    parser.add_argument("--sizes", type=str, default="1,5,20,60", help="Comma-separated section counts per script")
+    parser.add_argument("--repeats", type=int, default=20, help="Timing repeats per size")
+    parser.add_argument("--output", type=str, default="", help="Optional JSON report path")
+    args = parser.parse_args()
+
+    rows: List[Dict[str, Any]] = []
+    for sections in (int(size) for size in args.sizes.split(",")):
+        code = build_script(sections)
+        legacy = LegacyValidator(SecurityLevel.MODERATE)
+        assert legacy.validate(code) == SecurityValidator(SecurityLevel.MODERATE).validate(code)
+        SecurityValidator(SecurityLevel.MODERATE).validate(code)  # prime the cache
+        rows.append({
+            "lines": code.count("\n"),
+            "chars": len(code),
+            "legacy_ms": round(_time_ms(lambda: legacy.validate(code), args.repeats), 3),
+            "single_pass_ms": round(_time_ms(lambda: _uncached(code), args.repeats), 3),
+            "cached_ms": round(_time_ms(lambda: SecurityValidator(SecurityLevel.MODERATE).validate(code), args.repeats), 4),
+        })
+
+    largest = build_script(max(int(size) for size in args.sizes.split(",")))
+
+    async def _inline():
+        get_validation_cache().clear()
+        SecurityValidator(SecurityLevel.MODERATE).validate(largest)
+
+    async def _offloaded():
+        get_validation_cache().clear()
+        await asyncio.to_thread(SecurityValidator(SecurityLevel.MODERATE).validate, largest)
+
+    stall = {
+        "inline_ms": round(asyncio.run(_max_loop_stall_ms(_inline)), 2),
+        "offloaded_ms": round(asyncio.run(_max_loop_stall_ms(_offloaded)), 2),
+    }
+
+    print(f"{'lines':>6} {'chars':>8} {'legacy':>10} {'single-pass':>12} {'cached':>9}")
+    for row in rows:
+        print(
+            f"{row['lines']:>6} {row['chars']:>8} {row['legacy_ms']:>8.2f}ms "
+            f"{row['single_pass_ms']:>10.2f}ms {row['cached_ms']:>7.3f}ms"
+        )
+    print(
+        f"Max event-loop stall validating {largest.count(chr(10))} lines: "
+        f"inline {stall['inline_ms']:.1f}ms, offloaded {stall['offloaded_ms']:.1f}ms"
+    )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"sizes": rows, "loop_stall": stall}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
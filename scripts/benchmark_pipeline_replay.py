@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Offline per-stage latency benchmark for the query pipeline.
+
+Record once (live APIs, real keys):
+
+    python3 scripts/benchmark_pipeline_replay.py --record
+
+Then replay anywhere (no network) and compare with the stored baseline:
+
+    python3 scripts/benchmark_pipeline_replay.py --iterations 5 --jitter-ms 20 --seed 1
+
+Every query in the corpus runs through ``QueryService.process_query`` with
+``HTTP_CASSETTE_MODE`` set, so provider and LLM responses come from the
+cassette (see ``backend/services/http_cassette.py``). Processing-step
+durations are collected per stage and reported as p50/p95/p99. With a
+baseline file present the run is diffed against it and exits 1 when a stage
+regresses by more than ``--max-regression``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+CASSETTE_DIR = REPO_ROOT / "backend" / "tests" / "cassettes"
+DEFAULT_CASSETTE = CASSETTE_DIR / "pipeline_corpus.json"
+DEFAULT_BASELINE = CASSETTE_DIR / "pipeline_baseline.json"
+
+# One or two queries per provider, covering single, multi-country and comparison paths
+DEFAULT_CORPUS = [
+    "US GDP growth rate since 2010",
+    "US unemployment rate last 5 years",
+    "GDP per capita for Germany, France and Italy 2015-2023",
+    "China population from World Bank",
+    "IMF inflation forecast for Japan",
+    "Government debt to GDP for G7 countries",
+    "Eurostat unemployment rate Spain",
+    "OECD labour productivity United Kingdom",
+    "BIS policy rate for Canada",
+    "Canada CPI monthly from Statistics Canada",
+    "US imports from China 2020-2023",
+    "EUR to USD exchange rate",
+    "Bitcoin price last 30 days",
+]
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _summarise(samples: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    stages: Dict[str, Dict[str, float]] = {}
+    for stage, durations in sorted(samples.items()):
+        ordered = sorted(durations)
+        stages[stage] = {
+            "count": len(ordered),
+            "p50_ms": round(_percentile(ordered, 0.50), 2),
+            "p95_ms": round(_percentile(ordered, 0.95), 2),
+            "p99_ms": round(_percentile(ordered, 0.99), 2),
+        }
+    return stages
+
+
+async def _run_corpus(corpus: List[str], iterations: int, warmup: int) -> Dict[str, Any]:
+    from backend.config import get_settings
+    from backend.services.cache import cache_service
+    from backend.services.http_cassette import get_cassette
+    from backend.services.http_pool import close_http_pool
+    from backend.services.query import QueryService
+
+    settings = get_settings()
+    service = QueryService(
+        openrouter_key=settings.openrouter_api_key,
+        fred_key=settings.fred_api_key,
+        comtrade_key=settings.comtrade_api_key,
+        coingecko_key=settings.coingecko_api_key,
+        settings=settings,
+    )
+
+    samples: Dict[str, List[float]] = defaultdict(list)
+    errors: List[Dict[str, str]] = []
+    try:
+        for iteration in range(warmup + iterations):
+            measured = iteration >= warmup
+            for query in corpus:
+                # Every iteration must go upstream (to the cassette), not to the response cache
+                cache_service.clear()
+                start = time.perf_counter()
+                try:
+                    response = await service.process_query(query)
+                except Exception as exc:
+                    errors.append({"query": query, "error": f"{type(exc).__name__}: {exc}"[:300]})
+                    continue
+                total_ms = (time.perf_counter() - start) * 1000
+                if response.error and measured:
+                    errors.append({"query": query, "error": response.error[:300]})
+                if not measured:
+                    continue
+                samples["total"].append(total_ms)
+                for step in response.processingSteps or []:
+                    if step.duration_ms is not None:
+                        samples[step.step].append(step.duration_ms)
+    finally:
+        # Also writes the recordings buffered during a --record run
+        await close_http_pool()
+
+    cassette = get_cassette()
+    return {
+        "stages": _summarise(samples),
+        "errors": errors,
+        "cassette": cassette.get_stats() if cassette else None,
+    }
+
+
+def _diff(current: Dict[str, Any], baseline: Dict[str, Any], max_regression: float, min_delta_ms: float) -> List[str]:
+    regressions = []
+    print(f"\n{'stage':<24} {'p50 base':>10} {'p50 now':>10} {'p95 base':>10} {'p95 now':>10}")
+    for stage, now in current["stages"].items():
+        base = baseline.get("stages", {}).get(stage)
+        if base is None:
+            print(f"{stage:<24} {'-':>10} {now['p50_ms']:>10.1f} {'-':>10} {now['p95_ms']:>10.1f}  (new)")
+            continue
+        flags = []
+        for metric in ("p50_ms", "p95_ms"):
+            delta = now[metric] - base[metric]
+            if delta > min_delta_ms and now[metric] > base[metric] * (1 + max_regression):
+                flags.append(f"{metric} +{delta:.1f}ms")
+        print(
+            f"{stage:<24} {base['p50_ms']:>10.1f} {now['p50_ms']:>10.1f} "
+            f"{base['p95_ms']:>10.1f} {now['p95_ms']:>10.1f}  {'REGRESSION ' + ', '.join(flags) if flags else ''}"
+        )
+        if flags:
+            regressions.append(f"{stage}: {', '.join(flags)}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay recorded provider responses and report per-stage latency")
+    parser.add_argument("--record", action="store_true", help="Hit live APIs once and (re)record the cassette")
+    parser.add_argument("--cassette", type=str, default=str(DEFAULT_CASSETTE), help="Cassette file")
+    parser.add_argument("--corpus", type=str, default="", help="JSON file with a list of queries")
+    parser.add_argument("--iterations", type=int, default=3, help="Measured passes over the corpus (replay)")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured passes before measuring (replay)")
+    parser.add_argument("--latency-ms", type=float, default=None, help="Fixed upstream latency (default: recorded)")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Multiplier for recorded latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- jitter per response")
+    parser.add_argument("--seed", type=int, default=0, help="Jitter seed")
+    parser.add_argument("--baseline", type=str, default=str(DEFAULT_BASELINE), help="Baseline report to diff against")
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--max-regression", type=float, default=0.20, help="Allowed fractional p50/p95 increase")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0, help="Ignore increases smaller than this")
+    parser.add_argument("--output", type=str, default="", help="Optional JSON report path")
+    args = parser.parse_args()
+
+    # Settings are read once, so configure the cassette before importing the backend
+    os.environ["HTTP_CASSETTE_MODE"] = "record" if args.record else "replay"
+    os.environ["HTTP_CASSETTE_PATH"] = str(Path(args.cassette).resolve())
+    os.environ["HTTP_REPLAY_LATENCY_SCALE"] = str(args.latency_scale)
+    os.environ["HTTP_REPLAY_JITTER_MS"] = str(args.jitter_ms)
+    os.environ["HTTP_REPLAY_SEED"] = str(args.seed)
+    if args.latency_ms is not None:
+        os.environ["HTTP_REPLAY_LATENCY_MS"] = str(args.latency_ms)
+    # Caches in front of the pipeline would hide the stages being measured
+    for flag in ("USE_SERIES_STORE", "USE_IMF_PAYLOAD_CACHE", "USE_INTENT_CACHE"):
+        os.environ[flag] = "0"
+    os.environ.setdefault("DISABLE_MCP", "1")
+    os.environ.setdefault("DISABLE_BACKGROUND_JOBS", "1")
+    os.environ.setdefault("JWT_SECRET", "benchmark-only-secret")
+    os.environ.setdefault("OPENROUTER_API_KEY", "replay")
+
+    if not args.record and not Path(args.cassette).exists():
+        print(f"No cassette at {args.cassette}; record one first with --record (needs network and API keys)")
+        return 1
+
+    corpus = json.loads(Path(args.corpus).read_text()) if args.corpus else DEFAULT_CORPUS
+    iterations, warmup = (1, 0) if args.record else (args.iterations, args.warmup)
+    report = asyncio.run(_run_corpus(corpus, iterations, warmup))
+    report["config"] = {
+        "mode": os.environ["HTTP_CASSETTE_MODE"],
+        "queries": len(corpus),
+        "iterations": iterations,
+        "latency_ms": args.latency_ms,
+        "latency_scale": args.latency_scale,
+        "jitter_ms": args.jitter_ms,
+        "seed": args.seed,
+    }
+
+    print(f"{'stage':<24} {'count':>6} {'p50':>10} {'p95':>10} {'p99':>10}")
+    for stage, row in report["stages"].items():
+        print(f"{stage:<24} {row['count']:>6} {row['p50_ms']:>8.1f}ms {row['p95_ms']:>8.1f}ms {row['p99_ms']:>8.1f}ms")
+    for error in report["errors"]:
+        print(f"  error: {error['query']!r}: {error['error']}")
+    if report["cassette"]:
+        print(f"cassette: {report['cassette']}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    if args.record:
+        return 0
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=2))
+        print(f"Baseline written to {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; run with --update-baseline to create one")
+        return 0
+
+    regressions = _diff(report, json.loads(baseline_path.read_text()), args.max_regression, args.min_delta_ms)
+    if regressions:
+        print("\nRegressions vs baseline:\n  " + "\n  ".join(regressions))
+        return 1
+    print("\nNo stage regressed beyond the threshold")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Per-worker memory of the backend under different multi-worker launchers.
+
+Starts the server in each mode, waits for ``/api/health``, sends a few
+warm-up requests, then reads ``/proc/<pid>/smaps_rollup`` for the master and
+every worker:
+
+- uvicorn:   ``uvicorn backend.main:app --workers N`` (spawned interpreters,
+             catalogs loaded lazily, so only what the warm-up touched)
+- eager:     ``python -m backend.prefork --load-per-worker`` (fork, then every
+             worker loads the catalogs and indexes itself: the steady state
+             once each worker has served the queries that need them)
+- nofreeze:  ``python -m backend.prefork --no-freeze`` (preload, no gc.freeze)
+- preload:   ``python -m backend.prefork`` (preload + gc.freeze, then fork)
+
+USS is memory unique to one process; PSS charges shared pages
+proportionally, so the sum of PSS is the real footprint of the deployment.
+
+A short run rarely triggers a full collection in the workers, which is when
+an unfrozen heap gets copied. The GC probe therefore preloads, forks, runs
+``gc.collect()`` in the child and reports how much USS the collection added,
+with and without ``gc.freeze()``. Linux only (needs /proc). No API keys
+required.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from backend.services.preload import process_memory  # noqa: E402
+
+MODES = ("uvicorn", "eager", "nofreeze", "preload")
+
+
+def _command(mode: str, port: int, workers: int) -> List[str]:
+    if mode == "uvicorn":
+        return [sys.executable, "-m", "uvicorn", "backend.main:app", "--host", "127.0.0.1",
+                "--port", str(port), "--workers", str(workers), "--log-level", "warning"]
+    command = [sys.executable, "-m", "backend.prefork", "--host", "127.0.0.1", "--port", str(port),
+               "--workers", str(workers), "--log-level", "warning"]
+    extra = {"eager": ["--load-per-worker"], "nofreeze": ["--no-freeze"]}
+    return command + extra.get(mode, [])
+
+
+def _descendants(pid: int) -> List[int]:
+    children: List[int] = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children", "r", encoding="ascii") as f:
+                children.extend(int(child) for child in f.read().split())
+    except OSError:
+        return []
+    return [grandchild for child in children for grandchild in [child, *_descendants(child)]]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure(mode: str, workers: int, warm_requests: int, settle_s: float, env: Dict[str, str]) -> Dict[str, Any]:
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    server = subprocess.Popen(_command(mode, port, workers), cwd=REPO_ROOT, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        with httpx.Client(timeout=5.0) as client:
+            while True:
+                if server.poll() is not None:
+                    raise RuntimeError(f"{mode} server exited with {server.returncode}")
+                if time.perf_counter() - start > 120:
+                    raise RuntimeError(f"{mode} server did not become healthy")
+                try:
+                    if client.get(f"{base_url}/api/health").status_code == 200:
+                        break
+                except httpx.TransportError:
+                    time.sleep(0.05)
+            ready_ms = (time.perf_counter() - start) * 1000
+            # Several connections so every worker answers at least once
+            for _ in range(warm_requests):
+                with httpx.Client(timeout=5.0) as fresh:
+                    fresh.get(f"{base_url}/api/health")
+                    fresh.get(f"{base_url}/api/performance/metrics")
+        # Let lifespan startup finish in workers that were not hit yet
+        time.sleep(settle_s)
+
+        master = process_memory(server.pid) or {}
+        worker_rows = []
+        for pid in _descendants(server.pid):
+            memory = process_memory(pid)
+            # uvicorn --workers also runs a small multiprocessing resource tracker
+            if memory and memory["rss_kb"] > 20 * 1024:
+                worker_rows.append({"pid": pid, **memory})
+        processes = [master, *worker_rows]
+        return {
+            "mode": mode,
+            "ready_ms": round(ready_ms, 1),
+            "master": master,
+            "workers": worker_rows,
+            "worker_uss_mib": round(sum(row["uss_kb"] for row in worker_rows) / max(1, len(worker_rows)) / 1024, 1),
+            "total_pss_mib": round(sum(row.get("pss_kb", 0) for row in processes) / 1024, 1),
+            "total_rss_mib": round(sum(row.get("rss_kb", 0) for row in processes) / 1024, 1),
+        }
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def _gc_probe_child(freeze: bool) -> None:
+    import gc
+
+    from backend.services.preload import preload_shared_state
+
+    preload_shared_state(freeze=freeze)
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        before = process_memory()["uss_kb"]
+        gc.collect()
+        after = process_memory()["uss_kb"]
+        os.write(write_end, json.dumps({"before_kb": before, "after_kb": after}).encode())
+        os._exit(0)
+    os.close(write_end)
+    with os.fdopen(read_end) as f:
+        result = json.loads(f.read())
+    os.waitpid(pid, 0)
+    print(json.dumps({"freeze": freeze, **result}))
+
+
+def gc_probe(freeze: bool, env: Dict[str, str]) -> Dict[str, Any]:
+    output = subprocess.run(
+        [sys.executable, __file__, "--gc-probe", "freeze" if freeze else "nofreeze"],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare per-worker memory across launchers")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes per mode")
+    parser.add_argument("--modes", type=str, default=",".join(MODES), help="Comma-separated subset of modes")
+    parser.add_argument("--warm-requests", type=int, default=20, help="Health + metrics requests before measuring")
+    parser.add_argument("--settle", type=float, default=2.0, help="Seconds to wait before reading memory")
+    parser.add_argument("--skip-gc-probe", action="store_true", help="Skip the forked gc.collect() probe")
+    parser.add_argument("--output", type=str, default="", help="Optional JSON report path")
+    parser.add_argument("--gc-probe", choices=("freeze", "nofreeze"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.gc_probe:
+        _gc_probe_child(args.gc_probe == "freeze")
+        return 0
+
+    if process_memory() is None:
+        print("/proc/<pid>/smaps_rollup is not available on this platform")
+        return 1
+
+    env = dict(os.environ)
+    env.setdefault("OPENROUTER_API_KEY", "memory-benchmark")
+    env.setdefault("JWT_SECRET", "memory-benchmark-secret")
+    env.setdefault("DISABLE_MCP", "1")
+    env.setdefault("DISABLE_BACKGROUND_JOBS", "1")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+
+    rows = [measure(mode, args.workers, args.warm_requests, args.settle, env) for mode in args.modes.split(",")]
+
+    print(f"{'mode':<9} {'ready':>8} {'workers':>8} {'USS/worker':>11} {'total PSS':>10} {'total RSS':>10}")
+    for row in rows:
+        print(
+            f"{row['mode']:<9} {row['ready_ms']:>6.0f}ms {len(row['workers']):>8} "
+            f"{row['worker_uss_mib']:>8.1f}MiB {row['total_pss_mib']:>7.1f}MiB {row['total_rss_mib']:>7.1f}MiB"
+        )
+
+    probes = []
+    if not args.skip_gc_probe:
+        probes = [gc_probe(freeze, env) for freeze in (False, True)]
+        for probe in probes:
+            added = (probe["after_kb"] - probe["before_kb"]) / 1024
+            print(f"Full gc.collect() in a fresh worker, {'with' if probe['freeze'] else 'without'} gc.freeze: "
+                  f"+{added:.1f}MiB unique memory")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"workers": args.workers, "modes": rows, "gc_probe": probes}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
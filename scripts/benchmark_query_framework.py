@@ -2,9 +2,10 @@
 """
 Framework benchmark runner for OpenEcon query intelligence.
 
-Measures two core dimensions:
+Measures three core dimensions:
 1. Routing accuracy (query -> provider) using deterministic router.
 2. Series matching accuracy (query + provider -> indicator selection quality) using IndicatorResolver.
+3. Fast-path parser coverage/accuracy (query -> ParsedIntent without the LLM).
 
 Design goals:
 - Deterministic and local (no API calls required).
@@ -18,6 +19,7 @@ import argparse
 import ast
 import json
 import sys
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -30,13 +32,30 @@ if str(REPO_ROOT) not in sys.path:
 
 from backend.routing.unified_router import UnifiedRouter  # noqa: E402
 from backend.services.catalog_service import (  # noqa: E402
+    find_concept_by_term,
     get_all_synonyms,
     get_exclusions,
     get_indicator_codes,
     load_catalog,
 )
+from backend.services.fast_path_parser import DEFAULT_MIN_CONFIDENCE, FastPathParser  # noqa: E402
 from backend.services.indicator_resolver import get_indicator_resolver  # noqa: E402
 
+# Geography/time templates for synthesized fast-path cases, with the
+# parameters an accepted intent must carry. Without a named country the
+# answer is the provider's default geography, which is only unambiguous for
+# single-country providers (checked separately).
+FAST_PATH_TEMPLATES: List[Tuple[str, Dict[str, Any]]] = [
+    ("{term} in Germany from 2015 to 2020", {"country": "DE", "startDate": "2015-01-01", "endDate": "2020-12-31"}),
+    ("US {term} since 2010", {"country": "US", "startDate": "2010-01-01", "endDate": None}),
+    ("{term} in Japan and Brazil", {"countries": ["JP", "BR"]}),
+    ("{term}", {"country": None, "countries": None}),
+]
+FAST_PATH_SINGLE_COUNTRY_PROVIDERS = {"FRED", "STATSCAN"}
+
+# Thresholds swept for the fast-path accuracy/coverage curve
+FAST_PATH_CURVE_THRESHOLDS = [round(0.5 + 0.05 * step, 2) for step in range(10)]
+
 
 @dataclass
 class RoutingCase:
@@ -85,6 +104,13 @@ class SeriesResult:
     concept_score: float
 
 
+@dataclass
+class FastPathCase:
+    concept: str
+    query: str
+    expected_parameters: Dict[str, Any]
+
+
 def normalize_provider(provider: str) -> str:
     """Normalize provider names for comparison."""
     if not provider:
@@ -471,6 +497,142 @@ def run_series_benchmark(cases: List[SeriesCase], strict_code_match: bool = Fals
     }
 
 
+def build_fast_path_cases_from_catalog() -> List[FastPathCase]:
+    """Build templated queries per catalog concept from its primary synonym."""
+    cases: List[FastPathCase] = []
+    for concept_name, concept_data in load_catalog().items():
+        primary = [s.strip() for s in ((concept_data.get("synonyms", {}) or {}).get("primary", []) or []) if str(s).strip()]
+        term = primary[0] if primary else concept_name.replace("_", " ")
+        for template, expected in FAST_PATH_TEMPLATES:
+            cases.append(FastPathCase(concept=concept_name, query=template.format(term=term), expected_parameters=expected))
+    return cases
+
+
+def _fast_path_case_failure(case: FastPathCase, result: Any) -> Optional[Dict[str, Any]]:
+    """Return a failure record when an accepted catalog case is wrong, else None."""
+    intent = result.intent
+    params = intent.parameters or {}
+    provider = normalize_provider(intent.apiProvider)
+    concept_ok = result.concept == case.concept or find_concept_by_term(intent.indicators[0]) == case.concept
+    params_ok = all(params.get(k) == v for k, v in case.expected_parameters.items())
+    catalog_codes = {code.upper() for code in get_indicator_codes(case.concept, intent.apiProvider)}
+    code = str(result.indicator_code or "").upper()
+    series_ok = bool(code) and (not catalog_codes or code in catalog_codes)
+    geography_ok = bool(params.get("country") or params.get("countries")) or provider in FAST_PATH_SINGLE_COUNTRY_PROVIDERS
+    if concept_ok and params_ok and series_ok and geography_ok:
+        return None
+    return {
+        "query": case.query,
+        "confidence": result.confidence,
+        "expected_concept": case.concept,
+        "predicted_concept": result.concept,
+        "provider": intent.apiProvider,
+        "indicator_code": result.indicator_code,
+        "parameters": params,
+    }
+
+
+def run_fast_path_benchmark(
+    routing_cases: List[RoutingCase],
+    catalog_cases: List[FastPathCase],
+    min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    target_accuracy: float = 0.98,
+) -> Dict[str, Any]:
+    """
+    Measure how often the fast path answers without the LLM, and how well.
+
+    - Routing cases: coverage (accepted share) and provider agreement on accepted queries.
+    - Catalog cases: accepted queries must recover the concept, geography and
+      date range, and resolve to one of the concept's catalog series.
+
+    Every parse is scored once; the accuracy/coverage curve over
+    FAST_PATH_CURVE_THRESHOLDS shows where the confidence threshold trades
+    coverage for accuracy, and ``recommended_min_confidence`` is the lowest
+    threshold that keeps accuracy at or above ``target_accuracy``.
+    """
+    parser = FastPathParser()
+    parse_ms: List[float] = []
+
+    def _parse(query: str):
+        start = time.perf_counter()
+        result = parser.parse(query)
+        parse_ms.append((time.perf_counter() - start) * 1000)
+        return result
+
+    # (set, confidence, failure or None) for every parse that produced an intent
+    outcomes: List[Tuple[str, float, Optional[Dict[str, Any]]]] = []
+    for case in routing_cases:
+        result = _parse(case.query)
+        if result.intent is None:
+            continue
+        predicted = normalize_provider(result.intent.apiProvider)
+        expected = normalize_provider(case.expected_provider)
+        failure = None
+        if predicted != expected:
+            failure = {
+                "query": case.query,
+                "confidence": result.confidence,
+                "expected_provider": expected,
+                "predicted_provider": predicted,
+            }
+        outcomes.append(("routing", result.confidence, failure))
+
+    for case in catalog_cases:
+        result = _parse(case.query)
+        if result.intent is None:
+            continue
+        outcomes.append(("catalog", result.confidence, _fast_path_case_failure(case, result)))
+
+    def _at(threshold: float, case_set: Optional[str] = None) -> Tuple[int, int]:
+        accepted = [
+            failure for kind, confidence, failure in outcomes
+            if confidence >= threshold and (case_set is None or kind == case_set)
+        ]
+        return len(accepted), sum(1 for failure in accepted if failure is None)
+
+    total_cases = len(routing_cases) + len(catalog_cases)
+    curve: List[Dict[str, Any]] = []
+    for threshold in FAST_PATH_CURVE_THRESHOLDS:
+        accepted, correct = _at(threshold)
+        curve.append({
+            "min_confidence": threshold,
+            "coverage": (accepted / total_cases) if total_cases else 0.0,
+            "accuracy": (correct / accepted) if accepted else 0.0,
+            "accepted": accepted,
+        })
+    recommended = next(
+        (point["min_confidence"] for point in curve if point["accepted"] and point["accuracy"] >= target_accuracy),
+        None,
+    )
+
+    routing_accepted, routing_correct = _at(min_confidence, "routing")
+    catalog_accepted, catalog_correct = _at(min_confidence, "catalog")
+    accepted = routing_accepted + catalog_accepted
+    correct = routing_correct + catalog_correct
+    failures = [failure for _, confidence, failure in outcomes if failure is not None and confidence >= min_confidence]
+    sorted_ms = sorted(parse_ms)
+    return {
+        "min_confidence": min_confidence,
+        "routing_cases": len(routing_cases),
+        "routing_coverage": (routing_accepted / len(routing_cases)) if routing_cases else 0.0,
+        "routing_provider_accuracy": (routing_correct / routing_accepted) if routing_accepted else 0.0,
+        "catalog_cases": len(catalog_cases),
+        "catalog_coverage": (catalog_accepted / len(catalog_cases)) if catalog_cases else 0.0,
+        "catalog_accuracy": (catalog_correct / catalog_accepted) if catalog_accepted else 0.0,
+        "accepted": accepted,
+        "accuracy": (correct / accepted) if accepted else 0.0,
+        "curve": curve,
+        "target_accuracy": target_accuracy,
+        "recommended_min_confidence": recommended,
+        "parse_ms_p50": sorted_ms[len(sorted_ms) // 2] if sorted_ms else 0.0,
+        "parse_ms_max": sorted_ms[-1] if sorted_ms else 0.0,
+        "sample_failures": failures[:25],
+        "below_threshold_failures": [
+            failure for _, confidence, failure in outcomes if failure is not None and confidence < min_confidence
+        ][:25],
+    }
+
+
 def print_summary(report: Dict[str, Any]) -> None:
     routing = report["routing"]
     series = report["series"]
@@ -495,6 +657,32 @@ def print_summary(report: Dict[str, Any]) -> None:
         f"concept_match={series.get('concept_matches', 0)}"
     )
 
+    fast_path = report.get("fast_path")
+    if fast_path:
+        print("\nFast-Path Parser")
+        print(
+            f"- Coverage: routing={fast_path['routing_coverage'] * 100:.1f}% "
+            f"catalog={fast_path['catalog_coverage'] * 100:.1f}%"
+        )
+        print(
+            f"- Accuracy on accepted: {fast_path['accuracy'] * 100:.1f}% "
+            f"(provider={fast_path['routing_provider_accuracy'] * 100:.1f}%, "
+            f"concept+params={fast_path['catalog_accuracy'] * 100:.1f}%)"
+        )
+        print(f"- Parse time: p50={fast_path['parse_ms_p50']:.2f}ms max={fast_path['parse_ms_max']:.2f}ms")
+        print("- Threshold curve (min_confidence: coverage / accuracy):")
+        for point in fast_path["curve"]:
+            marker = " <- current" if point["min_confidence"] == round(fast_path["min_confidence"], 2) else ""
+            print(
+                f"    {point['min_confidence']:.2f}: {point['coverage'] * 100:5.1f}% / "
+                f"{point['accuracy'] * 100:5.1f}% ({point['accepted']} accepted){marker}"
+            )
+        recommended = fast_path["recommended_min_confidence"]
+        print(
+            f"- Lowest threshold with >= {fast_path['target_accuracy'] * 100:.0f}% accuracy: "
+            f"{recommended if recommended is not None else 'none'}"
+        )
+
     if routing["sample_failures"]:
         print("\nTop Routing Failures (sample)")
         for f in routing["sample_failures"][:5]:
@@ -554,6 +742,18 @@ def main() -> int:
         default=0.90,
         help="Fail if series matching accuracy falls below this threshold (0-1)",
     )
+    parser.add_argument(
+        "--min-fast-path-accuracy",
+        type=float,
+        default=0.0,
+        help="Fail if fast-path accuracy on accepted queries falls below this threshold (0-1, 0 = report only)",
+    )
+    parser.add_argument(
+        "--fast-path-min-confidence",
+        type=float,
+        default=DEFAULT_MIN_CONFIDENCE,
+        help="Fast-path confidence threshold to report coverage/accuracy at (default: parser default)",
+    )
     parser.add_argument(
         "--output",
         default="tests/benchmark_report.latest.json",
@@ -579,14 +779,21 @@ def main() -> int:
         series_cases,
         strict_code_match=args.strict_series_code_match,
     )
+    fast_path_report = run_fast_path_benchmark(
+        routing_cases,
+        build_fast_path_cases_from_catalog(),
+        min_confidence=args.fast_path_min_confidence,
+    )
 
     report = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "routing": routing_report,
         "series": series_report,
+        "fast_path": fast_path_report,
         "thresholds": {
             "min_routing_accuracy": args.min_routing_accuracy,
             "min_series_accuracy": args.min_series_accuracy,
+            "min_fast_path_accuracy": args.min_fast_path_accuracy,
         },
         "inputs": {
             "routing_source": str(routing_source),
@@ -606,8 +813,9 @@ def main() -> int:
 
     routing_ok = routing_report["accuracy"] >= args.min_routing_accuracy
     series_ok = series_report["accuracy"] >= args.min_series_accuracy
+    fast_path_ok = fast_path_report["accuracy"] >= args.min_fast_path_accuracy
 
-    if routing_ok and series_ok:
+    if routing_ok and series_ok and fast_path_ok:
         print("\n✅ Benchmark passed thresholds")
         return 0
 
@@ -622,6 +830,11 @@ def main() -> int:
             f"- Series accuracy {series_report['accuracy']:.3f} "
             f"< required {args.min_series_accuracy:.3f}"
         )
+    if not fast_path_ok:
+        print(
+            f"- Fast-path accuracy {fast_path_report['accuracy']:.3f} "
+            f"< required {args.min_fast_path_accuracy:.3f}"
+        )
     return 1
 
 
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Pro Mode sandbox latency benchmark.
+
+Runs the same pandas/numpy snippet through ``SecureCodeExecutor.execute_code``:
+1. cold: a fresh interpreter per execution (pool disabled)
+2. pooled: pre-warmed workers from ``SandboxWorkerPool``
+
+Reports p50/p95 end-to-end latency per mode. Sessions are written to a
+temporary directory. No network or API keys required.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from backend.services import secure_code_executor as executor_module  # noqa: E402
+from backend.services.sandbox_pool import POOL_SUPPORTED, SandboxWorkerPool  # noqa: E402
+from backend.services.secure_code_executor import (  # noqa: E402
+    SecureCodeExecutor,
+    SecurityLevel,
+    build_sandbox_env,
+)
+
+SNIPPET = """
+import numpy as np
+import pandas as pd
+
+df = pd.DataFrame({"year": range(2000, 2024), "gdp": np.linspace(1.0, 2.5, 24)})
+df["growth"] = df["gdp"].pct_change() * 100
+print(df["growth"].describe().round(3).to_string())
+"""
+
+
+def _summary(mode: str, latencies: List[float], failures: int) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    return {
+        "mode": mode,
+        "runs": len(ordered),
+        "failures": failures,
+        "p50_ms": round(statistics.median(ordered), 1),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 1),
+        "max_ms": round(ordered[-1], 1),
+    }
+
+
+async def _run_mode(mode: str, runs: int, pool_size: int, preload: List[str], base: Path) -> Dict[str, Any]:
+    pool = None
+    if mode == "pooled":
+        home_dir = base / "pool"
+        pool = SandboxWorkerPool(size=pool_size, env=build_sandbox_env(home_dir), home_dir=home_dir, preload=preload)
+        await pool.start()
+    executor_module.get_sandbox_pool = lambda: pool
+
+    executor = SecureCodeExecutor(
+        security_level=SecurityLevel.MODERATE,
+        session_dir=base / "sessions",
+        public_dir=base / "public",
+    )
+    latencies: List[float] = []
+    failures = 0
+    try:
+        for index in range(runs):
+            start = time.perf_counter()
+            result = await executor.execute_code(SNIPPET, session_id=f"bench_{mode}_{index}")
+            latencies.append((time.perf_counter() - start) * 1000)
+            failures += 0 if result.get("success") else 1
+    finally:
+        if pool is not None:
+            await pool.close()
+    return _summary(mode, latencies, failures)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark cold vs pooled Pro Mode sandbox executions")
+    parser.add_argument("--runs", type=int, default=20, help="Executions per mode")
+    parser.add_argument("--pool-size", type=int, default=2, help="Pre-warmed workers")
+    parser.add_argument("--preload", type=str, default="numpy,pandas", help="Comma-separated modules to preload")
+    parser.add_argument("--output", type=str, default="", help="Optional JSON report path")
+    args = parser.parse_args()
+
+    if not POOL_SUPPORTED:
+        print("Sandbox pool needs os.fork; only the cold path is available on this platform")
+        return 1
+
+    preload = [name.strip() for name in args.preload.split(",") if name.strip()]
+    report = {}
+    with tempfile.TemporaryDirectory(prefix="sandbox-bench-") as tmp:
+        for mode in ("cold", "pooled"):
+            report[mode] = asyncio.run(_run_mode(mode, args.runs, args.pool_size, preload, Path(tmp) / mode))
+
+    for row in report.values():
+        print(
+            f"{row['mode']:>7}: p50 {row['p50_ms']:.1f}ms p95 {row['p95_ms']:.1f}ms "
+            f"max {row['max_ms']:.1f}ms ({row['runs']} runs, {row['failures']} failed)"
+        )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
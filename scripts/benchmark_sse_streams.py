@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Concurrent SSE stream benchmark.
+
+Simulates many open streaming queries, each a task that emits tracker events at
+random intervals, and relays them with:
+1. the legacy loop (``wait_for(queue.get(), timeout=0.1)`` + ``task.done()`` check)
+2. ``backend.utils.sse.stream_task_events`` (event-driven, FIRST_COMPLETED)
+
+Reports process CPU time and "completion lag" (task finished -> stream ended),
+which is the extra latency added to the final result.
+No network or API keys required.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from backend.utils.sse import format_sse_event, stream_task_events  # noqa: E402
+
+
+@dataclass
+class _Event:
+    event: str
+    data: Dict[str, Any]
+
+
+async def _legacy_stream(task: asyncio.Task, queue: asyncio.Queue) -> AsyncIterator[str]:
+    while True:
+        try:
+            event = await asyncio.wait_for(queue.get(), timeout=0.1)
+            yield format_sse_event(event.event, event.data)
+        except asyncio.TimeoutError:
+            pass
+        if task.done():
+            while not queue.empty():
+                event = queue.get_nowait()
+                yield format_sse_event(event.event, event.data)
+            return
+
+
+async def _fake_query(queue: asyncio.Queue, events: int, duration: float, rng: random.Random) -> float:
+    gaps = [rng.random() for _ in range(events + 1)]
+    scale = duration / sum(gaps)
+    for index, gap in enumerate(gaps[:-1]):
+        await asyncio.sleep(gap * scale)
+        queue.put_nowait(_Event("step", {"step": f"step_{index}"}))
+    await asyncio.sleep(gaps[-1] * scale)
+    return time.perf_counter()
+
+
+async def _one_stream(mode: str, events: int, duration: float, seed: int) -> Dict[str, float]:
+    queue: asyncio.Queue = asyncio.Queue()
+    task = asyncio.create_task(_fake_query(queue, events, duration, random.Random(seed)))
+    stream = _legacy_stream(task, queue) if mode == "polling" else stream_task_events(task, queue, 15.0)
+    received = 0
+    async for _ in stream:
+        received += 1
+    ended = time.perf_counter()
+    finished = await task
+    return {"lag_ms": (ended - finished) * 1000, "events": received}
+
+
+async def _run_mode(mode: str, streams: int, events: int, duration: float) -> Dict[str, Any]:
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    results = await asyncio.gather(*[
+        _one_stream(mode, events, duration, seed) for seed in range(streams)
+    ])
+    lags = sorted(result["lag_ms"] for result in results)
+    return {
+        "mode": mode,
+        "streams": streams,
+        "wall_seconds": round(time.perf_counter() - wall_start, 3),
+        "cpu_seconds": round(time.process_time() - cpu_start, 3),
+        "lag_ms_p50": round(statistics.median(lags), 2),
+        "lag_ms_p95": round(lags[min(len(lags) - 1, int(0.95 * len(lags)))], 2),
+        "lag_ms_max": round(lags[-1], 2),
+        "events_delivered": int(sum(result["events"] for result in results)),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SSE relay loops under many concurrent streams")
+    parser.add_argument("--streams", type=int, default=500, help="Concurrent streams")
+    parser.add_argument("--events", type=int, default=10, help="Tracker events per stream")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds each simulated query runs")
+    parser.add_argument("--output", type=str, default="", help="Optional JSON report path")
+    args = parser.parse_args()
+
+    report = {
+        mode: asyncio.run(_run_mode(mode, args.streams, args.events, args.duration))
+        for mode in ("polling", "event_driven")
+    }
+    for row in report.values():
+        print(
+            f"{row['mode']:>13}: cpu {row['cpu_seconds']:.2f}s, wall {row['wall_seconds']:.2f}s, "
+            f"completion lag p50 {row['lag_ms_p50']:.1f}ms p95 {row['lag_ms_p95']:.1f}ms "
+            f"max {row['lag_ms_max']:.1f}ms, events {row['events_delivered']}"
+        )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
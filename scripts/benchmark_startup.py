@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Backend cold-start benchmark.
+
+1. Runs ``python -X importtime -c "import backend.main"`` in a fresh process
+   and reports total import time plus the slowest modules (cumulative and
+   self time), so regressions point at the import that caused them.
+2. Starts ``uvicorn backend.main:app`` and measures the wall time from
+   spawning the process to the first successful ``GET /api/health``.
+
+Exits 1 when the median time to first health response exceeds
+``--budget-ms``. Providers and heavy subsystems are built lazily (see
+``backend/services/lazy_registry.py``); a new top-level import of a provider,
+pandas or the MCP server shows up here first. No API keys required.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+DEFAULT_BUDGET_MS = 2500.0
+
+
+def _child_env(disable_mcp: bool) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("OPENROUTER_API_KEY", "startup-benchmark")
+    env.setdefault("JWT_SECRET", "startup-benchmark-secret")
+    env.setdefault("DISABLE_BACKGROUND_JOBS", "1")
+    env.setdefault("EMBEDDING_WARMUP_ON_STARTUP", "0")
+    env["DISABLE_MCP"] = "1" if disable_mcp else "0"
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def _parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "| imported package" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            modules.append({
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            })
+        except ValueError:
+            continue
+    return modules
+
+
+def measure_imports(env: Dict[str, str], top: int) -> Dict[str, Any]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import backend.main"],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"import backend.main failed:\n{result.stderr[-2000:]}")
+
+    modules = _parse_importtime(result.stderr)
+    main = next((m for m in modules if m["module"] == "backend.main"), None)
+    backend_modules = [m for m in modules if m["module"].startswith("backend.")]
+    return {
+        "process_wall_ms": round(wall_ms, 1),
+        "backend_main_ms": round(main["cumulative_ms"], 1) if main else None,
+        "modules_imported": len(modules),
+        "top_cumulative": sorted(
+            (m for m in modules if m["depth"] <= 2), key=lambda m: m["cumulative_ms"], reverse=True
+        )[:top],
+        "top_self": sorted(modules, key=lambda m: m["self_ms"], reverse=True)[:top],
+        "backend_self_ms": round(sum(m["self_ms"] for m in backend_modules), 1),
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_first_health(env: Dict[str, str], timeout_s: float) -> float:
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/api/health"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--log-level", "warning"],
+        cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    try:
+        with httpx.Client(timeout=1.0) as client:
+            while time.perf_counter() - start < timeout_s:
+                if server.poll() is not None:
+                    raise RuntimeError(f"uvicorn exited early:\n{server.stderr.read().decode()[-2000:]}")
+                try:
+                    if client.get(url).status_code == 200:
+                        return (time.perf_counter() - start) * 1000
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.01)
+        raise RuntimeError(f"/api/health did not answer within {timeout_s:.0f}s")
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure backend import time and time to first /api/health")
+    parser.add_argument("--runs", type=int, default=3, help="Server cold starts to time")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Median time-to-health budget")
+    parser.add_argument("--disable-mcp", action="store_true", help="Start without mounting the MCP server")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for each server start")
+    parser.add_argument("--output", type=str, default="", help="Optional JSON report path")
+    args = parser.parse_args()
+
+    env = _child_env(args.disable_mcp)
+    imports = measure_imports(env, args.top)
+
+    print(f"import backend.main: {imports['backend_main_ms']:.0f}ms "
+          f"({imports['modules_imported']} modules, process wall {imports['process_wall_ms']:.0f}ms)")
+    print(f"\n{'cumulative':>12}  module (depth <= 2)")
+    for row in imports["top_cumulative"]:
+        print(f"{row['cumulative_ms']:>10.1f}ms  {'  ' * row['depth']}{row['module']}")
+    print(f"\n{'self':>12}  module")
+    for row in imports["top_self"]:
+        print(f"{row['self_ms']:>10.1f}ms  {row['module']}")
+
+    samples = [measure_first_health(env, args.timeout) for _ in range(args.runs)]
+    median_ms = statistics.median(samples)
+    within_budget = median_ms <= args.budget_ms
+    print(
+        f"\nTime to first /api/health: median {median_ms:.0f}ms over {args.runs} runs "
+        f"(min {min(samples):.0f}ms, max {max(samples):.0f}ms), budget {args.budget_ms:.0f}ms: "
+        f"{'OK' if within_budget else 'OVER BUDGET'}"
+    )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({
+            "imports": imports,
+            "first_health_ms": [round(sample, 1) for sample in samples],
+            "first_health_median_ms": round(median_ms, 1),
+            "budget_ms": args.budget_ms,
+            "mcp_mounted": not args.disable_mcp,
+        }, indent=2))
+    return 0 if within_budget else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
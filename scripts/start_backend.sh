@@ -1,8 +1,11 @@
 #!/bin/bash
 # Proper backend startup script for econ-data-mcp
 # Usage: ./scripts/start_backend.sh [production|development]
+# WORKERS=4 ./scripts/start_backend.sh production  -> pre-forked workers sharing
+#   preloaded catalogs and indexes copy-on-write (python -m backend.prefork)
 
 MODE=${1:-production}
+WORKERS=${WORKERS:-1}
 PROJECT_ROOT="/home/hanlulong/econ-data-mcp"
 
 cd "$PROJECT_ROOT" || exit 1
@@ -15,7 +18,15 @@ sleep 2
 # Activate virtual environment
 source backend/.venv/bin/activate
 
-if [ "$MODE" = "production" ]; then
+if [ "$MODE" = "production" ] && [ "$WORKERS" -gt 1 ]; then
+    echo "🚀 Starting backend in PRODUCTION mode ($WORKERS pre-forked workers, shared preload)..."
+    nohup python -m backend.prefork \
+        --host 0.0.0.0 \
+        --port 3001 \
+        --workers "$WORKERS" \
+        > /tmp/backend-production.log 2>&1 &
+
+elif [ "$MODE" = "production" ]; then
     echo "🚀 Starting backend in PRODUCTION mode (no auto-reload)..."
     nohup uvicorn backend.main:app \
         --host 0.0.0.0 \
@@ -44,6 +55,7 @@ if curl -s http://localhost:3001/api/health > /dev/null 2>&1; then
     echo "✅ Backend started successfully"
     echo "   PID: $BACKEND_PID"
     echo "   Mode: $MODE"
+    echo "   Workers: $WORKERS"
     echo "   Logs: /tmp/backend-$MODE.log"
     echo ""
     echo "Monitor with: ps aux | grep uvicorn"